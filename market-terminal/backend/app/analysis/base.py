@@ -18,6 +18,8 @@ from typing import Any
 
 import pandas as pd
 
+from app.analysis.features import BarFeatures
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -270,12 +272,31 @@ class BaseMethodology(ABC):
     Subclasses must implement :meth:`analyze` and set the four class
     attributes (``name``, ``display_name``, ``default_timeframe``,
     ``version``).
+
+    Analyzers that set ``supports_incremental`` also accept an
+    ``incremental_state`` dict in :meth:`analyze` kwargs.  It carries
+    compact intermediate results from the previous run (stamped with the
+    last bar they cover via :meth:`stamp_state`); the analyzer folds in only
+    the bars after :meth:`resume_index` and rewrites the dict in place.
+    Signals must match a full recompute over the same bars.
+
+    Per-bar primitives (merged frame, true range, rolling extremes, swing
+    pivots, ...) come from a :class:`~app.analysis.features.BarFeatures`
+    shared by every analyzer in a run and passed as the ``features``
+    kwarg; :meth:`bar_features` falls back to a private one.
+
+    Analyzers that set ``runs_on_event_loop`` do their own async I/O
+    (database, shared batchers) and are always awaited on the server's
+    event loop, never inside a methodology worker pool; they offload any
+    CPU-bound work themselves.
     """
 
     name: str
     display_name: str
     default_timeframe: str
     version: str
+    supports_incremental: bool = False
+    runs_on_event_loop: bool = False
 
     @abstractmethod
     async def analyze(
@@ -293,12 +314,117 @@ class BaseMethodology(ABC):
             price_data: DataFrame with columns [date, open, high, low, close].
             volume_data: DataFrame with columns [date, volume].
             fundamentals: Optional fundamental data (required by CANSLIM).
-            **kwargs: Methodology-specific additional data.
+            **kwargs: Methodology-specific additional data, plus the
+                shared ``features`` (:class:`BarFeatures`) when available.
 
         Returns:
             A :class:`MethodologySignal` with analysis results.
         """
 
+    async def analyze_incremental(
+        self,
+        ticker: str,
+        price_data: pd.DataFrame,
+        volume_data: pd.DataFrame,
+        fundamentals: dict[str, Any] | None = None,
+        *,
+        state: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> tuple[MethodologySignal, dict[str, Any] | None]:
+        """Run :meth:`analyze`, resuming from *state* saved by a previous run.
+
+        Returns ``(signal, new_state)``; hand *new_state* (JSON-serializable)
+        back on the next call.  Analyzers without incremental support run a
+        full analysis and return ``None`` as the state.  A *state* that does
+        not match the data (other version, rewritten history) is rebuilt.
+        """
+        if not self.supports_incremental:
+            signal = await self.analyze(
+                ticker, price_data, volume_data, fundamentals, **kwargs,
+            )
+            return signal, None
+        work = dict(state) if state else {}
+        signal = await self.analyze(
+            ticker, price_data, volume_data, fundamentals,
+            incremental_state=work, **kwargs,
+        )
+        return signal, work
+
+    # -- shared features -----------------------------------------------------
+
+    @staticmethod
+    def bar_features(
+        price_data: pd.DataFrame,
+        volume_data: pd.DataFrame,
+        kwargs: dict[str, Any],
+    ) -> BarFeatures:
+        """Return ``kwargs["features"]`` if built from these frames, else a new one."""
+        features = kwargs.get("features")
+        if isinstance(features, BarFeatures) and features.matches(price_data, volume_data):
+            return features
+        return BarFeatures(price_data, volume_data)
+
+    # -- incremental state helpers ------------------------------------------
+
+    @staticmethod
+    def locate_dates(df: pd.DataFrame, dates: list[str]) -> list[int]:
+        """Row positions of *dates* (``str`` of the ``date`` values) in *df*.
+
+        Dates not present are reported as ``-1``.
+        """
+        if not dates or df.empty:
+            return [-1] * len(dates)
+        column = df["date"]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            keys: Any = pd.to_datetime(dates)
+        else:
+            keys = dates
+        try:
+            found = column.searchsorted(keys, side="left")
+        except (TypeError, ValueError):
+            return [-1] * len(dates)
+        n = len(df)
+        return [
+            int(pos) if pos < n and str(column.iloc[pos]) == d else -1
+            for pos, d in zip(found, dates)
+        ]
+
+    def resume_index(self, state: dict[str, Any] | None, df: pd.DataFrame) -> int | None:
+        """First row of *df* not yet folded into *state*.
+
+        Returns ``None`` when *state* is empty, belongs to another analyzer
+        or version, its stamped bar is missing from *df* or has a different
+        close (history was revised, e.g. split adjustment), or *df* now
+        starts earlier than the state did -- the caller must then rebuild
+        the state from scratch.
+        """
+        if not state or state.get("methodology") != self.name \
+                or state.get("version") != self.version:
+            return None
+        last_date = state.get("last_date")
+        first_date = state.get("first_date")
+        if not isinstance(last_date, str) or not isinstance(first_date, str):
+            return None
+        first_pos, pos = self.locate_dates(df, [first_date, last_date])
+        if first_pos > 0:
+            return None  # df now reaches further back than the state
+        if pos < 0 or float(df["close"].iloc[pos]) != state.get("last_close"):
+            return None
+        return pos + 1
+
+    def stamp_state(self, state: dict[str, Any], df: pd.DataFrame) -> None:
+        """Mark *state* as covering *df* up to its second-to-last bar.
+
+        The newest bar may still be forming (intraday refresh), so state
+        never depends on it.
+        """
+        pos = len(df) - 2
+        state["methodology"] = self.name
+        state["version"] = self.version
+        state["first_date"] = str(df["date"].iloc[0])
+        state["last_date"] = str(df["date"].iloc[pos])
+        state["last_close"] = float(df["close"].iloc[pos])
+
     def validate_input(
         self,
         price_data: pd.DataFrame,
@@ -28,6 +28,7 @@ import numpy as np
 import pandas as pd
 
 from app.analysis.base import BaseMethodology, Direction, Timeframe, MethodologySignal
+from app.analysis.features import BarFeatures, merge_price_volume
 
 # ---------------------------------------------------------------------------
 # Module-level constants
@@ -134,14 +135,15 @@ class CANSLIMAnalyzer(BaseMethodology):
         if fundamentals is None or not fundamentals:
             return self._no_fundamentals_signal(ticker)
 
-        df = self._merge_data(price_data, volume_data)
+        features = self.bar_features(price_data, volume_data, kwargs)
+        df = features.frame
 
         # Evaluate all 7 criteria
         c_result = self._evaluate_c(fundamentals)
         a_result = self._evaluate_a(fundamentals)
-        n_result = self._evaluate_n(df, fundamentals)
-        s_result = self._evaluate_s(df, fundamentals)
-        l_result = self._evaluate_l(df)
+        n_result = self._evaluate_n(df, fundamentals, features)
+        s_result = self._evaluate_s(df, fundamentals, features)
+        l_result = self._evaluate_l(df, features)
         i_result = self._evaluate_i(fundamentals, kwargs)
         m_result = self._evaluate_m(df, kwargs)
 
@@ -167,7 +169,7 @@ class CANSLIMAnalyzer(BaseMethodology):
 
         key_levels = self._build_key_levels(
             total_score, c_result, a_result, n_result,
-            s_result, l_result, i_result, m_result, df,
+            s_result, l_result, i_result, m_result, df, features,
         )
         reasoning = self._build_reasoning(
             ticker, total_score, c_result, a_result, n_result,
@@ -197,10 +199,7 @@ class CANSLIMAnalyzer(BaseMethodology):
         Returns a single DataFrame with columns
         ``[date, open, high, low, close, volume]`` sorted by date ascending.
         """
-        merged = pd.merge(price_data, volume_data, on="date", how="inner")
-        merged["volume"] = merged["volume"].fillna(0.0)
-        merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
-        return merged[["date", "open", "high", "low", "close", "volume"]]
+        return merge_price_volume(price_data, volume_data)
 
     # ------------------------------------------------------------------
     # C - Current quarterly earnings
@@ -307,6 +306,7 @@ class CANSLIMAnalyzer(BaseMethodology):
         self,
         df: pd.DataFrame,
         fundamentals: dict[str, Any],
+        features: BarFeatures | None = None,
     ) -> _CriterionResult:
         """Evaluate the N criterion: new highs, new products, Bollinger breakout.
 
@@ -315,9 +315,11 @@ class CANSLIMAnalyzer(BaseMethodology):
         2. 8-K filing keywords present in fundamentals
         3. Bollinger Band upper breakout
         """
+        if features is None:
+            features = BarFeatures(df)
         current_close = float(df["close"].iloc[-1])
         bars_for_52w = min(_TRADING_YEAR_BARS, len(df))
-        high_52w = float(df["high"].tail(bars_for_52w).max())
+        high_52w = features.tail_max("high", bars_for_52w)
 
         # Check 1: price near 52-week high
         near_high = current_close >= high_52w * (1.0 - _NEAR_52W_HIGH_PCT)
@@ -393,11 +395,14 @@ class CANSLIMAnalyzer(BaseMethodology):
         self,
         df: pd.DataFrame,
         fundamentals: dict[str, Any],
+        features: BarFeatures | None = None,
     ) -> _CriterionResult:
         """Evaluate the S criterion: supply and demand dynamics.
 
         PASS if shares outstanding < 500M OR up/down volume ratio > 1.2.
         """
+        if features is None:
+            features = BarFeatures(df)
         ttm = fundamentals.get("ttm", {})
         shares_outstanding = None
         if isinstance(ttm, dict):
@@ -406,9 +411,9 @@ class CANSLIMAnalyzer(BaseMethodology):
         # Volume ratio analysis
         lookback = min(_VOLUME_LOOKBACK, len(df))
         window = df.tail(lookback)
-        close_shifted = window["close"].shift(1)
-        up_mask = window["close"] > close_shifted
-        down_mask = window["close"] < close_shifted
+        direction = features.close_direction(lookback)
+        up_mask = direction > 0
+        down_mask = direction < 0
 
         up_volumes = window.loc[up_mask, "volume"]
         down_volumes = window.loc[down_mask, "volume"]
@@ -447,14 +452,19 @@ class CANSLIMAnalyzer(BaseMethodology):
     # L - Leader or laggard
     # ------------------------------------------------------------------
 
-    def _evaluate_l(self, df: pd.DataFrame) -> _CriterionResult:
+    def _evaluate_l(
+        self,
+        df: pd.DataFrame,
+        features: BarFeatures | None = None,
+    ) -> _CriterionResult:
         """Evaluate the L criterion: 12-month relative strength.
 
         PASS if the stock's 12-month return exceeds 20%.
         """
+        if features is None:
+            features = BarFeatures(df)
         bars_for_year = min(_TRADING_YEAR_BARS, len(df))
-        start_close = float(df["close"].iloc[-bars_for_year])
-        end_close = float(df["close"].iloc[-1])
+        start_close = float(features.column("close")[-bars_for_year])
 
         if abs(start_close) < _EPSILON:
             return _CriterionResult(
@@ -463,7 +473,7 @@ class CANSLIMAnalyzer(BaseMethodology):
                 data_available=True,
             )
 
-        twelve_month_return = (end_close - start_close) / start_close
+        twelve_month_return = features.period_return(bars_for_year)
 
         if math.isnan(twelve_month_return) or math.isinf(twelve_month_return):
             return _CriterionResult(
@@ -649,10 +659,13 @@ class CANSLIMAnalyzer(BaseMethodology):
         i_result: _CriterionResult,
         m_result: _CriterionResult,
         df: pd.DataFrame,
+        features: BarFeatures | None = None,
     ) -> dict[str, Any]:
         """Construct the ``key_levels`` dict for the output signal."""
+        if features is None:
+            features = BarFeatures(df)
         bars_for_52w = min(_TRADING_YEAR_BARS, len(df))
-        high_52w = float(df["high"].tail(bars_for_52w).max())
+        high_52w = features.tail_max("high", bars_for_52w)
         current_close = float(df["close"].iloc[-1])
 
         pct_vs_52w = (current_close / max(high_52w, _EPSILON) - 1.0) * 100.0
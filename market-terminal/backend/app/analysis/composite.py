@@ -23,6 +23,7 @@ from app.analysis.base import (
     MethodologySignal, OverallDirection, Timeframe,
 )
 from app.data.database import get_database
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -396,8 +397,12 @@ class CompositeAggregator:
         self, composite: CompositeSignal,
         signals: list[MethodologySignal], weights: dict[str, float],
     ) -> None:
-        """Store composite result in the ``analysis_cache`` table."""
-        db = await self._get_db()
+        """Store composite result in the ``analysis_cache`` table.
+
+        In app mode the insert is queued on the write-behind queue; a
+        standalone ``db_path`` connection writes and commits directly.
+        """
+        db = await self._get_db()  # ensures analysis_cache exists
         safe_ticker = _sanitize_ticker(composite.ticker)
         now = datetime.now(tz=timezone.utc).isoformat()
         sql = ("INSERT INTO analysis_cache "
@@ -410,7 +415,7 @@ class CompositeAggregator:
             json.dumps(weights, default=str),
             now)
         if self._db_path is None:
-            await db.execute(sql, params)
+            get_write_behind().put("analysis_cache", (safe_ticker, now), sql, params)
         else:
             await db.execute(sql, params)
             await db.commit()
@@ -425,6 +430,8 @@ class CompositeAggregator:
         quickly once news becomes available rather than serving a stale
         "no articles" result for the full 60-minute window.
         """
+        if self._db_path is None:
+            await get_write_behind().settle("analysis_cache")
         db = await self._get_db()
         safe_ticker = _sanitize_ticker(ticker)
         sql = ("SELECT composite_json, signals_json, created_at FROM analysis_cache "
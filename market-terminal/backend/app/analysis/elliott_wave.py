@@ -35,6 +35,7 @@ import numpy as np
 import pandas as pd
 
 from app.analysis.base import BaseMethodology, MethodologySignal
+from app.analysis.features import BarFeatures, merge_price_volume
 
 # ---------------------------------------------------------------------------
 # Degree registry — (name, min_pct_swing, atr_multiplier, target_bars, max_bars)
@@ -243,7 +244,8 @@ class ElliottWaveAnalyzer(BaseMethodology):
         **kwargs: Any,
     ) -> MethodologySignal:
         self.validate_input(price_data, volume_data)
-        merged = self._merge_data(price_data, volume_data)
+        features = self.bar_features(price_data, volume_data, kwargs)
+        merged = features.frame
         current_price = float(merged["close"].iloc[-1])
         n_bars = len(merged)
 
@@ -262,7 +264,8 @@ class ElliottWaveAnalyzer(BaseMethodology):
             if n_bars < min_bars:
                 continue
             result = self._analyze_degree(
-                name, min_pct, atr_mult, target_bars, max_bars, merged, current_price
+                name, min_pct, atr_mult, target_bars, max_bars, merged, current_price,
+                features,
             )
             degree_results.append(result)
 
@@ -311,9 +314,10 @@ class ElliottWaveAnalyzer(BaseMethodology):
         max_bars: int,
         merged: pd.DataFrame,
         current_price: float,
+        features: BarFeatures | None = None,
     ) -> _DegreeResult:
         result = _DegreeResult(degree=degree)
-        segments = self._construct_segments(merged, min_pct, atr_mult)
+        segments = self._construct_segments(merged, min_pct, atr_mult, features=features)
 
         # Coalesce sub-degree noise so _build_candidates receives
         # segments appropriate for this degree's time scale.
@@ -429,10 +433,7 @@ class ElliottWaveAnalyzer(BaseMethodology):
     def _merge_data(
         self, price_data: pd.DataFrame, volume_data: pd.DataFrame,
     ) -> pd.DataFrame:
-        merged = pd.merge(price_data, volume_data, on="date", how="inner")
-        merged["volume"] = merged["volume"].fillna(0.0)
-        merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
-        return merged[["date", "open", "high", "low", "close", "volume"]]
+        return merge_price_volume(price_data, volume_data)
 
     def _construct_segments(
         self,
@@ -440,27 +441,26 @@ class ElliottWaveAnalyzer(BaseMethodology):
         min_pct: float,
         atr_mult: float,
         pivot_period: int = 50,
+        features: BarFeatures | None = None,
     ) -> list[_WaveSegment]:
-        """Build wave segments for a given degree using ATR-scaled ZigZag."""
-        highs = df["high"].values
-        lows = df["low"].values
-        closes = df["close"].values
+        """Build wave segments for a given degree using ATR-scaled ZigZag.
+
+        *features* (built from *df*) supplies the arrays and median true
+        range, which are then shared across degrees.
+        """
+        if features is None:
+            features = BarFeatures(df)
+        highs = features.column("high")
+        lows = features.column("low")
+        closes = features.column("close")
         n = len(df)
         if n < 3:
             return []
 
         # Compute ATR-based threshold
-        lookback = min(n - 1, pivot_period)
-        true_ranges: list[float] = []
-        for i in range(n - lookback, n):
-            hl = highs[i] - lows[i]
-            hc = abs(highs[i] - closes[i - 1])
-            lc = abs(lows[i] - closes[i - 1])
-            true_ranges.append(max(hl, hc, lc))
+        median_tr = features.median_true_range(pivot_period)
         atr_pct = 0.0
-        if true_ranges:
-            true_ranges.sort()
-            median_tr = true_ranges[len(true_ranges) // 2]
+        if median_tr is not None:
             current_close = float(closes[-1])
             if current_close > 0:
                 atr_pct = (median_tr / current_close) * atr_mult
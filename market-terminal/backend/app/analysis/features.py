@@ -0,0 +1,325 @@
+"""Shared per-bar feature cache for the methodology analyzers.
+
+Every analyzer works on the same merged ``[date, open, high, low, close,
+volume]`` frame and several derive the same primitives from it (true range,
+rolling highs/lows, swing pivots, close-to-close direction, returns).  A
+:class:`BarFeatures` is built once per ``(symbol, interval, last bar)`` by
+:func:`get_bar_features` and handed to every analyzer through the
+``features`` kwarg of :meth:`BaseMethodology.analyze`; each primitive is
+computed lazily with numpy on first use and memoized, so it is computed
+once per analysis run rather than once per analyzer.
+
+Arrays returned here are read-only (analyzers may run concurrently in a
+thread pool and share them) and reproduce the analyzers' former
+per-module computations exactly.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+_CACHE_SIZE = 16
+
+_FrameKey = tuple[int, str, str, float]
+
+
+def merge_price_volume(
+    price_data: pd.DataFrame, volume_data: pd.DataFrame,
+) -> pd.DataFrame:
+    """Merge price and volume frames on ``date`` (inner), oldest first.
+
+    Returns a single DataFrame with columns
+    ``[date, open, high, low, close, volume]``; missing volume becomes 0.
+    """
+    merged = pd.merge(price_data, volume_data, on="date", how="inner")
+    merged["volume"] = merged["volume"].fillna(0.0)
+    merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
+    return merged[["date", "open", "high", "low", "close", "volume"]]
+
+
+def _frame_key(df: pd.DataFrame, value_column: str) -> _FrameKey:
+    """Cheap identity of a frame: length, first/last date, last value."""
+    if df.empty:
+        return (0, "", "", 0.0)
+    return (
+        len(df),
+        str(df["date"].iloc[0]),
+        str(df["date"].iloc[-1]),
+        float(df[value_column].iloc[-1]),
+    )
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.setflags(write=False)
+    return arr
+
+
+# ---------------------------------------------------------------------------
+# BarFeatures
+# ---------------------------------------------------------------------------
+
+
+class BarFeatures:
+    """Lazily computed, memoized per-bar arrays over one OHLCV series.
+
+    Pass ``volume_data=None`` to wrap a frame that is already merged.
+    """
+
+    def __init__(
+        self,
+        price_data: pd.DataFrame,
+        volume_data: pd.DataFrame | None = None,
+    ) -> None:
+        self._price = price_data
+        self._volume = volume_data
+        self._price_key = _frame_key(price_data, "close")
+        self._volume_key = (
+            _frame_key(volume_data, "volume") if volume_data is not None else None
+        )
+        self._memo: dict[tuple[Any, ...], Any] = {}
+
+    def _cached(self, key: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    def matches(
+        self, price_data: pd.DataFrame, volume_data: pd.DataFrame | None = None,
+    ) -> bool:
+        """Whether these features were built from (copies of) these frames."""
+        if price_data is self._price and volume_data is self._volume:
+            return True
+        if _frame_key(price_data, "close") != self._price_key:
+            return False
+        if volume_data is None or self._volume_key is None:
+            return volume_data is None and self._volume_key is None
+        return _frame_key(volume_data, "volume") == self._volume_key
+
+    # -- base series ---------------------------------------------------------
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The merged ``[date, open, high, low, close, volume]`` frame.
+
+        Shared by every analyzer in the run -- treat as read-only.
+        """
+        if self._volume is None:
+            return self._price
+        return self._cached(
+            ("frame",), lambda: merge_price_volume(self._price, self._volume),
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def column(self, name: str) -> np.ndarray:
+        """``float64`` values of an OHLCV column."""
+        return self._cached(
+            ("column", name),
+            lambda: _readonly(self.frame[name].to_numpy(dtype=np.float64, copy=True)),
+        )
+
+    @property
+    def prev_close(self) -> np.ndarray:
+        """Previous bar's close (``NaN`` for the first bar)."""
+        def _compute() -> np.ndarray:
+            closes = self.column("close")
+            out = np.empty_like(closes)
+            out[:1] = np.nan
+            out[1:] = closes[:-1]
+            return _readonly(out)
+        return self._cached(("prev_close",), _compute)
+
+    # -- range / volatility --------------------------------------------------
+
+    @property
+    def true_range(self) -> np.ndarray:
+        """Wilder true range; the first bar (no previous close) is high - low."""
+        def _compute() -> np.ndarray:
+            highs, lows = self.column("high"), self.column("low")
+            pc = self.prev_close
+            tr = highs - lows
+            tr[1:] = np.maximum(
+                tr[1:],
+                np.maximum(np.abs(highs[1:] - pc[1:]), np.abs(lows[1:] - pc[1:])),
+            )
+            return _readonly(tr)
+        return self._cached(("true_range",), _compute)
+
+    def window_true_range(self, lookback: int) -> np.ndarray:
+        """True range of the last *lookback* bars taken as a standalone window.
+
+        The window's first bar uses high - low, as if no earlier bar existed.
+        """
+        def _compute() -> np.ndarray:
+            n = len(self)
+            k = max(0, min(lookback, n))
+            tr = self.true_range[n - k:].copy()
+            if k:
+                tr[0] = self.column("high")[n - k] - self.column("low")[n - k]
+            return _readonly(tr)
+        return self._cached(("window_true_range", lookback), _compute)
+
+    def median_true_range(self, lookback: int) -> float | None:
+        """Upper median of the true range over the last *lookback* bars.
+
+        Every bar in the window must have a previous close, so *lookback*
+        is capped at ``len - 1``.  ``None`` when the window is empty.
+        """
+        def _compute() -> float | None:
+            k = max(0, min(lookback, len(self) - 1))
+            if k == 0:
+                return None
+            window = np.sort(self.true_range[-k:])
+            return float(window[k // 2])
+        return self._cached(("median_true_range", lookback), _compute)
+
+    # -- rolling extremes ----------------------------------------------------
+
+    def rolling_max(self, name: str, window: int) -> np.ndarray:
+        """Trailing *window*-bar max of a column (``NaN`` until the window fills)."""
+        return self._cached(
+            ("rolling_max", name, window),
+            lambda: self._rolling(name, window, np.max),
+        )
+
+    def rolling_min(self, name: str, window: int) -> np.ndarray:
+        """Trailing *window*-bar min of a column (``NaN`` until the window fills)."""
+        return self._cached(
+            ("rolling_min", name, window),
+            lambda: self._rolling(name, window, np.min),
+        )
+
+    def _rolling(self, name: str, window: int, reduce: Callable[..., np.ndarray]) -> np.ndarray:
+        values = self.column(name)
+        out = np.full(len(values), np.nan)
+        if 0 < window <= len(values):
+            views = np.lib.stride_tricks.sliding_window_view(values, window)
+            out[window - 1:] = reduce(views, axis=1)
+        return _readonly(out)
+
+    def tail_max(self, name: str, bars: int) -> float:
+        """Max of a column over the last *bars* bars, skipping ``NaN`` like pandas."""
+        def _compute() -> float:
+            window = self.column(name)[-bars:]
+            if np.isnan(window).all():
+                return float("nan")
+            return float(np.nanmax(window))
+        return self._cached(("tail_max", name, bars), _compute)
+
+    def swing_masks(self, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """Swing-high / swing-low flags for bars ``window .. len - window - 1``.
+
+        A bar is a swing high when its high is >= every high within
+        *window* bars on each side (swing low: low <= every low).  Both
+        masks are empty when there are fewer than ``2 * window + 1`` bars.
+        """
+        def _compute() -> tuple[np.ndarray, np.ndarray]:
+            highs, lows = self.column("high"), self.column("low")
+            n = len(highs)
+            if n < 2 * window + 1:
+                empty = _readonly(np.zeros(0, dtype=bool))
+                return empty, empty
+            centre = slice(window, n - window)
+            high_windows = np.lib.stride_tricks.sliding_window_view(highs, 2 * window + 1)
+            low_windows = np.lib.stride_tricks.sliding_window_view(lows, 2 * window + 1)
+            is_high = ~(high_windows > highs[centre, None]).any(axis=1)
+            is_low = ~(low_windows < lows[centre, None]).any(axis=1)
+            return _readonly(is_high), _readonly(is_low)
+        return self._cached(("swing_masks", window), _compute)
+
+    # -- returns / direction -------------------------------------------------
+
+    def period_return(self, bars: int) -> float:
+        """Simple return from the close *bars* bars back to the last close."""
+        def _compute() -> float:
+            closes = self.column("close")
+            start = float(closes[-bars])
+            return (float(closes[-1]) - start) / start
+        return self._cached(("period_return", bars), _compute)
+
+    def close_direction(self, lookback: int) -> np.ndarray:
+        """Sign of close-to-close change over the last *lookback* bars.
+
+        ``+1`` up, ``-1`` down, ``0`` unchanged.  The window's first bar is
+        0, as if no earlier bar existed.
+        """
+        def _compute() -> np.ndarray:
+            n = len(self)
+            k = max(0, min(lookback, n))
+            closes = self.column("close")[n - k:]
+            direction = np.zeros(k, dtype=np.int8)
+            if k > 1:
+                direction[1:] = np.sign(closes[1:] - closes[:-1]).astype(np.int8)
+            return _readonly(direction)
+        return self._cached(("close_direction", lookback), _compute)
+
+    # -- accumulation / distribution ----------------------------------------
+
+    @property
+    def williams_ad(self) -> np.ndarray:
+        """Per-bar Williams A/D contributions (0 for the first bar).
+
+        Up close: ``close - min(low, prev_close)``; down close:
+        ``close - max(high, prev_close)``; unchanged: 0.
+        """
+        def _compute() -> np.ndarray:
+            closes = self.column("close")
+            pc = self.prev_close
+            out = np.zeros(len(closes))
+            if len(closes) > 1:
+                c, p = closes[1:], pc[1:]
+                up = c - np.minimum(self.column("low")[1:], p)
+                down = c - np.maximum(self.column("high")[1:], p)
+                out[1:] = np.where(c > p, up, np.where(c < p, down, 0.0))
+            return _readonly(out)
+        return self._cached(("williams_ad",), _compute)
+
+    @property
+    def williams_ad_line(self) -> np.ndarray:
+        """Cumulative Williams A/D line."""
+        return self._cached(
+            ("williams_ad_line",), lambda: _readonly(np.cumsum(self.williams_ad)),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Per-run cache
+# ---------------------------------------------------------------------------
+
+_features: OrderedDict[tuple[str, str, str], BarFeatures] = OrderedDict()
+
+
+def get_bar_features(
+    symbol: str,
+    interval: str,
+    price_data: pd.DataFrame,
+    volume_data: pd.DataFrame,
+) -> BarFeatures:
+    """Return the shared :class:`BarFeatures` for ``(symbol, interval, last bar)``.
+
+    A cached entry is reused only when it was built from the same frames;
+    otherwise (e.g. the forming bar's close changed) it is rebuilt.
+    """
+    last = str(price_data["date"].iloc[-1]) if not price_data.empty else ""
+    key = (symbol.upper(), interval, last)
+    features = _features.get(key)
+    if features is None or not features.matches(price_data, volume_data):
+        features = BarFeatures(price_data, volume_data)
+        _features[key] = features
+        while len(_features) > _CACHE_SIZE:
+            _features.popitem(last=False)
+    else:
+        _features.move_to_end(key)
+    return features
+
+
+def clear_bar_features() -> None:
+    """Drop all cached features.  For tests."""
+    _features.clear()
@@ -25,6 +25,7 @@ import numpy as np
 import pandas as pd
 
 from app.analysis.base import BaseMethodology, Direction, MethodologySignal
+from app.analysis.features import BarFeatures, merge_price_volume
 
 # ---------------------------------------------------------------------------
 # Module-level constants
@@ -145,6 +146,73 @@ class _EntryZoneInfo(NamedTuple):
     risk_reward_ratio: float
 
 
+# ---------------------------------------------------------------------------
+# Vectorized array helpers
+# ---------------------------------------------------------------------------
+#
+# The detectors below replace per-bar Python scans with whole-array numpy
+# operations.  NaN handling deliberately mirrors the scalar comparisons they
+# replace (``nan > x`` is False), hence ``fmax``/``fmin`` which skip NaNs.
+
+
+def _block_max_table(values: np.ndarray) -> list[np.ndarray]:
+    """Sparse table of power-of-two block maxima.
+
+    ``table[k][i]`` is the NaN-ignoring max of ``values[i:i + 2**k]``.
+    """
+    table = [values]
+    span = 1
+    while span * 2 <= len(values):
+        prev = table[-1]
+        table.append(np.fmax(prev[:-span], prev[span:]))
+        span *= 2
+    return table
+
+
+def _first_above(
+    values: np.ndarray,
+    starts: np.ndarray,
+    levels: np.ndarray,
+) -> np.ndarray:
+    """For each query, the first ``j >= start`` with ``values[j] > level``.
+
+    Binary-lifts over :func:`_block_max_table`, skipping any block whose
+    maximum does not exceed the level.  Returns ``-1`` where no bar does.
+    """
+    n = len(values)
+    pos = np.asarray(starts, dtype=np.int64).copy()
+    levels = np.asarray(levels, dtype=np.float64)
+    if n == 0 or len(pos) == 0:
+        return np.full(len(pos), -1, dtype=np.int64)
+    table = _block_max_table(values)
+    for k in range(len(table) - 1, -1, -1):
+        block = table[k]
+        span = 1 << k
+        fits = pos + span <= n
+        block_max = block[np.where(fits, pos, 0)]
+        pos += np.where(fits & ~(block_max > levels), span, 0)
+    hit = (pos < n) & (values[np.minimum(pos, n - 1)] > levels)
+    return np.where(hit, pos, -1)
+
+
+def _suffix_min(values: np.ndarray) -> np.ndarray:
+    """``out[i]`` = NaN-ignoring min of ``values[i:]`` (NaN past the end)."""
+    out = np.fmin.accumulate(values[::-1])[::-1]
+    return np.append(out, np.nan)
+
+
+def _suffix_max(values: np.ndarray) -> np.ndarray:
+    """``out[i]`` = NaN-ignoring max of ``values[i:]`` (NaN past the end)."""
+    out = np.fmax.accumulate(values[::-1])[::-1]
+    return np.append(out, np.nan)
+
+
+def _last_true_at_or_before(mask: np.ndarray) -> np.ndarray:
+    """``out[i]`` = the last index ``j <= i`` where *mask* is set, else -1."""
+    idx = np.where(mask, np.arange(len(mask)), -1)
+    return np.maximum.accumulate(idx) if len(idx) else idx
+
+
 # ---------------------------------------------------------------------------
 # ICTSmartMoneyAnalyzer
 # ---------------------------------------------------------------------------
@@ -163,6 +231,7 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
     display_name: str = "ICT Smart Money Concepts"
     default_timeframe: str = "short"
     version: str = "1.0.0"
+    supports_incremental: bool = True
 
     # ------------------------------------------------------------------
     # Public API (BaseMethodology contract)
@@ -183,7 +252,9 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
             price_data: DataFrame with columns ``[date, open, high, low, close]``.
             volume_data: DataFrame with columns ``[date, volume]``.
             fundamentals: Not used by ICT (ignored).
-            **kwargs: Reserved for future extension.
+            **kwargs: ``incremental_state`` (optional dict) resumes swing
+                detection from a previous run; see
+                :meth:`_detect_swings_incremental`.
 
         Returns:
             A :class:`MethodologySignal` populated with ICT-specific
@@ -194,8 +265,13 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
         """
         self.validate_input(price_data, volume_data)
 
-        df = self._merge_data(price_data, volume_data)
-        swings = self._detect_swings(df)
+        features = self.bar_features(price_data, volume_data, kwargs)
+        df = features.frame
+        state = kwargs.get("incremental_state")
+        if state is None:
+            swings = self._detect_swings(df, features)
+        else:
+            swings = self._detect_swings_incremental(df, state, features)
 
         # If no swings, return early with neutral signal
         if not swings:
@@ -253,68 +329,89 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
         Returns a single DataFrame with columns
         ``[date, open, high, low, close, volume]`` sorted by date ascending.
         """
-        merged = pd.merge(price_data, volume_data, on="date", how="inner")
-        merged["volume"] = merged["volume"].fillna(0.0)
-        merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
-        return merged[["date", "open", "high", "low", "close", "volume"]]
+        return merge_price_volume(price_data, volume_data)
 
     # ------------------------------------------------------------------
     # Swing detection
     # ------------------------------------------------------------------
 
-    def _detect_swings(self, df: pd.DataFrame) -> list[_SwingPoint]:
+    def _detect_swings(
+        self, df: pd.DataFrame, features: BarFeatures | None = None,
+    ) -> list[_SwingPoint]:
         """Detect swing highs and swing lows across the DataFrame.
 
         A swing high occurs when a bar's high is >= all highs within
         ``_SWING_WINDOW`` bars on each side.  A swing low occurs when a
         bar's low is <= all lows within the same window.  Results are
-        returned sorted by index ascending.
+        returned sorted by index ascending (a high before a low on the
+        same bar).  *features*, when given, must be built from *df*.
         """
-        highs = df["high"].values
-        lows = df["low"].values
-        n = len(df)
-        swings: list[_SwingPoint] = []
+        if features is None:
+            features = BarFeatures(df)
+        highs = features.column("high")
+        lows = features.column("low")
+        dates = df["date"].array
         w = _SWING_WINDOW
+        if len(df) < 2 * w + 1:
+            return []
 
-        for i in range(w, n - w):
-            left_start = i - w
-            right_end = i + w + 1
+        is_high, is_low = features.swing_masks(w)
 
-            # Swing high: current high >= all highs in window on both sides
-            is_swing_high = True
-            for j in range(left_start, right_end):
-                if j == i:
-                    continue
-                if highs[j] > highs[i]:
-                    is_swing_high = False
-                    break
-
-            if is_swing_high:
+        swings: list[_SwingPoint] = []
+        for offset in np.flatnonzero(is_high | is_low).tolist():
+            i = offset + w
+            if is_high[offset]:
                 swings.append(_SwingPoint(
-                    index=i,
-                    price=float(highs[i]),
-                    date=str(df.iloc[i]["date"]),
-                    swing_type="high",
+                    index=i, price=float(highs[i]),
+                    date=str(dates[i]), swing_type="high",
                 ))
-
-            # Swing low: current low <= all lows in window on both sides
-            is_swing_low = True
-            for j in range(left_start, right_end):
-                if j == i:
-                    continue
-                if lows[j] < lows[i]:
-                    is_swing_low = False
-                    break
-
-            if is_swing_low:
+            if is_low[offset]:
                 swings.append(_SwingPoint(
-                    index=i,
-                    price=float(lows[i]),
-                    date=str(df.iloc[i]["date"]),
-                    swing_type="low",
+                    index=i, price=float(lows[i]),
+                    date=str(dates[i]), swing_type="low",
                 ))
+        return swings
 
-        swings.sort(key=lambda s: s.index)
+    def _detect_swings_incremental(
+        self,
+        df: pd.DataFrame,
+        state: dict[str, Any],
+        features: BarFeatures | None = None,
+    ) -> list[_SwingPoint]:
+        """:meth:`_detect_swings` resumed from *state*, which is updated in place.
+
+        *state* keeps ``swings`` as ``[date, price, type]`` for every swing
+        whose +/- ``_SWING_WINDOW`` window lies in bars it already covers;
+        those are reused and only the tail of *df* is rescanned.  Falls back
+        to a full scan when the state does not match *df*.
+        """
+        w = _SWING_WINDOW
+        resume = self.resume_index(state, df)
+        # First bar whose window reaches past the bars covered by state
+        rescan_from = resume - w if resume is not None else -1
+        if rescan_from < w:
+            swings = self._detect_swings(df, features)
+        else:
+            stored = state.get("swings") or []
+            positions = self.locate_dates(df, [sw[0] for sw in stored])
+            swings = [
+                _SwingPoint(index=i, price=float(price), date=date, swing_type=kind)
+                for (date, price, kind), i in zip(stored, positions)
+                if w <= i < rescan_from
+            ]
+            offset = rescan_from - w
+            swings.extend(
+                sp._replace(index=sp.index + offset)
+                for sp in self._detect_swings(df.iloc[offset:])
+            )
+
+        final_through = len(df) - 2 - w
+        state.clear()
+        state["swings"] = [
+            [sp.date, sp.price, sp.swing_type]
+            for sp in swings if sp.index <= final_through
+        ]
+        self.stamp_state(state, df)
         return swings
 
     # ------------------------------------------------------------------
@@ -443,87 +540,83 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
         bullish candle (close > open) before a move that breaks a prior
         swing low.  Mitigation status is tracked for all detected OBs.
 
+        The first break of each swing is found for all swings at once
+        (:func:`_first_above`), the candle before it via a running index
+        of the last bearish/bullish bar, and mitigation via suffix
+        min/max of lows/highs.
+
         Returns all OBs (mitigated and unmitigated) sorted by index
         descending (most recent first).
         """
-        n = len(df)
-        opens = df["open"].values
-        highs = df["high"].values
-        lows = df["low"].values
-        closes = df["close"].values
+        opens = df["open"].to_numpy(dtype=np.float64)
+        highs = df["high"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        closes = df["close"].to_numpy(dtype=np.float64)
+        dates = df["date"].array
+
+        swing_highs = [s for s in swings if s.swing_type == "high"]
+        swing_lows = [s for s in swings if s.swing_type == "low"]
+
+        def _candidates(
+            group: list[_SwingPoint], breaks: np.ndarray, last_candle: np.ndarray,
+        ) -> list[tuple[int, int]]:
+            """``(swing_index, ob_index)`` per swing that was broken."""
+            out: list[tuple[int, int]] = []
+            for sw, brk in zip(group, breaks.tolist()):
+                if brk < 0:
+                    continue
+                ob_idx = int(last_candle[brk - 1])
+                if ob_idx >= sw.index:
+                    out.append((sw.index, ob_idx))
+            return out
+
+        # Bullish OBs: last bearish candle before the break above a swing high
+        bull_breaks = _first_above(
+            highs,
+            np.array([s.index + 1 for s in swing_highs], dtype=np.int64),
+            np.array([s.price for s in swing_highs], dtype=np.float64),
+        )
+        # Bearish OBs: last bullish candle before the break below a swing low
+        bear_breaks = _first_above(
+            -lows,
+            np.array([s.index + 1 for s in swing_lows], dtype=np.int64),
+            -np.array([s.price for s in swing_lows], dtype=np.float64),
+        )
+        last_bearish = _last_true_at_or_before(closes < opens)
+        last_bullish = _last_true_at_or_before(closes > opens)
+        min_low_after = _suffix_min(lows)
+        max_high_after = _suffix_max(highs)
 
         order_blocks: list[_OrderBlock] = []
         seen_indices: set[int] = set()
 
-        swing_highs = [s for s in swings if s.swing_type == "high"]
-        swing_lows = [s for s in swings if s.swing_type == "low"]
+        for _, ob_idx in _candidates(swing_highs, bull_breaks, last_bearish):
+            if ob_idx in seen_indices:
+                continue
+            seen_indices.add(ob_idx)
+            ob_low = float(lows[ob_idx])
+            order_blocks.append(_OrderBlock(
+                ob_type="bullish",
+                high=float(max(opens[ob_idx], closes[ob_idx])),
+                low=ob_low,
+                date=str(dates[ob_idx]),
+                index=ob_idx,
+                mitigated=bool(min_low_after[ob_idx + 1] <= ob_low),
+            ))
 
-        # Bullish OBs: find bearish candle before move that breaks swing high
-        for sh in swing_highs:
-            target_level = sh.price
-            # Look for bars after the swing high that break above it
-            for i in range(sh.index + 1, n):
-                if highs[i] > target_level:
-                    # Found the break bar. Walk backward to find last bearish candle
-                    ob_idx: int | None = None
-                    for j in range(i - 1, max(sh.index - 1, -1), -1):
-                        if closes[j] < opens[j]:
-                            ob_idx = j
-                            break
-
-                    if ob_idx is not None and ob_idx not in seen_indices:
-                        seen_indices.add(ob_idx)
-                        ob_high = float(max(opens[ob_idx], closes[ob_idx]))
-                        ob_low = float(lows[ob_idx])
-
-                        # Check mitigation: any bar after OB trades through zone
-                        mitigated = False
-                        for k in range(ob_idx + 1, n):
-                            if lows[k] <= ob_low:
-                                mitigated = True
-                                break
-
-                        order_blocks.append(_OrderBlock(
-                            ob_type="bullish",
-                            high=ob_high,
-                            low=ob_low,
-                            date=str(df.iloc[ob_idx]["date"]),
-                            index=ob_idx,
-                            mitigated=mitigated,
-                        ))
-                    break  # Only use the first break of this swing
-
-        # Bearish OBs: find bullish candle before move that breaks swing low
-        for sl in swing_lows:
-            target_level = sl.price
-            for i in range(sl.index + 1, n):
-                if lows[i] < target_level:
-                    ob_idx = None
-                    for j in range(i - 1, max(sl.index - 1, -1), -1):
-                        if closes[j] > opens[j]:
-                            ob_idx = j
-                            break
-
-                    if ob_idx is not None and ob_idx not in seen_indices:
-                        seen_indices.add(ob_idx)
-                        ob_high = float(highs[ob_idx])
-                        ob_low = float(min(opens[ob_idx], closes[ob_idx]))
-
-                        mitigated = False
-                        for k in range(ob_idx + 1, n):
-                            if highs[k] >= ob_high:
-                                mitigated = True
-                                break
-
-                        order_blocks.append(_OrderBlock(
-                            ob_type="bearish",
-                            high=ob_high,
-                            low=ob_low,
-                            date=str(df.iloc[ob_idx]["date"]),
-                            index=ob_idx,
-                            mitigated=mitigated,
-                        ))
-                    break
+        for _, ob_idx in _candidates(swing_lows, bear_breaks, last_bullish):
+            if ob_idx in seen_indices:
+                continue
+            seen_indices.add(ob_idx)
+            ob_high = float(highs[ob_idx])
+            order_blocks.append(_OrderBlock(
+                ob_type="bearish",
+                high=ob_high,
+                low=float(min(opens[ob_idx], closes[ob_idx])),
+                date=str(dates[ob_idx]),
+                index=ob_idx,
+                mitigated=bool(max_high_after[ob_idx + 1] >= ob_high),
+            ))
 
         order_blocks.sort(key=lambda ob: ob.index, reverse=True)
         return order_blocks
@@ -538,86 +631,66 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
         A bullish FVG appears when candle 1's high < candle 3's low,
         creating an imbalance zone.  A bearish FVG appears when candle
         1's low > candle 3's high.  Partially filled FVGs track the
-        percentage of the gap that has been retraced.  Fully filled FVGs
-        (fill_percent >= 1.0) are excluded.
+        percentage of the gap that has been retraced (deepest later low /
+        high, from suffix min/max).  Fully filled FVGs (fill_percent >= 1.0)
+        are excluded.
 
         Returns unfilled/partially filled FVGs sorted by index descending,
         limited to ``_MAX_FVGS`` most recent.
         """
         n = len(df)
-        highs = df["high"].values
-        lows = df["low"].values
+        if n < 3:
+            return []
+        highs = df["high"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        dates = df["date"].array
+
+        c1_high, c1_low = highs[:-2], lows[:-2]
+        c3_high, c3_low = highs[2:], lows[2:]
+        # Deepest retrace by any bar after candle 3 (NaN when there is none)
+        min_low_after = _suffix_min(lows)[3:]
+        max_high_after = _suffix_max(highs)[3:]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            bull_gap = c3_low - c1_high
+            bull_pen = np.fmax(c3_low - min_low_after, 0.0)
+            bull_fill = np.minimum(bull_pen / bull_gap, 1.0)
+            bull = c1_high < c3_low
+            bull_skip = bull & ((bull_gap < _EPSILON) | (bull_fill >= 1.0))
+
+            bear_gap = c1_low - c3_high
+            bear_pen = np.fmax(max_high_after - c3_high, 0.0)
+            bear_fill = np.minimum(bear_pen / bear_gap, 1.0)
+            # A skipped bullish gap on the same bar also skips the bearish check
+            bear = (c1_low > c3_high) & ~bull_skip
+            bear_skip = bear & ((bear_gap < _EPSILON) | (bear_fill >= 1.0))
+
+        keep_bull = bull & ~bull_skip
+        keep_bear = bear & ~bear_skip
 
         fvgs: list[_FairValueGap] = []
-
-        for i in range(2, n):
-            c1_high = float(highs[i - 2])
-            c1_low = float(lows[i - 2])
-            c3_high = float(highs[i])
-            c3_low = float(lows[i])
-
-            # Bullish FVG: candle 1 high < candle 3 low
-            if c1_high < c3_low:
-                fvg_low = c1_high
-                fvg_high = c3_low
-                gap_size = fvg_high - fvg_low
-
-                if gap_size < _EPSILON:
-                    continue
-
-                # Calculate fill from subsequent bars
-                max_penetration = 0.0
-                for k in range(i + 1, n):
-                    pen = fvg_high - float(lows[k])
-                    if pen > max_penetration:
-                        max_penetration = pen
-
-                fill_pct = max_penetration / gap_size
-                fill_pct = max(0.0, min(1.0, fill_pct))
-
-                if fill_pct >= 1.0:
-                    continue
-
+        # Walk from the most recent bar; bullish before bearish on a tie.
+        for k in np.flatnonzero(keep_bull | keep_bear)[::-1].tolist():
+            if keep_bull[k]:
                 fvgs.append(_FairValueGap(
                     fvg_type="bullish",
-                    high=fvg_high,
-                    low=fvg_low,
-                    date=str(df.iloc[i - 1]["date"]),  # middle candle date
-                    index=i - 1,
-                    fill_percent=fill_pct,
+                    high=float(c3_low[k]),
+                    low=float(c1_high[k]),
+                    date=str(dates[k + 1]),  # middle candle date
+                    index=k + 1,
+                    fill_percent=float(bull_fill[k]),
                 ))
-
-            # Bearish FVG: candle 1 low > candle 3 high
-            if c1_low > c3_high:
-                fvg_high = c1_low
-                fvg_low = c3_high
-                gap_size = fvg_high - fvg_low
-
-                if gap_size < _EPSILON:
-                    continue
-
-                max_penetration = 0.0
-                for k in range(i + 1, n):
-                    pen = float(highs[k]) - fvg_low
-                    if pen > max_penetration:
-                        max_penetration = pen
-
-                fill_pct = max_penetration / gap_size
-                fill_pct = max(0.0, min(1.0, fill_pct))
-
-                if fill_pct >= 1.0:
-                    continue
-
+            if keep_bear[k]:
                 fvgs.append(_FairValueGap(
                     fvg_type="bearish",
-                    high=fvg_high,
-                    low=fvg_low,
-                    date=str(df.iloc[i - 1]["date"]),
-                    index=i - 1,
-                    fill_percent=fill_pct,
+                    high=float(c1_low[k]),
+                    low=float(c3_high[k]),
+                    date=str(dates[k + 1]),
+                    index=k + 1,
+                    fill_percent=float(bear_fill[k]),
                 ))
-
-        fvgs.sort(key=lambda f: f.index, reverse=True)
+            if len(fvgs) >= _MAX_FVGS:
+                break
         return fvgs[:_MAX_FVGS]
 
     # ------------------------------------------------------------------
@@ -637,73 +710,56 @@ class ICTSmartMoneyAnalyzer(BaseMethodology):
         wicks below a prior swing low and reverses back above (bullish
         implication).
 
-        Scans the last ``_SWEEP_LOOKBACK`` bars.
+        Scans the last ``_SWEEP_LOOKBACK`` bars.  Each swing bar index can
+        be swept once: the earliest qualifying bar wins, buy-side before
+        sell-side on the same bar.
 
         Returns sweeps sorted by index descending.
         """
         n = len(df)
-        highs = df["high"].values
-        lows = df["low"].values
-        closes = df["close"].values
-
         sweep_start = max(0, n - _SWEEP_LOOKBACK)
-        sweeps: list[_LiquiditySweep] = []
-        used_swings: set[int] = set()
-
-        swing_highs = [s for s in swings if s.swing_type == "high" and s.index < sweep_start]
-        swing_lows = [s for s in swings if s.swing_type == "low" and s.index < sweep_start]
-
-        # Also include swings within the sweep window that occurred before
-        # the bar being tested
-        all_swing_highs = [s for s in swings if s.swing_type == "high"]
-        all_swing_lows = [s for s in swings if s.swing_type == "low"]
+        if n == 0 or not swings:
+            return []
+        highs = df["high"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        closes = df["close"].to_numpy(dtype=np.float64)
+        dates = df["date"].array
+
+        bars = np.arange(sweep_start, n)
+        # Min / max close over each bar and the following _SWEEP_MAX_BARS
+        padded = np.append(closes, np.full(_SWEEP_MAX_BARS, np.nan))
+        windows = np.lib.stride_tricks.sliding_window_view(
+            padded, _SWEEP_MAX_BARS + 1,
+        )[sweep_start:n]
+        min_close_ahead = np.fmin.reduce(windows, axis=1)
+        max_close_ahead = np.fmax.reduce(windows, axis=1)
+
+        swing_idx = np.array([s.index for s in swings], dtype=np.int64)
+        level = np.array([s.price for s in swings], dtype=np.float64)[:, None]
+        is_high = np.array([s.swing_type == "high" for s in swings])[:, None]
+        is_low = np.array([s.swing_type == "low" for s in swings])[:, None]
+        prior = swing_idx[:, None] < bars[None, :]
+        buy_side = is_high & prior & (highs[bars][None, :] > level) & (min_close_ahead[None, :] < level)
+        sell_side = is_low & prior & (lows[bars][None, :] < level) & (max_close_ahead[None, :] > level)
+        hit = buy_side | sell_side
+
+        # Earliest event per swing, then one winner per swing bar index in
+        # processing order: bar, buy-side first, then list position.
+        winners: dict[int, tuple[int, int, int]] = {}
+        for pos in np.flatnonzero(hit.any(axis=1)).tolist():
+            sw = swings[pos]
+            event = (int(bars[np.argmax(hit[pos])]), 0 if sw.swing_type == "high" else 1, pos)
+            if sw.index not in winners or event < winners[sw.index]:
+                winners[sw.index] = event
 
-        for i in range(sweep_start, n):
-            # Buy-side sweep: bar high exceeds a prior swing high
-            for sh in all_swing_highs:
-                if sh.index >= i or sh.index in used_swings:
-                    continue
-                if highs[i] > sh.price:
-                    # Check reversal: close of this bar or within next bars
-                    # falls back below the swing high
-                    reversed_below = False
-                    check_end = min(i + _SWEEP_MAX_BARS + 1, n)
-                    for j in range(i, check_end):
-                        if closes[j] < sh.price:
-                            reversed_below = True
-                            break
-
-                    if reversed_below:
-                        used_swings.add(sh.index)
-                        sweeps.append(_LiquiditySweep(
-                            sweep_type="buy_side",
-                            level=sh.price,
-                            date=str(df.iloc[i]["date"]),
-                            index=i,
-                        ))
-
-            # Sell-side sweep: bar low goes below a prior swing low
-            for sl in all_swing_lows:
-                if sl.index >= i or sl.index in used_swings:
-                    continue
-                if lows[i] < sl.price:
-                    reversed_above = False
-                    check_end = min(i + _SWEEP_MAX_BARS + 1, n)
-                    for j in range(i, check_end):
-                        if closes[j] > sl.price:
-                            reversed_above = True
-                            break
-
-                    if reversed_above:
-                        used_swings.add(sl.index)
-                        sweeps.append(_LiquiditySweep(
-                            sweep_type="sell_side",
-                            level=sl.price,
-                            date=str(df.iloc[i]["date"]),
-                            index=i,
-                        ))
-
-        sweeps.sort(key=lambda s: s.index, reverse=True)
+        sweeps: list[_LiquiditySweep] = []
+        for bar, kind, pos in sorted(winners.values(), key=lambda e: (-e[0], e[1], e[2])):
+            sweeps.append(_LiquiditySweep(
+                sweep_type="buy_side" if kind == 0 else "sell_side",
+                level=swings[pos].price,
+                date=str(dates[bar]),
+                index=bar,
+            ))
         return sweeps
 
     # ------------------------------------------------------------------
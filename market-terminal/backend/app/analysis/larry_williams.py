@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 
 from app.analysis.base import BaseMethodology, Direction, Timeframe, MethodologySignal
+from app.analysis.features import BarFeatures, merge_price_volume
 
 # ---------------------------------------------------------------------------
 # Module-level constants
@@ -117,6 +118,7 @@ class LarryWilliamsAnalyzer(BaseMethodology):
     display_name: str = "Larry Williams Indicators"
     default_timeframe: str = "short"
     version: str = "1.0.0"
+    supports_incremental: bool = True
 
     # ------------------------------------------------------------------
     # Public API
@@ -132,13 +134,16 @@ class LarryWilliamsAnalyzer(BaseMethodology):
     ) -> MethodologySignal:
         self.validate_input(price_data, volume_data)
 
-        df = self._merge_data(price_data, volume_data)
+        features = self.bar_features(price_data, volume_data, kwargs)
+        df = features.frame
         cot_data = kwargs.get("cot_data")
 
-        wr_result = self._analyze_williams_r(df)
+        wr_result = self._analyze_williams_r(df, features)
         cot_result = self._analyze_cot(cot_data)
         seasonal_result = self._analyze_seasonal(df)
-        ad_result = self._analyze_accumulation_distribution(df)
+        ad_result = self._analyze_accumulation_distribution(
+            df, kwargs.get("incremental_state"), features,
+        )
 
         composite = self._calculate_composite(
             wr_result, cot_result, seasonal_result, ad_result,
@@ -179,24 +184,23 @@ class LarryWilliamsAnalyzer(BaseMethodology):
         self, price_data: pd.DataFrame, volume_data: pd.DataFrame,
     ) -> pd.DataFrame:
         """Inner-join price and volume on ``date``; fill missing volume with 0."""
-        merged = pd.merge(price_data, volume_data, on="date", how="inner")
-        merged["volume"] = merged["volume"].fillna(0.0)
-        merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
-        return merged[["date", "open", "high", "low", "close", "volume"]]
+        return merge_price_volume(price_data, volume_data)
 
     # ------------------------------------------------------------------
     # Williams %R
     # ------------------------------------------------------------------
 
-    def _analyze_williams_r(self, df: pd.DataFrame) -> _WilliamsRResult:
+    def _analyze_williams_r(
+        self, df: pd.DataFrame, features: BarFeatures | None = None,
+    ) -> _WilliamsRResult:
         """Calculate Williams %R (14/28) with crossover and divergence signals."""
+        if features is None:
+            features = BarFeatures(df)
         n = len(df)
-        closes = df["close"].values
-        highs = df["high"].values
-        lows = df["low"].values
+        wr_series = self._wr_series(features, _WR_PERIOD_SHORT)
 
-        wr_14 = self._compute_wr(highs, lows, closes, _WR_PERIOD_SHORT) if n >= _WR_PERIOD_SHORT else 0.0
-        wr_28 = self._compute_wr(highs, lows, closes, _WR_PERIOD_LONG) if n >= _WR_PERIOD_LONG else wr_14
+        wr_14 = float(wr_series[-1]) if n >= _WR_PERIOD_SHORT else 0.0
+        wr_28 = float(self._wr_series(features, _WR_PERIOD_LONG)[-1]) if n >= _WR_PERIOD_LONG else wr_14
 
         if n < _WR_PERIOD_SHORT:
             zone = "neutral"
@@ -209,9 +213,9 @@ class LarryWilliamsAnalyzer(BaseMethodology):
 
         signal = "none"
         if n >= _WR_PERIOD_SHORT + _WR_CROSSOVER_LOOKBACK:
-            signal = self._detect_wr_crossover(highs, lows, closes, wr_14)
+            signal = self._detect_wr_crossover(wr_series, wr_14)
         if signal == "none" and n >= _WR_PERIOD_SHORT + _WR_DIVERGENCE_LOOKBACK:
-            signal = self._detect_wr_divergence(highs, lows, closes)
+            signal = self._detect_wr_divergence(features.column("close"), wr_series)
 
         score = self._wr_score(wr_14, zone, signal)
         return _WilliamsRResult(wr_14=wr_14, wr_28=wr_28, zone=zone, signal=signal, score=score)
@@ -229,32 +233,46 @@ class LarryWilliamsAnalyzer(BaseMethodology):
             return -50.0
         return max(-100.0, min(0.0, wr))
 
-    def _detect_wr_crossover(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, current_wr: float) -> str:
+    @staticmethod
+    def _wr_series(features: BarFeatures, period: int) -> np.ndarray:
+        """Williams %R at every bar, as :meth:`_compute_wr` would give it.
+
+        Bars before the first full *period* window are ``NaN``.
+        """
+        highest_high = features.rolling_max("high", period)
+        lowest_low = features.rolling_min("low", period)
+        closes = features.column("close")
+        hl_range = highest_high - lowest_low
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wr = (highest_high - closes) / hl_range * -100.0
+        wr = np.where(np.isfinite(wr), np.clip(wr, -100.0, 0.0), -50.0)
+        wr[hl_range < _EPSILON] = -50.0
+        wr[:period - 1] = np.nan
+        return wr
+
+    def _detect_wr_crossover(self, wr_series: np.ndarray, current_wr: float) -> str:
         """Bullish: was <= -80, now > -80.  Bearish: was >= -20, now < -20."""
-        n = len(closes)
+        n = len(wr_series)
         for offset in range(1, _WR_CROSSOVER_LOOKBACK + 1):
             idx = n - 1 - offset
             if idx < _WR_PERIOD_SHORT - 1:
                 break
-            prev_wr = self._compute_wr(highs[:idx + 1], lows[:idx + 1], closes[:idx + 1], _WR_PERIOD_SHORT)
+            prev_wr = float(wr_series[idx])
             if prev_wr <= _WR_OVERSOLD and current_wr > _WR_OVERSOLD:
                 return "bullish_crossover"
             if prev_wr >= _WR_OVERBOUGHT and current_wr < _WR_OVERBOUGHT:
                 return "bearish_crossover"
         return "none"
 
-    def _detect_wr_divergence(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> str:
+    def _detect_wr_divergence(self, closes: np.ndarray, wr_series: np.ndarray) -> str:
         """Bullish div: lower price lows + higher %R lows.  Bearish: opposite."""
         n = len(closes)
         lookback = min(_WR_DIVERGENCE_LOOKBACK, n - _WR_PERIOD_SHORT)
         if lookback < 2:
             return "none"
 
-        wr_values: list[float] = []
-        for i in range(n - lookback, n):
-            if i < _WR_PERIOD_SHORT - 1:
-                continue
-            wr_values.append(self._compute_wr(highs[:i + 1], lows[:i + 1], closes[:i + 1], _WR_PERIOD_SHORT))
+        start = max(n - lookback, _WR_PERIOD_SHORT - 1)
+        wr_values = wr_series[start:n].tolist()
 
         if len(wr_values) < 2:
             return "none"
@@ -399,22 +417,47 @@ class LarryWilliamsAnalyzer(BaseMethodology):
     # Williams Accumulation/Distribution
     # ------------------------------------------------------------------
 
-    def _analyze_accumulation_distribution(self, df: pd.DataFrame) -> _ADResult:
-        """Williams A/D with slope-based divergence detection."""
+    def _analyze_accumulation_distribution(
+        self,
+        df: pd.DataFrame,
+        state: dict[str, Any] | None = None,
+        features: BarFeatures | None = None,
+    ) -> _ADResult:
+        """Williams A/D with slope-based divergence detection.
+
+        With an incremental *state* the A/D running total and the last
+        ``_AD_SLOPE_LOOKBACK`` line values are carried over, so only bars
+        after the state's stamp are accumulated.  The line stays anchored
+        at the first bar the state saw; slope and range are unaffected.
+        """
         n = len(df)
         closes = df["close"].values.astype(float)
         highs = df["high"].values.astype(float)
         lows = df["low"].values.astype(float)
 
-        ad_values = np.zeros(n, dtype=float)
-        for i in range(1, n):
-            c, pc, lo, hi = closes[i], closes[i - 1], lows[i], highs[i]
-            if c > pc:
-                ad_values[i] = c - min(lo, pc)
-            elif c < pc:
-                ad_values[i] = c - max(hi, pc)
-
-        ad_line = np.cumsum(ad_values)
+        resume = self.resume_index(state, df) if state is not None else None
+        if resume is not None and len(state.get("ad_tail") or ()) < min(
+            _AD_SLOPE_LOOKBACK, resume,
+        ):
+            resume = None
+        if resume is None and features is not None:
+            ad_line = features.williams_ad_line
+        elif resume is None:
+            ad_line = np.cumsum(self._ad_values(closes, highs, lows, 1))
+        else:
+            # Seeding cumsum with the carried total keeps the summation order
+            # (and so the floats) identical to a full pass.
+            carried = np.asarray(state["ad_tail"], dtype=float)
+            new_values = self._ad_values(closes, highs, lows, resume)[resume:]
+            ad_line = np.concatenate([
+                carried,
+                np.cumsum(np.concatenate([carried[-1:], new_values]))[1:],
+            ])
+
+        if state is not None and n >= 2:
+            state.clear()
+            state["ad_tail"] = ad_line[:-1][-_AD_SLOPE_LOOKBACK:].tolist()
+            self.stamp_state(state, df)
 
         lookback = min(_AD_SLOPE_LOOKBACK, n - 1)
         if lookback < 2:
@@ -457,6 +500,21 @@ class LarryWilliamsAnalyzer(BaseMethodology):
 
         return _ADResult(ad_slope, divergence, score)
 
+    @staticmethod
+    def _ad_values(
+        closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, start: int,
+    ) -> np.ndarray:
+        """Per-bar Williams A/D contributions for bars ``start..n-1`` (0 before)."""
+        n = len(closes)
+        ad_values = np.zeros(n, dtype=float)
+        for i in range(max(start, 1), n):
+            c, pc, lo, hi = closes[i], closes[i - 1], lows[i], highs[i]
+            if c > pc:
+                ad_values[i] = c - min(lo, pc)
+            elif c < pc:
+                ad_values[i] = c - max(hi, pc)
+        return ad_values
+
     @staticmethod
     def _safe_slope(x: np.ndarray, y: np.ndarray) -> float:
         if len(x) < 2 or np.all(y == y[0]):
@@ -10,7 +10,9 @@ Full implementation: TASK-ANALYSIS-007
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import logging
 import math
 import re
 from pathlib import Path
@@ -22,6 +24,8 @@ import pandas as pd
 
 from app.analysis.base import BaseMethodology, Direction, MethodologySignal
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Module-level constants
 # ---------------------------------------------------------------------------
@@ -38,6 +42,12 @@ _MAX_THEMES: int = 5
 _MIN_THEME_WORD_LEN: int = 4
 _MAX_TICKER_LEN: int = 10
 _FINBERT_MAX_TOKENS: int = 512
+_FINBERT_MODEL_ID: str = "ProsusAI/finbert"
+_FINBERT_BATCH_SIZE: int = 32
+# Stored in news_cache.sentiment_model; bump when FinBERT scoring changes so
+# persisted scores are recomputed instead of reused.
+_FINBERT_SCORE_VERSION: str = "finbert:ProsusAI/finbert:1"
+_SCORE_CACHE_CHUNK: int = 500
 _NO_ARTICLES_CONFIDENCE: float = 0.1
 
 # ---------------------------------------------------------------------------
@@ -96,13 +106,135 @@ def get_finbert() -> tuple[Any, Any]:
             AutoModelForSequenceClassification,
             AutoTokenizer,
         )
-        _finbert_tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
+        _finbert_tokenizer = AutoTokenizer.from_pretrained(_FINBERT_MODEL_ID)
         _finbert_model = AutoModelForSequenceClassification.from_pretrained(
-            "ProsusAI/finbert",
+            _FINBERT_MODEL_ID,
         )
     return _finbert_model, _finbert_tokenizer
 
 
+def _finbert_probs(texts: list[str]) -> list[tuple[float, float]]:
+    """FinBERT ``(positive, negative)`` probabilities for each of *texts*.
+
+    Blocking; texts are length-sorted and run as padded batches of
+    ``_FINBERT_BATCH_SIZE`` so short headlines are not padded to long ones.
+    """
+    import torch  # type: ignore[import-untyped]
+
+    model, tokenizer = get_finbert()
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    out: list[tuple[float, float]] = [(0.0, 0.0)] * len(texts)
+    for start in range(0, len(order), _FINBERT_BATCH_SIZE):
+        chunk = order[start:start + _FINBERT_BATCH_SIZE]
+        inputs = tokenizer(
+            [texts[i] for i in chunk],
+            return_tensors="pt",
+            truncation=True,
+            max_length=_FINBERT_MAX_TOKENS,
+            padding=True,
+        )
+        with torch.no_grad():
+            probs = torch.softmax(model(**inputs).logits, dim=-1).tolist()
+        # FinBERT label order: positive=0, negative=1, neutral=2
+        for i, row in zip(chunk, probs):
+            out[i] = (float(row[0]), float(row[1]))
+    return out
+
+
+class _FinBERTBatcher:
+    """Coalesces concurrent single-text FinBERT requests into one job.
+
+    Every :meth:`submit` issued in the same event-loop tick (e.g. the
+    coroutines of one ``asyncio.gather``) is answered by a single
+    :func:`_finbert_probs` call in the default executor.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[str, asyncio.Future[tuple[float, float]]]] = []
+
+    async def submit(self, text: str) -> tuple[float, float]:
+        """Return FinBERT ``(positive, negative)`` probabilities for *text*."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[tuple[float, float]] = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush, loop)
+        self._pending.append((text, future))
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch, self._pending = self._pending, []
+        job = loop.run_in_executor(None, _finbert_probs, [text for text, _ in batch])
+
+        def _resolve(done: asyncio.Future[list[tuple[float, float]]]) -> None:
+            exc = None if done.cancelled() else done.exception()
+            for i, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if done.cancelled():
+                    future.cancel()
+                elif exc is not None:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(done.result()[i])
+
+        job.add_done_callback(_resolve)
+
+
+_finbert_batcher = _FinBERTBatcher()
+
+
+# ---------------------------------------------------------------------------
+# Persistent score cache (news_cache.sentiment_* columns)
+# ---------------------------------------------------------------------------
+
+
+def _score_cache_key(article: dict[str, Any], text: str) -> str:
+    """Article URL, or a content hash for articles without one."""
+    url = article.get("url")
+    if isinstance(url, str) and url.strip():
+        return url.strip()
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+async def _load_cached_scores(symbol: str, keys: list[str]) -> dict[str, dict[str, Any]]:
+    """Current-version FinBERT rows for *keys*, as ``{key: row}``."""
+    from app.data.database import get_database
+
+    db = await get_database()
+    found: dict[str, dict[str, Any]] = {}
+    unique = list(dict.fromkeys(keys))
+    for start in range(0, len(unique), _SCORE_CACHE_CHUNK):
+        chunk = unique[start:start + _SCORE_CACHE_CHUNK]
+        rows = await db.fetch_all(
+            "SELECT url, headline, summary, sentiment_score FROM news_cache "
+            "WHERE symbol = ? AND sentiment_model = ? "
+            f"AND url IN ({','.join('?' * len(chunk))})",
+            (symbol, _FINBERT_SCORE_VERSION, *chunk),
+        )
+        found.update((row["url"], row) for row in rows)
+    return found
+
+
+async def _save_cached_scores(symbol: str, rows: list[tuple[Any, ...]]) -> None:
+    """Upsert ``(url, headline, summary, source, published_at, label, score)`` rows."""
+    from app.data.database import get_database
+
+    db = await get_database()
+    await db.executemany(
+        "INSERT INTO news_cache "
+        "(symbol, url, headline, summary, source, published_at, "
+        " sentiment, sentiment_score, sentiment_model) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(symbol, url) DO UPDATE SET "
+        "headline = excluded.headline, summary = excluded.summary, "
+        "sentiment = excluded.sentiment, "
+        "sentiment_score = excluded.sentiment_score, "
+        "sentiment_model = excluded.sentiment_model, "
+        "fetched_at = datetime('now')",
+        [(symbol, *row, _FINBERT_SCORE_VERSION) for row in rows],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Loughran-McDonald dictionary (lazy-loaded)
 # ---------------------------------------------------------------------------
@@ -149,6 +281,8 @@ class SentimentAnalyzer(BaseMethodology):
     display_name: str = "Sentiment Analysis"
     default_timeframe: str = "short"
     version: str = "1.0.0"
+    # Score cache and FinBERT batcher are bound to the server loop.
+    runs_on_event_loop: bool = True
 
     # ------------------------------------------------------------------
     # Public API (BaseMethodology contract)
@@ -196,7 +330,7 @@ class SentimentAnalyzer(BaseMethodology):
         parsed.sort(key=lambda a: a["published_at"], reverse=True)
 
         # Score all articles
-        scored = await self._score_all_articles(parsed, now)
+        scored = await self._score_all_articles(parsed, now, symbol=safe_ticker)
 
         if not scored:
             return self._no_articles_signal(safe_ticker)
@@ -277,11 +411,16 @@ class SentimentAnalyzer(BaseMethodology):
             if not isinstance(source, str):
                 source = ""
 
+            url = article.get("url")
+            if not isinstance(url, str):
+                url = ""
+
             parsed.append({
                 "headline": headline.strip(),
                 "summary": summary.strip(),
                 "published_at": pub_dt,
                 "source": source.strip(),
+                "url": url.strip(),
             })
 
         return parsed
@@ -293,40 +432,24 @@ class SentimentAnalyzer(BaseMethodology):
     async def _score_finbert(self, text: str) -> tuple[float, str]:
         """Score text using the FinBERT model.
 
-        Runs model inference in an executor to avoid blocking the event loop.
+        Inference runs in an executor to avoid blocking the event loop;
+        concurrent calls are coalesced into padded batches by
+        :class:`_FinBERTBatcher`.
 
         Returns:
             A tuple of (score, label) where score is in [-1.0, 1.0].
         """
-        import torch  # type: ignore[import-untyped]
-
-        model, tokenizer = get_finbert()
-
-        def _infer() -> tuple[float, str]:
-            inputs = tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=_FINBERT_MAX_TOKENS,
-                padding=True,
-            )
-            with torch.no_grad():
-                outputs = model(**inputs)
-            logits = outputs.logits[0]
-            probs = torch.softmax(logits, dim=0)
-            # FinBERT label order: positive=0, negative=1, neutral=2
-            pos_prob = float(probs[0])
-            neg_prob = float(probs[1])
-            score = pos_prob - neg_prob
-            # Guard NaN/Inf
-            if math.isnan(score) or math.isinf(score):
-                score = 0.0
-            score = max(-1.0, min(1.0, score))
-            label = self._score_to_label(score)
-            return score, label
+        import torch  # type: ignore[import-untyped]  # noqa: F401
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _infer)
+        get_finbert()
+        pos_prob, neg_prob = await _finbert_batcher.submit(text)
+        score = pos_prob - neg_prob
+        # Guard NaN/Inf
+        if math.isnan(score) or math.isinf(score):
+            score = 0.0
+        score = max(-1.0, min(1.0, score))
+        label = self._score_to_label(score)
+        return score, label
 
     # ------------------------------------------------------------------
     # Scoring: Loughran-McDonald
@@ -394,12 +517,16 @@ class SentimentAnalyzer(BaseMethodology):
         FinBERT (primary) -> Loughran-McDonald (secondary) -> VADER (tertiary).
 
         Returns:
-            A dict with keys: score, label, model.
+            A dict with keys: score, label, model.  FinBERT results also
+            carry ``model_version``, which marks them as cacheable.
         """
         # Primary: FinBERT
         try:
             score, label = await self._score_finbert(text)
-            return {"score": score, "label": label, "model": "finbert"}
+            return {
+                "score": score, "label": label, "model": "finbert",
+                "model_version": _FINBERT_SCORE_VERSION,
+            }
         except Exception:
             pass
 
@@ -422,39 +549,92 @@ class SentimentAnalyzer(BaseMethodology):
         self,
         parsed: list[dict[str, Any]],
         now: datetime,
+        symbol: str | None = None,
     ) -> list[dict[str, Any]]:
         """Score all parsed articles with batch optimization.
 
         When > BATCH_THRESHOLD articles, articles older than
         BATCH_OLD_ARTICLE_DAYS skip FinBERT and use Loughran-McDonald
-        directly for performance.
+        directly for performance.  The rest are scored concurrently so
+        FinBERT sees them as one padded batch.
+
+        With *symbol*, FinBERT scores are persisted in ``news_cache`` keyed
+        by article URL (content hash without one) and model version, and
+        only articles without a stored score for the same headline and
+        summary are sent to the model.
 
         Returns:
             A list of scored article dicts.
         """
-        scored: list[dict[str, Any]] = []
         use_batch_opt = len(parsed) > _BATCH_THRESHOLD
+        results: list[dict[str, Any] | None] = [None] * len(parsed)
+        texts: list[str] = []
+        ages: list[float] = []
+        chain: list[int] = []
 
-        for article in parsed:
+        for i, article in enumerate(parsed):
             text = article["headline"]
             if article["summary"]:
                 text = text + " " + article["summary"]
+            texts.append(text)
 
             days_old = (now - article["published_at"]).total_seconds() / 86400.0
             if math.isnan(days_old) or math.isinf(days_old) or days_old < 0:
                 days_old = 0.0
+            ages.append(days_old)
 
             if use_batch_opt and days_old > _BATCH_OLD_ARTICLE_DAYS:
                 # Skip FinBERT for older articles in batch mode
                 try:
                     score, label = self._score_loughran_mcdonald(text)
-                    result = {"score": score, "label": label, "model": "loughran_mcdonald"}
+                    results[i] = {"score": score, "label": label, "model": "loughran_mcdonald"}
                 except Exception:
                     score, label = self._score_vader(text)
-                    result = {"score": score, "label": label, "model": "vader"}
+                    results[i] = {"score": score, "label": label, "model": "vader"}
             else:
-                result = await self.score_article(text)
+                chain.append(i)
+
+        keys = {i: _score_cache_key(parsed[i], texts[i]) for i in chain} if symbol else {}
+        if keys:
+            try:
+                cached = await _load_cached_scores(symbol, list(keys.values()))
+            except Exception:
+                logger.debug("Sentiment score cache read failed for %s", symbol,
+                             exc_info=True)
+                cached = {}
+            for i, key in keys.items():
+                row = cached.get(key)
+                # Reuse only a score of the same scored text (headline + summary).
+                if row is not None and row["headline"] == parsed[i]["headline"] \
+                        and (row["summary"] or "") == parsed[i]["summary"] \
+                        and self._is_finite_number(row["sentiment_score"]):
+                    score = float(row["sentiment_score"])
+                    results[i] = {
+                        "score": score, "label": self._score_to_label(score),
+                        "model": "finbert",
+                    }
+
+        pending = [i for i in chain if results[i] is None]
+        fresh = await asyncio.gather(*(self.score_article(texts[i]) for i in pending))
+        to_store: list[tuple[Any, ...]] = []
+        for i, result in zip(pending, fresh):
+            results[i] = result
+            if i in keys and result.get("model_version") == _FINBERT_SCORE_VERSION:
+                article = parsed[i]
+                to_store.append((
+                    keys[i], article["headline"], article["summary"],
+                    article["source"], article["published_at"].isoformat(),
+                    result["label"], result["score"],
+                ))
+        if to_store:
+            try:
+                await _save_cached_scores(symbol, to_store)
+            except Exception:
+                logger.debug("Sentiment score cache write failed for %s", symbol,
+                             exc_info=True)
 
+        scored: list[dict[str, Any]] = []
+        for article, result, days_old in zip(parsed, results, ages):
             scored.append({
                 "headline": article["headline"],
                 "summary": article["summary"],
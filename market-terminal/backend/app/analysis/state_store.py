@@ -0,0 +1,56 @@
+"""Persistence for incremental analyzer state.
+
+Analyzers with ``supports_incremental`` hand back a small JSON-serializable
+dict after each run (see :meth:`BaseMethodology.analyze_incremental`).  It
+is kept per ``(symbol, methodology, timeframe)`` in the ``analysis_state``
+table so the next run only has to fold in new bars.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+async def load_analysis_state(
+    symbol: str, methodology: str, timeframe: str,
+) -> dict[str, Any]:
+    """Return the stored state, or an empty dict when none (or unreadable)."""
+    from app.data.database import get_database
+
+    db = await get_database()
+    row = await db.fetch_one(
+        "SELECT state_json FROM analysis_state "
+        "WHERE symbol = ? AND methodology = ? AND timeframe = ?",
+        (symbol.upper(), methodology, timeframe),
+    )
+    if row is None:
+        return {}
+    try:
+        state = json.loads(row["state_json"])
+    except (TypeError, ValueError):
+        logger.debug("Discarding unreadable %s state for %s", methodology, symbol)
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+async def save_analysis_state(
+    symbol: str, methodology: str, timeframe: str, state: dict[str, Any],
+) -> None:
+    """Replace the stored state for ``(symbol, methodology, timeframe)``."""
+    from app.data.database import get_database
+
+    db = await get_database()
+    await db.execute(
+        "INSERT OR REPLACE INTO analysis_state "
+        "(symbol, methodology, timeframe, state_json, updated_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            symbol.upper(), methodology, timeframe,
+            json.dumps(state, default=str),
+            datetime.now(timezone.utc).isoformat(),
+        ),
+    )
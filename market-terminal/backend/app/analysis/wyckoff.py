@@ -22,6 +22,7 @@ import numpy as np
 import pandas as pd
 
 from app.analysis.base import BaseMethodology, MethodologySignal
+from app.analysis.features import BarFeatures, merge_price_volume
 
 # ---------------------------------------------------------------------------
 # Module-level constants
@@ -182,11 +183,12 @@ class WyckoffAnalyzer(BaseMethodology):
         """
         self.validate_input(price_data, volume_data)
 
-        merged = self._merge_data(price_data, volume_data)
-        range_info = self._detect_trading_range(merged)
+        features = self.bar_features(price_data, volume_data, kwargs)
+        merged = features.frame
+        range_info = self._detect_trading_range(merged, features)
         phase_info = self._detect_phase(merged, range_info)
         spring_info = self._detect_spring_upthrust(merged, range_info)
-        vpa_info = self._analyze_volume_price_spread(merged)
+        vpa_info = self._analyze_volume_price_spread(merged, features)
         effort_info = self._analyze_effort_vs_result(merged)
 
         confidence = self._calculate_confidence(
@@ -227,21 +229,24 @@ class WyckoffAnalyzer(BaseMethodology):
         Returns a single DataFrame with columns
         ``[date, open, high, low, close, volume]`` sorted by date ascending.
         """
-        merged = pd.merge(price_data, volume_data, on="date", how="inner")
-        merged["volume"] = merged["volume"].fillna(0.0)
-        merged = merged.sort_values("date", ascending=True).reset_index(drop=True)
-        return merged[["date", "open", "high", "low", "close", "volume"]]
+        return merge_price_volume(price_data, volume_data)
 
     # ------------------------------------------------------------------
     # Trading range detection
     # ------------------------------------------------------------------
 
-    def _detect_trading_range(self, df: pd.DataFrame) -> _RangeInfo:
+    def _detect_trading_range(
+        self,
+        df: pd.DataFrame,
+        features: BarFeatures | None = None,
+    ) -> _RangeInfo:
         """Identify support/resistance boundaries and compute range metrics.
 
         Uses the last ``_DEFAULT_RANGE_LOOKBACK`` bars to find rolling
         highs/lows, average volumes (up vs down days), and SMA values.
         """
+        if features is None:
+            features = BarFeatures(df)
         lookback = min(_DEFAULT_RANGE_LOOKBACK, len(df))
         window = df.tail(lookback)
 
@@ -250,9 +255,9 @@ class WyckoffAnalyzer(BaseMethodology):
         range_height = max(resistance - support, _EPSILON)
 
         # Classify up/down days based on close vs previous close
-        close_shifted = window["close"].shift(1)
-        up_mask = window["close"] > close_shifted
-        down_mask = window["close"] < close_shifted
+        direction = features.close_direction(lookback)
+        up_mask = direction > 0
+        down_mask = direction < 0
 
         up_volumes = window.loc[up_mask, "volume"]
         down_volumes = window.loc[down_mask, "volume"]
@@ -427,7 +432,11 @@ class WyckoffAnalyzer(BaseMethodology):
     # Volume-price spread analysis (VPA)
     # ------------------------------------------------------------------
 
-    def _analyze_volume_price_spread(self, df: pd.DataFrame) -> _VPAInfo:
+    def _analyze_volume_price_spread(
+        self,
+        df: pd.DataFrame,
+        features: BarFeatures | None = None,
+    ) -> _VPAInfo:
         """Evaluate volume-price spread relationships over the VPA lookback.
 
         Identifies:
@@ -436,15 +445,13 @@ class WyckoffAnalyzer(BaseMethodology):
 
         Produces bullish and bearish VPA scores between 0.0 and 1.0.
         """
+        if features is None:
+            features = BarFeatures(df)
         lookback = min(_VPA_LOOKBACK, len(df))
         window = df.tail(lookback).copy()
 
         # Compute ATR over the window
-        prev_close = window["close"].shift(1)
-        tr1 = window["high"] - window["low"]
-        tr2 = (window["high"] - prev_close).abs()
-        tr3 = (window["low"] - prev_close).abs()
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        true_range = pd.Series(features.window_true_range(lookback), index=window.index)
         avg_atr = max(float(true_range.mean()), _EPSILON)
         avg_vol = max(float(window["volume"].mean()), _EPSILON)
 
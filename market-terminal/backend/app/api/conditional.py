@@ -0,0 +1,50 @@
+"""Conditional GET helpers (``ETag`` / ``If-None-Match``) for large payloads.
+
+Routes that return big, slowly-changing payloads (ticker history, options
+chains, heatmap snapshots) tag each response with a weak ETag derived from
+the freshness of the data behind it -- usually the cache entry's
+``fetched_at`` -- rather than from the serialized body, so a poll that
+matches can be answered with ``304 Not Modified`` before the payload is
+built or serialized.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag over *parts* (cache timestamps, keys, query values)."""
+    digest = hashlib.sha1(
+        "\x1f".join(str(p) for p in parts).encode(), usedforsecurity=False,
+    ).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an ``If-None-Match`` header value matches *etag* (weak comparison)."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def conditional(request: Request, response: Response, *parts: Any) -> Response | None:
+    """Tag *response* with the ETag of *parts*.
+
+    Returns a ``304 Not Modified`` response for the route to return as-is
+    when the request's ``If-None-Match`` already names that ETag, else
+    *None* (the route builds its payload as usual).
+    """
+    etag = make_etag(*parts)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -12,6 +12,7 @@ import importlib
 import logging
 import re
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 import pandas as pd
@@ -20,6 +21,10 @@ from pydantic import BaseModel, field_validator
 
 from app.analysis.base import METHODOLOGY_NAMES, MethodologySignal
 from app.analysis.composite import CompositeAggregator
+from app.analysis.features import get_bar_features
+from app.analysis.state_store import load_analysis_state, save_analysis_state
+from app.config import get_settings
+from app.data.bar_store import BarSeries
 from app.data.cache import get_cache_manager
 
 logger = logging.getLogger(__name__)
@@ -241,7 +246,7 @@ async def _fetch_data(
     volume_df = pd.DataFrame()
     try:
         hist_result = await cm.get_historical_prices(
-            symbol, period=tf_period, interval=tf_interval,
+            symbol, period=tf_period, interval=tf_interval, as_series=True,
         )
         # Fallback: if the preferred long-period fetch fails (e.g. rate-limited
         # while the primary period isn't cached yet), try a shorter period that
@@ -251,7 +256,7 @@ async def _fetch_data(
             ("20y", "1wk"): ("10y", "1wk"),
             ("20y", "1mo"): ("10y", "1mo"),
         }
-        if (hist_result is None or not isinstance(hist_result.data, list)) and \
+        if (hist_result is None or not isinstance(hist_result.data, (BarSeries, list))) and \
                 (tf_period, tf_interval) in _FALLBACK_PERIODS:
             fb_period, fb_interval = _FALLBACK_PERIODS[(tf_period, tf_interval)]
             logger.debug(
@@ -259,12 +264,14 @@ async def _fetch_data(
                 symbol, tf_period, tf_interval, fb_period, fb_interval,
             )
             hist_result = await cm.get_historical_prices(
-                symbol, period=fb_period, interval=fb_interval,
+                symbol, period=fb_period, interval=fb_interval, as_series=True,
             )
-        if hist_result is not None and isinstance(hist_result.data, list):
+        if hist_result is not None and isinstance(hist_result.data, BarSeries):
+            price_df, volume_df = hist_result.data.to_frames()
+        elif hist_result is not None and isinstance(hist_result.data, list):
             price_df, volume_df = _build_dataframes(hist_result.data)
-            if not price_df.empty:
-                sources.append(f"ohlcv:{hist_result.source}")
+        if hist_result is not None and not price_df.empty:
+            sources.append(f"ohlcv:{hist_result.source}")
     except Exception:
         logger.warning("Historical price fetch failed for %s", symbol,
                        exc_info=True)
@@ -299,6 +306,80 @@ async def _fetch_data(
     return price_df, volume_df, fundamentals, news_articles, sources
 
 
+# ---------------------------------------------------------------------------
+# Methodology execution (sequential / thread pool / process pool)
+# ---------------------------------------------------------------------------
+_EXECUTION_MODES = ("sequential", "thread", "process")
+_thread_pool: ThreadPoolExecutor | None = None
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_executor(mode: str) -> Executor | None:
+    """Return the lazily created pool for *mode* (None for sequential)."""
+    global _thread_pool, _process_pool
+    if mode == "thread":
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=get_settings().analysis_max_workers,
+                thread_name_prefix="analysis",
+            )
+        return _thread_pool
+    if mode == "process":
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=get_settings().analysis_max_workers,
+            )
+        return _process_pool
+    return None
+
+
+async def close_analysis_executors() -> None:
+    """Shut down the methodology worker pools (called from app lifespan)."""
+    global _thread_pool, _process_pool
+    for pool in (_thread_pool, _process_pool):
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    _thread_pool = None
+    _process_pool = None
+
+
+def _analyze_sync(
+    analyzer: Any,
+    symbol: str,
+    price_df: pd.DataFrame,
+    volume_df: pd.DataFrame,
+    fundamentals: dict[str, Any] | None,
+    kwargs: dict[str, Any],
+) -> MethodologySignal:
+    """Drive ``analyzer.analyze`` to completion on a private event loop.
+
+    Runs inside a pool worker so the CPU-bound pandas/numpy work never
+    blocks the server's event loop.
+    """
+    return asyncio.run(analyzer.analyze(
+        symbol,
+        price_data=price_df,
+        volume_data=volume_df,
+        fundamentals=fundamentals,
+        **kwargs,
+    ))
+
+
+def _analyze_in_process(
+    name: str,
+    symbol: str,
+    price_df: pd.DataFrame,
+    volume_df: pd.DataFrame,
+    fundamentals: dict[str, Any] | None,
+    kwargs: dict[str, Any],
+) -> MethodologySignal:
+    """Process-pool entry point: analyzers are loaded inside the worker."""
+    analyzer = _load_analyzer(name)
+    if analyzer is None:
+        raise RuntimeError(f"Methodology {name} not available")
+    return _analyze_sync(analyzer, symbol, price_df, volume_df, fundamentals, kwargs)
+
+
 async def _run_methodologies(
     symbol: str,
     price_df: pd.DataFrame,
@@ -309,17 +390,40 @@ async def _run_methodologies(
     weights: dict[str, float] | None,
     stream_progress: bool,
     timeframe: str = "1d",
+    execution_mode: str | None = None,
 ) -> dict[str, Any]:
     """Run requested methodology modules and aggregate results.
 
+    *execution_mode* (default: ``settings.analysis_execution_mode``) is one
+    of ``"sequential"`` (await each analyzer in turn on the event loop),
+    ``"thread"`` or ``"process"`` (fan all analyzers out to a worker pool so
+    wall time approaches the slowest single methodology).  In pool modes
+    each methodology is bounded by ``analysis_methodology_timeout_seconds``;
+    analyzers flagged ``runs_on_event_loop`` are still awaited here.
+
     Returns a dict with keys: ``composite``, ``signals``, ``metadata``.
     """
+    settings = get_settings()
+    mode = execution_mode or settings.analysis_execution_mode
+    if mode not in _EXECUTION_MODES:
+        logger.warning("Unknown analysis execution mode %r, using sequential", mode)
+        mode = "sequential"
+    executor = _get_executor(mode)
+    per_method_timeout = settings.analysis_methodology_timeout_seconds
+
     total = len(requested)
-    signals: list[MethodologySignal] = []
+    results: dict[str, MethodologySignal] = {}
     failed: list[str] = []
     durations: dict[str, float] = {}
+    incremental: list[str] = []
+    # Per-bar features are computed once and shared by every analyzer;
+    # worker processes cannot share memory, so they build their own.
+    features = (
+        get_bar_features(symbol, timeframe, price_df, volume_df)
+        if mode != "process" else None
+    )
 
-    for idx, name in enumerate(requested):
+    async def _run_one(idx: int, name: str) -> None:
         display_name = _DISPLAY_NAMES.get(name, name)
 
         if stream_progress:
@@ -332,7 +436,10 @@ async def _run_methodologies(
         if analyzer is None:
             failed.append(name)
             logger.warning("Methodology %s not available", name)
-            continue
+            return
+        # Analyzers doing their own async I/O stay on this loop: the
+        # database manager and shared batchers are bound to it.
+        on_loop = executor is None or getattr(analyzer, "runs_on_event_loop", False) is True
 
         t0 = time.monotonic()
         try:
@@ -343,16 +450,50 @@ async def _run_methodologies(
                 kwargs["cot_data"] = None
             if name == "elliott_wave":
                 kwargs["chart_timeframe"] = timeframe
-
-            signal = await analyzer.analyze(
-                symbol,
-                price_data=price_df,
-                volume_data=volume_df,
-                fundamentals=fundamentals,
-                **kwargs,
-            )
-            signals.append(signal)
+            if features is not None:
+                kwargs["features"] = features
+            # Worker processes get pickled frames, so state stays in-process.
+            state: dict[str, Any] | None = None
+            if (mode != "process" or on_loop) and getattr(analyzer, "supports_incremental", False) is True:
+                try:
+                    state = await load_analysis_state(symbol, name, timeframe)
+                except Exception:
+                    logger.debug("Failed to load %s state for %s", name, symbol,
+                                 exc_info=True)
+                    state = {}
+                kwargs["incremental_state"] = state
+
+            if on_loop:
+                signal = await analyzer.analyze(
+                    symbol,
+                    price_data=price_df,
+                    volume_data=volume_df,
+                    fundamentals=fundamentals,
+                    **kwargs,
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                if mode == "process":
+                    fut = loop.run_in_executor(
+                        executor, _analyze_in_process, name, symbol,
+                        price_df, volume_df, fundamentals, kwargs,
+                    )
+                else:
+                    # Private copies: analyzers share no mutable frames across threads.
+                    fut = loop.run_in_executor(
+                        executor, _analyze_sync, analyzer, symbol,
+                        price_df.copy(), volume_df.copy(), fundamentals, kwargs,
+                    )
+                signal = await asyncio.wait_for(fut, timeout=per_method_timeout)
+            results[name] = signal
             durations[name] = time.monotonic() - t0
+            if state:
+                incremental.append(name)
+                try:
+                    await save_analysis_state(symbol, name, timeframe, state)
+                except Exception:
+                    logger.debug("Failed to save %s state for %s", name, symbol,
+                                 exc_info=True)
 
             if stream_progress:
                 await _broadcast_progress(
@@ -370,6 +511,20 @@ async def _run_methodologies(
                     f"{display_name} failed",
                 )
 
+    t_run = time.monotonic()
+    if executor is None:
+        for idx, name in enumerate(requested):
+            await _run_one(idx, name)
+    else:
+        await asyncio.gather(*(
+            _run_one(idx, name) for idx, name in enumerate(requested)
+        ))
+    wall_ms = int((time.monotonic() - t_run) * 1000)
+
+    # Keep the requested order regardless of completion order
+    signals = [results[name] for name in requested if name in results]
+    failed = [name for name in requested if name in failed]
+
     # -- Aggregate ----------------------------------------------------------
     aggregator = CompositeAggregator()
     composite = await aggregator.aggregate(symbol, signals, weights=weights)
@@ -397,6 +552,14 @@ async def _run_methodologies(
             "methodologies_completed": len(signals),
             "methodologies_failed": len(failed),
             "failed_methodologies": failed,
+            "execution_mode": mode,
+            "incremental_methodologies": [
+                name for name in requested if name in incremental
+            ],
+            "methodologies_wall_ms": wall_ms,
+            "methodology_durations_ms": {
+                name: int(d * 1000) for name, d in durations.items()
+            },
         },
     }
 
@@ -79,9 +79,11 @@ async def get_fundamentals(symbol: str) -> dict[str, Any]:
 
     Combines SEC EDGAR filings (revenue, EPS, margins, balance sheet) with
     Finnhub/YFinance market-derived metrics (P/E, market cap, dividend yield).
+    The page does not show institutional ownership, so yfinance is only
+    consulted when EDGAR/Finnhub leave gaps.
     """
     symbol = _validate_symbol(symbol)
-    return await get_fundamentals_data(symbol)
+    return await get_fundamentals_data(symbol, include_ownership=False)
 
 
 @router.get("/{symbol}/short-interest", response_model=CachedResultSub)
@@ -1,6 +1,7 @@
 """Heatmap route -- stock universe with sector/index filtering and price data.
 
 GET /api/heatmap   returns full heatmap dataset with optional filters.
+                   Supports ``If-None-Match`` (304 until prices refresh).
 
 Query parameters:
   index  -- filter by index: "all" (default), "sp500", "nasdaq100"
@@ -12,8 +13,9 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.api.conditional import conditional
 from app.data.heatmap_service import get_heatmap_data
 
 logger = logging.getLogger(__name__)
@@ -46,16 +48,19 @@ _VALID_SECTORS = {
 # Endpoint
 # ---------------------------------------------------------------------------
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_heatmap(
+    request: Request,
+    response: Response,
     index: str = Query("all", description="Index filter: all, sp500, nasdaq100"),
     sector: str = Query("all", description="GICS sector filter"),
-) -> dict:
+) -> dict | Response:
     """Return heatmap data for all stocks with optional index and sector filters.
 
     Stocks include current price, daily change percent, market cap,
     sector, and index membership.  Data is cached: universe refreshes
-    every 24 h, prices every 60 s.
+    every 24 h, prices every 60 s.  The snapshot's ETag follows
+    ``refreshed_at``, so polls between price refreshes get ``304``.
     """
     if index not in _VALID_INDICES:
         raise HTTPException(status_code=400, detail="Invalid index filter")
@@ -69,4 +74,10 @@ async def get_heatmap(
         logger.error("Heatmap service error: %s", exc)
         raise HTTPException(status_code=503, detail="Heatmap data temporarily unavailable")
 
+    not_modified = conditional(
+        request, response, index, sector,
+        data.get("refreshed_at"), data.get("total_count"), data.get("prices_ready"),
+    )
+    if not_modified is not None:
+        return not_modified
     return data
@@ -3,7 +3,8 @@
 GET /api/macro/calendar              returns upcoming economic events (Finnhub).
 GET /api/macro/event/{event_type}    returns historical indicator data (FRED).
 GET /api/macro/reaction/{symbol}/{event_type}
-                                     returns historical price reactions.
+                                     returns historical price reactions
+                                     (precomputed by app.data.macro_reactions).
 
 Full implementation: TASK-API-006
 """
@@ -11,7 +12,6 @@ from __future__ import annotations
 
 import logging
 import re
-from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -19,6 +19,13 @@ from fastapi import APIRouter, HTTPException, Query
 
 from app.data.finnhub_client import get_finnhub_client
 from app.data.fred_client import get_fred_client
+from app.data.macro_reactions import (
+    AVERAGE_WINDOW,
+    HISTORY_RELEASES,
+    empty_averages,
+    get_reaction_engine,
+)
+from app.exceptions import DataSourceError
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +40,8 @@ _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _MAX_CALENDAR_RANGE_DAYS = 90
 _MAX_EVENT_PERIODS = 60
 _DEFAULT_EVENT_PERIODS = 12
-_MAX_REACTION_PERIODS = 36
-_DEFAULT_REACTION_PERIODS = 12
+_MAX_REACTION_PERIODS = HISTORY_RELEASES
+_DEFAULT_REACTION_PERIODS = AVERAGE_WINDOW
 
 # Event type → metadata (name, FRED series ID, FredClient indicator key)
 _EVENT_TYPES: dict[str, dict[str, Any]] = {
@@ -181,152 +188,6 @@ def _compute_trend(history: list[dict[str, Any]]) -> str:
     return "stable"
 
 
-# ---------------------------------------------------------------------------
-# Price-lookup helpers for reaction endpoint
-# ---------------------------------------------------------------------------
-def _build_price_lookup(candles: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    """Build date → {close, volume} lookup from candle data."""
-    lookup: dict[str, dict[str, Any]] = {}
-    for candle in candles:
-        ts = candle.get("timestamp")
-        if ts is None:
-            continue
-        try:
-            if isinstance(ts, str):
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            else:
-                dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-            date_str = dt.strftime("%Y-%m-%d")
-        except (ValueError, TypeError, OSError):
-            continue
-        lookup[date_str] = {
-            "close": candle.get("close"),
-            "volume": candle.get("volume"),
-        }
-    return lookup
-
-
-def _get_price_before(
-    event_date: str,
-    sorted_dates: list[str],
-    lookup: dict[str, dict[str, Any]],
-) -> float | None:
-    """Get closing price the trading day before *event_date*."""
-    idx = bisect_left(sorted_dates, event_date)
-    if idx > 0:
-        return lookup[sorted_dates[idx - 1]].get("close")
-    return None
-
-
-def _get_price_after(
-    event_date: str,
-    sorted_dates: list[str],
-    lookup: dict[str, dict[str, Any]],
-    days: int,
-) -> float | None:
-    """Get closing price *days* trading days after *event_date*.
-
-    Handles both trading-day and non-trading-day events consistently
-    by normalizing the base index to the first trading day after the event.
-    """
-    idx = bisect_left(sorted_dates, event_date)
-    # If event_date is in sorted_dates, skip it (base = first day AFTER event)
-    if idx < len(sorted_dates) and sorted_dates[idx] == event_date:
-        base = idx + 1
-    else:
-        # event_date is not a trading day; idx already points to next trading day
-        base = idx
-    target_idx = base + (days - 1)
-    if target_idx < len(sorted_dates):
-        return lookup[sorted_dates[target_idx]].get("close")
-    return None
-
-
-def _compute_volume_ratio(
-    event_date: str,
-    sorted_dates: list[str],
-    lookup: dict[str, dict[str, Any]],
-) -> float | None:
-    """Compute event-day volume / 10-day average volume."""
-    idx = bisect_left(sorted_dates, event_date)
-
-    # Resolve event-day index (exact match or next trading day)
-    event_idx = idx
-    if idx >= len(sorted_dates):
-        return None
-
-    event_vol = lookup[sorted_dates[event_idx]].get("volume")
-    if event_vol is None or event_vol == 0:
-        return None
-
-    volumes: list[float] = []
-    start = max(0, event_idx - 10)
-    for i in range(start, event_idx):
-        vol = lookup[sorted_dates[i]].get("volume")
-        if vol is not None and vol > 0:
-            volumes.append(vol)
-
-    if not volumes:
-        return None
-
-    avg_vol = sum(volumes) / len(volumes)
-    if avg_vol == 0:
-        return None
-
-    return round(event_vol / avg_vol, 2)
-
-
-def _empty_averages() -> dict[str, Any]:
-    """Return empty averages structure."""
-    return {
-        "avg_return_1d_on_beat": None,
-        "avg_return_1d_on_miss": None,
-        "avg_return_5d_on_beat": None,
-        "avg_return_5d_on_miss": None,
-        "avg_volume_ratio": None,
-    }
-
-
-def _compute_averages(reactions: list[dict[str, Any]]) -> dict[str, Any]:
-    """Compute average returns split by beat/miss."""
-    beats_1d: list[float] = []
-    misses_1d: list[float] = []
-    beats_5d: list[float] = []
-    misses_5d: list[float] = []
-    vol_ratios: list[float] = []
-
-    for r in reactions:
-        surprise = r.get("surprise")
-        ret_1d = r.get("return_1d_percent")
-        ret_5d = r.get("return_5d_percent")
-        vol = r.get("volume_ratio")
-
-        if vol is not None:
-            vol_ratios.append(vol)
-
-        if surprise == "above":
-            if ret_1d is not None:
-                beats_1d.append(ret_1d)
-            if ret_5d is not None:
-                beats_5d.append(ret_5d)
-        elif surprise == "below":
-            if ret_1d is not None:
-                misses_1d.append(ret_1d)
-            if ret_5d is not None:
-                misses_5d.append(ret_5d)
-
-    def _avg(lst: list[float]) -> float | None:
-        return round(sum(lst) / len(lst), 2) if lst else None
-
-    return {
-        "avg_return_1d_on_beat": _avg(beats_1d),
-        "avg_return_1d_on_miss": _avg(misses_1d),
-        "avg_return_5d_on_beat": _avg(beats_5d),
-        "avg_return_5d_on_miss": _avg(misses_5d),
-        "avg_volume_ratio": _avg(vol_ratios),
-    }
-
-
 # ---------------------------------------------------------------------------
 # Calendar endpoint
 # ---------------------------------------------------------------------------
@@ -552,138 +413,36 @@ async def get_reaction(
             "symbol": symbol,
             "event_type": event_type,
             "reactions": [],
-            "averages": _empty_averages(),
+            "averages": empty_averages(),
             "sample_size": 0,
             "data_sources": ["fred", "finnhub"],
             "data_timestamp": now.isoformat(),
             "note": "FOMC reaction analysis requires calendar dates",
         }
 
-    # Get FRED history
-    fred = get_fred_client()
+    # Served from the precomputed reaction store; a pair seen for the first
+    # time is computed now and kept up to date in the background.
     try:
-        records = await fred.get_series(meta["fred_indicator"])
-    except Exception:
-        logger.warning("FRED fetch error for reaction %s", event_type, exc_info=True)
-        raise HTTPException(status_code=502, detail="FRED service unavailable")
-
-    if records is None or len(records) < 2:
-        return {
-            "symbol": symbol,
-            "event_type": event_type,
-            "reactions": [],
-            "averages": _empty_averages(),
-            "sample_size": 0,
-            "data_sources": ["fred", "finnhub"],
-            "data_timestamp": now.isoformat(),
-        }
-
-    # Take last N+1 records (need previous for expected)
-    recent = records[-(periods + 1):] if len(records) > periods + 1 else records
-
-    if len(recent) < 2:
-        return {
-            "symbol": symbol,
-            "event_type": event_type,
-            "reactions": [],
-            "averages": _empty_averages(),
-            "sample_size": 0,
-            "data_sources": ["fred", "finnhub"],
-            "data_timestamp": now.isoformat(),
-        }
-
-    # Fetch candle data covering the entire date range with buffer
-    first_date = recent[0].get("date", "")
-    last_date = recent[-1].get("date", "")
-
-    try:
-        first_dt = datetime.strptime(first_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        last_dt = datetime.strptime(last_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        from_ts = int((first_dt - timedelta(days=20)).timestamp())
-        to_ts = int((last_dt + timedelta(days=15)).timestamp())
-    except (ValueError, TypeError):
-        return {
-            "symbol": symbol,
-            "event_type": event_type,
-            "reactions": [],
-            "averages": _empty_averages(),
-            "sample_size": 0,
-            "data_sources": ["fred", "finnhub"],
-            "data_timestamp": now.isoformat(),
-        }
-
-    finnhub = get_finnhub_client()
-    try:
-        candles = await finnhub.get_candles(symbol, "D", from_ts, to_ts)
-    except Exception:
-        logger.warning("Candle fetch error for %s", symbol, exc_info=True)
-        raise HTTPException(status_code=502, detail="Price data unavailable")
-
-    if candles is None or not candles:
-        return {
-            "symbol": symbol,
-            "event_type": event_type,
-            "reactions": [],
-            "averages": _empty_averages(),
-            "sample_size": 0,
-            "data_sources": ["fred", "finnhub"],
-            "data_timestamp": now.isoformat(),
-        }
-
-    # Build price lookup and compute reactions
-    price_by_date = _build_price_lookup(candles)
-    sorted_dates = sorted(price_by_date.keys())
-
-    reactions: list[dict[str, Any]] = []
-    for i in range(1, len(recent)):
-        rec = recent[i]
-        event_date = rec.get("date")
-        value = rec.get("value")
-        prev_value = recent[i - 1].get("value")
-
-        if event_date is None or value is None:
-            continue
-
-        surprise = "inline"
-        if prev_value is not None:
-            if value > prev_value:
-                surprise = "above"
-            elif value < prev_value:
-                surprise = "below"
-
-        price_before = _get_price_before(event_date, sorted_dates, price_by_date)
-        price_after_1d = _get_price_after(event_date, sorted_dates, price_by_date, days=1)
-        price_after_5d = _get_price_after(event_date, sorted_dates, price_by_date, days=5)
-        volume_ratio = _compute_volume_ratio(event_date, sorted_dates, price_by_date)
-
-        return_1d = None
-        return_5d = None
-        if price_before is not None and price_before > 0:
-            if price_after_1d is not None:
-                return_1d = round((price_after_1d - price_before) / price_before * 100, 2)
-            if price_after_5d is not None:
-                return_5d = round((price_after_5d - price_before) / price_before * 100, 2)
-
-        reactions.append({
-            "event_date": event_date,
-            "event_value": value,
-            "expected": prev_value,
-            "surprise": surprise,
-            "price_before": price_before,
-            "price_after_1d": price_after_1d,
-            "price_after_5d": price_after_5d,
-            "return_1d_percent": return_1d,
-            "return_5d_percent": return_5d,
-            "volume_ratio": volume_ratio,
-        })
-
-    averages = _compute_averages(reactions)
+        result = await get_reaction_engine().get_reactions(
+            event_type, symbol, meta["fred_indicator"], periods,
+            fred=get_fred_client(), finnhub=get_finnhub_client(),
+        )
+    except DataSourceError as exc:
+        logger.warning(
+            "Reaction fetch error for %s/%s", symbol, event_type, exc_info=True,
+        )
+        detail = (
+            "FRED service unavailable" if exc.source == "fred"
+            else "Price data unavailable"
+        )
+        raise HTTPException(status_code=502, detail=detail)
 
+    reactions = result["reactions"]
     return {
         "symbol": symbol,
         "event_type": event_type,
         "reactions": reactions,
-        "averages": averages,
+        "averages": result["averages"],
         "sample_size": len(reactions),
         "data_sources": ["fred", "finnhub"],
         "data_timestamp": now.isoformat(),
@@ -19,6 +19,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query
 
 from app.data.cache import get_cache_manager
+from app.data.rate_limiter import Priority, request_priority
 from app.analysis.sentiment import SentimentAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -199,7 +200,8 @@ async def get_news(
         # Fire-and-forget background warm-up so the *next* request hits the cache.
         async def _bg_warmup(sym: str) -> None:
             try:
-                await cache.get_news(sym, force_refresh=True)
+                with request_priority(Priority.BACKGROUND):
+                    await cache.get_news(sym, force_refresh=True)
                 logger.info("Background news warm-up complete for %s", sym)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Background news warm-up failed for %s: %s", sym, exc)
@@ -2,19 +2,26 @@
 
 Provides REST endpoints for MassiveClient options data including full chains,
 expirations lists, aggregated greeks, and individual contract snapshots.
+
+Chain, expiration and greeks responses are served from one cached snapshot
+per symbol, held as a columnar :class:`~app.data.options_chain.OptionChain`
+(filters, pagination and per-expiration aggregates come from its indexes;
+missing IV / greeks are computed locally with Black-Scholes).
 """
 from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi import APIRouter, HTTPException, Query, Path, Request, Response
 from pydantic import BaseModel
 
+from app.api.conditional import conditional
 from app.config import get_settings
 from app.data.cache import CacheManager
 from app.data.cache_types import CachedResult
 from app.data.massive_client import get_massive_client, OptionContractModel
+from app.data.options_chain import chain_for
 
 router = APIRouter(prefix="/api/options", tags=["options"])
 _cache_mgr = CacheManager()
@@ -107,6 +114,8 @@ def _handle_client_error(data: dict | None) -> None:
 
 @router.get("/chain/{symbol}", response_model=CachedResult)
 async def get_options_chain(
+    request: Request,
+    response: Response,
     symbol: str = Path(..., min_length=1, max_length=10),
     expiration_gte: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
     expiration_lte: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
@@ -115,8 +124,12 @@ async def get_options_chain(
     contract_type: str | None = Query("both"),
     page: int = Query(1, ge=1),
     page_size: int = Query(250, ge=1, le=500),
-) -> CachedResult:
-    """Get full options chain snapshot for a symbol."""
+) -> CachedResult | Response:
+    """Get full options chain snapshot for a symbol.
+
+    Tagged with an ETag of the cached chain's ``fetched_at``; a matching
+    ``If-None-Match`` returns ``304`` without rebuilding the page.
+    """
     symbol = symbol.strip().upper()
     if strike_gte is not None and strike_lte is not None and strike_gte > strike_lte:
         raise HTTPException(
@@ -133,44 +146,40 @@ async def get_options_chain(
     elif ctype not in ("call", "put", None):
         raise HTTPException(status_code=422, detail="contract_type must be call, put, or both")
 
-    kwargs = {
-        "expiration_gte": expiration_gte,
-        "expiration_lte": expiration_lte,
-        "strike_gte": strike_gte,
-        "strike_lte": strike_lte,
-        "contract_type": ctype,
-    }
-
-    # Filter out None kwargs for accurate cache keying
-    active_filters = {k: v for k, v in kwargs.items() if v is not None}
-    filter_str = ":".join(f"{k}={v}" for k, v in sorted(active_filters.items()))
-    period_key = f"chain:{filter_str}" if filter_str else "chain"
-
+    # One unfiltered snapshot per symbol serves every filter combination:
+    # filters and pagination are answered from the chain's column indexes.
     async with _get_symbol_lock(symbol):
         result = await _cache_mgr.get_or_fetch(
-            "options", symbol, period_key,
-            fetch_kwargs=kwargs,
+            "options", symbol, "chain",
             source_override="massive"
         )
 
     _handle_client_error(result.data if result else None)
     assert result is not None
-
-    data = result.data
-    contracts = data.get("chain", [])
-
-    # Apply pagination locally since the cache holds the full filtered chain
+    not_modified = conditional(
+        request, response, result.cache_key, result.fetched_at, request.url.query,
+    )
+    if not_modified is not None:
+        return not_modified
+
+    chain = chain_for(result)
+    rows = chain.select(
+        expiration_gte=expiration_gte,
+        expiration_lte=expiration_lte,
+        strike_gte=strike_gte,
+        strike_lte=strike_lte,
+        contract_type=ctype,
+    )
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
-    paginated_contracts = contracts[start_idx:end_idx]
-
-    has_more = end_idx < len(contracts)
+    paginated_contracts = chain.records(rows[start_idx:end_idx])
+    has_more = end_idx < len(rows)
 
     response_data = OptionsChainResponse(
-        underlying_symbol=data.get("underlying_symbol", symbol),
-        underlying_price=data.get("underlying_price"),
+        underlying_symbol=chain.symbol or symbol,
+        underlying_price=chain.underlying_price,
         chain=[OptionContractModel(**c) for c in paginated_contracts],
-        contract_count=len(contracts),
+        contract_count=len(rows),
         page=page,
         page_size=page_size,
         has_more=has_more,
@@ -194,13 +203,14 @@ async def get_options_chain(
 
 @router.get("/expirations/{symbol}", response_model=CachedResult)
 async def get_expirations(
+    request: Request,
+    response: Response,
     symbol: str = Path(..., min_length=1, max_length=10),
-) -> CachedResult:
+) -> CachedResult | Response:
     """Get sorted list of available option expiration dates."""
     symbol = symbol.strip().upper()
 
     async with _get_symbol_lock(symbol):
-        # We'll fetch the whole chain and derive expirations just like MassiveClient does
         result = await _cache_mgr.get_or_fetch(
             "options", symbol, "chain",
             source_override="massive"
@@ -208,22 +218,18 @@ async def get_expirations(
 
     _handle_client_error(result.data if result else None)
     assert result is not None
+    not_modified = conditional(request, response, "expirations", result.fetched_at)
+    if not_modified is not None:
+        return not_modified
 
-    data = result.data
-    contracts = data.get("chain", [])
-    
-    exp_counts: dict[str, int] = {}
-    for c in contracts:
-        exp = c["expiration"]
-        exp_counts[exp] = exp_counts.get(exp, 0) + 1
-
+    chain = chain_for(result)
     items = [
-        ExpirationItem(expiration_date=k, contract_count=v)
-        for k, v in sorted(exp_counts.items())
+        ExpirationItem(expiration_date=exp, contract_count=count)
+        for exp, count in chain.expiration_counts()
     ]
 
     response_data = ExpirationListResponse(
-        underlying_symbol=data.get("underlying_symbol", symbol),
+        underlying_symbol=chain.symbol or symbol,
         expirations=items,
         total_expirations=len(items)
     )
@@ -245,14 +251,14 @@ async def get_expirations(
 
 @router.get("/greeks/{symbol}", response_model=CachedResult)
 async def get_greeks_summary(
+    request: Request,
+    response: Response,
     symbol: str = Path(..., min_length=1, max_length=10),
-) -> CachedResult:
-    """Get aggregated greeks summary per expiration."""
+) -> CachedResult | Response:
+    """Get aggregated greeks summary per expiration (precomputed per snapshot)."""
     symbol = symbol.strip().upper()
 
     async with _get_symbol_lock(symbol):
-        # We manually call to massive client for greeks structure or derive if cached
-        client = get_massive_client()
         cached = await _cache_mgr.get_or_fetch(
             "options", symbol, "chain",
             source_override="massive"
@@ -260,46 +266,16 @@ async def get_greeks_summary(
 
     _handle_client_error(cached.data if cached else None)
     assert cached is not None
+    not_modified = conditional(request, response, "greeks", cached.fetched_at)
+    if not_modified is not None:
+        return not_modified
 
-    chain_data = cached.data
-    contracts = chain_data.get("chain", [])
-
-    exps: dict[str, Any] = {}
-    for c in contracts:
-        exp = c["expiration"]
-        if exp not in exps:
-            exps[exp] = {"iv": [], "oi": 0, "calls": 0, "puts": 0, "count": 0}
-
-        exps[exp]["count"] += 1
-        if c.get("implied_volatility") is not None:
-            exps[exp]["iv"].append(c["implied_volatility"])
-        if c.get("open_interest") is not None:
-            exps[exp]["oi"] += c["open_interest"]
-        if c.get("contract_type") == "call":
-            exps[exp]["calls"] += 1
-        elif c.get("contract_type") == "put":
-            exps[exp]["puts"] += 1
-
-    results = []
-    for exp, metrics in sorted(exps.items()):
-        avg_iv = sum(metrics["iv"]) / len(metrics["iv"]) if metrics["iv"] else None
-        pcr = metrics["puts"] / metrics["calls"] if metrics["calls"] > 0 else None
-        # Replace 0 with None if missing
-        oi = metrics["oi"] if metrics["oi"] > 0 else None
-        results.append(
-            GreeksExpirationItem(
-                expiration=exp,
-                avg_iv=avg_iv,
-                put_call_ratio=pcr,
-                total_open_interest=oi,
-                contract_count=metrics["count"],
-            )
-        )
+    chain = chain_for(cached)
 
     response_data = GreeksSummaryResponse(
-        underlying_symbol=chain_data.get("underlying_symbol", symbol),
-        underlying_price=chain_data.get("underlying_price"),
-        expirations=results
+        underlying_symbol=chain.symbol or symbol,
+        underlying_price=chain.underlying_price,
+        expirations=[GreeksExpirationItem(**item) for item in chain.summary],
     )
 
     return CachedResult(
@@ -5,6 +5,11 @@ GET /api/scan/bullish  preset: bullish with 3+ confluence, 50%+ confidence
 GET /api/scan/bearish  preset: bearish with 3+ confluence, 50%+ confidence
 GET /api/scan/strong   preset: 5+ confluence, 70%+ confidence
 
+Scans are set-based: the latest composite, methodology signal and last bar
+for every watchlist ticker come from one windowed query per table, with the
+confluence/confidence/direction filters pushed into SQL.  The response
+carries the executed ``scan_plan`` and per-query timings.
+
 Full implementation: TASK-ANALYSIS-010
 """
 from __future__ import annotations
@@ -19,6 +24,7 @@ from fastapi import APIRouter, HTTPException, Query
 
 from app.analysis.base import METHODOLOGY_NAMES
 from app.data.database import get_database
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -143,32 +149,101 @@ async def _fetch_watchlist(db: Any, group: str | None) -> list[dict[str, Any]]:
     )
 
 
-async def _get_composite(db: Any, symbol: str) -> dict[str, Any] | None:
-    """Get the most recent composite cache entry for *symbol*."""
-    row = await db.fetch_one(
-        "SELECT composite_json, signals_json, created_at "
-        "FROM analysis_cache WHERE ticker = ? "
-        "ORDER BY created_at DESC LIMIT 1", (symbol,),
+def _watchlist_subquery(group: str | None) -> tuple[str, tuple[Any, ...]]:
+    """Return ``(sql, params)`` selecting the scanned watchlist symbols."""
+    if group is not None:
+        return "SELECT symbol FROM watchlist WHERE group_name = ?", (group,)
+    return "SELECT symbol FROM watchlist", ()
+
+
+async def _fetch_composites(
+    db: Any, group: str | None, *,
+    confluence: int | None, min_conf: float | None,
+) -> dict[str, dict[str, Any]]:
+    """Latest composite per watchlist ticker in one windowed query.
+
+    *confluence* and *min_conf* (composite confidence) are pushed into SQL;
+    rows with corrupt JSON are dropped by :func:`_parse_composite_json`.
+    """
+    wl_sql, params = _watchlist_subquery(group)
+    where: list[str] = ["rn = 1"]
+    if confluence is not None:
+        where.append(
+            "CAST(CASE WHEN json_valid(composite_json) "
+            "THEN json_extract(composite_json, '$.confluence_count') END AS REAL) >= ?"
+        )
+        params += (confluence,)
+    if min_conf:
+        where.append(
+            "CAST(CASE WHEN json_valid(composite_json) "
+            "THEN json_extract(composite_json, '$.overall_confidence') END AS REAL) >= ?"
+        )
+        params += (min_conf,)
+    await get_write_behind().settle("analysis_cache")
+    rows = await db.fetch_all(
+        "SELECT ticker, composite_json, signals_json, created_at FROM ("
+        "SELECT ticker, composite_json, signals_json, created_at, "
+        "ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY created_at DESC) AS rn "
+        f"FROM analysis_cache WHERE ticker IN ({wl_sql})"
+        f") WHERE {' AND '.join(where)}",
+        params,
     )
-    if row is None:
-        return None
-    composite = _parse_composite_json(row.get("composite_json"))
-    if composite is None:
-        return None
-    composite["_created_at"] = row.get("created_at")
-    composite["_signals_json"] = row.get("signals_json")
-    return composite
-
-
-async def _get_method_signal(
-    db: Any, symbol: str, methodology: str,
-) -> dict[str, Any] | None:
-    """Get the most recent analysis_results row for a specific methodology."""
-    return await db.fetch_one(
-        "SELECT direction, confidence, timeframe, signal_json, analyzed_at "
-        "FROM analysis_results WHERE symbol = ? AND methodology = ? "
-        "ORDER BY analyzed_at DESC LIMIT 1", (symbol, methodology),
+    out: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        composite = _parse_composite_json(row.get("composite_json"))
+        if composite is None:
+            continue
+        composite["_created_at"] = row.get("created_at")
+        composite["_signals_json"] = row.get("signals_json")
+        out[row["ticker"]] = composite
+    return out
+
+
+async def _fetch_method_signals(
+    db: Any, group: str | None, methodology: str, *,
+    signal: str | None, min_conf: float | None, timeframe: str | None,
+) -> dict[str, dict[str, Any]]:
+    """Latest ``analysis_results`` row per ticker for *methodology*.
+
+    Direction, confidence and timeframe filters are pushed into SQL.
+    """
+    wl_sql, wl_params = _watchlist_subquery(group)
+    params: tuple[Any, ...] = (methodology, *wl_params)
+    where: list[str] = ["rn = 1"]
+    if signal is not None:
+        where.append("LOWER(direction) = ?")
+        params += (signal,)
+    if min_conf:
+        where.append("confidence >= ?")
+        params += (min_conf,)
+    if timeframe is not None:
+        where.append("LOWER(timeframe) = ?")
+        params += (timeframe,)
+    rows = await db.fetch_all(
+        "SELECT symbol, direction, confidence, timeframe, signal_json, analyzed_at "
+        "FROM (SELECT symbol, direction, confidence, timeframe, signal_json, "
+        "analyzed_at, ROW_NUMBER() OVER "
+        "(PARTITION BY symbol ORDER BY analyzed_at DESC) AS rn "
+        "FROM analysis_results WHERE methodology = ? "
+        f"AND symbol IN ({wl_sql})"
+        f") WHERE {' AND '.join(where)}",
+        params,
     )
+    return {row["symbol"]: row for row in rows}
+
+
+async def _fetch_last_bars(db: Any, group: str | None) -> dict[str, dict[str, Any]]:
+    """Latest ``price_cache`` bar (open/close) per watchlist ticker."""
+    wl_sql, params = _watchlist_subquery(group)
+    rows = await db.fetch_all(
+        "SELECT symbol, close, open FROM ("
+        "SELECT symbol, close, open, ROW_NUMBER() OVER "
+        "(PARTITION BY symbol ORDER BY date DESC) AS rn "
+        f"FROM price_cache WHERE symbol IN ({wl_sql})"
+        ") WHERE rn = 1",
+        params,
+    )
+    return {row["symbol"]: row for row in rows}
 
 
 # ---------------------------------------------------------------------------
@@ -288,6 +363,7 @@ def _envelope(
     min_confidence: float, timeframe: str | None, group: str | None,
     results: list[dict[str, Any]], total_scanned: int,
     duration_ms: int, note: str | None,
+    plan: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     return {
         "query": {
@@ -299,6 +375,7 @@ def _envelope(
         "total_matches": len(results),
         "total_scanned": total_scanned,
         "scan_duration_ms": duration_ms,
+        "scan_plan": plan,
         "note": note,
     }
 
@@ -347,38 +424,90 @@ async def _scan_impl(
 
     db = await get_database()
     cache_ok = await _table_exists(db, "analysis_cache")
+    t_q = time.monotonic()
     tickers = await _fetch_watchlist(db, group)
     total_scanned = len(tickers)
 
+    # The plan records which filters run in SQL vs. in Python, and where time went.
+    pushed: list[str] = []
+    if confluence is not None:
+        pushed.append("confluence")
+    if min_confidence:
+        pushed.append("method_confidence" if method else "composite_confidence")
+    if method is not None:
+        pushed.append("method")
+        if signal is not None:
+            pushed.append("signal")
+        if timeframe is not None:
+            pushed.append("timeframe")
+    plan: dict[str, Any] = {
+        "engine": "batch",
+        "queries": ["watchlist"],
+        "pushed_filters": pushed,
+        "residual_filters": (
+            ["timeframe"] if timeframe is not None and method is None else []
+        ),
+        "timings_ms": {"watchlist": _elapsed_ms(t_q)},
+    }
+
     env = dict(method=method, signal=signal, confluence=confluence,
                min_confidence=min_confidence, timeframe=timeframe, group=group)
 
     if total_scanned == 0:
         return _envelope(**env, results=[], total_scanned=0,
-                         duration_ms=_elapsed_ms(t0), note="No tickers in watchlist")
+                         duration_ms=_elapsed_ms(t0), note="No tickers in watchlist",
+                         plan=plan)
     if not cache_ok:
         return _envelope(**env, results=[], total_scanned=total_scanned,
                          duration_ms=_elapsed_ms(t0),
-                         note="No analysis data available yet. Run analysis first.")
-
-    # -- Scan each ticker -----------------------------------------------------
-    results: list[dict[str, Any]] = []
-    all_stale = True
+                         note="No analysis data available yet. Run analysis first.",
+                         plan=plan)
+
+    # -- Set-based fetch: one windowed query per table ------------------------
+    t_q = time.monotonic()
+    composites = await _fetch_composites(
+        db, group, confluence=confluence,
+        min_conf=None if method else min_confidence,
+    )
+    plan["queries"].append("composites")
+    plan["timings_ms"]["composites"] = _elapsed_ms(t_q)
+
+    method_signals: dict[str, dict[str, Any]] = {}
+    if method and composites:
+        t_q = time.monotonic()
+        method_signals = await _fetch_method_signals(
+            db, group, method, signal=signal,
+            min_conf=min_confidence, timeframe=timeframe,
+        )
+        plan["queries"].append("method_signals")
+        plan["timings_ms"]["method_signals"] = _elapsed_ms(t_q)
 
+    # -- Residual filtering (pushed filters are re-checked; cheap) ------------
+    t_q = time.monotonic()
+    matched: list[tuple[str, dict[str, Any], dict[str, Any] | None]] = []
     for row in tickers:
         sym = row["symbol"]
-        comp = await _get_composite(db, sym)
+        comp = composites.get(sym)
         if comp is None:
             continue
-        msig = await _get_method_signal(db, sym, method) if method else None
+        msig = method_signals.get(sym) if method else None
         if not _matches(comp, msig, method, signal,
                         confluence, min_confidence, timeframe):
             continue
-        price_row = await db.fetch_one(
-            "SELECT close, open FROM price_cache "
-            "WHERE symbol = ? ORDER BY date DESC LIMIT 1", (sym,),
-        )
-        lp, pcp = _price_info(price_row)
+        matched.append((sym, comp, msig))
+    plan["timings_ms"]["filter"] = _elapsed_ms(t_q)
+
+    bars: dict[str, dict[str, Any]] = {}
+    if matched:
+        t_q = time.monotonic()
+        bars = await _fetch_last_bars(db, group)
+        plan["queries"].append("last_bars")
+        plan["timings_ms"]["last_bars"] = _elapsed_ms(t_q)
+
+    results: list[dict[str, Any]] = []
+    all_stale = True
+    for sym, comp, msig in matched:
+        lp, pcp = _price_info(bars.get(sym))
         item = _build_item(sym, comp, method, msig, lp, pcp)
         if not item["stale"]:
             all_stale = False
@@ -394,10 +523,11 @@ async def _scan_impl(
         note = "All results are stale (>2 hours old). Consider re-running analysis."
 
     duration_ms = _elapsed_ms(t0)
-    logger.info("Scan: %d/%d matches in %dms", len(results), total_scanned, duration_ms)
+    logger.info("Scan: %d/%d matches in %dms (%d queries)",
+                len(results), total_scanned, duration_ms, len(plan["queries"]))
 
     return _envelope(**env, results=results, total_scanned=total_scanned,
-                     duration_ms=duration_ms, note=note)
+                     duration_ms=duration_ms, note=note, plan=plan)
 
 
 # ---------------------------------------------------------------------------
@@ -3,14 +3,16 @@
 GET /api/ticker/{symbol}  returns current price, company metadata,
 data freshness info, and optional OHLCV history.
 
-Uses the CacheManager (Finnhub → yfinance fallback chain) for price
-data, plus direct FinnhubClient calls for supplementary company
-profile and basic financials.
+Uses the CacheManager for the price quote (Finnhub → yfinance fallback
+chain) and, concurrently with it, for the supplementary Finnhub company
+profile and basic financials, so a warm view makes no upstream calls.
+The ``freshness`` block reports source and age per response section.
 
 Full implementation: TASK-API-002
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from datetime import datetime
@@ -18,9 +20,11 @@ from enum import Enum
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.api.conditional import conditional
 from app.data.cache import get_cache_manager
+from app.data.cache_types import CachedResult
 from app.data.finnhub_client import get_finnhub_client
 
 logger = logging.getLogger(__name__)
@@ -60,67 +64,60 @@ class Period(str, Enum):
     h12 = "12h"
 
 
+# Chart period -> resampling rule (see app.data.bar_store.CHART_RULES)
+_CHART_RULES: dict[Period, str] = {
+    Period.h1: "1h",
+    Period.h4: "4h",
+    Period.h8: "8h",
+    Period.h12: "12h",
+    Period.d1: "1d",
+    Period.w1: "1wk",
+    Period.m1: "1mo",
+    Period.m3: "3mo",
+    Period.y6: "6mo",
+    Period.y1: "1y",
+    Period.y5: "5y",
+}
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _aggregate_bars(bars: list[dict[str, Any]], hours: int) -> list[dict[str, Any]]:
-    """Aggregate 1h bars into N-hour bars."""
-    if not bars:
-        return []
-    
-    aggregated = []
-    current_batch = []
-    batch_start_time = None
-    
-    # Simple aggregation: group by N entries since we expect continuous hourly data
-    # A more robust approach would align to clock hours (e.g. 9:30, 13:30) but this suffices for now.
-    
-    for bar in bars:
-        # Check for session breaks (large time gaps) to reset batch
-        # For simplicity, we just group every 'hours' bars. 
-        # Ideally we'd respect trading sessions.
-        
-        current_batch.append(bar)
-        
-        if len(current_batch) == hours:
-            # Aggregate
-            open_p = current_batch[0]["open"]
-            close_p = current_batch[-1]["close"]
-            high_p = max(b["high"] for b in current_batch)
-            low_p = min(b["low"] for b in current_batch)
-            volume = sum(b.get("volume", 0) or 0 for b in current_batch)
-            date = current_batch[-1]["date"] # Use close time/date
-            
-            aggregated.append({
-                "date": date,
-                "open": open_p,
-                "high": high_p,
-                "low": low_p,
-                "close": close_p,
-                "volume": volume,
-            })
-            current_batch = []
-            
-    # Handle remaining partial batch
-    if current_batch:
-        open_p = current_batch[0]["open"]
-        close_p = current_batch[-1]["close"]
-        high_p = max(b["high"] for b in current_batch)
-        low_p = min(b["low"] for b in current_batch)
-        volume = sum(b.get("volume", 0) or 0 for b in current_batch)
-        date = current_batch[-1]["date"]
-        
-        aggregated.append({
-            "date": date,
-            "open": open_p,
-            "high": high_p,
-            "low": low_p,
-            "close": close_p,
-            "volume": volume,
-        })
-        
-    return aggregated
+async def _no_result() -> None:
+    """Stand-in for a supplement that is not fetched (source disabled)."""
+    return None
+
+
+def _supplement(label: str, symbol: str, result: Any) -> CachedResult | None:
+    """*result* of a best-effort supplement fetch, or *None* if it failed."""
+    if isinstance(result, BaseException):
+        logger.debug("%s fetch failed for %s", label, symbol, exc_info=result)
+        return None
+    if result is None or not isinstance(result.data, dict):
+        return None
+    return result
+
+
+def _freshness(result: CachedResult | None) -> dict[str, Any] | None:
+    """Freshness metadata of one response section (*None* if unavailable)."""
+    if result is None:
+        return None
+    return {
+        "source": result.source,
+        "fetched_at": result.fetched_at,
+        "age_seconds": result.cache_age_seconds,
+        "is_stale": result.is_stale,
+        "expires_at": result.expires_at,
+    }
+
+
+def _etag_parts(result: CachedResult | None) -> tuple[Any, ...]:
+    """What identifies one section's cache entry for the response ETag."""
+    if result is None:
+        return (None, None, None)
+    return (result.cache_key, result.source, result.fetched_at)
+
 
 def _validate_symbol(symbol: str) -> str:
     """Strip, upper-case, and validate *symbol*.  Raises 400 on failure."""
@@ -184,25 +181,46 @@ def _extract_price_block(
 # Endpoint
 # ---------------------------------------------------------------------------
 
-@router.get("/{symbol}")
+@router.get("/{symbol}", response_model=None)
 async def get_ticker(
+    request: Request,
+    http_response: Response,
     symbol: str,
     period: Period = Query(Period.d1, description="OHLCV history period"),
     include_history: bool = Query(False, description="Include OHLCV array"),
-) -> dict[str, Any]:
+    since: str | None = Query(
+        None,
+        pattern=r"^\d{4}-\d{2}-\d{2}([T ][0-9:.+\-Z]*)?$",
+        description="Only return OHLCV bars dated on/after this bar date",
+    ),
+) -> dict[str, Any] | Response:
     """Return price data and basic info for *symbol*.
 
     Always includes ``data_timestamp``, ``data_age_seconds``, and
     ``is_market_open`` so the UI never silently shows stale data.
+
+    Pollers pass the date of the last bar they hold as *since* to receive
+    only that bar (it may still be forming) and newer ones, and send the
+    previous ``ETag`` as ``If-None-Match`` to get ``304`` while neither the
+    quote nor the history has changed.
     """
     symbol = _validate_symbol(symbol)
     cache = get_cache_manager()
 
-    # -- 1. Price quote via cache (finnhub → yfinance fallback) -------------
-    try:
-        price_result = await cache.get_price(symbol)
-    except Exception:
-        logger.warning("Cache fetch error for %s", symbol, exc_info=True)
+    # -- 1. Quote + supplements, fetched concurrently through the cache ----
+    #    Quote: finnhub → yfinance fallback.  Company profile (TTL days) and
+    #    basic financials (TTL hours) come from Finnhub and are best-effort;
+    #    their failures do not block the response.
+    supplements = get_finnhub_client().is_enabled
+    price_result, profile_result, financials_result = await asyncio.gather(
+        cache.get_price(symbol),
+        cache.get_company_profile(symbol) if supplements else _no_result(),
+        cache.get_basic_financials(symbol) if supplements else _no_result(),
+        return_exceptions=True,
+    )
+
+    if isinstance(price_result, BaseException):
+        logger.warning("Cache fetch error for %s", symbol, exc_info=price_result)
         price_result = None
 
     if price_result is None:
@@ -215,22 +233,40 @@ async def get_ticker(
     quote: dict[str, Any] = price_result.data
 
     # -- 2. Supplementary data (company profile + financials) ---------------
-    #    These are best-effort; failures do not block the response.
-    finnhub = get_finnhub_client()
-    profile: dict[str, Any] | None = None
-    financials: dict[str, Any] | None = None
+    profile_result = _supplement("Company profile", symbol, profile_result)
+    financials_result = _supplement("Basic financials", symbol, financials_result)
+    profile: dict[str, Any] | None = profile_result.data if profile_result else None
+    financials: dict[str, Any] | None = (
+        financials_result.data if financials_result else None
+    )
 
-    if finnhub.is_enabled:
-        try:
-            profile = await finnhub.get_company_profile(symbol)
-        except Exception:
-            logger.debug("Company profile fetch failed for %s", symbol, exc_info=True)
+    # -- 3. Optional OHLCV history ------------------------------------------
+    hist_result = None
+    if include_history:
+        # Every chart period is resampled server-side from the symbol's
+        # cached 1h / 1d base series, so switching periods does not download.
         try:
-            financials = await finnhub.get_basic_financials(symbol)
+            hist_result = await cache.get_chart_bars(
+                symbol, _CHART_RULES[period], since=since,
+            )
         except Exception:
-            logger.debug("Basic financials fetch failed for %s", symbol, exc_info=True)
+            logger.debug("Historical prices fetch failed for %s", symbol, exc_info=True)
+            hist_result = None
+
+    # -- 4. Conditional GET -------------------------------------------------
+    #    Tagged by the cache entries behind the payload, so an unchanged
+    #    poll is answered before the response and OHLCV rows are built.
+    market_open = _is_market_open()
+    not_modified = conditional(
+        request, http_response,
+        *_etag_parts(price_result), *_etag_parts(profile_result),
+        *_etag_parts(financials_result), *_etag_parts(hist_result),
+        period.value, since, include_history, market_open,
+    )
+    if not_modified is not None:
+        return not_modified
 
-    # -- 3. Build response --------------------------------------------------
+    # -- 5. Build response --------------------------------------------------
     response: dict[str, Any] = {
         "symbol": symbol,
         "name": (profile or {}).get("name"),
@@ -241,48 +277,13 @@ async def get_ticker(
         "data_source": price_result.source if price_result else "none",
         "data_timestamp": price_result.fetched_at if price_result else "",
         "data_age_seconds": price_result.cache_age_seconds if price_result else 0.0,
-        "is_market_open": _is_market_open(),
+        "is_market_open": market_open,
         "cache_hit": price_result.is_cached if price_result else False,
     }
 
-    # -- 4. Optional OHLCV history ------------------------------------------
     if include_history:
-        # Determine yfinance parameters based on requested period
-        if period in (Period.h1, Period.h4, Period.h8, Period.h12):
-            # Intraday: fetch 1h data for max available time (2y)
-            yf_period = "2y"
-            yf_interval = "1h"
-        elif period == Period.d1:
-            yf_period = "10y"
-            yf_interval = "1d"
-        elif period == Period.w1:
-            yf_period = "10y"
-            yf_interval = "1wk"
-        elif period == Period.m1:
-            yf_period = "10y"
-            yf_interval = "1mo"
-        elif period == Period.m3:
-            yf_period = "10y"
-            yf_interval = "3mo"
-        elif period in (Period.y6, Period.y1, Period.y5):
-            # Aggregate from 3mo data
-            yf_period = "max"
-            yf_interval = "3mo"
-        else:
-            # Fallback (should cover all enum cases already)
-            yf_period = "max"
-            yf_interval = "1d"
-
-        try:
-            hist_result = await cache.get_historical_prices(
-                symbol, period=yf_period, interval=yf_interval,
-            )
-        except Exception:
-            logger.debug("Historical prices fetch failed for %s", symbol, exc_info=True)
-            hist_result = None
-
-        if hist_result and hist_result.data is not None and isinstance(hist_result.data, list):
-            bars = [
+        if hist_result and isinstance(hist_result.data, list):
+            response["ohlcv"] = [
                 {
                     "date": bar.get("date"),
                     "open": bar.get("open"),
@@ -293,32 +294,17 @@ async def get_ticker(
                 }
                 for bar in hist_result.data
             ]
-            
-            # Aggregate if needed
-            # Intraday Aggregation
-            if period == Period.h4:
-                bars = _aggregate_bars(bars, 4)
-            elif period == Period.h8:
-                bars = _aggregate_bars(bars, 8)
-            elif period == Period.h12:
-                bars = _aggregate_bars(bars, 12)
-            
-            # Long-term Aggregation (from 3mo bars)
-            elif period == Period.y6:
-                # 6 months = 2 * 3mo
-                bars = _aggregate_bars(bars, 2)
-            elif period == Period.y1:
-                # 1 year = 4 * 3mo
-                bars = _aggregate_bars(bars, 4)
-            elif period == Period.y5:
-                # 5 years = 20 * 3mo
-                bars = _aggregate_bars(bars, 20)
-                
-            response["ohlcv"] = bars
         else:
             response["ohlcv"] = []
 
-
+    # -- 6. Per-section freshness -------------------------------------------
+    response["freshness"] = {
+        "quote": _freshness(price_result),
+        "profile": _freshness(profile_result),
+        "financials": _freshness(financials_result),
+    }
+    if include_history:
+        response["freshness"]["history"] = _freshness(hist_result)
 
     logger.info(
         "Ticker %s: source=%s cache_hit=%s age=%.0fs",
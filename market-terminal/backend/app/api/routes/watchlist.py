@@ -17,7 +17,9 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, field_validator
 
+from app.data.cache import get_cache_manager
 from app.data.database import get_database
+from app.data.rate_limiter import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -217,9 +219,10 @@ async def _warm_ticker_cache(symbol: str) -> None:
             _fetch_data, _run_methodologies, METHODOLOGY_NAMES,
             _MAX_ANALYSIS_SECONDS,
         )
-        price_df, volume_df, fundamentals, news_articles, _ = (
-            await _fetch_data(symbol, timeframe="1d", force_refresh=False)
-        )
+        with request_priority(Priority.PREWARM):
+            price_df, volume_df, fundamentals, news_articles, _ = (
+                await _fetch_data(symbol, timeframe="1d", force_refresh=False)
+            )
         await asyncio.wait_for(
             _run_methodologies(
                 symbol, price_df, volume_df, fundamentals,
@@ -301,6 +304,8 @@ async def add_to_watchlist(body: _AddTickerRequest) -> dict[str, Any]:
 
     # Fire background task to pre-warm analysis cache for instant first-click UX
     asyncio.create_task(_warm_ticker_cache(body.symbol))
+    # Keep its quote refreshed ahead of expiry from now on
+    get_cache_manager().pin_symbols([body.symbol])
 
     return await _enrich_entry(inserted)
 
@@ -325,6 +330,7 @@ async def remove_from_watchlist(symbol: str) -> dict[str, str]:
         raise HTTPException(status_code=404, detail="Symbol not in watchlist")
 
     await db.execute("DELETE FROM watchlist WHERE symbol = ?", (cleaned,))
+    get_cache_manager().unpin_symbols([cleaned])
 
     return {"removed": cleaned}
 
@@ -4,6 +4,13 @@ Real-time data streaming: price updates, analysis progress, news alerts,
 god-agent streaming responses.  Manages multiple client connections with
 channel subscriptions, heartbeat monitoring, and auto-cleanup.
 
+Fan-out is indexed by channel, so a broadcast touches only the channel's
+subscribers.  Each message is serialized once and the encoded text frame
+is appended to every recipient's bounded send queue; a per-client writer
+task drains the queue in order.  A client whose queue fills up (it reads
+slower than we publish) is evicted rather than allowed to stall or bloat
+the server.
+
 Full implementation: TASK-API-008
 """
 
@@ -13,6 +20,7 @@ import asyncio
 import json
 import logging
 import uuid
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any
 
@@ -26,19 +34,29 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 _HEARTBEAT_INTERVAL_S = 30
 _STALE_TIMEOUT_S = 90  # 3 missed heartbeats
-_MAX_CONNECTIONS = 10
+_MAX_CONNECTIONS = 500
 _MAX_MESSAGE_BYTES = 65_536  # 64 KB
+_SEND_QUEUE_SIZE = 256  # frames buffered per client before it is evicted
+_SLOW_CONSUMER_CLOSE_CODE = 1013  # "try again later"
 
 router = APIRouter(tags=["websocket"])
 
 
+def _encode(message: dict[str, Any]) -> str:
+    """Serialize *message* exactly as ``WebSocket.send_json`` would."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 # ---------------------------------------------------------------------------
 # Connection record
 # ---------------------------------------------------------------------------
 class _Connection:
-    """Metadata for a single WebSocket connection."""
+    """Metadata and outbound queue for a single WebSocket connection."""
 
-    __slots__ = ("ws", "client_id", "connected_at", "subscriptions", "last_heartbeat")
+    __slots__ = (
+        "ws", "client_id", "connected_at", "subscriptions", "last_heartbeat",
+        "queue", "writer",
+    )
 
     def __init__(self, ws: WebSocket, client_id: str) -> None:
         self.ws = ws
@@ -46,6 +64,8 @@ class _Connection:
         self.connected_at = datetime.now(tz=timezone.utc).isoformat()
         self.subscriptions: set[str] = set()
         self.last_heartbeat = datetime.now(tz=timezone.utc)
+        self.queue: deque[str] = deque()
+        self.writer: asyncio.Task[None] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -64,6 +84,8 @@ class WebSocketManager:
 
     def __init__(self) -> None:
         self._connections: dict[str, _Connection] = {}
+        self._channels: dict[str, set[_Connection]] = {}
+        self._closing: set[asyncio.Task[None]] = set()
         self._lock = asyncio.Lock()
 
     # -- lifecycle ----------------------------------------------------------
@@ -76,6 +98,9 @@ class WebSocketManager:
         async with self._lock:
             if len(self._connections) >= _MAX_CONNECTIONS:
                 raise ConnectionRefusedError("Maximum connections reached")
+            previous = self._connections.get(client_id)
+            if previous is not None:
+                self._remove(previous)
             self._connections[client_id] = _Connection(websocket, client_id)
         logger.info("WebSocket client connected: %s (total: %d)",
                      client_id, len(self._connections))
@@ -83,68 +108,54 @@ class WebSocketManager:
     async def disconnect(self, client_id: str) -> None:
         """Remove a client from the connection pool."""
         async with self._lock:
-            self._connections.pop(client_id, None)
+            conn = self._connections.get(client_id)
+            if conn is not None:
+                self._remove(conn)
         logger.info("WebSocket client disconnected: %s (total: %d)",
                      client_id, len(self._connections))
 
     # -- messaging ----------------------------------------------------------
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """Send *message* to ALL connected clients.
+        """Queue *message* for ALL connected clients.
 
-        Uses ``asyncio.gather`` with ``return_exceptions=True`` so a failed
-        send to one client does not block the others.
+        The message is serialized once; delivery happens on each client's
+        writer task, so a slow or failing client does not block the others.
         """
-        async with self._lock:
-            conns = list(self._connections.values())
-
-        if not conns:
-            return
-
-        results = await asyncio.gather(
-            *(self._safe_send(c, message) for c in conns),
-            return_exceptions=True,
-        )
-
-        # Clean up any clients that failed
-        for conn, result in zip(conns, results):
-            if result is True:  # _safe_send returns True on failure
-                await self.disconnect(conn.client_id)
+        if self._connections:
+            self._fan_out(list(self._connections.values()), message)
 
     async def send_to_client(
         self, client_id: str, message: dict[str, Any]
     ) -> None:
-        """Send *message* to a single client identified by *client_id*."""
-        async with self._lock:
-            conn = self._connections.get(client_id)
+        """Queue *message* for a single client identified by *client_id*."""
+        conn = self._connections.get(client_id)
         if conn is None:
             logger.warning("send_to_client: unknown client %s", client_id)
             return
-        failed = await self._safe_send(conn, message)
-        if failed:
-            await self.disconnect(client_id)
+        self._fan_out([conn], message)
 
     async def broadcast_to_subscribers(
         self, channel: str, message: dict[str, Any]
     ) -> None:
-        """Send *message* only to clients subscribed to *channel*."""
-        async with self._lock:
-            conns = [
-                c for c in self._connections.values()
-                if channel in c.subscriptions
-            ]
-
-        if not conns:
-            return
-
-        results = await asyncio.gather(
-            *(self._safe_send(c, message) for c in conns),
-            return_exceptions=True,
-        )
+        """Queue *message* only for clients subscribed to *channel*.
 
-        for conn, result in zip(conns, results):
-            if result is True:
-                await self.disconnect(conn.client_id)
+        Costs O(subscribers): the channel index is consulted directly
+        instead of scanning every connection.
+        """
+        subscribers = self._channels.get(channel)
+        if subscribers:
+            self._fan_out(list(subscribers), message)
+
+    async def drain(self) -> None:
+        """Wait until every queued frame has been sent or its client dropped."""
+        pending = [
+            c.writer for c in self._connections.values()
+            if c.writer is not None and not c.writer.done()
+        ]
+        pending.extend(self._closing)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     # -- queries ------------------------------------------------------------
 
@@ -169,6 +180,7 @@ class WebSocketManager:
             if conn is None:
                 return False
             conn.subscriptions.add(channel)
+            self._channels.setdefault(channel, set()).add(conn)
         logger.debug("Client %s subscribed to %s", client_id, channel)
         return True
 
@@ -182,6 +194,7 @@ class WebSocketManager:
             if conn is None:
                 return False
             conn.subscriptions.discard(channel)
+            self._unindex(conn, channel)
         logger.debug("Client %s unsubscribed from %s", client_id, channel)
         return True
 
@@ -207,21 +220,90 @@ class WebSocketManager:
                 elapsed = (now - conn.last_heartbeat).total_seconds()
                 if elapsed >= _STALE_TIMEOUT_S:
                     stale.append(cid)
-                    self._connections.pop(cid, None)
+                    self._remove(conn)
                     logger.info("Removed stale connection: %s (%.0fs)", cid, elapsed)
 
         return stale
 
     # -- internals ----------------------------------------------------------
 
-    async def _safe_send(
-        self, conn: _Connection, message: dict[str, Any]
-    ) -> bool:
-        """Send *message* to *conn*; return *True* on failure."""
+    def _fan_out(self, conns: list[_Connection], message: dict[str, Any]) -> None:
+        """Serialize *message* once and queue the frame for each of *conns*."""
+        try:
+            frame = _encode(message)
+        except (TypeError, ValueError):
+            logger.warning("Dropping unserializable WebSocket message (type=%s)",
+                           message.get("type"), exc_info=True)
+            return
+        for conn in conns:
+            self._enqueue(conn, frame)
+
+    def _enqueue(self, conn: _Connection, frame: str) -> None:
+        """Append *frame* to *conn*'s queue, evicting the client if it is full."""
+        if len(conn.queue) >= _SEND_QUEUE_SIZE:
+            self._evict(conn)
+            return
+        conn.queue.append(frame)
+        if conn.writer is None or conn.writer.done():
+            conn.writer = asyncio.get_running_loop().create_task(self._write(conn))
+
+    async def _write(self, conn: _Connection) -> None:
+        """Drain *conn*'s queue in order; drop the client on a failed send."""
+        while conn.queue:
+            frame = conn.queue.popleft()
+            if await self._safe_send(conn, frame):
+                self._remove(conn)
+                return
+
+    def _evict(self, conn: _Connection) -> None:
+        """Drop a client that cannot keep up and close its socket."""
+        logger.warning("Evicting slow WebSocket client %s (%d frames queued)",
+                       conn.client_id, len(conn.queue))
+        if not self._remove(conn):
+            return
+        task = asyncio.get_running_loop().create_task(self._close(conn))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(conn: _Connection) -> None:
+        try:
+            await conn.ws.close(
+                code=_SLOW_CONSUMER_CLOSE_CODE, reason="Client too slow",
+            )
+        except Exception:
+            logger.debug("Close failed for evicted client %s", conn.client_id)
+
+    def _remove(self, conn: _Connection) -> bool:
+        """Unregister *conn* (if still current) and stop its writer.
+
+        Callers either hold ``_lock`` or run without awaiting, so the
+        connection map and channel index change together.
+        """
+        if self._connections.get(conn.client_id) is not conn:
+            return False
+        del self._connections[conn.client_id]
+        for channel in conn.subscriptions:
+            self._unindex(conn, channel)
+        conn.queue.clear()
+        writer = conn.writer
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        return True
+
+    def _unindex(self, conn: _Connection, channel: str) -> None:
+        subscribers = self._channels.get(channel)
+        if subscribers is not None:
+            subscribers.discard(conn)
+            if not subscribers:
+                del self._channels[channel]
+
+    async def _safe_send(self, conn: _Connection, frame: str) -> bool:
+        """Send the pre-encoded *frame* to *conn*; return *True* on failure."""
         try:
             if conn.ws.client_state != WebSocketState.CONNECTED:
                 return True  # already disconnected
-            await conn.ws.send_json(message)
+            await conn.ws.send_text(frame)
             return False
         except Exception:
             logger.warning("Failed to send to client %s", conn.client_id,
@@ -69,6 +69,39 @@ class Settings(BaseSettings):
 
     # -- Database -------------------------------------------------------------
     database_path: Path = Path("data/market_terminal.db")
+    database_read_pool_size: int = 4
+    # Writes landing within this window share one COMMIT
+    database_commit_window_ms: float = 2.0
+    database_statement_cache_size: int = 256
+    # PRAGMAs applied to every connection
+    database_synchronous: str = "NORMAL"  # OFF | NORMAL | FULL | EXTRA
+    database_mmap_size: int = 268_435_456  # bytes; 0 disables mmap
+    database_cache_size_kib: int = 65_536  # page cache per connection
+    database_temp_store: str = "MEMORY"  # DEFAULT | FILE | MEMORY
+    # One-off full VACUUM at startup so older files gain auto_vacuum=INCREMENTAL
+    database_convert_auto_vacuum: bool = False
+    # Cache upserts are queued and flushed in one transaction per interval
+    write_behind_flush_ms: int = 250
+    write_behind_max_pending: int = 1000
+
+    # -- Retention (app.data.retention) ---------------------------------------
+    retention_enabled: bool = True
+    retention_interval_minutes: int = 360
+    retention_analysis_keep: int = 20  # composites kept per ticker
+    retention_analysis_days: int = 30
+    retention_history_days: int = 7  # legacy hist_* rows in fundamentals_cache
+    retention_options_full_hours: int = 24  # older snapshots kept one per day
+    retention_options_days: int = 30
+
+    # -- Refresh-ahead (app.data.refresh_ahead) -------------------------------
+    refresh_ahead_lead_pct: int = 10  # refresh this % of the TTL before expiry
+    refresh_ahead_hot_minutes: int = 30  # keys read within this window stay hot
+    refresh_ahead_max_keys: int = 500
+    refresh_ahead_concurrency: int = 4
+
+    # -- Macro reactions (app.data.macro_reactions) ---------------------------
+    macro_reactions_enabled: bool = True
+    macro_reactions_interval_minutes: int = 60
 
     # -- Cache TTL (seconds) --------------------------------------------------
     cache_ttl_price: int = 900
@@ -81,15 +114,35 @@ class Settings(BaseSettings):
     cache_ttl_analysis: int = 3600
     cache_ttl_options: int = 300
     cache_ttl_economic_calendar: int = 43200
+    cache_ttl_profile: int = 604800
+    cache_ttl_financials: int = 21600
 
     # -- Massive Options ------------------------------------------------------
     massive_options_tier: str = "starter"
+    # Annualised rate used for locally computed option greeks / implied vol
+    options_risk_free_rate: float = 0.04
+    # Cadence at which streamed quotes/trades are flushed to WebSocket clients
+    massive_ws_flush_ms: int = 100
+
+    # -- Upstream rate limits (calls per window; see app.data.rate_limiter) ---
+    rate_limit_finnhub_per_minute: int = 60
+    rate_limit_fred_per_minute: int = 120
+    rate_limit_edgar_per_second: int = 10
+    rate_limit_forex_factory_per_5min: int = 2
+    # 0 = derive from massive_options_tier
+    rate_limit_massive_per_minute: int = 0
 
     # -- Circuit breaker ------------------------------------------------------
     circuit_breaker_failure_threshold: int = 3
     circuit_breaker_window_seconds: int = 300
     circuit_breaker_cooldown_seconds: int = 900
 
+    # -- Analysis pipeline ----------------------------------------------------
+    # "sequential" | "thread" | "process"
+    analysis_execution_mode: str = "thread"
+    analysis_max_workers: int = 6
+    analysis_methodology_timeout_seconds: float = 25.0
+
     # -- Sentiment ------------------------------------------------------------
     sentiment_use_lightweight: bool = False
 
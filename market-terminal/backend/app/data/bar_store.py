@@ -0,0 +1,636 @@
+"""Columnar OHLCV bar store backing :meth:`CacheManager.get_historical_prices`.
+
+Historical bars used to be cached as one JSON list per
+``hist_{period}_{interval}`` key in ``fundamentals_cache``, so ``1y`` /
+``10y`` / ``15y`` requests for the same symbol each held an overlapping copy
+and every read re-parsed the whole list.  This module keeps **one series per
+(symbol, interval)** instead:
+
+* Persisted one row per bar in ``price_bars`` (``WITHOUT ROWID``, keyed by
+  ``(symbol, interval, ts)``) plus a ``price_bar_series`` row recording how
+  far back the series is complete and when it was last topped up
+* Held in memory as numpy column arrays (:class:`BarSeries`); any *period*
+  is served by slicing the shared series with ``np.searchsorted``
+* Incremental append: a stale series only asks the source for a short
+  trailing window and writes just the bars missing from what is stored
+  or whose OHLCV the source has revised (e.g. a dividend back-adjustment)
+* Zero-copy frames: :meth:`BarSeries.to_frames` wraps the (read-only)
+  column arrays in the ``price_df`` / ``volume_df`` layout the analyzers
+  consume without copying them
+* Chart resampling: every chart period (:data:`CHART_RULES`) is derived
+  from one base series -- ``1h`` for intraday, ``1d`` for everything
+  longer -- with vectorized session- or calendar-aligned buckets
+  (:func:`resample`), memoized per base series by
+  :meth:`BarStore.resampled`
+
+Timestamps are the ISO strings produced by the yfinance client
+(``YYYY-MM-DD`` for daily and longer bars, full isoformat for intraday), so
+lexicographic order is chronological and a ``YYYY-MM-DD`` window start
+compares correctly against both.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_MAX_SERIES = 256
+_MAX_DERIVED = 512
+_ET = ZoneInfo("America/New_York")
+_SESSION_OPEN_MIN = 9 * 60 + 30  # 09:30 ET, minutes after midnight
+_MIN_SOURCE_BARS = 15  # yfinance client rejects smaller results (except 1d/5d)
+
+# Periods yfinance accepts, with their nominal length in days.
+_SOURCE_PERIODS: tuple[tuple[str, int], ...] = (
+    ("5d", 5),
+    ("1mo", 31),
+    ("3mo", 93),
+    ("6mo", 186),
+    ("1y", 365),
+    ("2y", 730),
+    ("5y", 1825),
+    ("10y", 3650),
+)
+
+# How far back yfinance serves intraday intervals.
+_MAX_LOOKBACK_DAYS: dict[str, int] = {
+    "1h": 730, "60m": 730, "90m": 60, "30m": 60,
+    "15m": 60, "5m": 60, "2m": 60, "1m": 7,
+}
+
+# Approximate calendar days covered by one bar (used to size top-ups).
+_BAR_DAYS: dict[str, float] = {
+    "1h": 0.25, "60m": 0.25, "1d": 1.5, "5d": 7.0,
+    "1wk": 7.0, "1mo": 31.0, "3mo": 92.0,
+}
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|m|y)$")
+_UNIT_DAYS = {"d": 1, "wk": 7, "mo": 31, "m": 31, "y": 365}
+
+_UPSERT_BARS = (
+    "INSERT OR REPLACE INTO price_bars "
+    "(symbol, interval, ts, open, high, low, close, volume) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+# ---------------------------------------------------------------------------
+# Period helpers
+# ---------------------------------------------------------------------------
+
+def period_days(period: str, now: datetime | None = None) -> int | None:
+    """Nominal length of *period* in days, or *None* for full history."""
+    if period == "ytd":
+        now = now or datetime.now(timezone.utc)
+        return now.timetuple().tm_yday
+    m = _PERIOD_RE.match(period)
+    if m is None:
+        return None
+    return int(m.group(1)) * _UNIT_DAYS[m.group(2)]
+
+
+def source_period(days: float | None, interval: str) -> str:
+    """Smallest yfinance period spanning *days* (capped for intraday intervals).
+
+    Lets the store honour periods yfinance itself rejects (``9mo``, ``15y``).
+    """
+    cap = _MAX_LOOKBACK_DAYS.get(interval)
+    best = _SOURCE_PERIODS[0][0]
+    for name, n in _SOURCE_PERIODS:
+        if cap is not None and n > cap:
+            return best
+        best = name
+        if days is not None and n >= days:
+            return name
+    return best if cap is not None else "max"
+
+
+def window_start(period: str, interval: str, now: datetime | None = None) -> str | None:
+    """First ``YYYY-MM-DD`` inside *period*, or *None* for full history.
+
+    Intraday windows are clamped to what the source can serve at all so a
+    long request does not look permanently uncovered.
+    """
+    now = now or datetime.now(timezone.utc)
+    days = period_days(period, now)
+    cap = _MAX_LOOKBACK_DAYS.get(interval)
+    if cap is not None:
+        days = cap if days is None else min(days, cap)
+    if days is None:
+        return None
+    return (now - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _wider(a: str | None, b: str | None) -> str | None:
+    """The earlier of two coverage starts (*None* = full history)."""
+    if a is None or b is None:
+        return None
+    return min(a, b)
+
+
+# ---------------------------------------------------------------------------
+# BarSeries
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True, eq=False)
+class BarSeries:
+    """Column arrays for one (symbol, interval), sorted by unique ``dates``.
+
+    Arrays are marked read-only because the same series is shared by every
+    caller; slices returned by :meth:`window` are views into it.
+    """
+
+    symbol: str
+    interval: str
+    dates: np.ndarray      # object array of ISO strings
+    open: np.ndarray       # float64
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray     # float64, NaN where unknown
+    covered_from: str | None
+    source: str
+    fetched_at: str
+    fetched_ts: float
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def last_date(self) -> str | None:
+        return self.dates[-1] if len(self.dates) else None
+
+    @property
+    def age(self) -> float:
+        return max(time.time() - self.fetched_ts, 0.0)
+
+    def covers(self, start: str | None) -> bool:
+        """True if every bar from *start* onward is already stored."""
+        if self.covered_from is None:
+            return True
+        return start is not None and start >= self.covered_from
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def from_columns(
+        cls,
+        symbol: str,
+        interval: str,
+        columns: dict[str, np.ndarray],
+        *,
+        covered_from: str | None,
+        source: str,
+        fetched_at: str,
+        fetched_ts: float,
+    ) -> BarSeries:
+        for arr in columns.values():
+            arr.flags.writeable = False
+        return cls(
+            symbol=symbol, interval=interval,
+            dates=columns["dates"], open=columns["open"], high=columns["high"],
+            low=columns["low"], close=columns["close"], volume=columns["volume"],
+            covered_from=covered_from, source=source,
+            fetched_at=fetched_at, fetched_ts=fetched_ts,
+        )
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {
+            "dates": self.dates, "open": self.open, "high": self.high,
+            "low": self.low, "close": self.close, "volume": self.volume,
+        }
+
+    # -- views --------------------------------------------------------------
+
+    def window(self, start: str | None) -> BarSeries:
+        """Bars dated on/after *start* (a view; *None* returns the full series)."""
+        if start is None or not len(self.dates) or self.dates[0] >= start:
+            return self
+        i = int(np.searchsorted(self.dates, start, side="left"))
+        cols = {k: v[i:] for k, v in self.columns().items()}
+        return BarSeries(
+            self.symbol, self.interval, covered_from=self.covered_from,
+            source=self.source, fetched_at=self.fetched_at,
+            fetched_ts=self.fetched_ts,
+            dates=cols["dates"], open=cols["open"], high=cols["high"],
+            low=cols["low"], close=cols["close"], volume=cols["volume"],
+        )
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Bar dicts in the shape :meth:`YFinanceClient.get_historical` returns."""
+        volumes = [None if v != v else int(v) for v in self.volume.tolist()]
+        return [
+            {"date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+            for d, o, h, lo, c, v in zip(
+                self.dates.tolist(), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), volumes,
+            )
+        ]
+
+    def to_frames(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """``(price_df, volume_df)`` backed by the series arrays without copying.
+
+        Only the volume frame is copied, and only when some bars lack volume.
+        """
+        price_df = pd.DataFrame(
+            {"date": self.dates, "open": self.open, "high": self.high,
+             "low": self.low, "close": self.close},
+            copy=False,
+        )
+        known = ~np.isnan(self.volume)
+        if known.all():
+            volume_df = pd.DataFrame(
+                {"date": self.dates, "volume": self.volume}, copy=False,
+            )
+        else:
+            volume_df = pd.DataFrame(
+                {"date": self.dates[known], "volume": self.volume[known]},
+            )
+        return price_df, volume_df
+
+
+def _columns_from_bars(bars: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """Column arrays from bar dicts, dropping bars without a full OHLC set."""
+    def _col(key: str) -> np.ndarray:
+        return np.array(
+            [b.get(key) if b.get(key) is not None else np.nan for b in bars],
+            dtype=np.float64,
+        )
+
+    cols = {
+        "dates": np.array([str(b.get("date") or "") for b in bars], dtype=object),
+        "open": _col("open"), "high": _col("high"),
+        "low": _col("low"), "close": _col("close"), "volume": _col("volume"),
+    }
+    ok = cols["dates"] != ""
+    for key in ("open", "high", "low", "close"):
+        ok &= ~np.isnan(cols[key])
+    if not ok.all():
+        cols = {k: v[ok] for k, v in cols.items()}
+    return cols
+
+
+def _merge_columns(
+    old: dict[str, np.ndarray], new: dict[str, np.ndarray],
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Merge *new* bars into *old* (new wins on equal dates).
+
+    Returns ``(merged_columns, persist_mask)`` where *persist_mask* selects
+    the rows of *new* that are not already stored as they are: bars missing
+    from *old* and bars whose OHLCV differs from the stored one (a still
+    forming last bar, or history the source has revised).
+    """
+    if not len(old["dates"]):
+        return new, np.ones(len(new["dates"]), dtype=bool)
+    at = np.minimum(np.searchsorted(old["dates"], new["dates"]), len(old["dates"]) - 1)
+    persist = old["dates"][at] != new["dates"]
+    for k in ("open", "high", "low", "close", "volume"):
+        was, now = old[k][at], new[k]
+        persist |= (was != now) & ~(np.isnan(was) & np.isnan(now))
+    dates = np.concatenate([old["dates"], new["dates"]])
+    # Stable sort keeps old-before-new for equal dates; keep the last of each run.
+    order = np.argsort(dates, kind="stable")
+    sorted_dates = dates[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[:-1] = sorted_dates[:-1] != sorted_dates[1:]
+    idx = order[keep]
+    merged = {
+        k: np.concatenate([old[k], new[k]])[idx] for k in old
+    }
+    return merged, persist
+
+
+# ---------------------------------------------------------------------------
+# Chart resampling
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True, frozen=True)
+class ChartRule:
+    """How one chart period is derived from a base series.
+
+    *unit* is ``"session"`` (*size*-hour buckets counted from the 09:30 ET
+    open of each session), ``"week"`` (Monday-aligned), ``"month"``
+    (*size*-month buckets aligned to January) or *None* for the base bars
+    as they are.  *window* is how much history the chart is served.
+    """
+
+    base_interval: str
+    base_period: str
+    window: str
+    unit: str | None = None
+    size: int = 1
+
+
+CHART_RULES: dict[str, ChartRule] = {
+    "1h":  ChartRule("1h", "2y", "2y"),
+    "4h":  ChartRule("1h", "2y", "2y", "session", 4),
+    "8h":  ChartRule("1h", "2y", "2y", "session", 8),
+    "12h": ChartRule("1h", "2y", "2y", "session", 12),
+    "1d":  ChartRule("1d", "max", "10y"),
+    "1wk": ChartRule("1d", "max", "10y", "week"),
+    "1mo": ChartRule("1d", "max", "10y", "month", 1),
+    "3mo": ChartRule("1d", "max", "10y", "month", 3),
+    "6mo": ChartRule("1d", "max", "max", "month", 6),
+    "1y":  ChartRule("1d", "max", "max", "month", 12),
+    "5y":  ChartRule("1d", "max", "max", "month", 60),
+}
+
+
+def bucket_ids(dates: np.ndarray, unit: str, size: int = 1) -> np.ndarray:
+    """Non-decreasing int64 bucket id per bar for sorted ISO *dates*."""
+    if unit == "session":
+        local = pd.to_datetime(pd.Index(dates), utc=True).tz_convert(_ET)
+        minutes = (local.hour * 60 + local.minute).to_numpy(dtype=np.int64)
+        days = local.tz_localize(None).to_numpy().astype("datetime64[D]").astype(np.int64)
+        # Pre-market bars fall in negative slots; +16 keeps slots positive.
+        slot = (minutes - _SESSION_OPEN_MIN) // (size * 60) + 16
+        return days * 64 + slot
+    days = dates.astype("datetime64[D]")
+    if unit == "week":
+        # 1970-01-01 was a Thursday, so day + 3 rolls over on Mondays.
+        return (days.astype(np.int64) + 3) // 7
+    if unit == "month":
+        return days.astype("datetime64[M]").astype(np.int64) // size
+    raise ValueError(f"Unknown resample unit: {unit!r}")
+
+
+def resample(series: BarSeries, rule: str) -> BarSeries:
+    """Aggregate *series* into the buckets of chart *rule*.
+
+    Each bucket is dated by its first bar; open/close come from its first
+    and last bars, high/low are the extremes and volume the sum of known
+    volumes (NaN if none are known).
+    """
+    spec = CHART_RULES[rule]
+    if spec.unit is None or not len(series):
+        return series
+    ids = bucket_ids(series.dates, spec.unit, spec.size)
+    starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+    ends = np.append(starts[1:], len(ids)) - 1
+    known = ~np.isnan(series.volume)
+    volume = np.add.reduceat(np.where(known, series.volume, 0.0), starts)
+    counts = np.add.reduceat(known.astype(np.int64), starts)
+    cols = {
+        "dates": series.dates[starts],
+        "open": series.open[starts],
+        "high": np.maximum.reduceat(series.high, starts),
+        "low": np.minimum.reduceat(series.low, starts),
+        "close": series.close[ends],
+        "volume": np.where(counts > 0, volume, np.nan),
+    }
+    return BarSeries.from_columns(
+        series.symbol, rule, cols,
+        covered_from=series.covered_from, source=series.source,
+        fetched_at=series.fetched_at, fetched_ts=series.fetched_ts,
+    )
+
+
+# ---------------------------------------------------------------------------
+# BarStore
+# ---------------------------------------------------------------------------
+
+FetchFn = Callable[..., Awaitable[Any]]
+
+
+class BarStore:
+    """Memory + SQLite store of shared per-(symbol, interval) bar series.
+
+    Callers are expected to serialise access per (symbol, interval);
+    :class:`~app.data.cache.CacheManager` does so with its per-key locks.
+    """
+
+    def __init__(self, max_series: int = _MAX_SERIES) -> None:
+        self._max_series = max_series
+        self._series: OrderedDict[tuple[str, str], BarSeries] = OrderedDict()
+        # (symbol, rule) -> (base token, derived series)
+        self._derived: OrderedDict[tuple[str, str], tuple[tuple[Any, ...], BarSeries]] = (
+            OrderedDict()
+        )
+        self._stats: dict[str, int] = defaultdict(int)
+
+    # -- read ---------------------------------------------------------------
+
+    async def load(self, symbol: str, interval: str) -> BarSeries | None:
+        """Return the stored series from memory, else SQLite, else *None*."""
+        key = (symbol.upper(), interval)
+        series = self._series.get(key)
+        if series is not None:
+            self._series.move_to_end(key)
+            return series
+
+        from app.data.database import get_database
+        db = await get_database()
+        meta = await db.fetch_one(
+            "SELECT covered_from, source, fetched_at FROM price_bar_series "
+            "WHERE symbol = ? AND interval = ?",
+            key,
+        )
+        if meta is None:
+            return None
+        rows = await db.fetch_all(
+            "SELECT ts, open, high, low, close, volume FROM price_bars "
+            "WHERE symbol = ? AND interval = ? ORDER BY ts",
+            key,
+        )
+        if not rows:
+            return None
+        cols = {
+            "dates": np.array([r["ts"] for r in rows], dtype=object),
+            "volume": np.array(
+                [r["volume"] if r["volume"] is not None else np.nan for r in rows],
+                dtype=np.float64,
+            ),
+        }
+        for name in ("open", "high", "low", "close"):
+            cols[name] = np.array([r[name] for r in rows], dtype=np.float64)
+        try:
+            fetched_ts = datetime.fromisoformat(meta["fetched_at"]).timestamp()
+        except (ValueError, TypeError):
+            fetched_ts = 0.0
+        series = BarSeries.from_columns(
+            key[0], interval, cols,
+            covered_from=meta["covered_from"], source=meta["source"],
+            fetched_at=meta["fetched_at"], fetched_ts=fetched_ts,
+        )
+        self._remember(series)
+        self._stats["db_loads"] += 1
+        return series
+
+    # -- write --------------------------------------------------------------
+
+    async def ingest(
+        self,
+        symbol: str,
+        interval: str,
+        bars: list[dict[str, Any]],
+        *,
+        covered_from: str | None,
+        source: str,
+    ) -> BarSeries:
+        """Merge *bars* into the stored series and persist only new or revised rows.
+
+        *covered_from* is the window start the bars were fetched for; the
+        series' coverage becomes the wider of that and what it already had.
+        """
+        symbol = symbol.upper()
+        existing = await self.load(symbol, interval)
+        new_cols = _columns_from_bars(bars)
+        if existing is not None:
+            merged, persist = _merge_columns(existing.columns(), new_cols)
+            covered_from = _wider(existing.covered_from, covered_from)
+        else:
+            merged, persist = new_cols, np.ones(len(new_cols["dates"]), dtype=bool)
+
+        now_dt = datetime.now(timezone.utc)
+        series = BarSeries.from_columns(
+            symbol, interval, merged,
+            covered_from=covered_from, source=source,
+            fetched_at=now_dt.isoformat(), fetched_ts=now_dt.timestamp(),
+        )
+
+        rows = [
+            (symbol, interval, d, o, h, lo, c, None if v != v else v)
+            for d, o, h, lo, c, v in zip(
+                *(new_cols[k][persist].tolist()
+                  for k in ("dates", "open", "high", "low", "close", "volume"))
+            )
+        ]
+        from app.data.database import get_database
+        db = await get_database()
+        if rows:
+            await db.executemany(_UPSERT_BARS, rows)
+        await db.execute(
+            "INSERT OR REPLACE INTO price_bar_series "
+            "(symbol, interval, covered_from, source, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (symbol, interval, covered_from, source, series.fetched_at),
+        )
+        self._remember(series)
+        self._stats["rows_written"] += len(rows)
+        return series
+
+    async def backfill(
+        self, symbol: str, period: str, interval: str, fetch_fn: FetchFn,
+        *, source: str = "yfinance",
+    ) -> BarSeries | None:
+        """Fetch the whole window for *period* and merge it into the series."""
+        src_period = source_period(period_days(period), interval)
+        bars = await fetch_fn(symbol=symbol, period=src_period, interval=interval)
+        if not isinstance(bars, list) or not bars:
+            return None
+        self._stats["backfills"] += 1
+        return await self.ingest(
+            symbol, interval, bars,
+            covered_from=window_start(src_period, interval), source=source,
+        )
+
+    async def append_latest(
+        self, series: BarSeries, fetch_fn: FetchFn, *, source: str = "yfinance",
+    ) -> BarSeries | None:
+        """Top *series* up with the bars published since its last one."""
+        last = series.last_date
+        gap_days = _MAX_LOOKBACK_DAYS.get(series.interval, 3650)
+        if last:
+            try:
+                last_dt = datetime.fromisoformat(last[:10]).replace(tzinfo=timezone.utc)
+                gap_days = (datetime.now(timezone.utc) - last_dt).days + 2
+            except ValueError:
+                pass
+        need = max(gap_days, _MIN_SOURCE_BARS * _BAR_DAYS.get(series.interval, 1.5))
+        bars = await fetch_fn(
+            symbol=series.symbol,
+            period=source_period(need, series.interval),
+            interval=series.interval,
+        )
+        if not isinstance(bars, list) or not bars:
+            return None
+        self._stats["appends"] += 1
+        return await self.ingest(
+            series.symbol, series.interval, bars,
+            covered_from=series.covered_from, source=source,
+        )
+
+    # -- derived intervals --------------------------------------------------
+
+    def resampled(self, series: BarSeries, rule: str) -> BarSeries:
+        """:func:`resample` *series* into chart *rule*, memoized until the
+        base series changes (top-up, backfill or a moved window)."""
+        if CHART_RULES[rule].unit is None:
+            return series
+        key = (series.symbol, rule)
+        token = (
+            series.interval, series.fetched_ts, len(series),
+            series.dates[0] if len(series) else None, series.last_date,
+        )
+        hit = self._derived.get(key)
+        if hit is not None and hit[0] == token:
+            self._derived.move_to_end(key)
+            self._stats["resample_hits"] += 1
+            return hit[1]
+        derived = resample(series, rule)
+        self._derived[key] = (token, derived)
+        self._derived.move_to_end(key)
+        while len(self._derived) > _MAX_DERIVED:
+            self._derived.popitem(last=False)
+        self._stats["resamples"] += 1
+        return derived
+
+    # -- invalidation -------------------------------------------------------
+
+    async def delete(self, symbol: str) -> None:
+        """Drop every series for *symbol* (e.g. after a split)."""
+        symbol = symbol.upper()
+        for key in [k for k in self._series if k[0] == symbol]:
+            del self._series[key]
+        for key in [k for k in self._derived if k[0] == symbol]:
+            del self._derived[key]
+        from app.data.database import get_database
+        db = await get_database()
+        await db.execute("DELETE FROM price_bars WHERE symbol = ?", (symbol,))
+        await db.execute("DELETE FROM price_bar_series WHERE symbol = ?", (symbol,))
+
+    async def delete_all(self) -> None:
+        """Drop every stored series."""
+        self._series.clear()
+        self._derived.clear()
+        from app.data.database import get_database
+        db = await get_database()
+        await db.execute("DELETE FROM price_bars WHERE 1=1")
+        await db.execute("DELETE FROM price_bar_series WHERE 1=1")
+
+    def clear(self) -> None:
+        """Forget in-memory series (SQLite rows are kept)."""
+        self._series.clear()
+        self._derived.clear()
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "bar_series_in_memory": len(self._series),
+            "bar_backfills": self._stats.get("backfills", 0),
+            "bar_appends": self._stats.get("appends", 0),
+            "bar_rows_written": self._stats.get("rows_written", 0),
+            "bar_db_loads": self._stats.get("db_loads", 0),
+            "bar_resamples": self._stats.get("resamples", 0),
+            "bar_resample_hits": self._stats.get("resample_hits", 0),
+        }
+
+    # -- internals ----------------------------------------------------------
+
+    def _remember(self, series: BarSeries) -> None:
+        key = (series.symbol, series.interval)
+        self._series[key] = series
+        self._series.move_to_end(key)
+        while len(self._series) > self._max_series:
+            self._series.popitem(last=False)
@@ -7,16 +7,27 @@ FRED, yfinance, CFTC).  Features:
 * TTL-based expiration per data type (8 types)
 * Data freshness tracking via :class:`~app.data.cache_types.CachedResult`
 * Source fallback chains (e.g. Finnhub → yfinance for price)
+* Bulk price quotes (:meth:`CacheManager.get_prices_bulk`) fetched per
+  source in one pass instead of one fallback walk per symbol
 * Per-key ``asyncio.Lock`` to prevent duplicate concurrent fetches
+* In-process L1 tier (:class:`~app.data.memory_cache.MemoryCache`) of
+  decoded payloads in front of SQLite, written through on every store
+* Historical OHLCV bars in a shared columnar series per symbol/interval
+  (:class:`~app.data.bar_store.BarStore`), topped up incrementally
+* SQLite upserts queued on the write-behind queue
+  (:mod:`app.data.write_behind`) instead of committed on the request path
 * Cache invalidation per symbol / data type
 * In-memory hit/miss statistics
-* Background refresh for stale data (stale-while-revalidate)
+* Refresh-ahead of hot keys (watchlist quotes, recently read keys)
+  shortly before TTL expiry, and deduplicated refresh of keys served stale
+  (:mod:`app.data.refresh_ahead`)
 
 Full implementation: TASK-DATA-008
 """
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
 import logging
 import time
@@ -30,10 +41,17 @@ from app.data.cache_types import (
     CachedResult,
     format_age,
 )
+from app.data.bar_store import CHART_RULES, BarSeries, BarStore, window_start
+from app.data.memory_cache import MemoryCache
+from app.data.rate_limiter import Priority, request_priority
+from app.data.refresh_ahead import create_refresh_scheduler
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
 _MAX_BG_TASKS = 10
+_L1_MAX_ENTRIES = 2048
+_L1_MAX_BYTES = 64 * 1024 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +76,8 @@ def _get_ttl_map() -> dict[str, int]:
             "analysis":     s.cache_ttl_analysis,
             "options":      s.cache_ttl_options,
             "economic_calendar": s.cache_ttl_economic_calendar,
+            "profile":      s.cache_ttl_profile,
+            "financials":   s.cache_ttl_financials,
         }
     return _ttl_map
 
@@ -72,12 +92,16 @@ class CacheManager:
         self._locks: dict[str, asyncio.Lock] = {}
         self._bg_tasks: set[asyncio.Task[None]] = set()
         self._stats: dict[str, int] = defaultdict(int)
+        self._l1 = MemoryCache(_L1_MAX_ENTRIES, _L1_MAX_BYTES)
+        self._bars = BarStore()
+        self._refresh = create_refresh_scheduler(self._refresh_key)
         logger.info("CacheManager initialized")
 
     # -- lifecycle ----------------------------------------------------------
 
     async def close(self) -> None:
         """Cancel background tasks and clear state."""
+        await self._refresh.stop()
         for task in self._bg_tasks:
             if not task.done():
                 task.cancel()
@@ -87,6 +111,8 @@ class CacheManager:
         self._bg_tasks.clear()
         self._locks.clear()
         self._stats.clear()
+        self._l1.clear()
+        self._bars.clear()
         logger.info("CacheManager closed (%d bg tasks cancelled)", n)
 
     # -- lock management ----------------------------------------------------
@@ -107,32 +133,55 @@ class CacheManager:
     async def _read_cache(
         self, symbol: str, data_type: str, period: str,
     ) -> tuple[Any, str, float] | None:
-        """Read from ``fundamentals_cache``.
+        """Read from the L1 tier, falling back to ``fundamentals_cache``.
+
+        A row still queued on the write-behind queue is served from the
+        buffer; SQLite is only read once no write of the key is pending.
 
         Returns ``(data, fetched_at_iso, age_seconds)`` or *None*.
         """
-        from app.data.database import get_database
-        db = await get_database()
-        row = await db.fetch_one(
-            "SELECT value_json, source, fetched_at FROM fundamentals_cache "
-            "WHERE symbol = ? AND data_type = ? AND period = ? "
-            "ORDER BY fetched_at DESC LIMIT 1",
-            (symbol.upper(), data_type, period),
-        )
-        if row is None:
-            return None
+        key = self._make_key(data_type, symbol, period)
+        hit = self._l1.get(key)
+        if hit is not None:
+            return hit
+
+        wb = get_write_behind()
+        prefix = (symbol.upper(), data_type, period)
+        queued = wb.queued("fundamentals_cache", prefix)
+        if queued:
+            # (symbol, data_type, period, value_json, source, fetched_at)
+            _, _, _, value_json, _, fetched_at = max(queued, key=lambda p: p[5])
+        else:
+            await wb.wait_inflight("fundamentals_cache", prefix)
+            from app.data.database import get_database
+            db = await get_database()
+            row = await db.fetch_one(
+                "SELECT value_json, source, fetched_at FROM fundamentals_cache "
+                "WHERE symbol = ? AND data_type = ? AND period = ? "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                prefix,
+            )
+            if row is None:
+                return None
+            value_json, fetched_at = row["value_json"], row["fetched_at"]
         try:
-            data = json.loads(row["value_json"])
+            data = json.loads(value_json)
         except (json.JSONDecodeError, TypeError):
             return None
-        fetched_at = row["fetched_at"]
         try:
             dt = datetime.fromisoformat(fetched_at)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             age = (datetime.now(timezone.utc) - dt).total_seconds()
         except (ValueError, TypeError):
-            age = 0.0
+            return data, fetched_at, 0.0
+        self._l1.put(
+            key, data,
+            data_type=data_type, symbol=symbol, fetched_at=fetched_at,
+            fetched_ts=dt.timestamp(),
+            ttl=_get_ttl_map().get(data_type, 3600),
+            size=len(value_json),
+        )
         return data, fetched_at, max(age, 0.0)
 
     async def _write_cache(
@@ -143,21 +192,41 @@ class CacheManager:
         source: str,
         data: Any,
     ) -> None:
-        """Upsert into ``fundamentals_cache``."""
-        from app.data.database import get_database
-        db = await get_database()
-        now = datetime.now(timezone.utc).isoformat()
-        await db.execute(
+        """Write through to the L1 tier and queue the ``fundamentals_cache`` upsert."""
+        now_dt = datetime.now(timezone.utc)
+        now = now_dt.isoformat()
+        value_json = json.dumps(data)
+        sym = symbol.upper()
+        get_write_behind().put(
+            "fundamentals_cache", (sym, data_type, period, source),
             "INSERT OR REPLACE INTO fundamentals_cache "
             "(symbol, data_type, period, value_json, source, fetched_at) "
             "VALUES (?, ?, ?, ?, ?, ?)",
-            (symbol.upper(), data_type, period, json.dumps(data), source, now),
+            (sym, data_type, period, value_json, source, now),
+        )
+        self._l1.put(
+            self._make_key(data_type, symbol, period), data,
+            data_type=data_type, symbol=symbol, fetched_at=now,
+            fetched_ts=now_dt.timestamp(),
+            ttl=_get_ttl_map().get(data_type, 3600),
+            size=len(value_json),
         )
 
     async def _delete_cache(
         self, symbol: str, data_type: str | None = None,
     ) -> int:
-        """Delete cache entries.  Returns row count deleted."""
+        """Delete cache entries (L1, bar store and SQLite).
+
+        Returns the ``fundamentals_cache`` row count deleted.
+        """
+        self._l1.invalidate(symbol, data_type)
+        prefix = (symbol.upper(), data_type) if data_type else (symbol.upper(),)
+        wb = get_write_behind()
+        wb.discard("fundamentals_cache", prefix)
+        # A batch already running would write the rows back after the DELETE.
+        await wb.wait_inflight("fundamentals_cache", prefix)
+        if data_type in (None, "price"):
+            await self._bars.delete(symbol)
         from app.data.database import get_database
         db = await get_database()
         if data_type:
@@ -219,28 +288,92 @@ class CacheManager:
         period: str,
         fetch_kwargs: dict[str, Any] | None = None,
     ) -> bool:
+        """Queue a deduplicated refresh of a key served stale."""
+        return self._refresh.request_now(
+            data_type, symbol, period,
+            ttl=_get_ttl_map().get(data_type, 3600), fetch_kwargs=fetch_kwargs,
+        )
+
+    async def _refresh_key(
+        self,
+        data_type: str,
+        symbol: str,
+        period: str,
+        fetch_kwargs: dict[str, Any] | None,
+        max_age: float,
+    ) -> float | None:
+        """Refresh-ahead callback: make the cached value at most *max_age* old.
+
+        Returns the fetch timestamp of the value now cached, or *None* if
+        every source failed.  A value refreshed meanwhile (e.g. by an
+        interactive miss) is not fetched again.
+        """
+        cached = await self._read_cache(symbol, data_type, period)
+        if cached is not None and cached[2] < max_age:
+            return time.time() - cached[2]
+        for src in FALLBACK_CHAINS.get(data_type, []):
+            with request_priority(Priority.BACKGROUND):
+                result = await self._fetch_from_source(
+                    data_type, symbol, period, src, **(fetch_kwargs or {}),
+                )
+            if result is not None:
+                await self._write_cache(symbol, data_type, period, src, result)
+                self._stats["bg_refreshes"] += 1
+                logger.debug("Background refresh: %s:%s from %s", data_type, symbol, src)
+                return time.time()
+        return None
+
+    def _track(
+        self,
+        data_type: str,
+        symbol: str,
+        period: str,
+        age: float,
+        ttl: int,
+        fetch_kwargs: dict[str, Any] | None,
+    ) -> None:
+        """Note a read of a fallback-chain key for refresh-ahead."""
+        if FALLBACK_CHAINS.get(data_type):
+            self._refresh.touch(
+                data_type, symbol, period,
+                fetched_ts=time.time() - age, ttl=ttl, fetch_kwargs=fetch_kwargs,
+            )
+
+    def pin_symbols(self, symbols: list[str]) -> None:
+        """Keep the price quotes of *symbols* refreshed ahead of expiry (watchlist)."""
+        self._refresh.pin(symbols, ttl=_get_ttl_map().get("price", 900))
+
+    def unpin_symbols(self, symbols: list[str]) -> None:
+        """Undo :meth:`pin_symbols`."""
+        self._refresh.unpin(symbols)
+
+    def _schedule_bar_append(
+        self,
+        symbol: str,
+        interval: str,
+        fetch_fn: Callable[..., Awaitable[Any]],
+        ttl: int,
+    ) -> bool:
+        """Top up a stale bar series in the background (new bars only)."""
         self._bg_tasks = {t for t in self._bg_tasks if not t.done()}
         if len(self._bg_tasks) >= _MAX_BG_TASKS:
             return False
 
-        async def _do_refresh() -> None:
+        async def _do_append() -> None:
             try:
-                sources = FALLBACK_CHAINS.get(data_type, [])
-                for src in sources:
-                    result = await self._fetch_from_source(
-                        data_type, symbol, period, src, **(fetch_kwargs or {}),
-                    )
-                    if result is not None:
-                        await self._write_cache(symbol, data_type, period, src, result)
+                async with self._get_lock(f"bars:{symbol}:{interval}"):
+                    series = await self._bars.load(symbol, interval)
+                    if series is None or series.age <= ttl:
+                        return  # already topped up by a concurrent request
+                    with request_priority(Priority.BACKGROUND):
+                        appended = await self._bars.append_latest(series, fetch_fn)
+                    if appended is not None:
                         self._stats["bg_refreshes"] += 1
-                        logger.debug(
-                            "Background refresh: %s:%s from %s", data_type, symbol, src,
-                        )
-                        return
+                        logger.debug("Background bar append: %s %s", symbol, interval)
             except Exception:
-                logger.debug("Background refresh failed: %s:%s", data_type, symbol, exc_info=True)
+                logger.debug("Background bar append failed: %s %s", symbol, interval, exc_info=True)
 
-        task = asyncio.create_task(_do_refresh())
+        task = asyncio.create_task(_do_append())
         self._bg_tasks.add(task)
         task.add_done_callback(self._bg_tasks.discard)
         return True
@@ -300,6 +433,14 @@ class CacheManager:
             from app.data.yfinance_client import get_yfinance_client
             return await get_yfinance_client().get_info(symbol)
 
+        if data_type == "profile" and source == "finnhub":
+            from app.data.finnhub_client import get_finnhub_client
+            return await get_finnhub_client().get_company_profile(symbol)
+
+        if data_type == "financials" and source == "finnhub":
+            from app.data.finnhub_client import get_finnhub_client
+            return await get_finnhub_client().get_basic_financials(symbol)
+
         if data_type == "news" and source == "finnhub":
             from app.data.finnhub_client import get_finnhub_client
             today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -393,6 +534,8 @@ class CacheManager:
                     data, fetched_at, age = cached
                     if age <= ttl:
                         self._stats["hits"] += 1
+                        if fetch_fn is None and source_override is None:
+                            self._track(data_type, symbol, period, age, ttl, fetch_kwargs)
                         logger.debug("Cache HIT %s (%.0fs old)", cache_key, age)
                         return self._build_result(
                             data, data_type, symbol, period, "cache",
@@ -447,6 +590,8 @@ class CacheManager:
                 if result_data is not None:
                     await self._write_cache(symbol, data_type, period, src, result_data)
                     self._stats["fetches"] += 1
+                    if source_override is None:
+                        self._track(data_type, symbol, period, 0.0, ttl, fetch_kwargs)
                     logger.info(
                         "Cache MISS %s -> %s (%.0fms)", cache_key, src, elapsed_ms,
                     )
@@ -475,6 +620,108 @@ class CacheManager:
         """Current price quote.  Chain: finnhub → yfinance.  TTL: 15m."""
         return await self.get_or_fetch("price", symbol, force_refresh=force_refresh)
 
+    async def get_prices_bulk(
+        self, symbols: list[str], *, force_refresh: bool = False,
+    ) -> dict[str, CachedResult | None]:
+        """Current price quotes for many symbols in one pass.
+
+        Fresh entries are served from cache.  Missing and stale ones (all of
+        them with *force_refresh*) are fetched together by
+        :meth:`_fetch_prices_bulk` instead of one fallback walk per symbol.
+        A stale entry whose refresh fails is returned stale; a miss that
+        fails maps to *None*.
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        ttl = _get_ttl_map().get("price", 3600)
+        results: dict[str, CachedResult | None] = {}
+        stale: dict[str, tuple[Any, str, float]] = {}
+        pending: list[str] = []
+
+        for sym in symbols:
+            cached = None if force_refresh else await self._read_cache(sym, "price", "latest")
+            if cached is not None and cached[2] <= ttl:
+                data, fetched_at, age = cached
+                self._stats["hits"] += 1
+                results[sym] = self._build_result(
+                    data, "price", sym, "latest", "cache",
+                    is_cached=True, is_stale=False,
+                    fetched_at=fetched_at, age=age, ttl=ttl,
+                )
+                continue
+            if cached is not None:
+                stale[sym] = cached
+            pending.append(sym)
+
+        fetched = await self._fetch_prices_bulk(pending) if pending else {}
+        now_iso = datetime.now(timezone.utc).isoformat()
+        for sym in pending:
+            if sym in fetched:
+                src, data = fetched[sym]
+                await self._write_cache(sym, "price", "latest", src, data)
+                self._stats["misses"] += 1
+                self._stats["fetches"] += 1
+                results[sym] = self._build_result(
+                    data, "price", sym, "latest", src,
+                    is_cached=False, is_stale=False,
+                    fetched_at=now_iso, age=0.0, ttl=ttl,
+                )
+            elif sym in stale:
+                data, fetched_at, age = stale[sym]
+                self._stats["stale_hits"] += 1
+                results[sym] = self._build_result(
+                    data, "price", sym, "latest", "cache",
+                    is_cached=True, is_stale=True,
+                    fetched_at=fetched_at, age=age, ttl=ttl,
+                )
+            else:
+                self._stats["total_failures"] += 1
+                results[sym] = None
+
+        logger.info(
+            "Bulk price: %d symbols, %d cached, %d fetched, %d failed",
+            len(symbols), len(symbols) - len(pending), len(fetched),
+            sum(1 for sym in pending if sym not in fetched and sym not in stale),
+        )
+        return {sym: results[sym] for sym in symbols}
+
+    async def _fetch_prices_bulk(self, symbols: list[str]) -> dict[str, tuple[str, Any]]:
+        """Walk the price fallback chain once for a whole set of symbols.
+
+        Finnhub quotes run concurrently for as many symbols as its rate-limit
+        window currently has room for, so they never queue behind the
+        limiter; yfinance takes everything left in chunked ``yf.download``
+        calls.  Returns ``{symbol: (source, quote)}`` for the successes.
+        """
+        found: dict[str, tuple[str, Any]] = {}
+        for src in FALLBACK_CHAINS.get("price", []):
+            rest = [sym for sym in symbols if sym not in found]
+            if not rest:
+                break
+            start = time.monotonic()
+            if src == "yfinance":
+                from app.data.yfinance_client import get_yfinance_client
+                try:
+                    quotes = await get_yfinance_client().get_quotes_bulk(rest)
+                except Exception as exc:
+                    logger.warning("Bulk price fetch from yfinance failed: %s", exc)
+                    quotes = {}
+            else:
+                if src == "finnhub":
+                    from app.data.finnhub_client import get_finnhub_client
+                    client = get_finnhub_client()
+                    rest = rest[:client.calls_remaining] if client.is_enabled else []
+                results = await asyncio.gather(*(
+                    self._fetch_from_source("price", sym, "latest", src) for sym in rest
+                ))
+                quotes = {sym: data for sym, data in zip(rest, results) if data is not None}
+            batch = [sym for sym in rest if sym in quotes]
+            found.update((sym, (src, quotes[sym])) for sym in batch)
+            logger.info(
+                "Bulk price %s: %d / %d symbols (%.0fms)",
+                src, len(batch), len(rest), (time.monotonic() - start) * 1000,
+            )
+        return found
+
     async def get_historical_prices(
         self,
         symbol: str,
@@ -482,15 +729,96 @@ class CacheManager:
         interval: str = "1d",
         *,
         force_refresh: bool = False,
+        as_series: bool = False,
     ) -> CachedResult | None:
-        """Historical OHLCV bars from yfinance.  TTL: 15m."""
+        """Historical OHLCV bars from yfinance via the bar store.  TTL: 15m.
+
+        Every *period* of a (symbol, interval) is sliced from one shared
+        series.  A stale series is served immediately while only the bars
+        published since its last one are fetched in the background.  With
+        ``as_series=True`` the data is the :class:`BarSeries` window (for
+        zero-copy frames) instead of a list of bar dicts.
+        """
         from app.data.yfinance_client import get_yfinance_client
-        return await self.get_or_fetch(
-            "price", symbol, f"hist_{period}_{interval}",
-            force_refresh=force_refresh,
-            fetch_fn=get_yfinance_client().get_historical,
-            fetch_kwargs={"symbol": symbol, "period": period, "interval": interval},
-            source_override="yfinance",
+        symbol = symbol.upper()
+        fetch_fn = get_yfinance_client().get_historical
+        ttl = _get_ttl_map().get("price", 900)
+        start = window_start(period, interval)
+        fetched = False
+
+        async with self._get_lock(f"bars:{symbol}:{interval}"):
+            series: BarSeries | None = await self._bars.load(symbol, interval)
+            if force_refresh or series is None or not series.covers(start):
+                refreshed: BarSeries | None = None
+                try:
+                    refreshed = await self._bars.backfill(symbol, period, interval, fetch_fn)
+                except Exception as exc:
+                    logger.warning(
+                        "Cache fetch error price:%s hist_%s_%s from yfinance: %s",
+                        symbol, period, interval, exc,
+                    )
+                if refreshed is not None:
+                    series, fetched = refreshed, True
+                    self._stats["misses"] += 1
+                    self._stats["fetches"] += 1
+                elif series is None or not len(series):
+                    self._stats["total_failures"] += 1
+                    return None
+
+        is_stale = False
+        if not fetched:
+            # Narrower-than-requested coverage only survives a failed backfill.
+            is_stale = series.age > ttl or not series.covers(start)
+            if is_stale:
+                self._stats["stale_hits"] += 1
+                if series.age > ttl:
+                    self._schedule_bar_append(symbol, interval, fetch_fn, ttl)
+            else:
+                self._stats["hits"] += 1
+
+        window = series.window(start)
+        return self._build_result(
+            window if as_series else window.to_records(),
+            "price", symbol, f"hist_{period}_{interval}", series.source,
+            is_cached=not fetched, is_stale=is_stale,
+            fetched_at=series.fetched_at, age=0.0 if fetched else series.age,
+            ttl=ttl,
+        )
+
+    async def get_chart_bars(
+        self,
+        symbol: str,
+        rule: str = "1d",
+        *,
+        since: str | None = None,
+        force_refresh: bool = False,
+    ) -> CachedResult | None:
+        """OHLCV bars for chart period *rule* (a :data:`CHART_RULES` key).
+
+        Every rule is resampled from the symbol's shared ``1h`` or ``1d``
+        base series, so switching chart periods only downloads when that
+        base series itself is missing or stale.  *since* (a bar date, e.g.
+        the last one a client holds) limits the result to bars dated on or
+        after it, which includes a still-forming last bar.
+        """
+        spec = CHART_RULES.get(rule)
+        if spec is None:
+            raise ValueError(f"Unknown chart rule: {rule!r}")
+        base = await self.get_historical_prices(
+            symbol, spec.base_period, spec.base_interval,
+            force_refresh=force_refresh, as_series=True,
+        )
+        if base is None:
+            return None
+        bars = self._bars.resampled(base.data, rule)
+        start = window_start(spec.window, spec.base_interval)
+        if since is not None and (start is None or since > start):
+            start = since
+        window = bars.window(start)
+        return dataclasses.replace(
+            base,
+            data=window.to_records(),
+            cache_key=self._make_key("price", symbol, f"chart_{rule}"),
         )
 
     async def get_fundamentals(
@@ -499,6 +827,18 @@ class CacheManager:
         """Key financial metrics.  Chain: edgar → yfinance.  TTL: 24h."""
         return await self.get_or_fetch("fundamentals", symbol, force_refresh=force_refresh)
 
+    async def get_company_profile(
+        self, symbol: str, *, force_refresh: bool = False,
+    ) -> CachedResult | None:
+        """Company profile (name, exchange, industry) from Finnhub.  TTL: 7d."""
+        return await self.get_or_fetch("profile", symbol, force_refresh=force_refresh)
+
+    async def get_basic_financials(
+        self, symbol: str, *, force_refresh: bool = False,
+    ) -> CachedResult | None:
+        """Key metrics (52w range, market cap, avg volume) from Finnhub.  TTL: 6h."""
+        return await self.get_or_fetch("financials", symbol, force_refresh=force_refresh)
+
     async def get_income_statement(
         self, symbol: str, periods: int = 8, *, force_refresh: bool = False,
     ) -> CachedResult | None:
@@ -593,6 +933,11 @@ class CacheManager:
         """Clear ALL cached data.  Use for debugging/maintenance only."""
         from app.data.database import get_database
         db = await get_database()
+        self._l1.clear()
+        wb = get_write_behind()
+        wb.discard("fundamentals_cache")
+        await wb.wait_inflight("fundamentals_cache")
+        await self._bars.delete_all()
         await db.execute("DELETE FROM fundamentals_cache WHERE 1=1")
         logger.warning("Invalidated ALL cache entries")
 
@@ -601,9 +946,11 @@ class CacheManager:
     # ======================================================================
 
     def get_stats(self) -> dict[str, Any]:
-        """Return cache statistics snapshot."""
+        """Return cache statistics snapshot (including the L1 tier)."""
         total = self._stats.get("hits", 0) + self._stats.get("misses", 0)
         return {
+            **self._l1.get_stats(),
+            **self._bars.get_stats(),
             "total_hits": self._stats.get("hits", 0),
             "total_misses": self._stats.get("misses", 0),
             "stale_hits": self._stats.get("stale_hits", 0),
@@ -613,6 +960,7 @@ class CacheManager:
             "total_failures": self._stats.get("total_failures", 0),
             "bg_refreshes": self._stats.get("bg_refreshes", 0),
             "active_bg_tasks": len({t for t in self._bg_tasks if not t.done()}),
+            "refresh_ahead": self._refresh.get_stats(),
         }
 
     async def get_freshness(self, symbol: str) -> dict[str, Any]:
@@ -641,10 +989,13 @@ class CacheManager:
     # ======================================================================
 
     async def schedule_watchlist_refresh(self, symbols: list[str]) -> None:
-        """Refresh price data for watchlist symbols with staggered delays."""
-        for sym in symbols:
-            await self.get_price(sym, force_refresh=True)
-            await asyncio.sleep(1.0)  # stagger to respect rate limits
+        """Refresh price data for watchlist symbols in one bulk fetch.
+
+        Runs at background priority so it never delays interactive requests
+        for the same upstream budgets.
+        """
+        with request_priority(Priority.BACKGROUND):
+            await self.get_prices_bulk(symbols, force_refresh=True)
 
     async def refresh_symbol(self, symbol: str) -> dict[str, str]:
         """Force-refresh all data types for a symbol."""
@@ -26,6 +26,8 @@ DATA_TYPES: list[str] = [
     "analysis",
     "options",
     "economic_calendar",
+    "profile",
+    "financials",
 ]
 
 
@@ -43,6 +45,8 @@ FALLBACK_CHAINS: dict[str, list[str]] = {
     "analysis":     [],
     "options":      ["massive"],
     "economic_calendar": ["forex_calendar", "finnhub"],
+    "profile":      ["finnhub"],
+    "financials":   ["finnhub"],
 }
 
 
@@ -0,0 +1,78 @@
+"""Local archive of completed CFTC COT years.
+
+A calendar year's CFTC archive stops changing once the year is over and
+its last weekly report has been published, so each completed year is
+downloaded and parsed once, then stored for every mapped market in the
+``cot_history`` table.  ``cot_archive_years`` records which years are
+archived, so a market absent from an archived year is also answered
+locally.
+
+Used by :mod:`app.data.cot_client`.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from app.data.cot_helpers import now_iso
+from app.data.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# The final report of a year (late December) is published in early January.
+ARCHIVE_GRACE_DAYS: int = 14
+
+_COLUMNS: tuple[str, ...] = (
+    "market_name", "report_date", "commercial_long", "commercial_short",
+    "commercial_net", "speculative_long", "speculative_short",
+    "speculative_net", "open_interest",
+)
+
+
+def is_completed_year(year: int, now: datetime | None = None) -> bool:
+    """Whether *year*'s CFTC archive is final (and so may be archived)."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    final_after = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    return (now - final_after).days >= ARCHIVE_GRACE_DAYS
+
+
+async def load_archived_year(
+    year: int, market_name: str,
+) -> list[dict[str, Any]] | None:
+    """Return *market_name*'s archived rows for *year*.
+
+    Returns None when *year* has not been archived, and an empty list
+    when it has but the market did not report that year.
+    """
+    db = await get_database()
+    marker = await db.fetch_one(
+        "SELECT year FROM cot_archive_years WHERE year = ?", (year,),
+    )
+    if marker is None:
+        return None
+    return await db.fetch_all(
+        f"SELECT {', '.join(_COLUMNS)} FROM cot_history "
+        "WHERE market_name = ? AND report_date BETWEEN ? AND ? "
+        "ORDER BY report_date",
+        (market_name, f"{year}-01-01", f"{year}-12-31"),
+    )
+
+
+async def archive_year(year: int, rows: list[dict[str, Any]]) -> None:
+    """Persist every mapped market's parsed rows for *year*, then mark it."""
+    db = await get_database()
+    year_rows = [r for r in rows if str(r.get("report_date", "")).startswith(f"{year}-")]
+    if year_rows:
+        await db.executemany(
+            f"INSERT OR REPLACE INTO cot_history ({', '.join(_COLUMNS)}) "
+            f"VALUES ({', '.join(['?'] * len(_COLUMNS))})",
+            [tuple(r.get(col, 0) for col in _COLUMNS) for r in year_rows],
+        )
+    await db.execute(
+        "INSERT OR REPLACE INTO cot_archive_years (year, num_rows, archived_at) "
+        "VALUES (?, ?, ?)",
+        (year, len(year_rows), now_iso()),
+    )
+    logger.info("COT: archived %d rows for %d", len(year_rows), year)
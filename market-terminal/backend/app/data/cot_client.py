@@ -10,12 +10,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import httpx
 
 from app.config import get_settings
+from app.data.cot_archive import archive_year, is_completed_year, load_archived_year
 from app.data.cot_helpers import (
     CFTC_CURRENT_URL,
     CFTC_HISTORICAL_URL_TEMPLATE,
@@ -36,6 +38,8 @@ logger = logging.getLogger(__name__)
 
 _CONNECT_TIMEOUT: float = 10.0
 _READ_TIMEOUT: float = 30.0
+# How long a parsed current report / current-year archive is reused in-process.
+_LIVE_PARSE_TTL: float = 3600.0
 
 
 # ---------------------------------------------------------------------------
@@ -55,6 +59,10 @@ class CotClient:
         settings = get_settings()
         self._cache_ttl: int = settings.cache_ttl_cot
         self._http: httpx.AsyncClient | None = None
+        # url -> (monotonic parse time, mapped-market rows) for live reports
+        self._parsed: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        # url -> in-flight download+parse (shared by concurrent lookups)
+        self._inflight: dict[str, asyncio.Task[list[dict[str, Any]] | None]] = {}
         logger.info("COT client initialized (CFTC public data - no key required)")
 
     # -- lifecycle ----------------------------------------------------------
@@ -132,14 +140,8 @@ class CotClient:
             entries = await self._enrich_rows(cached_rows)
             return tag(entries, cached=True)
 
-        # 2. Download fresh
-        logger.info("COT: downloading current report from CFTC")
-        text = await self._download_text(CFTC_CURRENT_URL)
-        if text is None:
-            return None
-
-        # 3. Parse CSV in worker thread
-        parsed = await asyncio.to_thread(parse_cot_csv_sync, text)
+        # 2-3. Download fresh and parse in a worker thread
+        parsed = await self._parsed_current_report()
         if not parsed:
             logger.warning("COT: current report parse returned no records")
             return None
@@ -170,20 +172,18 @@ class CotClient:
         now = datetime.now(timezone.utc)
         years_needed = self._years_for_weeks(now.year, weeks)
 
-        # 3. Download and parse each year
+        # 3. Load each year (archived years are local reads) and the current
+        #    report (most up-to-date data) concurrently
+        *year_rows, current_parsed = await asyncio.gather(
+            *(self._fetch_year(year, market_name) for year in years_needed),
+            self._parsed_current_report(),
+        )
         all_rows: list[dict[str, Any]] = []
-        for year in years_needed:
-            rows = await self._fetch_year(year, market_name)
+        for rows in year_rows:
             if rows:
                 all_rows.extend(rows)
-
-        # Also fetch the current report (most up-to-date data)
-        current_text = await self._download_text(CFTC_CURRENT_URL)
-        if current_text:
-            current_parsed = await asyncio.to_thread(parse_cot_csv_sync, current_text)
-            market_rows = [r for r in current_parsed if r["market_name"] == market_name]
-            if market_rows:
-                all_rows.extend(market_rows)
+        if current_parsed:
+            all_rows.extend(r for r in current_parsed if r["market_name"] == market_name)
 
         if not all_rows:
             logger.warning("COT historical %s: no data found", market_name)
@@ -288,7 +288,38 @@ class CotClient:
     async def _fetch_year(
         self, year: int, market_name: str,
     ) -> list[dict[str, Any]] | None:
-        """Download and parse a single year's historical archive."""
+        """Return one market's rows from a single year's historical archive.
+
+        Completed years come from the local archive once stored; otherwise
+        the year is downloaded and parsed (once for all mapped markets).
+        """
+        completed = is_completed_year(year)
+        if completed:
+            try:
+                archived = await load_archived_year(year, market_name)
+            except Exception:
+                logger.warning("COT: failed to read %d archive", year, exc_info=True)
+                archived = None
+            if archived is not None:
+                return archived or None
+        all_parsed = await self._shared_parse(
+            CFTC_HISTORICAL_URL_TEMPLATE.format(year=year),
+            lambda: self._download_year(year, archive=completed),
+            live=not completed,
+        )
+        if not all_parsed:
+            return None
+        market_rows = [r for r in all_parsed if r["market_name"] == market_name]
+        if not market_rows:
+            logger.info("COT: market '%s' not found in %d archive", market_name, year)
+            return None
+        logger.info("COT: parsed %d rows for '%s' from %d archive", len(market_rows), market_name, year)
+        return market_rows
+
+    async def _download_year(
+        self, year: int, *, archive: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Download and parse a year's archive; store it if *archive*."""
         url = CFTC_HISTORICAL_URL_TEMPLATE.format(year=year)
         logger.info("COT: downloading historical archive for %d", year)
         zip_bytes = await self._download_bytes(url)
@@ -298,13 +329,49 @@ class CotClient:
         if csv_text is None:
             logger.warning("COT: failed to extract CSV from %d archive", year)
             return None
-        all_parsed = await asyncio.to_thread(parse_cot_csv_sync, csv_text)
-        market_rows = [r for r in all_parsed if r["market_name"] == market_name]
-        if not market_rows:
-            logger.info("COT: market '%s' not found in %d archive", market_name, year)
-            return None
-        logger.info("COT: parsed %d rows for '%s' from %d archive", len(market_rows), market_name, year)
-        return market_rows
+        parsed = await asyncio.to_thread(parse_cot_csv_sync, csv_text)
+        if archive and parsed:
+            try:
+                await archive_year(year, parsed)
+            except Exception:
+                logger.warning("COT: failed to archive %d", year, exc_info=True)
+        return parsed
+
+    async def _parsed_current_report(self) -> list[dict[str, Any]] | None:
+        """Download and parse the current weekly report (shared, short-lived)."""
+        async def _load() -> list[dict[str, Any]] | None:
+            logger.info("COT: downloading current report from CFTC")
+            text = await self._download_text(CFTC_CURRENT_URL)
+            if text is None:
+                return None
+            return await asyncio.to_thread(parse_cot_csv_sync, text)
+
+        return await self._shared_parse(CFTC_CURRENT_URL, _load, live=True)
+
+    async def _shared_parse(
+        self,
+        url: str,
+        load: Callable[[], Awaitable[list[dict[str, Any]] | None]],
+        *,
+        live: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Run *load* once for concurrent callers of *url*.
+
+        *live* results (current report, current year) are reused for
+        ``_LIVE_PARSE_TTL`` seconds; completed years are archived instead.
+        """
+        hit = self._parsed.get(url)
+        if hit is not None and time.monotonic() - hit[0] < _LIVE_PARSE_TTL:
+            return hit[1]
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[url] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(url, None))
+        parsed = await asyncio.shield(task)
+        if live and parsed:
+            self._parsed[url] = (time.monotonic(), parsed)
+        return parsed
 
     @staticmethod
     def _years_for_weeks(current_year: int, weeks: int) -> list[int]:
@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from app.data.database import get_database
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -196,50 +197,54 @@ def parse_cot_csv_sync(csv_text: str) -> list[dict[str, Any]]:
     if name_col is None or date_col is None:
         logger.warning("COT CSV missing required columns (name=%s, date=%s)", name_col, date_col)
         return []
+    # Keep only mapped markets before touching any other column.
+    names = df[name_col].astype(str).str.strip()
+    mask = names.isin(list(COT_MARKET_MAP))
+    if not mask.any():
+        return []
+    df = df.loc[mask]
+    names = names[mask]
+    # A yearly file has ~52 distinct dates; parse each once.
+    dates = df[date_col].map(
+        {raw: _parse_cftc_date(raw) for raw in df[date_col].unique()}
+    )
+    valid = dates.notna()
+    df, names, dates = df.loc[valid], names[valid], dates[valid]
+    values = {key: _int_column(df, candidates) for key, candidates in _COT_FIELDS}
     records: list[dict[str, Any]] = []
-    for _, row in df.iterrows():
-        market_raw = str(row[name_col]).strip()
-        if market_raw not in COT_MARKET_MAP:
-            continue
-        report_date = _parse_cftc_date(row[date_col])
-        if report_date is None:
-            continue
+    for i, (market_raw, report_date) in enumerate(zip(names.tolist(), dates.tolist())):
         info = COT_MARKET_MAP[market_raw]
-        comm_long = _safe_int(row, ["Comml_Positions_Long_All", "Commercial Positions-Long (All)"])
-        comm_short = _safe_int(row, ["Comml_Positions_Short_All", "Commercial Positions-Short (All)"])
-        spec_long = _safe_int(row, ["NonComml_Positions_Long_All", "Noncommercial Positions-Long (All)"])
-        spec_short = _safe_int(row, ["NonComml_Positions_Short_All", "Noncommercial Positions-Short (All)"])
-        small_long = _safe_int(row, ["NonRept_Positions_Long_All", "Nonreportable Positions-Long (All)"])
-        small_short = _safe_int(row, ["NonRept_Positions_Short_All", "Nonreportable Positions-Short (All)"])
-        oi = _safe_int(row, ["Open_Interest_All", "Open Interest (All)"])
-        oi_change = _safe_int(row, ["Change_in_Open_Interest_All", "Change in Open Interest (All)"])
-        comm_long_chg = _safe_int(row, ["Change_in_Comml_Long_All", "Change in Commercial-Long (All)"])
-        comm_short_chg = _safe_int(row, ["Change_in_Comml_Short_All", "Change in Commercial-Short (All)"])
-        spec_long_chg = _safe_int(row, ["Change_in_NonComml_Long_All", "Change in Noncommercial-Long (All)"])
-        spec_short_chg = _safe_int(row, ["Change_in_NonComml_Short_All", "Change in Noncommercial-Short (All)"])
-        records.append({
-            "market_name": market_raw,
-            "symbol": info["symbol"],
-            "display_name": info["display"],
-            "asset_class": info["asset_class"],
+        rec: dict[str, Any] = {
+            "market_name": market_raw, "symbol": info["symbol"],
+            "display_name": info["display"], "asset_class": info["asset_class"],
             "report_date": report_date,
-            "commercial_long": comm_long,
-            "commercial_short": comm_short,
-            "commercial_net": comm_long - comm_short,
-            "commercial_change": (comm_long_chg or 0) - (comm_short_chg or 0),
-            "speculative_long": spec_long,
-            "speculative_short": spec_short,
-            "speculative_net": spec_long - spec_short,
-            "speculative_change": (spec_long_chg or 0) - (spec_short_chg or 0),
-            "small_trader_long": small_long,
-            "small_trader_short": small_short,
-            "small_trader_net": small_long - small_short,
-            "open_interest": oi,
-            "open_interest_change": oi_change or 0,
-        })
+        }
+        rec.update((key, col[i]) for key, col in values.items())
+        for side in ("commercial", "speculative", "small_trader"):
+            rec[f"{side}_net"] = rec[f"{side}_long"] - rec[f"{side}_short"]
+        for side in ("commercial", "speculative"):
+            rec[f"{side}_change"] = rec.pop(f"{side}_long_chg") - rec.pop(f"{side}_short_chg")
+        records.append(rec)
     return records
 
 
+# (record key, candidate CSV columns: current layout first, then legacy)
+_COT_FIELDS: tuple[tuple[str, list[str]], ...] = (
+    ("commercial_long", ["Comml_Positions_Long_All", "Commercial Positions-Long (All)"]),
+    ("commercial_short", ["Comml_Positions_Short_All", "Commercial Positions-Short (All)"]),
+    ("speculative_long", ["NonComml_Positions_Long_All", "Noncommercial Positions-Long (All)"]),
+    ("speculative_short", ["NonComml_Positions_Short_All", "Noncommercial Positions-Short (All)"]),
+    ("small_trader_long", ["NonRept_Positions_Long_All", "Nonreportable Positions-Long (All)"]),
+    ("small_trader_short", ["NonRept_Positions_Short_All", "Nonreportable Positions-Short (All)"]),
+    ("open_interest", ["Open_Interest_All", "Open Interest (All)"]),
+    ("open_interest_change", ["Change_in_Open_Interest_All", "Change in Open Interest (All)"]),
+    ("commercial_long_chg", ["Change_in_Comml_Long_All", "Change in Commercial-Long (All)"]),
+    ("commercial_short_chg", ["Change_in_Comml_Short_All", "Change in Commercial-Short (All)"]),
+    ("speculative_long_chg", ["Change_in_NonComml_Long_All", "Change in Noncommercial-Long (All)"]),
+    ("speculative_short_chg", ["Change_in_NonComml_Short_All", "Change in Noncommercial-Short (All)"]),
+)
+
+
 def _find_column(df: Any, candidates: list[str]) -> str | None:
     """Return the first column name from *candidates* that exists in *df*."""
     for c in candidates:
@@ -258,17 +263,14 @@ def _parse_cftc_date(raw: Any) -> str | None:
         return None
 
 
-def _safe_int(row: Any, candidates: list[str]) -> int:
-    """Extract an integer from *row* trying multiple column names."""
+def _int_column(df: Any, candidates: list[str]) -> list[int]:
+    """Per-row ints from the first candidate column with a value; else 0."""
     import pandas as pd
+    result = pd.Series(float("nan"), index=df.index)
     for col in candidates:
-        try:
-            val = row[col]
-            if pd.notna(val):
-                return int(val)
-        except (KeyError, ValueError, TypeError):
-            continue
-    return 0
+        if col in df.columns:
+            result = result.fillna(pd.to_numeric(df[col], errors="coerce"))
+    return result.fillna(0).astype("int64").tolist()
 
 
 def extract_csv_from_zip_sync(zip_bytes: bytes) -> str | None:
@@ -290,6 +292,7 @@ async def get_cached_cot_data(
     market_name: str, weeks: int, cache_ttl: int,
 ) -> list[dict[str, Any]] | None:
     """Return cached COT rows for *market_name* if fresh (within TTL)."""
+    await get_write_behind().settle("cot_data")
     db = await get_database()
     rows = await db.fetch_all(
         "SELECT market_name, report_date, commercial_long, commercial_short, "
@@ -315,6 +318,7 @@ async def get_cached_cot_data(
 
 async def get_cached_current_report(cache_ttl: int) -> list[dict[str, Any]] | None:
     """Return all cached rows for the most recent report_date if fresh."""
+    await get_write_behind().settle("cot_data")
     db = await get_database()
     latest = await db.fetch_one(
         "SELECT report_date, fetched_at FROM cot_data "
@@ -343,12 +347,12 @@ async def get_cached_current_report(cache_ttl: int) -> list[dict[str, Any]] | No
 
 
 async def store_cot_rows(rows: list[dict[str, Any]]) -> None:
-    """Upsert parsed COT rows into ``cot_data``."""
+    """Queue upserts of parsed COT rows into ``cot_data`` (write-behind)."""
     if not rows:
         return
-    db = await get_database()
     now = now_iso()
-    await db.executemany(
+    get_write_behind().put_many(
+        "cot_data",
         "INSERT OR REPLACE INTO cot_data "
         "(market_name, report_date, commercial_long, commercial_short, "
         "commercial_net, speculative_long, speculative_short, speculative_net, "
@@ -356,12 +360,15 @@ async def store_cot_rows(rows: list[dict[str, Any]]) -> None:
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'cftc', ?)",
         [
             (
-                r["market_name"], r["report_date"],
-                r.get("commercial_long", 0), r.get("commercial_short", 0),
-                r.get("commercial_net", 0),
-                r.get("speculative_long", 0), r.get("speculative_short", 0),
-                r.get("speculative_net", 0),
-                r.get("open_interest", 0), now,
+                (r["market_name"], r["report_date"]),
+                (
+                    r["market_name"], r["report_date"],
+                    r.get("commercial_long", 0), r.get("commercial_short", 0),
+                    r.get("commercial_net", 0),
+                    r.get("speculative_long", 0), r.get("speculative_short", 0),
+                    r.get("speculative_net", 0),
+                    r.get("open_interest", 0), now,
+                ),
             )
             for r in rows
         ],
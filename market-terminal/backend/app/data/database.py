@@ -3,16 +3,29 @@
 Provides a singleton :class:`DatabaseManager` with WAL mode, dict-based row
 returns, schema initialization, and forward-only migrations.
 
+Reads are served by a small pool of read-only connections so they never
+queue behind writes; all writes go through a single writer connection
+whose commits are grouped -- writes finishing within
+``database_commit_window_ms`` of each other share one ``COMMIT``.
+
+The pool queue and the group-commit future belong to the event loop that
+called :meth:`DatabaseManager.initialize`.  Calls arriving on any other
+loop (e.g. a worker thread's ``asyncio.run``) bypass both: they read on
+the writer and commit their own write.
+
 Full implementation: TASK-DATA-001
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
 import logging
 import sqlite3
+import time
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 import aiosqlite
 
@@ -26,6 +39,9 @@ logger = logging.getLogger(__name__)
 _manager: DatabaseManager | None = None
 _init_lock: asyncio.Lock = asyncio.Lock()
 
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+_TEMP_STORE_MODES = frozenset({"DEFAULT", "FILE", "MEMORY"})
+
 
 # ---------------------------------------------------------------------------
 # Path resolution
@@ -53,6 +69,70 @@ def _resolve_db_path() -> Path:
     return current / db_path
 
 
+def _connection_pragmas(settings: Any) -> list[str]:
+    """PRAGMA statements applied to every connection, from *settings*.
+
+    Unknown ``synchronous`` / ``temp_store`` values fall back to the
+    defaults rather than being interpolated into SQL.
+    """
+    synchronous = str(settings.database_synchronous).upper()
+    if synchronous not in _SYNCHRONOUS_MODES:
+        synchronous = "NORMAL"
+    temp_store = str(settings.database_temp_store).upper()
+    if temp_store not in _TEMP_STORE_MODES:
+        temp_store = "MEMORY"
+    return [
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={max(int(settings.database_mmap_size), 0)}",
+        f"PRAGMA cache_size=-{max(int(settings.database_cache_size_kib), 0)}",
+        f"PRAGMA temp_store={temp_store}",
+    ]
+
+
+class _Timing:
+    """Running count / total / max of durations in seconds."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+def _worker_alive(conn: aiosqlite.Connection) -> bool:
+    """False once *conn*'s aiosqlite worker thread has exited.
+
+    The worker dies if it hands a result to an event loop that has since
+    closed; anything queued after that never runs, so awaiting it hangs.
+    """
+    thread = getattr(conn, "_thread", None)
+    return thread is None or thread.is_alive()
+
+
+def _settle(future: asyncio.Future[None], error: Exception | None) -> None:
+    """Resolve a group-commit *future* unless it is already done."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
+
+
 # ---------------------------------------------------------------------------
 # DatabaseManager
 # ---------------------------------------------------------------------------
@@ -70,7 +150,28 @@ class DatabaseManager:
         if db_path is None:
             db_path = _resolve_db_path()
         self._db_path = Path(db_path)
-        self._db: aiosqlite.Connection | None = None
+        self._db: aiosqlite.Connection | None = None  # the single writer
+
+        settings = get_settings()
+        self._pragmas = _connection_pragmas(settings)
+        self._pool_size = max(int(settings.database_read_pool_size), 0)
+        self._commit_window_s = max(float(settings.database_commit_window_ms), 0.0) / 1000.0
+        self._statement_cache = max(int(settings.database_statement_cache_size), 0)
+        self._convert_auto_vacuum = bool(settings.database_convert_auto_vacuum)
+
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._pending_commit: asyncio.Future[None] | None = None
+        self._commit_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Held while a statement runs on the writer (owner loop only), so
+        # maintenance can find the writer outside any transaction.
+        self._write_lock = asyncio.Lock()
+
+        self._pool_wait = _Timing()
+        self._read_time = _Timing()
+        self._write_time = _Timing()
+        self._commits = 0
 
     # -- properties ---------------------------------------------------------
 
@@ -94,8 +195,13 @@ class DatabaseManager:
         """
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._db = await aiosqlite.connect(str(self._db_path))
-        self._db.row_factory = sqlite3.Row
+        self._loop = asyncio.get_running_loop()
+        self._db = await self._connect(str(self._db_path))
+
+        # Free pages are returned by app.data.retention via incremental_vacuum.
+        # Must precede journal_mode (which writes the header) to take effect
+        # on a new file; existing files need enable_incremental_vacuum().
+        await self._db.execute("PRAGMA auto_vacuum=INCREMENTAL")
 
         # WAL mode for concurrent reads from WebSocket handlers
         wal_result = await self._db.execute("PRAGMA journal_mode=WAL")
@@ -113,26 +219,112 @@ class DatabaseManager:
         # Run pending migrations
         await self._migrate()
 
+        # Opt-in: rewriting the whole file is only safe before other users.
+        if self._convert_auto_vacuum:
+            await self.enable_incremental_vacuum()
+
+        await self._open_read_pool()
+
         logger.info("Database initialized at %s", self._db_path)
 
     async def close(self) -> None:
-        """Close the database connection.  No-op if already closed."""
+        """Commit pending writes and close all connections.
+
+        Every pooled reader is closed along with the writer: aiosqlite runs
+        each connection on a non-daemon thread that would otherwise keep
+        the interpreter alive.  Connections whose worker already died are
+        dropped without awaiting them.  No-op if already closed.
+        """
+        task, self._commit_task = self._commit_task, None
+        pending, self._pending_commit = self._pending_commit, None
+        if task is not None:
+            self._call_on_owner_loop(task.cancel)
+        writer_alive = self._db is not None and _worker_alive(self._db)
+        error: Exception | None = None
+        if writer_alive:
+            try:
+                await self._db.commit()
+            except Exception as exc:
+                logger.warning("Final group commit failed", exc_info=True)
+                error = exc
+        if pending is not None:
+            self._call_on_owner_loop(_settle, pending, error)
+        await self._close_read_pool()
         if self._db is not None:
-            await self._db.close()
+            if writer_alive:
+                await self._db.close()
+            else:
+                logger.warning("Writer connection thread exited; dropping it")
             self._db = None
             logger.info("Database connection closed")
+        self._loop = None
+
+    async def _connect(self, database: str, **kwargs: Any) -> aiosqlite.Connection:
+        """Open a connection with dict-convertible rows and tuned pragmas."""
+        conn = await aiosqlite.connect(
+            database, cached_statements=self._statement_cache, **kwargs,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self._pragmas:
+            await conn.execute(pragma)
+        return conn
+
+    async def _open_read_pool(self) -> None:
+        """Open the read-only connections (once the schema exists).
+
+        If read-only connections cannot be opened, reads fall back to the
+        writer connection.
+        """
+        if self._readers or self._pool_size == 0:
+            return
+        uri = f"{self._db_path.resolve().as_uri()}?mode=ro"
+        idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        try:
+            for _ in range(self._pool_size):
+                conn = await self._connect(uri, uri=True)
+                await conn.execute("PRAGMA query_only=ON")
+                self._readers.append(conn)
+                idle.put_nowait(conn)
+        except sqlite3.Error:
+            logger.warning("Read pool unavailable; reads will use the writer",
+                           exc_info=True)
+            await self._close_read_pool()
+            return
+        self._idle_readers = idle
+
+    async def _close_read_pool(self) -> None:
+        readers, self._readers = self._readers, []
+        idle, self._idle_readers = self._idle_readers, None
+        while idle is not None and not idle.empty():
+            conn = idle.get_nowait()
+            if conn not in readers:
+                readers.append(conn)
+        for conn in readers:
+            if not _worker_alive(conn):
+                continue
+            try:
+                await conn.close()
+            except Exception:
+                logger.debug("Failed to close pooled reader", exc_info=True)
 
     # -- query interface ----------------------------------------------------
 
     async def execute(
         self, sql: str, params: tuple[Any, ...] = ()
     ) -> aiosqlite.Cursor:
-        """Execute a single SQL statement, commit, and return the cursor."""
+        """Execute a single SQL statement on the writer, commit, return the cursor.
+
+        The commit is shared with any other writes landing in the same
+        group-commit window; the call returns once it is durable.
+        """
         assert self._db is not None, (
             "Database not initialized. Call initialize() first."
         )
-        cursor = await self._db.execute(sql, params)
-        await self._db.commit()
+        started = time.perf_counter()
+        async with self._writer():
+            cursor = await self._db.execute(sql, params)
+        await self._group_commit()
+        self._write_time.add(time.perf_counter() - started)
         return cursor
 
     async def executemany(
@@ -140,16 +332,51 @@ class DatabaseManager:
     ) -> None:
         """Execute *sql* against each parameter set in *params_seq* and commit."""
         assert self._db is not None, "Database not initialized."
-        await self._db.executemany(sql, params_seq)
-        await self._db.commit()
+        started = time.perf_counter()
+        async with self._writer():
+            await self._db.executemany(sql, params_seq)
+        await self._group_commit()
+        self._write_time.add(time.perf_counter() - started)
+
+    async def execute_batch(
+        self, groups: Iterable[tuple[str, Sequence[tuple[Any, ...]]]]
+    ) -> list[Exception | None]:
+        """Run several ``(sql, params_seq)`` groups on the writer under one commit.
+
+        Used by :mod:`app.data.write_behind`.  Groups that succeed are
+        committed even if another fails, so the outcome is reported per
+        group: the returned list holds ``None`` for each committed group and
+        the exception for each failed one.  A failed COMMIT raises.
+        """
+        assert self._db is not None, "Database not initialized."
+        started = time.perf_counter()
+        errors: list[Exception | None] = []
+        async with self._writer():
+            for sql, params_seq in groups:
+                try:
+                    await self._db.executemany(sql, params_seq)
+                except Exception as exc:
+                    errors.append(exc)
+                else:
+                    errors.append(None)
+        await self._group_commit()
+        self._write_time.add(time.perf_counter() - started)
+        return errors
 
     async def fetch_one(
         self, sql: str, params: tuple[Any, ...] = ()
     ) -> dict[str, Any] | None:
         """Execute *sql* and return a single row as a dict, or *None*."""
         assert self._db is not None, "Database not initialized."
-        cursor = await self._db.execute(sql, params)
-        row = await cursor.fetchone()
+        conn = await self._acquire_reader()
+        started = time.perf_counter()
+        try:
+            cursor = await conn.execute(sql, params)
+            row = await cursor.fetchone()
+            await cursor.close()
+        finally:
+            self._release_reader(conn)
+            self._read_time.add(time.perf_counter() - started)
         return dict(row) if row else None
 
     async def fetch_all(
@@ -157,10 +384,178 @@ class DatabaseManager:
     ) -> list[dict[str, Any]]:
         """Execute *sql* and return all rows as a list of dicts."""
         assert self._db is not None, "Database not initialized."
-        cursor = await self._db.execute(sql, params)
-        rows = await cursor.fetchall()
+        conn = await self._acquire_reader()
+        started = time.perf_counter()
+        try:
+            cursor = await conn.execute(sql, params)
+            rows = await cursor.fetchall()
+            await cursor.close()
+        finally:
+            self._release_reader(conn)
+            self._read_time.add(time.perf_counter() - started)
         return [dict(r) for r in rows]
 
+    def get_stats(self) -> dict[str, Any]:
+        """Return read-pool, query latency and commit counters."""
+        idle = self._idle_readers
+        return {
+            "read_pool_size": len(self._readers),
+            "read_pool_idle": idle.qsize() if idle is not None else 0,
+            "pool_wait": self._pool_wait.to_dict(),
+            "reads": self._read_time.to_dict(),
+            "writes": self._write_time.to_dict(),
+            "commits": self._commits,
+        }
+
+    # -- maintenance --------------------------------------------------------
+
+    async def page_stats(self) -> dict[str, int]:
+        """Return ``page_size``, ``page_count``, ``freelist_count`` and ``auto_vacuum``."""
+        assert self._db is not None, "Database not initialized."
+        stats: dict[str, int] = {}
+        for pragma in ("page_size", "page_count", "freelist_count", "auto_vacuum"):
+            cursor = await self._db.execute(f"PRAGMA {pragma}")
+            row = await cursor.fetchone()
+            await cursor.close()
+            stats[pragma] = int(row[0]) if row else 0
+        return stats
+
+    async def reclaim_space(self, max_pages: int | None = None) -> int:
+        """Return up to *max_pages* free pages (default: all) to the filesystem.
+
+        Runs ``PRAGMA incremental_vacuum`` once the open group commit has
+        landed, holding the writer so no other write starts a transaction
+        meanwhile.  Files created before ``auto_vacuum=INCREMENTAL`` was
+        enabled are skipped; they are converted only on request by
+        :meth:`enable_incremental_vacuum`.  Returns the pages released.
+        """
+        assert self._db is not None, "Database not initialized."
+        async with self._writer():
+            await self._flush_pending_commit()
+            before = await self.page_stats()
+            if before["auto_vacuum"] != 2:  # 2 = INCREMENTAL
+                logger.debug("auto_vacuum is not INCREMENTAL; free pages kept")
+                return 0
+            pages = before["freelist_count"] if max_pages is None else max(int(max_pages), 0)
+            if pages == 0:
+                return 0
+            # sqlite3 steps a row-less statement once, and each step of
+            # incremental_vacuum frees one page: run the one-page form
+            # *pages* times.  Unlike executescript() this never COMMITs.
+            await self._db.executemany(
+                "PRAGMA incremental_vacuum(1)", itertools.repeat((), pages),
+            )
+            after = await self.page_stats()
+        return max(before["freelist_count"] - after["freelist_count"], 0)
+
+    async def enable_incremental_vacuum(self) -> None:
+        """Convert a pre-existing file to ``auto_vacuum=INCREMENTAL``.
+
+        Needs one full ``VACUUM``, which rewrites the whole file and blocks
+        every write until it finishes -- run it deliberately (the
+        ``database_convert_auto_vacuum`` setting does so at startup), never
+        on a schedule.  No-op if the file is already incremental.
+        """
+        assert self._db is not None, "Database not initialized."
+        async with self._writer():
+            await self._flush_pending_commit()
+            if (await self.page_stats())["auto_vacuum"] == 2:
+                return
+            await self._db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            await self._db.execute("VACUUM")
+        logger.info("Converted database to auto_vacuum=INCREMENTAL")
+
+    async def analyze(self, analysis_limit: int = 1000) -> None:
+        """Refresh query-planner statistics (bounded ``ANALYZE``)."""
+        assert self._db is not None, "Database not initialized."
+        async with self._writer():
+            await self._db.execute(f"PRAGMA analysis_limit={int(analysis_limit)}")
+            await self._db.execute("ANALYZE")
+        await self._group_commit()
+
+    # -- connection plumbing ------------------------------------------------
+
+    def _call_on_owner_loop(self, callback: Any, *args: Any) -> None:
+        """Run *callback* on the owner loop (directly when already on it)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if self._on_owner_loop():
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
+
+    def _on_owner_loop(self) -> bool:
+        """True when running on the loop that owns the pool and commit future."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _writer(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Hold the write lock (a no-op off the owner loop)."""
+        if self._on_owner_loop():
+            return self._write_lock
+        return contextlib.nullcontext()
+
+    async def _flush_pending_commit(self) -> None:
+        """Wait for the open group commit, if any, so the writer is idle."""
+        if self._pending_commit is None:
+            return
+        if self._on_owner_loop():
+            await asyncio.shield(self._pending_commit)
+        else:
+            await self._db.commit()
+
+    async def _acquire_reader(self) -> aiosqlite.Connection:
+        """Take an idle read-only connection, waiting if all are busy.
+
+        Off the owner loop the pool queue is unusable, so reads go to the
+        writer connection instead.
+        """
+        idle = self._idle_readers
+        if idle is None or not self._on_owner_loop():
+            return self._db
+        started = time.perf_counter()
+        conn = await idle.get()
+        self._pool_wait.add(time.perf_counter() - started)
+        return conn
+
+    def _release_reader(self, conn: aiosqlite.Connection) -> None:
+        if self._idle_readers is not None and conn is not self._db:
+            self._idle_readers.put_nowait(conn)
+
+    async def _group_commit(self) -> None:
+        """Wait for a COMMIT that covers the write just executed.
+
+        The first writer to arrive schedules a commit after the group
+        window; writers arriving before it runs join the same commit.
+        Writers on a foreign loop commit immediately on their own.
+        """
+        if not self._on_owner_loop():
+            await self._db.commit()
+            self._commits += 1
+            return
+        pending = self._pending_commit
+        if pending is None:
+            pending = self._loop.create_future()
+            self._pending_commit = pending
+            self._commit_task = self._loop.create_task(self._commit_after_window(pending))
+        await asyncio.shield(pending)
+
+    async def _commit_after_window(self, done: asyncio.Future[None]) -> None:
+        await asyncio.sleep(self._commit_window_s)
+        # Writes finishing from here on need the next commit.
+        self._pending_commit = None
+        self._commit_task = None
+        try:
+            await self._db.commit()
+            self._commits += 1
+        except Exception as exc:
+            _settle(done, exc)
+        else:
+            _settle(done, None)
+
     # -- migrations ---------------------------------------------------------
 
     async def _migrate(self) -> None:
@@ -195,11 +590,32 @@ class DatabaseManager:
 # ---------------------------------------------------------------------------
 _MIGRATIONS: dict[int, Any] = {
     # Register future migrations here:
-    #   async def _migrate_v2(db: aiosqlite.Connection) -> None:
+    #   async def _migrate_v3(db: aiosqlite.Connection) -> None:
     #       await db.execute("ALTER TABLE watchlist ADD COLUMN notes TEXT")
-    #   _MIGRATIONS[2] = _migrate_v2
+    #   _MIGRATIONS[3] = _migrate_v3
 }
 
+_MACRO_REACTION_DETAIL_COLUMNS: tuple[str, ...] = (
+    "event_value", "expected_value", "price_before",
+    "price_after_1d", "price_after_5d", "volume_ratio",
+)
+
+
+async def _migrate_v2(db: aiosqlite.Connection) -> None:
+    """Reaction detail columns for app.data.macro_reactions.
+
+    New files already have them from schema.sql, so only missing columns
+    are added.
+    """
+    cursor = await db.execute("PRAGMA table_info(macro_reactions)")
+    existing = {row[1] for row in await cursor.fetchall()}
+    for column in _MACRO_REACTION_DETAIL_COLUMNS:
+        if column not in existing:
+            await db.execute(f"ALTER TABLE macro_reactions ADD COLUMN {column} REAL")
+
+
+_MIGRATIONS[2] = _migrate_v2
+
 
 # ---------------------------------------------------------------------------
 # Module-level convenience functions
@@ -1,7 +1,8 @@
 """Async SEC EDGAR financials client for Market Terminal.
 
 Wraps the synchronous ``edgartools`` library with async helpers, a shared
-10-req/s rate limiter (SEC fair-access policy), SQLite cache integration
+10-req/s rate limit (SEC fair-access policy, enforced by
+:mod:`app.data.rate_limiter`), SQLite cache integration
 (``fundamentals_cache`` table, 24 h TTL), and response metadata tagging.
 
 Full implementation: TASK-DATA-003
@@ -12,47 +13,25 @@ import asyncio
 import json
 import logging
 import re
-import time
-from collections import deque
 from datetime import datetime, timezone
 from typing import Any
 
 from app.config import get_settings
 from app.data.database import get_database
+from app.data.rate_limiter import get_rate_limiter
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Module-level rate limiter (shared with future edgar_ownership_client.py)
-# ---------------------------------------------------------------------------
-_EDGAR_MAX_CALLS_PER_SECOND = 10
-_edgar_call_timestamps: deque[float] = deque()
-_edgar_rate_lock: asyncio.Lock | None = None
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
-def _get_edgar_rate_lock() -> asyncio.Lock:
-    global _edgar_rate_lock
-    if _edgar_rate_lock is None:
-        _edgar_rate_lock = asyncio.Lock()
-    return _edgar_rate_lock
-
-
+# ---------------------------------------------------------------------------
+# Rate limiting (shared with edgar_ownership.py)
+# ---------------------------------------------------------------------------
 async def _wait_for_edgar_rate_limit() -> None:
-    """Block until a request slot is available (sliding 1-s window, 10 req)."""
-    lock = _get_edgar_rate_lock()
-    async with lock:
-        now = time.monotonic()
-        while _edgar_call_timestamps and _edgar_call_timestamps[0] < now - 1.0:
-            _edgar_call_timestamps.popleft()
-        if len(_edgar_call_timestamps) >= _EDGAR_MAX_CALLS_PER_SECOND:
-            wait = 1.0 - (now - _edgar_call_timestamps[0])
-            if wait > 0:
-                await asyncio.sleep(wait)
-                now = time.monotonic()
-                while _edgar_call_timestamps and _edgar_call_timestamps[0] < now - 1.0:
-                    _edgar_call_timestamps.popleft()
-        _edgar_call_timestamps.append(now)
+    """Wait for an EDGAR token (SEC fair-access budget, 10 req/s by default)."""
+    await get_rate_limiter("edgar").acquire()
 
 
 # ---------------------------------------------------------------------------
@@ -152,6 +131,7 @@ class EdgarClient:
 
     async def _get_cached(self, symbol: str, data_type: str, period: str = "latest") -> dict | list | None:
         """Return parsed JSON from ``fundamentals_cache`` if within TTL."""
+        await get_write_behind().settle("fundamentals_cache")
         db = await get_database()
         row = await db.fetch_one(
             "SELECT value_json, fetched_at FROM fundamentals_cache "
@@ -18,14 +18,21 @@ from app.config import get_settings
 from app.data.edgar_client import _wait_for_edgar_rate_limit
 from app.data.edgar_ownership_helpers import (
     EFTS_URL,
+    MAX_13F_CONCURRENCY,
+    MAX_13F_FILINGS,
     MAX_EFTS_RESULTS,
     MAX_FILINGS_PER_SEARCH,
     build_holders_response,
     build_insider_response,
     get_cached_holders,
     get_cached_insiders,
+    get_parsed_13f_holdings,
+    holding_from_position,
+    match_13f_position,
+    parse_13f_table,
     parse_form4_sync,
     quarter_start,
+    store_13f_table,
     store_holders,
     store_insiders,
     tag,
@@ -49,6 +56,8 @@ class EdgarOwnershipClient:
         self._user_agent: str = settings.sec_edgar_user_agent
         self._http: httpx.AsyncClient | None = None
         self._identity_set: bool = False
+        # accession_no -> in-flight 13F table download (shared by lookups)
+        self._inflight_13f: dict[str, asyncio.Task[Any]] = {}
 
     # -- lifecycle ----------------------------------------------------------
 
@@ -160,12 +169,47 @@ class EdgarOwnershipClient:
     ) -> dict[str, Any] | None:
         """Parse a single 13F filing for *target_ticker*.
 
+        The whole information table is persisted per accession, so the
+        download also serves later lookups for every other symbol held.
+
         Returns dict with holder_name, shares, value_usd, report_period
         or None if the ticker is not found in the filing.
         """
+        table = self._inflight_13f.get(accession_no)
+        if table is None:
+            table = asyncio.ensure_future(self._load_13f_table(
+                cik, company_name, form, filing_date, accession_no,
+            ))
+            self._inflight_13f[accession_no] = table
+            table.add_done_callback(
+                lambda _t: self._inflight_13f.pop(accession_no, None)
+            )
+        parsed = await asyncio.shield(table)
+        if parsed is None:
+            return None
+        report_period, positions = parsed
+        position = match_13f_position(positions, target_ticker)
+        if position is None:
+            return None
+        return holding_from_position(
+            company_name, filing_date, report_period, position,
+        )
+
+    async def _load_13f_table(
+        self,
+        cik: int,
+        company_name: str,
+        form: str,
+        filing_date: str,
+        accession_no: str,
+    ) -> tuple[str, list[dict[str, Any]]] | None:
+        """Download, parse and persist one 13F information table.
+
+        Returns ``(report_period, positions)`` or None on failure.
+        """
         self._ensure_identity()
 
-        def _parse_sync() -> dict[str, Any] | None:
+        def _parse_sync() -> tuple[str, list[dict[str, Any]]] | None:
             from edgar import Filing  # type: ignore[import-untyped]
             filing = Filing(
                 cik=cik, company=company_name, form=form,
@@ -177,51 +221,27 @@ class EdgarOwnershipClient:
             holdings = getattr(obj, "holdings", None)
             if holdings is None:
                 return None
-            ticker_upper = target_ticker.upper()
-            try:
-                # Handle Ticker aliases using shared configuration
-                from app.data.edgar_ownership_helpers import TICKER_ALIASES
-                
-                search_tickers = [ticker_upper]
-                aliases = TICKER_ALIASES.get(ticker_upper, [])
-                search_tickers.extend(aliases)
-
-                matched = None
-                for t in search_tickers:
-                    # Exact match
-                    m = holdings[holdings["Ticker"] == t]
-                    if not m.empty:
-                        matched = m
-                        break
-                    # Case-insensitive match
-                    m = holdings[holdings["Ticker"].str.upper() == t]
-                    if not m.empty:
-                        matched = m
-                        break
-
-                if matched is None or matched.empty:
-                    return None
-            except Exception:
-                return None
-            row = matched.iloc[0]
-            shares_val = row.get("SharesPrnAmount")
-            value_val = row.get("Value")
-            return {
-                "holder_name": company_name,
-                "shares": int(shares_val) if shares_val is not None else None,
-                "value_usd": float(value_val) if value_val is not None else None,
-                "report_period": getattr(obj, "report_period", "") or "",
-                "filing_date": filing_date,
-            }
+            report_period = getattr(obj, "report_period", "") or ""
+            return str(report_period), parse_13f_table(holdings)
 
         try:
             await _wait_for_edgar_rate_limit()
-            return await asyncio.to_thread(_parse_sync)
+            parsed = await asyncio.to_thread(_parse_sync)
         except Exception as exc:
             logger.warning(
                 "13F parse failed (CIK %s, %s): %s", cik, accession_no, exc
             )
             return None
+        if parsed is None:
+            return None
+
+        try:
+            await store_13f_table(
+                accession_no, cik, company_name, filing_date, *parsed,
+            )
+        except Exception as exc:
+            logger.warning("13F table cache write failed (%s): %s", accession_no, exc)
+        return parsed
 
     # -- internal: Form 4 parsing ------------------------------------------
 
@@ -245,7 +265,10 @@ class EdgarOwnershipClient:
         """Return 13F institutional holders for *symbol*.
 
         Checks cache first; on miss searches EFTS for 13F filings and
-        parses each to extract the position for *symbol*.
+        parses each to extract the position for *symbol*.  Filings parsed
+        by an earlier lookup (for any symbol) are answered from the local
+        13F table cache; the rest are downloaded concurrently, bounded by
+        ``MAX_13F_CONCURRENCY`` and the shared EDGAR rate limiter.
         """
         sym = symbol.upper()
 
@@ -309,18 +332,36 @@ class EdgarOwnershipClient:
                 unique_hits.append(hit)
 
         # -- parse each 13F ------------------------------------------------
-        holders: list[dict[str, Any]] = []
-        for hit in unique_hits[:20]:
-            holding = await self._parse_13f_holding(
-                cik=hit["cik"],
-                company_name=hit["institution_name"],
-                form="13F-HR",
-                filing_date=hit["filing_date"],
-                accession_no=hit["accession_no"],
-                target_ticker=sym,
+        hits = unique_hits[:MAX_13F_FILINGS]
+        try:
+            parsed = await get_parsed_13f_holdings(
+                [h["accession_no"] for h in hits], sym,
             )
-            if holding is not None:
-                holders.append(holding)
+        except Exception as exc:
+            logger.warning("13F table cache read failed for %s: %s", sym, exc)
+            parsed = {}
+        semaphore = asyncio.Semaphore(MAX_13F_CONCURRENCY)
+
+        async def _holding(hit: dict[str, Any]) -> dict[str, Any] | None:
+            if hit["accession_no"] in parsed:
+                return parsed[hit["accession_no"]]
+            async with semaphore:
+                return await self._parse_13f_holding(
+                    cik=hit["cik"],
+                    company_name=hit["institution_name"],
+                    form="13F-HR",
+                    filing_date=hit["filing_date"],
+                    accession_no=hit["accession_no"],
+                    target_ticker=sym,
+                )
+
+        results = await asyncio.gather(*(_holding(h) for h in hits))
+        holders = [h for h in results if h is not None]
+        logger.info(
+            "13F holders for %s: %d filings (%d from local cache), %d holders",
+            sym, len(hits), sum(1 for h in hits if h["accession_no"] in parsed),
+            len(holders),
+        )
 
         if not holders:
             logger.info("No 13F holdings found for %s", sym)
@@ -8,10 +8,13 @@ Split from edgar_ownership.py to comply with the 500-line file limit.
 from __future__ import annotations
 
 import logging
+import math
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 from app.data.database import get_database
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,8 @@ INSIDER_CACHE_TTL = 14400   # 4 hours for Form 4
 HOLDER_CACHE_TTL = 86400    # 24 hours for 13F
 MAX_EFTS_RESULTS = 50
 MAX_FILINGS_PER_SEARCH = 30
+MAX_13F_FILINGS = 20        # institutions parsed per holder lookup
+MAX_13F_CONCURRENCY = 4     # 13F filings downloaded in parallel
 
 # Transaction code to human-readable type mapping
 TX_CODE_MAP: dict[str, str] = {
@@ -84,6 +89,7 @@ def quarter_start(quarters_back: int) -> str:
 # ---------------------------------------------------------------------------
 async def get_cached_holders(symbol: str) -> list[dict[str, Any]] | None:
     """Return cached ownership_cache rows if fresh (within TTL)."""
+    await get_write_behind().settle("ownership_cache")
     db = await get_database()
     rows = await db.fetch_all(
         "SELECT * FROM ownership_cache WHERE symbol = ? AND source = 'edgar_13f' "
@@ -106,25 +112,29 @@ async def get_cached_holders(symbol: str) -> list[dict[str, Any]] | None:
 
 
 async def store_holders(symbol: str, holders: list[dict[str, Any]]) -> None:
-    """Upsert holders into ownership_cache."""
+    """Queue upserts of holders into ownership_cache (write-behind)."""
     if not holders:
         return
-    db = await get_database()
-    await db.executemany(
+    sym = symbol.upper()
+    get_write_behind().put_many(
+        "ownership_cache",
         "INSERT OR REPLACE INTO ownership_cache "
         "(symbol, holder_name, shares, value_usd, change_shares, "
         "change_percent, filing_date, report_period, source) "
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'edgar_13f')",
         [
             (
-                symbol.upper(),
-                h["holder_name"],
-                h.get("shares"),
-                h.get("value_usd"),
-                h.get("change_shares"),
-                h.get("change_percent"),
-                h.get("filing_date", ""),
-                h.get("report_period", ""),
+                (sym, h["holder_name"], h.get("report_period", "")),
+                (
+                    sym,
+                    h["holder_name"],
+                    h.get("shares"),
+                    h.get("value_usd"),
+                    h.get("change_shares"),
+                    h.get("change_percent"),
+                    h.get("filing_date", ""),
+                    h.get("report_period", ""),
+                ),
             )
             for h in holders
         ],
@@ -138,6 +148,7 @@ async def get_cached_insiders(
     cutoff = (
         datetime.now(timezone.utc) - timedelta(days=days)
     ).strftime("%Y-%m-%d")
+    await get_write_behind().settle("insider_transactions")
     db = await get_database()
     rows = await db.fetch_all(
         "SELECT * FROM insider_transactions "
@@ -164,11 +175,12 @@ async def get_cached_insiders(
 async def store_insiders(
     symbol: str, transactions: list[dict[str, Any]]
 ) -> None:
-    """Upsert into insider_transactions."""
+    """Queue upserts into insider_transactions (write-behind)."""
     if not transactions:
         return
-    db = await get_database()
-    await db.executemany(
+    sym = symbol.upper()
+    get_write_behind().put_many(
+        "insider_transactions",
         "INSERT OR REPLACE INTO insider_transactions "
         "(symbol, insider_name, insider_title, transaction_type, shares, "
         "price_per_share, total_value, shares_owned_after, "
@@ -176,22 +188,182 @@ async def store_insiders(
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'edgar_form4')",
         [
             (
-                symbol.upper(),
-                t["insider_name"],
-                t.get("insider_title"),
-                t["transaction_type"],
-                t["shares"],
-                t.get("price_per_share"),
-                t.get("total_value"),
-                t.get("shares_owned_after"),
-                t["transaction_date"],
-                t.get("filing_date", ""),
+                (sym, t["insider_name"], t["transaction_date"],
+                 t["transaction_type"], t["shares"]),
+                (
+                    sym,
+                    t["insider_name"],
+                    t.get("insider_title"),
+                    t["transaction_type"],
+                    t["shares"],
+                    t.get("price_per_share"),
+                    t.get("total_value"),
+                    t.get("shares_owned_after"),
+                    t["transaction_date"],
+                    t.get("filing_date", ""),
+                ),
             )
             for t in transactions
         ],
     )
 
 
+# ---------------------------------------------------------------------------
+# 13F information tables (parsed once per accession)
+# ---------------------------------------------------------------------------
+def search_tickers(symbol: str) -> list[str]:
+    """Return *symbol* followed by its legacy 13F aliases."""
+    sym = symbol.upper()
+    return [sym, *TICKER_ALIASES.get(sym, [])]
+
+
+def parse_13f_table(holdings: Any) -> list[dict[str, Any]]:
+    """Reduce an edgartools 13F holdings frame to one position per CUSIP.
+
+    The first row for a CUSIP wins (later rows are other-manager or
+    put/call lines).  Rows without a CUSIP are keyed by ticker instead.
+    """
+    if holdings is None or getattr(holdings, "empty", True):
+        return []
+    positions: dict[str, dict[str, Any]] = {}
+    for row in holdings.to_dict("records"):
+        ticker = _clean_str(row.get("Ticker")).upper()
+        cusip = _clean_str(row.get("Cusip")).upper()
+        if not cusip:
+            if not ticker:
+                continue
+            cusip = f"TICKER:{ticker}"
+        if cusip in positions:
+            continue
+        positions[cusip] = {
+            "cusip": cusip,
+            "ticker": ticker or None,
+            "shares": _int_or_none(row.get("SharesPrnAmount")),
+            "value_usd": _float_or_none(row.get("Value")),
+        }
+    return list(positions.values())
+
+
+def match_13f_position(
+    positions: list[dict[str, Any]], symbol: str
+) -> dict[str, Any] | None:
+    """Return the position for *symbol* (or its first matching alias)."""
+    for ticker in search_tickers(symbol):
+        for pos in positions:
+            if pos.get("ticker") == ticker:
+                return pos
+    return None
+
+
+def holding_from_position(
+    holder_name: str, filing_date: str, report_period: str,
+    position: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the holder dict returned by the client from a 13F position."""
+    return {
+        "holder_name": holder_name,
+        "shares": position.get("shares"),
+        "value_usd": position.get("value_usd"),
+        "report_period": report_period,
+        "filing_date": filing_date,
+    }
+
+
+async def get_parsed_13f_holdings(
+    accession_nos: list[str], symbol: str
+) -> dict[str, dict[str, Any] | None]:
+    """Return *symbol*'s holding for every accession already parsed.
+
+    Accessions missing from the result have never been parsed; a value
+    of ``None`` means the filing was parsed and does not hold *symbol*.
+    """
+    if not accession_nos:
+        return {}
+    db = await get_database()
+    acc_marks = ",".join("?" * len(accession_nos))
+    filings = await db.fetch_all(
+        "SELECT accession_no, holder_name, filing_date, report_period "
+        f"FROM thirteenf_filings WHERE accession_no IN ({acc_marks})",
+        tuple(accession_nos),
+    )
+    if not filings:
+        return {}
+    tickers = search_tickers(symbol)
+    rows = await db.fetch_all(
+        "SELECT accession_no, ticker, shares, value_usd FROM thirteenf_positions "
+        f"WHERE accession_no IN ({acc_marks}) "
+        f"AND ticker IN ({','.join('?' * len(tickers))}) ORDER BY rowid",
+        (*accession_nos, *tickers),
+    )
+    by_accession: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        by_accession[row["accession_no"]].append(row)
+
+    result: dict[str, dict[str, Any] | None] = {}
+    for f in filings:
+        pos = match_13f_position(by_accession.get(f["accession_no"], []), symbol)
+        result[f["accession_no"]] = (
+            holding_from_position(
+                f["holder_name"], f["filing_date"], f["report_period"], pos,
+            )
+            if pos is not None else None
+        )
+    return result
+
+
+async def store_13f_table(
+    accession_no: str,
+    cik: int,
+    holder_name: str,
+    filing_date: str,
+    report_period: str,
+    positions: list[dict[str, Any]],
+) -> None:
+    """Persist a parsed 13F information table, then mark the accession parsed."""
+    db = await get_database()
+    await db.execute(
+        "DELETE FROM thirteenf_positions WHERE accession_no = ?", (accession_no,)
+    )
+    if positions:
+        await db.executemany(
+            "INSERT OR REPLACE INTO thirteenf_positions "
+            "(accession_no, cusip, ticker, shares, value_usd) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (accession_no, p["cusip"], p.get("ticker"),
+                 p.get("shares"), p.get("value_usd"))
+                for p in positions
+            ],
+        )
+    await db.execute(
+        "INSERT OR REPLACE INTO thirteenf_filings "
+        "(accession_no, cik, holder_name, filing_date, report_period, "
+        "num_positions, parsed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (accession_no, cik, holder_name, filing_date, report_period,
+         len(positions), now_iso()),
+    )
+
+
+def _clean_str(val: Any) -> str:
+    return val.strip() if isinstance(val, str) else ""
+
+
+def _int_or_none(val: Any) -> int | None:
+    try:
+        num = float(val)
+    except (TypeError, ValueError):
+        return None
+    return int(num) if math.isfinite(num) else None
+
+
+def _float_or_none(val: Any) -> float | None:
+    try:
+        num = float(val)
+    except (TypeError, ValueError):
+        return None
+    return num if math.isfinite(num) else None
+
+
 # ---------------------------------------------------------------------------
 # Response builders
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Async Finnhub API client for Market Terminal.
 
-Provides a singleton :class:`FinnhubClient` with rate limiting (60 req/min),
+Provides a singleton :class:`FinnhubClient` with rate limiting (60 req/min via
+the shared :mod:`app.data.rate_limiter` scheduler),
 circuit-breaker protection, camelCase-to-snake_case normalization, and
 response metadata tagging.
 
@@ -21,6 +22,7 @@ from typing import Any
 import httpx
 
 from app.config import get_settings
+from app.data.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +30,6 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 _BASE_URL = "https://finnhub.io/api/v1"
-_MAX_CALLS_PER_MINUTE = 60
 _CONNECT_TIMEOUT = 10.0
 _READ_TIMEOUT = 30.0
 _RATE_LIMIT_PAUSE = 60.0
@@ -63,9 +64,6 @@ class FinnhubClient:
         self._circuit_state: CircuitState = CircuitState.CLOSED
         self._failure_timestamps: deque[float] = deque()
         self._circuit_opened_at: float = 0.0
-        # Rate limiter
-        self._call_timestamps: deque[float] = deque()
-        self._rate_lock: asyncio.Lock = asyncio.Lock()
         # HTTP client (lazy)
         self._http_client: httpx.AsyncClient | None = None
 
@@ -83,10 +81,8 @@ class FinnhubClient:
 
     @property
     def calls_remaining(self) -> int:
-        """Approximate API calls available in the current 60-s window."""
-        now = time.monotonic()
-        valid = sum(1 for ts in self._call_timestamps if ts >= now - 60)
-        return max(0, _MAX_CALLS_PER_MINUTE - valid)
+        """API calls the current priority class may make right now."""
+        return get_rate_limiter("finnhub").available_for()
 
     # -- lifecycle ----------------------------------------------------------
 
@@ -111,20 +107,8 @@ class FinnhubClient:
     # -- rate limiter -------------------------------------------------------
 
     async def _wait_for_rate_limit(self) -> None:
-        """Block until a request slot is available (sliding 60-s window)."""
-        async with self._rate_lock:
-            now = time.monotonic()
-            while self._call_timestamps and self._call_timestamps[0] < now - 60:
-                self._call_timestamps.popleft()
-            if len(self._call_timestamps) >= _MAX_CALLS_PER_MINUTE:
-                wait_time = 60 - (now - self._call_timestamps[0])
-                if wait_time > 0:
-                    logger.info("Finnhub rate limit reached, waiting %.0fms", wait_time * 1000)
-                    await asyncio.sleep(wait_time)
-                    now = time.monotonic()
-                    while self._call_timestamps and self._call_timestamps[0] < now - 60:
-                        self._call_timestamps.popleft()
-            self._call_timestamps.append(now)
+        """Wait for a Finnhub token from the shared rate-limit scheduler."""
+        await get_rate_limiter("finnhub").acquire()
 
     # -- circuit breaker ----------------------------------------------------
 
@@ -16,6 +16,7 @@ import difflib
 import httpx
 
 from app.config import get_settings
+from app.data.rate_limiter import get_rate_limiter
 import enum
 
 class CircuitBreakerState(enum.Enum):
@@ -34,8 +35,6 @@ except ImportError:
     logger.warning("jb-news SDK not installed; JBlanked features disabled")
 
 _FF_FEED_URL = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
-_FF_RATE_LIMIT = 2
-_FF_RATE_WINDOW = 300.0
 
 
 def _normalize_name(name: str) -> str:
@@ -52,10 +51,6 @@ class ForexCalendarClient:
     def __init__(self) -> None:
         self._http: httpx.AsyncClient | None = None
         
-        # FF Rate Limiter
-        self._ff_rate_limiter: deque[float] = deque()
-        self._ff_rate_lock = asyncio.Lock()
-        
         # FF Circuit Breaker
         self._ff_cb_state = CircuitBreakerState.CLOSED
         self._ff_cb_failures: deque[float] = deque()
@@ -115,14 +110,8 @@ class ForexCalendarClient:
             return True
 
     async def _check_ff_rate_limit(self) -> bool:
-        now = time.monotonic()
-        async with self._ff_rate_lock:
-            while self._ff_rate_limiter and now - self._ff_rate_limiter[0] > _FF_RATE_WINDOW:
-                self._ff_rate_limiter.popleft()
-            if len(self._ff_rate_limiter) >= _FF_RATE_LIMIT:
-                return False
-            self._ff_rate_limiter.append(now)
-            return True
+        # ForexFactory budget (2 per 5 min) from the shared scheduler; never waits.
+        return get_rate_limiter("forex_factory").try_acquire()
 
     async def _fetch_ff(self) -> list[dict] | None:
         if not await self._check_ff_cb():
@@ -1,8 +1,9 @@
 """Async FRED API client for Market Terminal.
 
-Wraps the synchronous ``fredapi`` library with async helpers, a sliding-window
-rate limiter (120 req/min), SQLite cache integration (``fundamentals_cache``
-and ``macro_events`` tables), and response metadata tagging.
+Wraps the synchronous ``fredapi`` library with async helpers, a 120 req/min
+rate limit (shared :mod:`app.data.rate_limiter` scheduler), SQLite cache
+integration (``fundamentals_cache`` and ``macro_events`` tables), and
+response metadata tagging.
 
 Full implementation: TASK-DATA-005
 """
@@ -11,13 +12,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import time
-from collections import deque
 from datetime import datetime, timezone
 from typing import Any
 
 from app.config import get_settings
 from app.data.database import get_database
+from app.data.rate_limiter import get_rate_limiter
+from app.data.write_behind import get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +50,6 @@ FRED_SERIES: dict[str, str] = {
     "initial_claims": "ICSA",
 }
 
-_MAX_CALLS_PER_MINUTE = 120
-
 
 # ---------------------------------------------------------------------------
 # Pure helpers
@@ -86,11 +85,6 @@ class FredClient:
         self._enabled: bool = bool(api_key)
         self._cache_ttl_fundamentals: int = settings.cache_ttl_fundamentals
         self._cache_ttl_macro: int = settings.cache_ttl_macro
-        self._max_per_min: int = _MAX_CALLS_PER_MINUTE
-
-        # Rate limiter
-        self._rate_timestamps: deque[float] = deque()
-        self._rate_lock: asyncio.Lock = asyncio.Lock()
 
         # Lazy fredapi import
         self._fred: Any = None
@@ -128,25 +122,8 @@ class FredClient:
     # -- rate limiter -------------------------------------------------------
 
     async def _wait_for_rate_limit(self) -> None:
-        """Block until a request slot is available (sliding 60-s window)."""
-        async with self._rate_lock:
-            now = time.monotonic()
-            while self._rate_timestamps and self._rate_timestamps[0] < now - 60:
-                self._rate_timestamps.popleft()
-            if len(self._rate_timestamps) >= self._max_per_min:
-                wait = 60 - (now - self._rate_timestamps[0])
-                if wait > 0:
-                    logger.info(
-                        "FRED rate limit reached, waiting %.0fms", wait * 1000
-                    )
-                    await asyncio.sleep(wait)
-                    now = time.monotonic()
-                    while (
-                        self._rate_timestamps
-                        and self._rate_timestamps[0] < now - 60
-                    ):
-                        self._rate_timestamps.popleft()
-            self._rate_timestamps.append(time.monotonic())
+        """Wait for a FRED token from the shared rate-limit scheduler."""
+        await get_rate_limiter("fred").acquire()
 
     # -- sync fetch via asyncio.to_thread -----------------------------------
 
@@ -213,6 +190,7 @@ class FredClient:
         end: str | None,
     ) -> list[dict[str, Any]] | None:
         """Return cached series records from ``fundamentals_cache`` if within TTL."""
+        await get_write_behind().settle("fundamentals_cache")
         db = await get_database()
         period = f"{start or 'all'}_{end or 'latest'}"
         row = await db.fetch_one(
@@ -7,14 +7,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable
 
 from fastapi import HTTPException
 
 from app.data.edgar_client import get_edgar_client
 from app.data.finnhub_client import get_finnhub_client
-from app.data.yfinance_client import get_yfinance_client
+from app.data.yfinance_client import get_yfinance_client, statement_to_records
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,6 @@ def _fetch_yf_financials_direct(sym: str) -> dict[str, Any] | None:
     """
     try:
         import yfinance as yf
-        import pandas as pd
 
         ticker = yf.Ticker(sym)
         raw = {
@@ -93,26 +93,13 @@ def _fetch_yf_financials_direct(sym: str) -> dict[str, Any] | None:
             "annual_cashflow": ticker.cashflow,
         }
 
-        def _df_to_records(df: Any) -> list[dict[str, Any]]:
-            if df is None or (hasattr(df, "empty") and df.empty):
-                return []
-            records: list[dict[str, Any]] = []
-            for col in df.columns:
-                period = col.strftime("%Y-%m-%d") if hasattr(col, "strftime") else str(col)
-                row_data: dict[str, Any] = {"period": period}
-                for idx_name, val in df[col].items():
-                    key = str(idx_name).lower().replace(" ", "_")
-                    row_data[key] = float(val) if pd.notna(val) else None
-                records.append(row_data)
-            return records
-
         return {
-            "income_statement": _df_to_records(raw.get("income")),
-            "balance_sheet": _df_to_records(raw.get("balance")),
-            "cash_flow": _df_to_records(raw.get("cashflow")),
-            "annual_income_statement": _df_to_records(raw.get("annual_income")),
-            "annual_balance_sheet": _df_to_records(raw.get("annual_balance")),
-            "annual_cash_flow": _df_to_records(raw.get("annual_cashflow")),
+            "income_statement": statement_to_records(raw.get("income")),
+            "balance_sheet": statement_to_records(raw.get("balance")),
+            "cash_flow": statement_to_records(raw.get("cashflow")),
+            "annual_income_statement": statement_to_records(raw.get("annual_income")),
+            "annual_balance_sheet": statement_to_records(raw.get("annual_balance")),
+            "annual_cash_flow": statement_to_records(raw.get("annual_cashflow")),
         }
     except Exception:
         return None
@@ -449,11 +436,43 @@ def _build_ttm(
 # Main Service Function
 # ---------------------------------------------------------------------------
 
-async def get_fundamentals_data(symbol: str) -> dict[str, Any]:
+def _needs_yf_info(
+    quote_data: dict[str, Any] | None,
+    market_data: dict[str, Any] | None,
+    profile_data: dict[str, Any] | None,
+    has_quarterly: bool = True,
+) -> bool:
+    """Return *True* if the primary sources left a field the yfinance info backfills.
+
+    Besides the Finnhub market fields this covers the dividend yield and,
+    when EDGAR produced no quarterly data (*has_quarterly* false), the
+    fallback TTM block built from the info's revenue, margins and ratios.
+    """
+    missing_price = not quote_data or not quote_data.get("current_price")
+    missing_mcap = (not market_data or not market_data.get("market_cap")) and (not profile_data or not profile_data.get("market_cap"))
+    missing_pe = not market_data or not market_data.get("pe_ratio")
+    missing_shares = not profile_data or not profile_data.get("shareOutstanding")
+    missing_dividend = not market_data or market_data.get("dividend_yield") is None
+    return (
+        missing_price or missing_mcap or missing_pe or missing_shares
+        or missing_dividend or not has_quarterly
+    )
+
+
+async def get_fundamentals_data(
+    symbol: str, *, include_ownership: bool = True,
+) -> dict[str, Any]:
     """Return aggregated fundamental financial data for *symbol*.
     
     Orchestrates EDGAR, Finnhub, and YFinance to produce a composite view.
     Includes logic for fallbacks, missing data patching, and validity checks.
+
+    Sources are fetched in dependency order: every EDGAR and Finnhub call
+    runs concurrently (each under its provider's shared rate limiter), then
+    the yfinance supplements run only where those results leave gaps.
+    Institutional ownership only comes from yfinance, so with
+    *include_ownership* the yfinance info call joins the first stage.
+    Per-source latencies are reported in ``_timings_ms``.
     """
     # Reject non-equity asset types (crypto)
     if _is_non_equity(symbol):
@@ -469,83 +488,77 @@ async def get_fundamentals_data(symbol: str) -> dict[str, Any]:
     finnhub = get_finnhub_client()
     yfinance = get_yfinance_client()
 
-    # Fetch data from all sources (best-effort for each)
-    income_data: list[dict[str, Any]] | None = None
-    balance_data: list[dict[str, Any]] | None = None
-    cash_flow_data: list[dict[str, Any]] | None = None
-    company_info: dict[str, Any] | None = None
-    market_data: dict[str, Any] | None = None
-    profile_data: dict[str, Any] | None = None
-    quote_data: dict[str, Any] | None = None
-    yf_data: dict[str, Any] | None = None
-
-    # EDGAR: income statement (quarterly)
-    try:
+    started = time.monotonic()
+    timings: dict[str, float] = {}
+
+    async def _fetch(name: str, call: Awaitable[Any]) -> Any:
+        """Await *call* best-effort, recording its latency under *name*."""
+        t0 = time.monotonic()
+        try:
+            return await call
+        except Exception:
+            logger.warning("%s fetch error for %s", name, symbol, exc_info=True)
+            return None
+        finally:
+            timings[name] = round((time.monotonic() - t0) * 1000, 1)
+
+    # Stage 1: primary sources are independent of each other
+    yf_info_task: asyncio.Future[Any] | None = None
+    if include_ownership:
+        yf_info_task = asyncio.ensure_future(_fetch("yfinance_info", yfinance.get_info(symbol)))
+
+    (
+        income_data, balance_data, cash_flow_data, company_info,
+        market_data, profile_data, quote_data,
+    ) = await asyncio.gather(
         # Increase quarters to support annual calculation
-        income_data = await edgar.get_eps_history(symbol, quarters=12)
-    except Exception:
-        logger.warning("EDGAR income fetch error for %s", symbol, exc_info=True)
+        _fetch("edgar_income", edgar.get_eps_history(symbol, quarters=12)),
+        _fetch("edgar_balance_sheet", edgar.get_balance_sheet(symbol, periods=4)),
+        _fetch("edgar_cash_flow", edgar.get_cash_flow(symbol, periods=4)),
+        _fetch("edgar_company", edgar.get_company(symbol)),
+        _fetch("finnhub_financials", finnhub.get_basic_financials(symbol)),
+        _fetch("finnhub_profile", finnhub.get_company_profile(symbol)),
+        _fetch("finnhub_quote", finnhub.get_quote(symbol)),
+    )
 
-    # EDGAR: balance sheet
-    try:
-        balance_data = await edgar.get_balance_sheet(symbol, periods=4)
-    except Exception:
-        logger.warning("EDGAR balance sheet fetch error for %s", symbol, exc_info=True)
+    latest_bs = balance_data[0] if balance_data else None
+    has_valid_balance = latest_bs and latest_bs.get("total_equity") is not None and latest_bs.get("debt_to_equity") is not None
+    
+    has_valid_cash = cash_flow_data and len(cash_flow_data) > 0 and cash_flow_data[0].get("free_cash_flow") is not None
+    
+    has_valid_income = income_data and len(income_data) > 0 and income_data[0].get("eps_diluted") is not None and income_data[0].get("revenue") is not None
 
-    # EDGAR: cash flow
-    try:
-        cash_flow_data = await edgar.get_cash_flow(symbol, periods=4)
-    except Exception:
-        logger.warning("EDGAR cash flow fetch error for %s", symbol, exc_info=True)
+    # Calculate initial Annual EPS from available quarterly data
+    quarterly_initial = _build_quarterly(income_data, cash_flow_data)
+    annual_eps_initial = _build_annual_eps(quarterly_initial)
 
-    # EDGAR: company info (CIK, name)
-    try:
-        company_info = await edgar.get_company(symbol)
-    except Exception:
-        logger.warning("EDGAR company fetch error for %s", symbol, exc_info=True)
+    # Stage 2: yfinance supplements, started only for what stage 1 missed
+    if yf_info_task is None and _needs_yf_info(
+        quote_data, market_data, profile_data, bool(quarterly_initial),
+    ):
+        yf_info_task = asyncio.ensure_future(_fetch("yfinance_info", yfinance.get_info(symbol)))
+    
+    # Check if we have enough annual data (at least 2 years) for CANSLIM
+    has_sufficient_annual_eps = len(annual_eps_initial) >= 2
 
-    # Finnhub: market-derived metrics
-    try:
-        market_data = await finnhub.get_basic_financials(symbol)
-    except Exception:
-        logger.warning("Finnhub financials fetch error for %s", symbol, exc_info=True)
+    has_edgar = income_data is not None and len(income_data) > 0
+    needs_financials = (not has_edgar) or (not has_valid_income) or (not has_valid_balance) or (not has_valid_cash) or (not has_sufficient_annual_eps)
 
-    # Finnhub: company profile (name fallback, shares outstanding)
-    try:
-        profile_data = await finnhub.get_company_profile(symbol)
-    except Exception:
-        logger.warning("Finnhub profile fetch error for %s", symbol, exc_info=True)
-        
-    # Finnhub: quote (price for fallback derivations)
-    try:
-        quote_data = await finnhub.get_quote(symbol)
-    except Exception:
-        logger.warning("Finnhub quote fetch error for %s", symbol, exc_info=True)
-        
-    # Check if we are missing critical data
-    missing_price = not quote_data or not quote_data.get("current_price")
-    missing_mcap = (not market_data or not market_data.get("market_cap")) and (not profile_data or not profile_data.get("market_cap"))
-    missing_pe = not market_data or not market_data.get("pe_ratio")
-    missing_shares = not profile_data or not profile_data.get("shareOutstanding")
-    
-    # YFinance Fallback and Supplemental Data
-    # Fetch YF info if basic data is missing OR if we want rich data (e.g. ownership)
-    if missing_price or missing_mcap or missing_pe or missing_shares or True:
-        try:
-            yf_data = await yfinance.get_info(symbol)
-        except Exception:
-            logger.warning("YFinance info fetch error for %s", symbol, exc_info=True)
+    yf_fins_task: asyncio.Future[Any] | None = None
+    if needs_financials:
+        yf_fins_task = asyncio.ensure_future(_fetch("yfinance_financials", yfinance.get_financials(symbol)))
+
+    yf_data: dict[str, Any] | None = await yf_info_task if yf_info_task is not None else None
 
     # Direct fast_info fallback when YFinanceClient circuit is open
-    if yf_data is None:
-        try:
-            loop = asyncio.get_event_loop()
-            fi_result = await loop.run_in_executor(None, _fetch_fast_info, symbol)
-            if fi_result:
-                yf_data = fi_result
-                logger.info("fast_info fallback succeeded for %s: %s", symbol, fi_result)
-        except Exception:
-            logger.warning("fast_info fallback failed for %s", symbol, exc_info=True)
+    if yf_info_task is not None and yf_data is None:
+        loop = asyncio.get_event_loop()
+        fi_result = await _fetch(
+            "yfinance_fast_info", loop.run_in_executor(None, _fetch_fast_info, symbol),
+        )
+        if fi_result:
+            yf_data = fi_result
+            logger.info("fast_info fallback succeeded for %s: %s", symbol, fi_result)
 
     # Determine company name and CIK
     company_name = None
@@ -559,11 +572,12 @@ async def get_fundamentals_data(symbol: str) -> dict[str, Any]:
         company_name = yf_data.get("name")
 
     # If no data from any source, 404
-    has_edgar = income_data is not None and len(income_data) > 0
     has_finnhub = market_data is not None or profile_data is not None
     has_yfinance = yf_data is not None
     
     if not has_edgar and not has_finnhub and not has_yfinance:
+        if yf_fins_task is not None:
+            yf_fins_task.cancel()
         raise HTTPException(
             status_code=404,
             detail={
@@ -576,41 +590,20 @@ async def get_fundamentals_data(symbol: str) -> dict[str, Any]:
     financials_source = "edgar" if has_edgar else "finnhub"
     market_source = "finnhub" if has_finnhub else ("yfinance" if has_yfinance else "none")
 
-    # YFinance Financials Fallback Logic
-    latest_bs = balance_data[0] if balance_data else None
-    has_valid_balance = latest_bs and latest_bs.get("total_equity") is not None and latest_bs.get("debt_to_equity") is not None
-    
-    has_valid_cash = cash_flow_data and len(cash_flow_data) > 0 and cash_flow_data[0].get("free_cash_flow") is not None
-    
-    has_valid_income = income_data and len(income_data) > 0 and income_data[0].get("eps_diluted") is not None and income_data[0].get("revenue") is not None
-
-    # Calculate initial Annual EPS from available quarterly data
-    quarterly_initial = _build_quarterly(income_data, cash_flow_data)
-    annual_eps_initial = _build_annual_eps(quarterly_initial)
-    
-    # Check if we have enough annual data (at least 2 years) for CANSLIM
-    has_sufficient_annual_eps = len(annual_eps_initial) >= 2
-
-    needs_financials = (not has_edgar) or (not has_valid_income) or (not has_valid_balance) or (not has_valid_cash) or (not has_sufficient_annual_eps)
-    
     aid_yf = None
 
-    if needs_financials:
-        yf_fins = None
-        try:
-            yf_fins = await yfinance.get_financials(symbol)
-        except Exception:
-            logger.warning("YFinance financials fallback failed for %s", symbol, exc_info=True)
+    if yf_fins_task is not None:
+        yf_fins = await yf_fins_task
 
         # If YFinanceClient circuit is open, try direct yfinance bypass
         if yf_fins is None:
-            try:
-                loop = asyncio.get_event_loop()
-                yf_fins = await loop.run_in_executor(None, _fetch_yf_financials_direct, symbol)
-                if yf_fins:
-                    logger.info("Direct yfinance financials bypass succeeded for %s", symbol)
-            except Exception:
-                logger.warning("Direct yfinance financials bypass failed for %s", symbol, exc_info=True)
+            loop = asyncio.get_event_loop()
+            yf_fins = await _fetch(
+                "yfinance_financials_direct",
+                loop.run_in_executor(None, _fetch_yf_financials_direct, symbol),
+            )
+            if yf_fins:
+                logger.info("Direct yfinance financials bypass succeeded for %s", symbol)
 
         if yf_fins:
             id_yf, bd_yf, cfd_yf, aid_yf, _, _ = _adapt_yfinance_financials(yf_fins)
@@ -714,6 +707,10 @@ async def get_fundamentals_data(symbol: str) -> dict[str, Any]:
             "market_data": market_source,
         },
         "data_timestamp": now,
+        "_timings_ms": {
+            **timings,
+            "total": round((time.monotonic() - started) * 1000, 1),
+        },
     }
 
     if not has_edgar:
@@ -0,0 +1,656 @@
+"""Precomputed price reactions to macro releases (``macro_reactions``).
+
+``/api/macro/reaction`` used to fetch the FRED series and a full Finnhub
+candle range on every request, rebuild a date -> price lookup and scan it
+for every release.  :class:`ReactionEngine` computes each (event type,
+release date, symbol) reaction once and keeps it in ``macro_reactions``,
+with the pair's averages over the default window in
+``macro_reaction_stats``:
+
+* A pair is computed on its first request (cold path) and tracked from
+  then on; every ``macro_reactions_interval_minutes`` the background loop
+  updates tracked pairs, and every watchlist symbol for each tracked event
+  type
+* Updates are incremental -- only releases not stored yet, revised ones,
+  and recent ones still waiting for their 5-day price are computed, from a
+  single candle fetch spanning just those dates
+* Stored rows are pruned to the current FRED window, so releases that
+  aged out of it (or that FRED dropped) are never served
+* Reads are one indexed query per pair, with the default-window averages
+  read precomputed from the stats row
+
+Without a database the engine degrades to computing on every request.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from app.exceptions import DataSourceError
+
+logger = logging.getLogger(__name__)
+
+HISTORY_RELEASES: int = 36  # releases kept per pair (= max ``periods``)
+AVERAGE_WINDOW: int = 12    # releases behind the precomputed averages
+# A release whose 5-day price is still missing this long after it is final.
+_SETTLE_DAYS: int = 14
+_CANDLES_BEFORE_DAYS: int = 20
+_CANDLES_AFTER_DAYS: int = 15
+_MAX_TRACKED: int = 500
+# First run waits this long after startup so it never competes with warm-up.
+_STARTUP_DELAY_S: float = 180.0
+
+_AVERAGE_KEYS: tuple[str, ...] = (
+    "avg_return_1d_on_beat", "avg_return_1d_on_miss",
+    "avg_return_5d_on_beat", "avg_return_5d_on_miss",
+    "avg_volume_ratio",
+)
+# Response key -> macro_reactions column
+_COLUMNS: dict[str, str] = {
+    "event_date": "event_date",
+    "event_value": "event_value",
+    "expected": "expected_value",
+    "surprise": "surprise_direction",
+    "price_before": "price_before",
+    "price_after_1d": "price_after_1d",
+    "price_after_5d": "price_after_5d",
+    "return_1d_percent": "reaction_1d",
+    "return_5d_percent": "reaction_5d",
+    "volume_ratio": "volume_ratio",
+}
+
+
+# ---------------------------------------------------------------------------
+# Reaction math
+# ---------------------------------------------------------------------------
+
+def build_price_lookup(candles: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Build date -> {close, volume} lookup from candle data."""
+    lookup: dict[str, dict[str, Any]] = {}
+    for candle in candles:
+        ts = candle.get("timestamp")
+        if ts is None:
+            continue
+        try:
+            if isinstance(ts, str):
+                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+            else:
+                dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+            date_str = dt.strftime("%Y-%m-%d")
+        except (ValueError, TypeError, OSError):
+            continue
+        lookup[date_str] = {
+            "close": candle.get("close"),
+            "volume": candle.get("volume"),
+        }
+    return lookup
+
+
+def price_before(
+    event_date: str,
+    sorted_dates: list[str],
+    lookup: dict[str, dict[str, Any]],
+) -> float | None:
+    """Get closing price the trading day before *event_date*."""
+    idx = bisect_left(sorted_dates, event_date)
+    if idx > 0:
+        return lookup[sorted_dates[idx - 1]].get("close")
+    return None
+
+
+def price_after(
+    event_date: str,
+    sorted_dates: list[str],
+    lookup: dict[str, dict[str, Any]],
+    days: int,
+) -> float | None:
+    """Get closing price *days* trading days after *event_date*.
+
+    Handles both trading-day and non-trading-day events consistently
+    by normalizing the base index to the first trading day after the event.
+    """
+    idx = bisect_left(sorted_dates, event_date)
+    # If event_date is in sorted_dates, skip it (base = first day AFTER event)
+    if idx < len(sorted_dates) and sorted_dates[idx] == event_date:
+        base = idx + 1
+    else:
+        # event_date is not a trading day; idx already points to next trading day
+        base = idx
+    target_idx = base + (days - 1)
+    if target_idx < len(sorted_dates):
+        return lookup[sorted_dates[target_idx]].get("close")
+    return None
+
+
+def volume_ratio(
+    event_date: str,
+    sorted_dates: list[str],
+    lookup: dict[str, dict[str, Any]],
+) -> float | None:
+    """Compute event-day volume / 10-day average volume."""
+    idx = bisect_left(sorted_dates, event_date)
+
+    # Resolve event-day index (exact match or next trading day)
+    event_idx = idx
+    if idx >= len(sorted_dates):
+        return None
+
+    event_vol = lookup[sorted_dates[event_idx]].get("volume")
+    if event_vol is None or event_vol == 0:
+        return None
+
+    volumes: list[float] = []
+    start = max(0, event_idx - 10)
+    for i in range(start, event_idx):
+        vol = lookup[sorted_dates[i]].get("volume")
+        if vol is not None and vol > 0:
+            volumes.append(vol)
+
+    if not volumes:
+        return None
+
+    avg_vol = sum(volumes) / len(volumes)
+    if avg_vol == 0:
+        return None
+
+    return round(event_vol / avg_vol, 2)
+
+
+def compute_reactions(
+    records: list[dict[str, Any]],
+    indices: list[int],
+    lookup: dict[str, dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Reactions to ``records[i]`` for each *i* in *indices* (``i >= 1``).
+
+    The previous record's value is the expectation; records without a date
+    or value are skipped.
+    """
+    sorted_dates = sorted(lookup.keys())
+    reactions: list[dict[str, Any]] = []
+    for i in indices:
+        rec = records[i]
+        event_date = rec.get("date")
+        value = rec.get("value")
+        prev_value = records[i - 1].get("value")
+
+        if event_date is None or value is None:
+            continue
+
+        surprise = "inline"
+        if prev_value is not None:
+            if value > prev_value:
+                surprise = "above"
+            elif value < prev_value:
+                surprise = "below"
+
+        before = price_before(event_date, sorted_dates, lookup)
+        after_1d = price_after(event_date, sorted_dates, lookup, days=1)
+        after_5d = price_after(event_date, sorted_dates, lookup, days=5)
+
+        return_1d = None
+        return_5d = None
+        if before is not None and before > 0:
+            if after_1d is not None:
+                return_1d = round((after_1d - before) / before * 100, 2)
+            if after_5d is not None:
+                return_5d = round((after_5d - before) / before * 100, 2)
+
+        reactions.append({
+            "event_date": event_date,
+            "event_value": value,
+            "expected": prev_value,
+            "surprise": surprise,
+            "price_before": before,
+            "price_after_1d": after_1d,
+            "price_after_5d": after_5d,
+            "return_1d_percent": return_1d,
+            "return_5d_percent": return_5d,
+            "volume_ratio": volume_ratio(event_date, sorted_dates, lookup),
+        })
+    return reactions
+
+
+def empty_averages() -> dict[str, Any]:
+    """Return empty averages structure."""
+    return {key: None for key in _AVERAGE_KEYS}
+
+
+def compute_averages(reactions: list[dict[str, Any]]) -> dict[str, Any]:
+    """Compute average returns split by beat/miss."""
+    beats_1d: list[float] = []
+    misses_1d: list[float] = []
+    beats_5d: list[float] = []
+    misses_5d: list[float] = []
+    vol_ratios: list[float] = []
+
+    for r in reactions:
+        surprise = r.get("surprise")
+        ret_1d = r.get("return_1d_percent")
+        ret_5d = r.get("return_5d_percent")
+        vol = r.get("volume_ratio")
+
+        if vol is not None:
+            vol_ratios.append(vol)
+
+        if surprise == "above":
+            if ret_1d is not None:
+                beats_1d.append(ret_1d)
+            if ret_5d is not None:
+                beats_5d.append(ret_5d)
+        elif surprise == "below":
+            if ret_1d is not None:
+                misses_1d.append(ret_1d)
+            if ret_5d is not None:
+                misses_5d.append(ret_5d)
+
+    def _avg(lst: list[float]) -> float | None:
+        return round(sum(lst) / len(lst), 2) if lst else None
+
+    return {
+        "avg_return_1d_on_beat": _avg(beats_1d),
+        "avg_return_1d_on_miss": _avg(misses_1d),
+        "avg_return_5d_on_beat": _avg(beats_5d),
+        "avg_return_5d_on_miss": _avg(misses_5d),
+        "avg_volume_ratio": _avg(vol_ratios),
+    }
+
+
+def _needs_update(
+    records: list[dict[str, Any]],
+    i: int,
+    stored: dict[str, dict[str, Any]],
+    settle_cutoff: str,
+) -> bool:
+    """True if the reaction to ``records[i]`` is missing, revised or unsettled."""
+    event_date = records[i].get("date")
+    value = records[i].get("value")
+    if event_date is None or value is None:
+        return False
+    row = stored.get(event_date)
+    if row is None:
+        return True
+    if row["event_value"] != value or row["expected"] != records[i - 1].get("value"):
+        return True
+    return row["price_after_5d"] is None and event_date >= settle_cutoff
+
+
+def _candle_range(dates: list[str]) -> tuple[int, int] | None:
+    """Unix bounds of a daily candle fetch covering reactions on *dates*."""
+    parsed = []
+    for d in dates:
+        try:
+            parsed.append(datetime.strptime(d, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+        except (ValueError, TypeError):
+            continue
+    if not parsed:
+        return None
+    return (
+        int((min(parsed) - timedelta(days=_CANDLES_BEFORE_DAYS)).timestamp()),
+        int((max(parsed) + timedelta(days=_CANDLES_AFTER_DAYS)).timestamp()),
+    )
+
+
+# ---------------------------------------------------------------------------
+# ReactionEngine
+# ---------------------------------------------------------------------------
+
+async def _database() -> Any | None:
+    try:
+        from app.data.database import get_database
+        return await get_database()
+    except Exception:
+        logger.debug("Reaction store unavailable -- computing without it", exc_info=True)
+        return None
+
+
+class ReactionEngine:
+    """Computes, stores and serves price reactions per (event type, symbol)."""
+
+    def __init__(self, interval_s: float) -> None:
+        self._interval_s = interval_s
+        self._task: asyncio.Task[None] | None = None
+        self._run_lock = asyncio.Lock()
+        self._pair_locks: dict[tuple[str, str], asyncio.Lock] = {}
+        # (event_type, symbol) -> FRED indicator, least recently requested first
+        self._tracked: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._restored = False
+
+        self._hits = 0
+        self._misses = 0
+        self._rows_written = 0
+        self._runs = 0
+        self._failures = 0
+        self._last_report: dict[str, Any] | None = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def start(self, initial_delay_s: float = _STARTUP_DELAY_S) -> None:
+        """Start the background loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._loop(initial_delay_s),
+            )
+
+    async def stop(self) -> None:
+        """Cancel the background loop, waiting for a run in progress to abort."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, initial_delay_s: float) -> None:
+        await asyncio.sleep(initial_delay_s)
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failures += 1
+                logger.warning("Macro reaction run failed", exc_info=True)
+            await asyncio.sleep(self._interval_s)
+
+    # -- reads --------------------------------------------------------------
+
+    def track(self, event_type: str, symbol: str, indicator: str) -> None:
+        """Keep (event_type, symbol) updated by the background loop."""
+        key = (event_type, symbol)
+        self._tracked[key] = indicator
+        self._tracked.move_to_end(key)
+        while len(self._tracked) > _MAX_TRACKED:
+            self._tracked.popitem(last=False)
+
+    async def get_reactions(
+        self,
+        event_type: str,
+        symbol: str,
+        indicator: str,
+        periods: int,
+        *,
+        fred: Any = None,
+        finnhub: Any = None,
+    ) -> dict[str, Any]:
+        """The last *periods* reactions (oldest first) and their averages.
+
+        Served from the store once the pair has been computed; otherwise
+        computed now with *fred* / *finnhub*.  Raises
+        :class:`~app.exceptions.DataSourceError` if a source fails.
+        """
+        self.track(event_type, symbol, indicator)
+        db = await _database()
+        if db is not None:
+            stored = await self._read(db, event_type, symbol, periods)
+            if stored is not None:
+                self._hits += 1
+                return stored
+
+        self._misses += 1
+        history = await self.update(
+            event_type, symbol, indicator, fred=fred, finnhub=finnhub, db=db,
+        )
+        reactions = history[-periods:]
+        return {"reactions": reactions, "averages": compute_averages(reactions)}
+
+    async def _read(
+        self, db: Any, event_type: str, symbol: str, periods: int,
+    ) -> dict[str, Any] | None:
+        stats = await db.fetch_one(
+            "SELECT * FROM macro_reaction_stats WHERE event_name = ? AND symbol = ?",
+            (event_type, symbol),
+        )
+        if stats is None:
+            return None
+        rows = await db.fetch_all(
+            f"SELECT {', '.join(_COLUMNS.values())} FROM macro_reactions "
+            "WHERE event_name = ? AND symbol = ? ORDER BY event_date DESC LIMIT ?",
+            (event_type, symbol, periods),
+        )
+        reactions = [
+            {key: row[col] for key, col in _COLUMNS.items()} for row in reversed(rows)
+        ]
+        averages = (
+            {key: stats[key] for key in _AVERAGE_KEYS}
+            if periods == AVERAGE_WINDOW else compute_averages(reactions)
+        )
+        return {"reactions": reactions, "averages": averages}
+
+    # -- updates ------------------------------------------------------------
+
+    async def update(
+        self,
+        event_type: str,
+        symbol: str,
+        indicator: str,
+        *,
+        fred: Any = None,
+        finnhub: Any = None,
+        db: Any = None,
+    ) -> list[dict[str, Any]]:
+        """Compute the pair's pending reactions and store them.
+
+        Returns the pair's last :data:`HISTORY_RELEASES` reactions, oldest
+        first.  Nothing is stored (and the pair stays uncomputed) when FRED
+        or Finnhub return no data.
+        """
+        key = (event_type, symbol)
+        lock = self._pair_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if fred is None:
+                from app.data.fred_client import get_fred_client
+                fred = get_fred_client()
+            if finnhub is None:
+                from app.data.finnhub_client import get_finnhub_client
+                finnhub = get_finnhub_client()
+
+            try:
+                records = await fred.get_series(indicator)
+            except Exception as exc:
+                raise DataSourceError("fred") from exc
+            if not records or len(records) < 2:
+                return []
+
+            window = records[-(HISTORY_RELEASES + 1):]
+            stored = await self._stored(db, event_type, symbol) if db is not None else {}
+            current = {rec.get("date") for rec in window[1:]}
+            dropped = [d for d in stored if d not in current]
+            settle_cutoff = (
+                datetime.now(timezone.utc) - timedelta(days=_SETTLE_DAYS)
+            ).strftime("%Y-%m-%d")
+            pending = [
+                i for i in range(1, len(window))
+                if _needs_update(window, i, stored, settle_cutoff)
+            ]
+
+            fresh: list[dict[str, Any]] = []
+            if pending:
+                bounds = _candle_range([window[i]["date"] for i in pending])
+                if bounds is None:
+                    return []
+                try:
+                    candles = await finnhub.get_candles(symbol, "D", *bounds)
+                except Exception as exc:
+                    raise DataSourceError("finnhub") from exc
+                if not candles:
+                    history = _history(stored, window)
+                    if dropped:
+                        await self._write(
+                            db, event_type, symbol, indicator, [], history, dropped,
+                        )
+                    return history
+                fresh = compute_reactions(window, pending, build_price_lookup(candles))
+
+            merged = {**stored, **{r["event_date"]: r for r in fresh}}
+            history = _history(merged, window)
+            if db is not None and (fresh or dropped or not stored):
+                await self._write(
+                    db, event_type, symbol, indicator, fresh, history, dropped,
+                )
+            return history
+
+    @staticmethod
+    async def _stored(db: Any, event_type: str, symbol: str) -> dict[str, dict[str, Any]]:
+        rows = await db.fetch_all(
+            f"SELECT {', '.join(_COLUMNS.values())} FROM macro_reactions "
+            "WHERE event_name = ? AND symbol = ?",
+            (event_type, symbol),
+        )
+        return {
+            row["event_date"]: {key: row[col] for key, col in _COLUMNS.items()}
+            for row in rows
+        }
+
+    async def _write(
+        self,
+        db: Any,
+        event_type: str,
+        symbol: str,
+        indicator: str,
+        fresh: list[dict[str, Any]],
+        history: list[dict[str, Any]],
+        dropped: list[str],
+    ) -> None:
+        """Store *fresh* reactions, delete the *dropped* dates, refresh the stats."""
+        now = datetime.now(timezone.utc).isoformat()
+        if dropped:
+            await db.executemany(
+                "DELETE FROM macro_reactions "
+                "WHERE event_name = ? AND symbol = ? AND event_date = ?",
+                [(event_type, symbol, d) for d in dropped],
+            )
+        if fresh:
+            columns = ["event_name", "symbol", *_COLUMNS.values(), "calculated_at"]
+            await db.executemany(
+                f"INSERT OR REPLACE INTO macro_reactions ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                [
+                    (event_type, symbol, *(r[key] for key in _COLUMNS), now)
+                    for r in fresh
+                ],
+            )
+            self._rows_written += len(fresh)
+        averages = compute_averages(history[-AVERAGE_WINDOW:])
+        await db.execute(
+            "INSERT OR REPLACE INTO macro_reaction_stats "
+            "(event_name, symbol, fred_indicator, latest_event_date, "
+            f"{', '.join(_AVERAGE_KEYS)}, calculated_at) "
+            f"VALUES (?, ?, ?, ?, {', '.join('?' * len(_AVERAGE_KEYS))}, ?)",
+            (
+                event_type, symbol, indicator,
+                history[-1]["event_date"] if history else None,
+                *(averages[key] for key in _AVERAGE_KEYS), now,
+            ),
+        )
+
+    # -- background pass ----------------------------------------------------
+
+    async def run_once(self) -> dict[str, Any]:
+        """Update every tracked pair and every watchlist symbol.  Returns the report."""
+        async with self._run_lock:
+            db = await _database()
+            started = time.perf_counter()
+            written_before = self._rows_written
+
+            if db is not None and not self._restored:
+                for row in await db.fetch_all(
+                    "SELECT event_name, symbol, fred_indicator FROM macro_reaction_stats"
+                ):
+                    self._tracked.setdefault(
+                        (row["event_name"], row["symbol"]), row["fred_indicator"],
+                    )
+                self._restored = True
+
+            # Without a store there is nothing to keep warm.
+            pairs: dict[tuple[str, str], str] = {}
+            if db is not None:
+                pairs = dict(self._tracked)
+                indicators = {
+                    event_type: indicator for (event_type, _), indicator in pairs.items()
+                }
+                for row in await db.fetch_all("SELECT symbol FROM watchlist"):
+                    for event_type, indicator in indicators.items():
+                        pairs.setdefault((event_type, row["symbol"]), indicator)
+
+            failed = 0
+            for (event_type, symbol), indicator in pairs.items():
+                try:
+                    await self.update(event_type, symbol, indicator, db=db)
+                except DataSourceError:
+                    failed += 1
+                    logger.debug(
+                        "Reaction update failed for %s/%s", symbol, event_type, exc_info=True,
+                    )
+
+            rows = self._rows_written - written_before
+            report = {
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "pairs": len(pairs),
+                "pairs_failed": failed,
+                "rows_written": rows,
+            }
+            self._runs += 1
+            self._last_report = report
+            logger.info(
+                "Macro reactions: %d pairs, %d rows written in %.0f ms",
+                len(pairs), rows, report["elapsed_ms"],
+            )
+            return report
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return store hits/misses, run counters and the last run's report."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_s": self._interval_s,
+            "tracked_pairs": len(self._tracked),
+            "hits": self._hits,
+            "misses": self._misses,
+            "rows_written": self._rows_written,
+            "runs": self._runs,
+            "failures": self._failures,
+            "last_run": self._last_report,
+        }
+
+
+def _history(
+    by_date: dict[str, dict[str, Any]], window: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Reactions in *by_date* for the releases of *window*, oldest first."""
+    dates = {rec.get("date") for rec in window[1:]}
+    return [by_date[d] for d in sorted(by_date) if d in dates]
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+_engine: ReactionEngine | None = None
+
+
+def get_reaction_engine() -> ReactionEngine:
+    """Return the process-wide reaction engine (not started)."""
+    global _engine
+    if _engine is None:
+        from app.config import get_settings
+        s = get_settings()
+        _engine = ReactionEngine(
+            interval_s=max(s.macro_reactions_interval_minutes, 1) * 60.0,
+        )
+    return _engine
+
+
+async def close_reaction_engine() -> None:
+    """Stop and drop the singleton (FastAPI shutdown)."""
+    global _engine
+    if _engine is not None:
+        await _engine.stop()
+        _engine = None
@@ -18,6 +18,7 @@ import httpx
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from app.config import get_settings
+from app.data.rate_limiter import RateLimiter, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,8 @@ class OptionContractModel(BaseModel):
     vega: float | None = None
     break_even_price: float | None = None
     option_ticker: str
+    # True when IV / greeks were filled in locally (app.data.options_chain)
+    greeks_computed: bool = False
 
     @field_validator("contract_type", mode="before")
     @classmethod
@@ -139,8 +142,6 @@ class MassiveClient:
 
         tier_limits = {"free": 5, "starter": 6000, "developer": 6000, "advanced": 6000}
         self._rate_limit = tier_limits.get(self._tier, 5)
-        self._rate_limiter: deque[float] = deque()
-        self._rate_lock = asyncio.Lock()
         self._symbol_locks: dict[str, asyncio.Lock] = {}
 
         self._cb_state = CircuitBreakerState.CLOSED
@@ -171,10 +172,11 @@ class MassiveClient:
 
     @property
     def calls_remaining(self) -> int:
-        now = time.monotonic()
-        while self._rate_limiter and now - self._rate_limiter[0] > 60.0:
-            self._rate_limiter.popleft()
-        return max(0, self._rate_limit - len(self._rate_limiter))
+        return self._limiter.available_for()
+
+    @property
+    def _limiter(self) -> RateLimiter:
+        return get_rate_limiter("massive", default_calls=self._rate_limit)
 
     def _get_symbol_lock(self, symbol: str) -> asyncio.Lock:
         if symbol not in self._symbol_locks:
@@ -218,18 +220,13 @@ class MassiveClient:
             elif self._cb_state == CircuitBreakerState.HALF_OPEN:
                 return None
 
-        async with self._rate_lock:
-            now = time.monotonic()
-            while self._rate_limiter and now - self._rate_limiter[0] > 60.0:
-                self._rate_limiter.popleft()
-            if len(self._rate_limiter) >= self._rate_limit:
-                logger.warning("MassiveClient rate limit exceeded (%d/min).", self._rate_limit)
-                if is_test_request:
-                    async with self._cb_lock:
-                        self._cb_state = CircuitBreakerState.OPEN
-                        self._cb_open_time = now - self._cb_cooldown + 0.1
-                return None
-            self._rate_limiter.append(now)
+        if not self._limiter.try_acquire():
+            logger.warning("MassiveClient rate limit exceeded (%d/min).", self._limiter.calls)
+            if is_test_request:
+                async with self._cb_lock:
+                    self._cb_state = CircuitBreakerState.OPEN
+                    self._cb_open_time = time.monotonic() - self._cb_cooldown + 0.1
+            return None
 
         try:
             # We attempt httpx since the requirements state the SDK might not be there 
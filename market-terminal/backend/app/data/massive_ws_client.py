@@ -4,6 +4,10 @@ Connects to wss://socket.massive.com/options for live quotes and trades.
 Authenticates with user API key, parses payloads safely dropping NaNs,
 and injects into the unified WebSocketManager.
 
+Events are conflated rather than forwarded one by one: the latest quote
+per option ticker is kept in a slot and trades are buffered, and a flush
+task publishes the slots and trade batches every ``massive_ws_flush_ms``.
+
 TASK-UPDATE-007
 """
 
@@ -13,7 +17,7 @@ import logging
 import random
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import websockets
 from websockets.exceptions import WebSocketException
@@ -35,6 +39,10 @@ _MAX_MESSAGE_BYTES = 65_536  # 64KB
 _CB_MAX_ATTEMPTS = 10
 _CB_COOLDOWN_S = 120
 
+# Conflation
+_MIN_FLUSH_MS = 10
+_MAX_PENDING_TRADES = 5_000  # per flush window, across all tickers
+
 
 class MassiveWsClient:
     """Singleton WebSocket client connecting to Massive.com feed."""
@@ -48,11 +56,18 @@ class MassiveWsClient:
 
         self._enabled = True
         self._check_tier_enabled()
+        self._flush_interval_s = max(settings.massive_ws_flush_ms, _MIN_FLUSH_MS) / 1000.0
 
         self._subscriptions: Set[str] = set()
         self._connection: Optional[websockets.WebSocketClientProtocol] = None
         self._receive_task: Optional[asyncio.Task] = None
         self._ping_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Conflation buffers, swapped out on every flush
+        self._pending_quotes: Dict[str, Dict[str, Any]] = {}
+        self._pending_trades: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_trade_count = 0
 
         self._reconnect_attempts = 0
         self._circuit_breaker_state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
@@ -63,6 +78,8 @@ class MassiveWsClient:
         self._reconnection_count = 0
         self._last_message_at: Optional[datetime] = None
         self._latency_ms: Optional[float] = None
+        self._conflated_quotes = 0
+        self._dropped_events = 0
 
     def _check_tier_enabled(self) -> None:
         """Verify the configured Massive Tier supports Websockets."""
@@ -143,6 +160,8 @@ class MassiveWsClient:
                 return
             self._reconnect_attempts = 0
             self._receive_task = asyncio.create_task(self._connect_and_loop())
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_loop())
 
     async def stop(self) -> None:
         """Stop the WebSocket connection and cancel the receive loop task."""
@@ -155,6 +174,13 @@ class MassiveWsClient:
                 self._receive_task.cancel()
                 self._receive_task = None
 
+            if self._flush_task:
+                self._flush_task.cancel()
+                self._flush_task = None
+            self._pending_quotes = {}
+            self._pending_trades = {}
+            self._pending_trade_count = 0
+
             if self._connection:
                 await self._connection.close()
                 self._connection = None
@@ -331,7 +357,7 @@ class MassiveWsClient:
              pass
 
     def _process_payload(self, raw_str: str) -> None:
-        """Converts Massive payloads safely checking floats and propagating to WS unified loop."""
+        """Converts Massive payloads safely checking floats and buffering them for the next flush."""
         try:
              data = json.loads(raw_str)
         except json.JSONDecodeError:
@@ -363,8 +389,11 @@ class MassiveWsClient:
                  self._latency_ms = (now - p_time).total_seconds() * 1000.0
 
             if event_type == "OQ":
-                 # OQ Options Quote mapping
-                 cleaned = {
+                 # OQ Options Quote mapping -- only the latest quote per
+                 # ticker survives until the next flush
+                 if sym in self._pending_quotes:
+                     self._conflated_quotes += 1
+                 self._pending_quotes[sym] = {
                      "type": "options_quote",
                      "ticker": sym,
                      "bid": _sanitize_float(buf.get("bp")),
@@ -375,26 +404,56 @@ class MassiveWsClient:
                      "timestamp": pdt,
                      "source": "massive_ws"
                  }
-                 channel = f"options_quote:{sym}"
-                 async def broadcast_safe(chan, msg):
-                     await ws_manager.broadcast_to_subscribers(chan, msg)
-                 asyncio.create_task(broadcast_safe(channel, cleaned))
-                 
+
             elif event_type == "O":
-                 # O Options Trade mapping
-                 cleaned = {
-                     "type": "options_trade",
-                     "ticker": sym,
+                 # O Options Trade mapping -- every trade is kept, batched
+                 if self._pending_trade_count >= _MAX_PENDING_TRADES:
+                     self._dropped_events += 1
+                     continue
+                 self._pending_trades.setdefault(sym, []).append({
                      "price": _sanitize_float(buf.get("p")),
                      "size": _sanitize_float(buf.get("s")),
                      "exchange": str(buf.get("x", "")),
                      "timestamp": pdt,
-                     "source": "massive_ws"
-                 }
-                 channel = f"options_trade:{sym}"
-                 async def broadcast_safe_trade(chan, msg):
-                     await ws_manager.broadcast_to_subscribers(chan, msg)
-                 asyncio.create_task(broadcast_safe_trade(channel, cleaned))
+                 })
+                 self._pending_trade_count += 1
+
+    async def _flush_loop(self) -> None:
+        """Publish conflated quotes and trade batches every flush interval."""
+        try:
+            while True:
+                await asyncio.sleep(self._flush_interval_s)
+                await self._flush()
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush(self) -> None:
+        """Swap out the pending buffers and broadcast them to subscribers."""
+        quotes, self._pending_quotes = self._pending_quotes, {}
+        trades, self._pending_trades = self._pending_trades, {}
+        self._pending_trade_count = 0
+
+        for sym, quote in quotes.items():
+            if not await self._publish(f"options_quote:{sym}", quote):
+                self._dropped_events += 1
+
+        for sym, batch in trades.items():
+            message = {
+                "type": "options_trades",
+                "ticker": sym,
+                "trades": batch,
+                "source": "massive_ws"
+            }
+            if not await self._publish(f"options_trade:{sym}", message):
+                self._dropped_events += len(batch)
+
+    async def _publish(self, channel: str, message: Dict[str, Any]) -> bool:
+        try:
+            await ws_manager.broadcast_to_subscribers(channel, message)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish {channel}: {str(e)}")
+            return False
 
     async def get_metrics(self) -> dict[str, Any]:
         """Return current mapping snapshot."""
@@ -410,7 +469,11 @@ class MassiveWsClient:
             "subscriptions_count": subs,
             "circuit_breaker_state": self._circuit_breaker_state,
             "enabled": self._enabled,
-            "connected": is_connected
+            "connected": is_connected,
+            "flush_interval_ms": round(self._flush_interval_s * 1000),
+            "conflated_quotes": self._conflated_quotes,
+            "dropped_events": self._dropped_events,
+            "backlog": len(self._pending_quotes) + self._pending_trade_count
         }
 
 # Module-level singleton
@@ -0,0 +1,169 @@
+"""In-process L1 tier for :class:`~app.data.cache.CacheManager`.
+
+Holds already-decoded payloads keyed by ``CacheManager._make_key`` so that
+hot keys (watchlist quotes polled by the UI) skip the SQLite ``SELECT``,
+``json.loads`` and ISO timestamp parse on every hit.  Features:
+
+* Bounded by entry count *and* approximate payload bytes (JSON length)
+* TTL-aware: entries expire at ``fetched_at + ttl`` and expired entries are
+  purged before any live entry is evicted
+* LRU eviction among live entries
+* Per-symbol / per-data-type invalidation
+* Own hit/miss/eviction counters
+
+Payloads are shared between callers, so they must be treated as read-only
+(as :class:`~app.data.cache_types.CachedResult` already implies).
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class _Entry:
+    """A single decoded cache payload with its freshness metadata."""
+
+    data: Any
+    data_type: str
+    symbol: str
+    fetched_at: str
+    fetched_ts: float
+    expires_ts: float
+    size: int
+
+
+class MemoryCache:
+    """Bounded TTL + size-aware LRU map of decoded cache payloads."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- read / write -------------------------------------------------------
+
+    def get(self, key: str) -> tuple[Any, str, float] | None:
+        """Return ``(data, fetched_at_iso, age_seconds)`` or *None*.
+
+        Expired entries are dropped and reported as a miss so the caller
+        falls through to SQLite (which still serves stale data).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        now = time.time()
+        if now > entry.expires_ts:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.data, entry.fetched_at, max(now - entry.fetched_ts, 0.0)
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        *,
+        data_type: str,
+        symbol: str,
+        fetched_at: str,
+        fetched_ts: float,
+        ttl: int,
+        size: int,
+    ) -> bool:
+        """Insert or replace *key*.  Returns False if the entry was not admitted.
+
+        Entries that are already past their TTL, or larger than the whole
+        byte budget, are not admitted.
+        """
+        expires_ts = fetched_ts + ttl
+        if expires_ts <= time.time() or size > self._max_bytes:
+            self._remove(key)
+            return False
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(
+            data=data,
+            data_type=data_type,
+            symbol=symbol.upper(),
+            fetched_at=fetched_at,
+            fetched_ts=fetched_ts,
+            expires_ts=expires_ts,
+            size=size,
+        )
+        self._bytes += size
+        self._enforce_limits()
+        return True
+
+    # -- invalidation -------------------------------------------------------
+
+    def invalidate(self, symbol: str, data_type: str | None = None) -> int:
+        """Drop entries for *symbol* (optionally scoped to *data_type*)."""
+        symbol = symbol.upper()
+        doomed = [
+            k for k, e in self._entries.items()
+            if e.symbol == symbol and (data_type is None or e.data_type == data_type)
+        ]
+        for k in doomed:
+            self._remove(k)
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return L1 counters and occupancy."""
+        total = self._hits + self._misses
+        return {
+            "l1_hits": self._hits,
+            "l1_misses": self._misses,
+            "l1_hit_rate": self._hits / total if total > 0 else 0.0,
+            "l1_evictions": self._evictions,
+            "l1_expirations": self._expirations,
+            "l1_entries": len(self._entries),
+            "l1_bytes": self._bytes,
+            "l1_max_entries": self._max_entries,
+            "l1_max_bytes": self._max_bytes,
+        }
+
+    # -- internals ----------------------------------------------------------
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _over_budget(self) -> bool:
+        return len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+
+    def _enforce_limits(self) -> None:
+        if not self._over_budget():
+            return
+        # Expired entries go first -- they would be a miss anyway.
+        now = time.time()
+        for key in [k for k, e in self._entries.items() if now > e.expires_ts]:
+            self._remove(key)
+            self._expirations += 1
+        # Then least-recently-used live entries.
+        while self._over_budget() and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._evictions += 1
@@ -0,0 +1,431 @@
+"""Columnar options chains with precomputed indexes and local greeks.
+
+The options routes used to walk the cached chain (a list of contract dicts)
+in Python on every request -- bucketing IV / open interest per expiration,
+filtering strikes -- and each filter combination was a separate upstream
+snapshot.  This module turns one cached snapshot per symbol into an
+:class:`OptionChain` once:
+
+* Contracts held as numpy columns sorted by (expiration, strike, type),
+  with per-expiration row offsets, so an expiration range is two bisects
+  and strike / type filters are a vectorized mask over that slice
+  (memoized per filter set, so pagination is a slice of a cached index)
+* Per-expiration aggregates (average IV, put/call ratio, open interest,
+  contract count) computed with ``np.add.reduceat`` at build time
+* Vectorized Black-Scholes (:func:`bs_price`, :func:`bs_greeks`,
+  :func:`implied_vol`): IV, delta, gamma, theta and vega are computed in one
+  pass for every contract the provider left without them, from the
+  bid/ask mid (or last trade) and the underlying price
+
+Chains are memoized per cache key until the snapshot's ``fetched_at``
+changes (:func:`chain_for`).
+"""
+from __future__ import annotations
+
+import logging
+import math
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dtime, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from app.data.cache_types import CachedResult
+
+logger = logging.getLogger(__name__)
+
+_MAX_CHAINS = 64
+_MAX_SELECTIONS = 32
+_ET = ZoneInfo("America/New_York")
+_YEAR_S = 365.0 * 86400.0
+_IV_LOW = 1e-4
+_IV_HIGH = 5.0
+_IV_ITERATIONS = 60
+_DEFAULT_RATE = 0.04
+
+# Float columns (NaN = not provided) in OptionContractModel field order.
+_FLOAT_FIELDS: tuple[str, ...] = (
+    "bid", "ask", "last_price", "volume", "open_interest",
+    "implied_volatility", "delta", "gamma", "theta", "vega",
+    "break_even_price",
+)
+_GREEK_FIELDS: tuple[str, ...] = ("implied_volatility", "delta", "gamma", "theta", "vega")
+_INT_FIELDS = frozenset({"volume", "open_interest"})
+
+
+# ---------------------------------------------------------------------------
+# Vectorized Black-Scholes
+# ---------------------------------------------------------------------------
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Abramowitz & Stegun 26.2.17, |error| < 7.5e-8)."""
+    ax = np.abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * ax)
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (
+        1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    upper = 1.0 - norm_pdf(ax) * poly
+    return np.where(x >= 0.0, upper, 1.0 - upper)
+
+
+def _d1_d2(
+    s: np.ndarray, k: np.ndarray, t: np.ndarray, sigma: np.ndarray, r: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    sqrt_t = np.sqrt(t)
+    vol_t = sigma * sqrt_t
+    d1 = (np.log(s / k) + (r + 0.5 * sigma * sigma) * t) / vol_t
+    return d1, d1 - vol_t, sqrt_t
+
+
+def bs_price(
+    s: np.ndarray, k: np.ndarray, t: np.ndarray, sigma: np.ndarray,
+    r: float, is_call: np.ndarray,
+) -> np.ndarray:
+    """European option value (no dividends); *t* in years."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, _ = _d1_d2(s, k, t, sigma, r)
+        disc_k = k * np.exp(-r * t)
+        call = s * norm_cdf(d1) - disc_k * norm_cdf(d2)
+        put = disc_k * norm_cdf(-d2) - s * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def bs_greeks(
+    s: np.ndarray, k: np.ndarray, t: np.ndarray, sigma: np.ndarray,
+    r: float, is_call: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Delta, gamma, theta (per calendar day) and vega (per vol point)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, sqrt_t = _d1_d2(s, k, t, sigma, r)
+        pdf = norm_pdf(d1)
+        disc_k = k * np.exp(-r * t)
+        decay = -s * pdf * sigma / (2.0 * sqrt_t)
+        theta = np.where(
+            is_call,
+            decay - r * disc_k * norm_cdf(d2),
+            decay + r * disc_k * norm_cdf(-d2),
+        )
+        return {
+            "delta": np.where(is_call, norm_cdf(d1), norm_cdf(d1) - 1.0),
+            "gamma": pdf / (s * sigma * sqrt_t),
+            "theta": theta / 365.0,
+            "vega": s * pdf * sqrt_t / 100.0,
+        }
+
+
+def implied_vol(
+    price: np.ndarray, s: np.ndarray, k: np.ndarray, t: np.ndarray,
+    r: float, is_call: np.ndarray,
+) -> np.ndarray:
+    """Implied volatility by vectorized bisection on ``[1e-4, 5]``.
+
+    NaN where *price* lies outside what any volatility in that range can
+    produce (e.g. below intrinsic value).
+    """
+    lo = np.full(price.shape, _IV_LOW)
+    hi = np.full(price.shape, _IV_HIGH)
+    solvable = (
+        (price >= bs_price(s, k, t, lo, r, is_call))
+        & (price <= bs_price(s, k, t, hi, r, is_call))
+    )
+    for _ in range(_IV_ITERATIONS):
+        mid = 0.5 * (lo + hi)
+        above = bs_price(s, k, t, mid, r, is_call) > price
+        hi = np.where(above, mid, hi)
+        lo = np.where(above, lo, mid)
+    return np.where(solvable, 0.5 * (lo + hi), np.nan)
+
+
+def years_to_expiry(expirations: list[str], now: datetime | None = None) -> np.ndarray:
+    """Years from *now* to the 16:00 ET close of each ``YYYY-MM-DD`` expiration."""
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    out = np.empty(len(expirations))
+    for i, exp in enumerate(expirations):
+        try:
+            close = datetime.combine(date.fromisoformat(exp), dtime(16, 0), tzinfo=_ET)
+            out[i] = (close.timestamp() - now_ts) / _YEAR_S
+        except ValueError:
+            out[i] = np.nan
+    return out
+
+
+# ---------------------------------------------------------------------------
+# OptionChain
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True, eq=False)
+class OptionChain:
+    """One options snapshot as read-only columns sorted by (expiration, strike, type).
+
+    Rows of ``expirations[i]`` are ``offsets[i]:offsets[i + 1]``.
+    """
+
+    symbol: str
+    underlying_price: float | None
+    fetched_at: str
+    expirations: list[str]     # unique, sorted
+    offsets: np.ndarray        # int64, len(expirations) + 1
+    expiration: np.ndarray     # int64 index into ``expirations`` per row
+    strike: np.ndarray         # float64
+    is_call: np.ndarray        # bool
+    option_ticker: np.ndarray  # object
+    values: dict[str, np.ndarray]  # _FLOAT_FIELDS -> float64, NaN = unknown
+    greeks_computed: np.ndarray    # bool, greeks filled in locally
+    summary: list[dict[str, Any]]  # per-expiration aggregates
+    _selections: OrderedDict[tuple[Any, ...], np.ndarray] = field(
+        default_factory=OrderedDict, repr=False,
+    )
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def from_payload(
+        cls,
+        data: dict[str, Any],
+        *,
+        fetched_at: str = "",
+        rate: float = _DEFAULT_RATE,
+        now: datetime | None = None,
+    ) -> OptionChain:
+        """Build from a cached ``MassiveClient.get_options_chain`` payload."""
+        contracts = [c for c in data.get("chain") or [] if isinstance(c, dict)]
+        underlying = data.get("underlying_price")
+
+        def _col(key: str) -> np.ndarray:
+            return np.array(
+                [c.get(key) if c.get(key) is not None else np.nan for c in contracts],
+                dtype=np.float64,
+            )
+
+        exp_str = [str(c.get("expiration") or "") for c in contracts]
+        expirations = sorted(set(exp_str))
+        exp_index = {exp: i for i, exp in enumerate(expirations)}
+        exp_code = np.array([exp_index[exp] for exp in exp_str], dtype=np.int64)
+        strike = _col("strike")
+        is_call = np.array([c.get("contract_type") == "call" for c in contracts], dtype=bool)
+        order = np.lexsort((~is_call, strike, exp_code))
+
+        exp_code = exp_code[order]
+        strike = strike[order]
+        is_call = is_call[order]
+        tickers = np.array([c.get("option_ticker") for c in contracts], dtype=object)[order]
+        values = {key: _col(key)[order] for key in _FLOAT_FIELDS}
+        computed = _fill_greeks(
+            values, strike, is_call, exp_code,
+            years_to_expiry(expirations, now), underlying, rate,
+        )
+        offsets = np.searchsorted(exp_code, np.arange(len(expirations) + 1)).astype(np.int64)
+
+        for arr in (exp_code, strike, is_call, tickers, computed, offsets, *values.values()):
+            arr.flags.writeable = False
+        return cls(
+            symbol=str(data.get("underlying_symbol") or ""),
+            underlying_price=underlying,
+            fetched_at=fetched_at,
+            expirations=expirations,
+            offsets=offsets,
+            expiration=exp_code,
+            strike=strike,
+            is_call=is_call,
+            option_ticker=tickers,
+            values=values,
+            greeks_computed=computed,
+            summary=_summarize(expirations, offsets, values, is_call),
+        )
+
+    # -- queries ------------------------------------------------------------
+
+    def select(
+        self,
+        *,
+        expiration_gte: str | None = None,
+        expiration_lte: str | None = None,
+        strike_gte: float | None = None,
+        strike_lte: float | None = None,
+        contract_type: str | None = None,
+    ) -> np.ndarray:
+        """Row indices matching the filters, in chain order (memoized)."""
+        key = (expiration_gte, expiration_lte, strike_gte, strike_lte, contract_type)
+        hit = self._selections.get(key)
+        if hit is not None:
+            self._selections.move_to_end(key)
+            return hit
+
+        lo = 0 if expiration_gte is None else bisect_left(self.expirations, expiration_gte)
+        hi = (
+            len(self.expirations) if expiration_lte is None
+            else bisect_right(self.expirations, expiration_lte)
+        )
+        start, stop = int(self.offsets[lo]), int(self.offsets[max(hi, lo)])
+        rows = np.arange(start, stop)
+        if strike_gte is not None or strike_lte is not None or contract_type is not None:
+            mask = np.ones(stop - start, dtype=bool)
+            if strike_gte is not None:
+                mask &= self.strike[start:stop] >= strike_gte
+            if strike_lte is not None:
+                mask &= self.strike[start:stop] <= strike_lte
+            if contract_type is not None:
+                mask &= self.is_call[start:stop] == (contract_type == "call")
+            rows = rows[mask]
+
+        rows.flags.writeable = False
+        self._selections[key] = rows
+        while len(self._selections) > _MAX_SELECTIONS:
+            self._selections.popitem(last=False)
+        return rows
+
+    def records(self, rows: np.ndarray) -> list[dict[str, Any]]:
+        """Contract dicts (``OptionContractModel`` fields) for *rows*."""
+        cols = {
+            key: [
+                None if v != v else (int(v) if key in _INT_FIELDS else v)
+                for v in arr[rows].tolist()
+            ]
+            for key, arr in self.values.items()
+        }
+        exps = [self.expirations[i] for i in self.expiration[rows].tolist()]
+        strikes = self.strike[rows].tolist()
+        calls = self.is_call[rows].tolist()
+        tickers = self.option_ticker[rows].tolist()
+        computed = self.greeks_computed[rows].tolist()
+        return [
+            {
+                "strike": strikes[i],
+                "expiration": exps[i],
+                "contract_type": "call" if calls[i] else "put",
+                **{key: cols[key][i] for key in _FLOAT_FIELDS},
+                "option_ticker": tickers[i],
+                "greeks_computed": computed[i],
+            }
+            for i in range(len(strikes))
+        ]
+
+    def expiration_counts(self) -> list[tuple[str, int]]:
+        """``(expiration, contract count)`` pairs in date order."""
+        return list(zip(self.expirations, np.diff(self.offsets).tolist()))
+
+
+def _fill_greeks(
+    values: dict[str, np.ndarray],
+    strike: np.ndarray,
+    is_call: np.ndarray,
+    exp_code: np.ndarray,
+    expiry_years: np.ndarray,
+    underlying: float | None,
+    rate: float,
+) -> np.ndarray:
+    """Fill missing IV / greeks in *values* in place; return the rows filled."""
+    missing = np.zeros(len(strike), dtype=bool)
+    for key in _GREEK_FIELDS:
+        missing |= np.isnan(values[key])
+    if underlying is None or not underlying > 0 or not missing.any():
+        return np.zeros(len(strike), dtype=bool)
+
+    rows = np.flatnonzero(missing)
+    k = strike[rows]
+    t = expiry_years[exp_code[rows]]
+    calls = is_call[rows]
+    s = np.full(len(rows), float(underlying))
+
+    bid, ask, last = values["bid"][rows], values["ask"][rows], values["last_price"][rows]
+    quoted = ~np.isnan(bid) & ~np.isnan(ask) & (ask > 0) & (ask >= bid)
+    price = np.where(quoted, 0.5 * (bid + ask), np.where(last > 0, last, np.nan))
+
+    sigma = values["implied_volatility"][rows]
+    live = (t > 0) & (k > 0)
+    solve = np.isnan(sigma) & live & ~np.isnan(price)
+    if solve.any():
+        sigma = sigma.copy()
+        sigma[solve] = implied_vol(price[solve], s[solve], k[solve], t[solve], rate, calls[solve])
+    ok = live & ~np.isnan(sigma) & (sigma > 0)
+    if not ok.any():
+        return np.zeros(len(strike), dtype=bool)
+
+    greeks = bs_greeks(s[ok], k[ok], t[ok], sigma[ok], rate, calls[ok])
+    greeks["implied_volatility"] = sigma[ok]
+    target = rows[ok]
+    for key, computed in greeks.items():
+        col = values[key]
+        col[target] = np.where(np.isnan(col[target]), computed, col[target])
+
+    filled = np.zeros(len(strike), dtype=bool)
+    filled[target] = True
+    return filled
+
+
+def _summarize(
+    expirations: list[str],
+    offsets: np.ndarray,
+    values: dict[str, np.ndarray],
+    is_call: np.ndarray,
+) -> list[dict[str, Any]]:
+    """Per-expiration aggregates in the shape of ``GreeksExpirationItem``."""
+    if not expirations:
+        return []
+    starts = offsets[:-1]
+    iv = values["implied_volatility"]
+    oi = values["open_interest"]
+    known_iv = ~np.isnan(iv)
+    iv_sum = np.add.reduceat(np.where(known_iv, iv, 0.0), starts)
+    iv_n = np.add.reduceat(known_iv.astype(np.int64), starts)
+    oi_sum = np.add.reduceat(np.where(np.isnan(oi), 0.0, oi), starts)
+    calls = np.add.reduceat(is_call.astype(np.int64), starts)
+    counts = np.diff(offsets)
+    puts = counts - calls
+    return [
+        {
+            "expiration": exp,
+            "avg_iv": float(iv_sum[i] / iv_n[i]) if iv_n[i] else None,
+            "put_call_ratio": float(puts[i] / calls[i]) if calls[i] else None,
+            "total_open_interest": int(oi_sum[i]) if oi_sum[i] > 0 else None,
+            "contract_count": int(counts[i]),
+        }
+        for i, exp in enumerate(expirations)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Snapshot memo
+# ---------------------------------------------------------------------------
+
+_chains: OrderedDict[str, OptionChain] = OrderedDict()
+
+
+def _risk_free_rate() -> float:
+    from app.config import get_settings
+    value = getattr(get_settings(), "options_risk_free_rate", _DEFAULT_RATE)
+    return float(value) if isinstance(value, (int, float)) else _DEFAULT_RATE
+
+
+def chain_for(result: CachedResult) -> OptionChain:
+    """The :class:`OptionChain` of a cached snapshot, built once per ``fetched_at``."""
+    chain = _chains.get(result.cache_key)
+    if chain is not None and chain.fetched_at == result.fetched_at:
+        _chains.move_to_end(result.cache_key)
+        return chain
+    chain = OptionChain.from_payload(
+        result.data, fetched_at=result.fetched_at, rate=_risk_free_rate(),
+    )
+    logger.debug(
+        "Built option chain %s: %d contracts, %d with local greeks",
+        result.cache_key, len(chain), int(chain.greeks_computed.sum()),
+    )
+    _chains[result.cache_key] = chain
+    _chains.move_to_end(result.cache_key)
+    while len(_chains) > _MAX_CHAINS:
+        _chains.popitem(last=False)
+    return chain
+
+
+def reset_option_chains() -> None:
+    """Forget memoized chains.  For tests."""
+    _chains.clear()
@@ -0,0 +1,273 @@
+"""Shared upstream rate-limit scheduler for Market Terminal data clients.
+
+Every provider (Finnhub, EDGAR, FRED, Massive, ForexFactory) draws from one
+:class:`RateLimiter` obtained via :func:`get_rate_limiter`.  Features:
+
+* Token bucket sized to the provider's published window budget: each of
+  ``calls`` tokens returns ``period`` seconds after it was spent, so no
+  window of ``period`` seconds ever carries more than ``calls`` requests
+  and the provider's 429 path is never reached
+* Lock-free fast path -- a caller only queues when the bucket is empty
+* Priority classes (:class:`Priority`): queued interactive requests are
+  granted before background refreshes, which go before pre-warm work, and
+  a tenth of each budget is held back for interactive requests only so a
+  background burst cannot drain the bucket ahead of the UI
+* Queue-depth and wait-time metrics per provider
+
+Priority is taken from the :func:`request_priority` context so background
+call sites do not have to thread it through every client method; the
+default is :attr:`Priority.INTERACTIVE`.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import enum
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(enum.IntEnum):
+    """Scheduling class of an upstream request (lower is served first)."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    PREWARM = 2
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "rate_limit_priority", default=Priority.INTERACTIVE,
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed block (and tasks it creates) at *priority*."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Return the priority of the current context."""
+    return _priority.get()
+
+
+# ---------------------------------------------------------------------------
+# RateLimiter
+# ---------------------------------------------------------------------------
+class RateLimiter:
+    """Priority-aware token bucket for a single upstream provider."""
+
+    def __init__(self, name: str, calls: int, period: float) -> None:
+        self.name = name
+        self.calls = max(1, int(calls))
+        self.period = float(period)
+        self.reserve = self.calls // 10
+        self._spent: deque[float] = deque()
+        self._waiters: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_loop: asyncio.AbstractEventLoop | None = None
+        # Metrics
+        self._granted = {p: 0 for p in Priority}
+        self._queued = {p: 0 for p in Priority}
+        self._wait_total = {p: 0.0 for p in Priority}
+        self._wait_max = 0.0
+        self._max_queue_depth = 0
+        self._rejected = 0
+
+    # -- token accounting ---------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        cutoff = now - self.period
+        while self._spent and self._spent[0] <= cutoff:
+            self._spent.popleft()
+
+    def _limit(self, priority: Priority) -> int:
+        """Tokens *priority* may have outstanding (the reserve is interactive-only)."""
+        return self.calls if priority == Priority.INTERACTIVE else self.calls - self.reserve
+
+    @property
+    def available(self) -> int:
+        """Tokens that can be spent right now."""
+        self._refill(time.monotonic())
+        return max(0, self.calls - len(self._spent))
+
+    def available_for(self, priority: Priority | None = None) -> int:
+        """Tokens a caller at *priority* (default: current context) may spend now."""
+        if priority is None:
+            priority = current_priority()
+        self._refill(time.monotonic())
+        return max(0, self._limit(priority) - len(self._spent))
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers currently waiting for a token."""
+        return sum(1 for *_, fut in self._waiters if not fut.done())
+
+    def next_token_in(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """Seconds until *priority* can spend a token (0 when it can now)."""
+        now = time.monotonic()
+        self._refill(now)
+        excess = len(self._spent) - self._limit(priority)
+        if excess < 0:
+            return 0.0
+        return max(0.0, self._spent[excess] + self.period - now)
+
+    # -- acquisition --------------------------------------------------------
+
+    def try_acquire(self) -> bool:
+        """Spend a token without waiting.  Never jumps ahead of the queue."""
+        priority = current_priority()
+        now = time.monotonic()
+        self._refill(now)
+        if self._waiters or len(self._spent) >= self._limit(priority):
+            self._rejected += 1
+            return False
+        self._spent.append(now)
+        self._granted[priority] += 1
+        return True
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait for a token.  *priority* defaults to the current context's."""
+        if priority is None:
+            priority = current_priority()
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and len(self._spent) < self._limit(priority):
+            self._spent.append(now)
+            self._granted[priority] += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), now, future))
+        self._queued[priority] += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        self._schedule(loop)
+        logger.debug(
+            "%s rate limit: queued %s request (depth %d)",
+            self.name, priority.name.lower(), self.queue_depth,
+        )
+        await future
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """(Re-)arm the timer for when the head of the queue can take a token."""
+        if self._timer is not None:
+            self._timer.cancel()
+        head = Priority(self._waiters[0][0])
+        self._timer_loop = loop
+        self._timer = loop.call_later(self.next_token_in(head), self._drain)
+
+    def _drain(self) -> None:
+        """Hand returned tokens to waiters in (priority, arrival) order."""
+        self._timer = None
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            prio, _, queued_at, future = self._waiters[0]
+            if future.done():  # cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if len(self._spent) >= self._limit(Priority(prio)):
+                break
+            heapq.heappop(self._waiters)
+            self._spent.append(now)
+            waited = now - queued_at
+            self._granted[Priority(prio)] += 1
+            self._wait_total[Priority(prio)] += waited
+            self._wait_max = max(self._wait_max, waited)
+            future.set_result(None)
+        if self._waiters and self._timer_loop is not None:
+            self._schedule(self._timer_loop)
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return budget, queue and wait-time counters."""
+        queued = sum(self._queued.values())
+        wait_total = sum(self._wait_total.values())
+        return {
+            "calls": self.calls,
+            "period_seconds": self.period,
+            "interactive_reserve": self.reserve,
+            "available": self.available,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "granted": {p.name.lower(): n for p, n in self._granted.items()},
+            "queued": {p.name.lower(): n for p, n in self._queued.items()},
+            "rejected": self._rejected,
+            "avg_wait_ms": round(wait_total / queued * 1000, 1) if queued else 0.0,
+            "avg_wait_ms_by_priority": {
+                p.name.lower(): round(self._wait_total[p] / self._queued[p] * 1000, 1)
+                if self._queued[p] else 0.0
+                for p in Priority
+            },
+            "max_wait_ms": round(self._wait_max * 1000, 1),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Provider budgets (from Settings) and registry
+# ---------------------------------------------------------------------------
+# provider -> (Settings field, window seconds, default calls per window)
+_BUDGETS: dict[str, tuple[str, float, int]] = {
+    "finnhub":       ("rate_limit_finnhub_per_minute", 60.0, 60),
+    "fred":          ("rate_limit_fred_per_minute", 60.0, 120),
+    "edgar":         ("rate_limit_edgar_per_second", 1.0, 10),
+    "massive":       ("rate_limit_massive_per_minute", 60.0, 5),
+    "forex_factory": ("rate_limit_forex_factory_per_5min", 300.0, 2),
+}
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+def _budget(provider: str, default_calls: int | None) -> tuple[int, float]:
+    """Return ``(calls, period)`` for *provider*; a Settings value <= 0 means default."""
+    field, period, default = _BUDGETS[provider]
+    if default_calls is not None:
+        default = default_calls
+    from app.config import get_settings
+    value = getattr(get_settings(), field, 0)
+    calls = value if isinstance(value, int) and value > 0 else default
+    return calls, period
+
+
+def get_rate_limiter(provider: str, default_calls: int | None = None) -> RateLimiter:
+    """Return the shared limiter for *provider*, creating it on first use.
+
+    *default_calls* overrides the built-in budget when Settings leaves it
+    unset (e.g. Massive, whose limit depends on the subscription tier).
+    """
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        calls, period = _budget(provider, default_calls)
+        limiter = RateLimiter(provider, calls, period)
+        _limiters[provider] = limiter
+        logger.info("Rate limiter %s: %d calls / %.0fs", provider, calls, period)
+    return limiter
+
+
+def provider_wait(provider: str, priority: Priority = Priority.BACKGROUND) -> float:
+    """Seconds until *priority* may call *provider* (0 if it has no limiter yet)."""
+    limiter = _limiters.get(provider)
+    return limiter.next_token_in(priority) if limiter is not None else 0.0
+
+
+def get_rate_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Return :meth:`RateLimiter.get_stats` for every limiter in use."""
+    return {name: limiter.get_stats() for name, limiter in _limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiters (budgets are re-read on next use).  For tests."""
+    _limiters.clear()
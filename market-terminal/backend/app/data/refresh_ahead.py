@@ -0,0 +1,447 @@
+"""Refresh-ahead scheduler for hot cache keys.
+
+Stale-while-revalidate only refreshes a key after a reader has already been
+served stale data.  :class:`RefreshScheduler` instead tracks the expiry of
+*hot* keys -- watchlist quotes (pinned) and keys read within
+``refresh_ahead_hot_minutes`` -- and refreshes each one shortly before its
+TTL runs out.  Features:
+
+* One entry per cache key in a due-time heap, so repeated reads and stale
+  hits of a key never queue duplicate refreshes
+* Refreshes start ``refresh_ahead_lead_pct`` percent of the TTL (at least
+  :data:`_MIN_LEAD_S`) before expiry and run at
+  :attr:`~app.data.rate_limiter.Priority.BACKGROUND`, at most
+  ``refresh_ahead_concurrency`` at a time
+* Stale hits are queued due-now, ahead of routine refresh-ahead work
+* A key whose primary provider has no background budget left is deferred
+  until its limiter frees a token rather than parked on the limiter
+* Pinned quotes are kept fresh through market hours; outside them they
+  are parked until just before the next open unless someone reads them
+* Unpinned keys not read within the hot window are dropped when they come
+  due, and at ``refresh_ahead_max_keys`` the least recently read unpinned
+  key is evicted
+* Queue depth, lateness and drop counters via
+  :meth:`RefreshScheduler.get_stats`
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Iterable
+from zoneinfo import ZoneInfo
+
+from app.data.cache_types import FALLBACK_CHAINS
+from app.data.rate_limiter import Priority, provider_wait
+
+logger = logging.getLogger(__name__)
+
+_ET = ZoneInfo("America/New_York")
+_MIN_LEAD_S: float = 30.0
+_RETRY_S: float = 60.0
+
+# Scheduling rank (lower runs first among keys due at the same time)
+_STALE = 0
+_PINNED = 1
+_HOT = 2
+
+# Fallback-chain source -> rate limiter provider (sources without a
+# limiter, e.g. yfinance and cftc, are never deferred)
+_SOURCE_PROVIDER: dict[str, str] = {
+    "finnhub": "finnhub",
+    "edgar": "edgar",
+    "fred": "fred",
+    "massive": "massive",
+    "forex_calendar": "forex_factory",
+}
+
+# (data_type, symbol, period, fetch_kwargs, max_age) -> fetched_ts | None
+RefreshFn = Callable[
+    [str, str, str, dict[str, Any] | None, float], Awaitable[float | None],
+]
+
+
+def _is_market_open(ts: float) -> bool:
+    """Mon-Fri 9:30-16:00 ET (no holiday calendar)."""
+    now = datetime.fromtimestamp(ts, _ET)
+    if now.weekday() >= 5:
+        return False
+    return (9, 30) <= (now.hour, now.minute) < (16, 0)
+
+
+def _next_market_open(ts: float) -> float:
+    """Timestamp of the next 9:30 ET weekday open after *ts*."""
+    now = datetime.fromtimestamp(ts, _ET)
+    day = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if day <= now:
+        day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day.timestamp()
+
+
+@dataclass(slots=True)
+class _Entry:
+    data_type: str
+    symbol: str
+    period: str
+    fetch_kwargs: dict[str, Any] | None
+    ttl: float
+    expires_at: float = 0.0
+    last_read: float = 0.0
+    pinned: bool = False
+    due: float = 0.0
+    target: float = 0.0  # due time before any budget deferral
+    rank: int = _HOT
+    version: int = 0
+    running: bool = False
+
+
+class RefreshScheduler:
+    """Deduplicating, budget-aware refresh-ahead queue of cache keys."""
+
+    def __init__(
+        self,
+        refresh_fn: RefreshFn,
+        *,
+        lead_fraction: float = 0.1,
+        hot_window_s: float = 1800.0,
+        max_keys: int = 500,
+        concurrency: int = 4,
+    ) -> None:
+        self._refresh_fn = refresh_fn
+        self._lead_fraction = lead_fraction
+        self._hot_window = hot_window_s
+        self._max_keys = max_keys
+        self._concurrency = concurrency
+        self._entries: dict[str, _Entry] = {}
+        # (due, rank, seq, key, version); superseded items are skipped on pop
+        self._heap: list[tuple[float, int, int, str, int]] = []
+        self._seq = itertools.count()
+        self._running: set[asyncio.Task[None]] = set()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._refreshed = 0
+        self._failed = 0
+        self._deduplicated = 0
+        self._deferred = 0
+        self._missed_expiry = 0
+        self._dropped_cold = 0
+        self._dropped_evicted = 0
+        self._dropped_full = 0
+        self._parked = 0
+        self._lateness_total = 0.0
+        self._lateness_max = 0.0
+        self._dispatched = 0
+
+    # -- producers ----------------------------------------------------------
+
+    def touch(
+        self,
+        data_type: str,
+        symbol: str,
+        period: str,
+        *,
+        fetched_ts: float,
+        ttl: float,
+        fetch_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a read (or fresh fetch) of a key whose value was fetched at
+        *fetched_ts*, scheduling its refresh ahead of expiry."""
+        now = time.time()
+        entry = self._entry(data_type, symbol, period, fetch_kwargs, ttl)
+        if entry is None:
+            return
+        entry.last_read = now
+        entry.fetch_kwargs = fetch_kwargs
+        expires_at = fetched_ts + ttl
+        if entry.running or (entry.version and abs(entry.expires_at - expires_at) < 1.0):
+            return  # already scheduled for this value
+        entry.ttl = ttl
+        entry.expires_at = expires_at
+        self._schedule(entry, expires_at - self._lead(ttl), _PINNED if entry.pinned else _HOT)
+
+    def request_now(
+        self,
+        data_type: str,
+        symbol: str,
+        period: str,
+        *,
+        ttl: float,
+        fetch_kwargs: dict[str, Any] | None = None,
+    ) -> bool:
+        """Queue an immediate refresh of a key served stale.
+
+        Returns *False* only when the key could not be tracked; a refresh
+        already queued or in flight for the key counts as queued.
+        """
+        now = time.time()
+        entry = self._entry(data_type, symbol, period, fetch_kwargs, ttl)
+        if entry is None:
+            return False
+        entry.last_read = now
+        entry.fetch_kwargs = fetch_kwargs
+        if entry.running or (entry.rank == _STALE and entry.version):
+            self._deduplicated += 1
+            return True
+        self._schedule(entry, now, _STALE)
+        return True
+
+    def pin(self, symbols: Iterable[str], ttl: float) -> None:
+        """Keep the latest price quote of *symbols* fresh (watchlist)."""
+        for symbol in symbols:
+            key = self._key("price", symbol.upper(), "latest")
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry("price", symbol.upper(), "latest", None, ttl)
+                self._entries[key] = entry
+            if entry.pinned:
+                continue
+            entry.pinned = True
+            if not entry.running:
+                # Unknown expiry: the refresh returns early if the cached
+                # quote is still fresh and reschedules from its age.
+                due = entry.expires_at - self._lead(entry.ttl) if entry.version else 0.0
+                self._schedule(entry, due, _PINNED)
+
+    def unpin(self, symbols: Iterable[str]) -> None:
+        """Stop pinning *symbols*; they stay tracked while read."""
+        for symbol in symbols:
+            entry = self._entries.get(self._key("price", symbol.upper(), "latest"))
+            if entry is not None:
+                entry.pinned = False
+
+    # -- lifecycle ----------------------------------------------------------
+
+    async def stop(self) -> None:
+        """Cancel the dispatcher and in-flight refreshes."""
+        self._closed = True
+        tasks = [t for t in (self._task, *self._running) if t is not None and not t.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._running.clear()
+        self._entries.clear()
+        self._heap.clear()
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, refresh outcomes, lateness and drop counters."""
+        now = time.time()
+        return {
+            "tracked": len(self._entries),
+            "pinned": sum(1 for e in self._entries.values() if e.pinned),
+            "queue_depth": sum(
+                1 for e in self._entries.values()
+                if e.version and not e.running and e.due <= now
+            ),
+            "in_flight": len(self._running),
+            "refreshed": self._refreshed,
+            "failed": self._failed,
+            "deduplicated": self._deduplicated,
+            "deferred": self._deferred,
+            "parked": self._parked,
+            "missed_expiry": self._missed_expiry,
+            "dropped_cold": self._dropped_cold,
+            "dropped_evicted": self._dropped_evicted,
+            "dropped_full": self._dropped_full,
+            "avg_lateness_ms": round(
+                self._lateness_total / self._dispatched * 1000, 1,
+            ) if self._dispatched else 0.0,
+            "max_lateness_ms": round(self._lateness_max * 1000, 1),
+        }
+
+    # -- internals ----------------------------------------------------------
+
+    @staticmethod
+    def _key(data_type: str, symbol: str, period: str) -> str:
+        return f"{data_type}:{symbol}:{period}"
+
+    def _lead(self, ttl: float) -> float:
+        return min(max(ttl * self._lead_fraction, _MIN_LEAD_S), ttl / 2)
+
+    def _entry(
+        self,
+        data_type: str,
+        symbol: str,
+        period: str,
+        fetch_kwargs: dict[str, Any] | None,
+        ttl: float,
+    ) -> _Entry | None:
+        key = self._key(data_type, symbol, period)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        if len(self._entries) >= self._max_keys and not self._evict_one():
+            self._dropped_full += 1
+            return None
+        entry = _Entry(data_type, symbol, period, fetch_kwargs, ttl)
+        self._entries[key] = entry
+        return entry
+
+    def _evict_one(self) -> bool:
+        """Drop the least recently read unpinned idle key."""
+        victims = [
+            (e.last_read, k) for k, e in self._entries.items()
+            if not e.pinned and not e.running
+        ]
+        if not victims:
+            return False
+        del self._entries[min(victims)[1]]
+        self._dropped_evicted += 1
+        return True
+
+    def _schedule(self, entry: _Entry, due: float, rank: int, *, deferral: bool = False) -> None:
+        entry.version += 1
+        entry.due = due
+        entry.rank = rank
+        if not deferral:
+            entry.target = due
+        key = self._key(entry.data_type, entry.symbol, entry.period)
+        heapq.heappush(self._heap, (due, rank, next(self._seq), key, entry.version))
+        if len(self._heap) > 4 * len(self._entries) + 64:
+            self._compact()
+        self._ensure_running()
+        self._wake.set()
+
+    def _ensure_running(self) -> None:
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._wake.set()
+            self._task = loop.create_task(self._dispatch_loop())
+
+    def _compact(self) -> None:
+        """Rebuild the heap without superseded items."""
+        live = []
+        for item in self._heap:
+            entry = self._entries.get(item[3])
+            if entry is not None and entry.version == item[4]:
+                live.append(item)
+        heapq.heapify(live)
+        self._heap = live
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            self._wake.clear()
+            timeout = self._dispatch_due()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _dispatch_due(self) -> float | None:
+        """Start every due refresh a slot is free for.
+
+        Returns seconds until the next entry comes due, or *None* to wait
+        for a wake-up (empty queue or all slots busy).
+        """
+        now = time.time()
+        while self._heap and len(self._running) < self._concurrency:
+            due, rank, _, key, version = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version or entry.running:
+                heapq.heappop(self._heap)
+                continue
+            if due > now:
+                return due - now
+            heapq.heappop(self._heap)
+            if not self._keep(key, entry, now):
+                continue
+            wait = self._budget_wait(entry)
+            if wait > 0:
+                self._deferred += 1
+                self._schedule(entry, now + wait, rank, deferral=True)
+                continue
+            lateness = max(now - entry.target, 0.0)
+            self._dispatched += 1
+            self._lateness_total += lateness
+            self._lateness_max = max(self._lateness_max, lateness)
+            entry.running = True
+            task = asyncio.get_running_loop().create_task(self._refresh(entry))
+            self._running.add(task)
+            task.add_done_callback(self._on_done)
+        return None
+
+    def _keep(self, key: str, entry: _Entry, now: float) -> bool:
+        """Whether a due entry is still hot; parks or drops it otherwise."""
+        if entry.rank == _STALE or now - entry.last_read <= self._hot_window:
+            return True
+        if entry.pinned:
+            if _is_market_open(now + self._lead(entry.ttl)):
+                return True
+            self._parked += 1
+            self._schedule(entry, _next_market_open(now) - self._lead(entry.ttl), _PINNED)
+            return False
+        del self._entries[key]
+        self._dropped_cold += 1
+        return False
+
+    @staticmethod
+    def _budget_wait(entry: _Entry) -> float:
+        chain = FALLBACK_CHAINS.get(entry.data_type) or []
+        provider = _SOURCE_PROVIDER.get(chain[0]) if chain else None
+        return provider_wait(provider, Priority.BACKGROUND) if provider else 0.0
+
+    async def _refresh(self, entry: _Entry) -> None:
+        fetched_ts: float | None = None
+        try:
+            fetched_ts = await self._refresh_fn(
+                entry.data_type, entry.symbol, entry.period, entry.fetch_kwargs,
+                entry.ttl - self._lead(entry.ttl),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug(
+                "Refresh-ahead failed: %s:%s", entry.data_type, entry.symbol, exc_info=True,
+            )
+        finally:
+            entry.running = False
+        now = time.time()
+        key = self._key(entry.data_type, entry.symbol, entry.period)
+        if self._entries.get(key) is not entry:
+            return  # scheduler stopped meanwhile
+        rank = _PINNED if entry.pinned else _HOT
+        if fetched_ts is None:
+            self._failed += 1
+            self._schedule(entry, now + min(_RETRY_S, self._lead(entry.ttl)), rank)
+            return
+        self._refreshed += 1
+        if entry.rank != _STALE and entry.expires_at and now > entry.expires_at:
+            self._missed_expiry += 1
+        entry.expires_at = fetched_ts + entry.ttl
+        self._schedule(entry, entry.expires_at - self._lead(entry.ttl), rank)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._running.discard(task)
+        self._wake.set()
+
+
+def create_refresh_scheduler(refresh_fn: RefreshFn) -> RefreshScheduler:
+    """Build a scheduler for *refresh_fn* from Settings."""
+    from app.config import get_settings
+    s = get_settings()
+
+    def _setting(name: str, default: int) -> int:
+        value = getattr(s, name, 0)
+        return value if isinstance(value, int) and value > 0 else default
+
+    return RefreshScheduler(
+        refresh_fn,
+        lead_fraction=min(_setting("refresh_ahead_lead_pct", 10), 50) / 100.0,
+        hot_window_s=_setting("refresh_ahead_hot_minutes", 30) * 60.0,
+        max_keys=_setting("refresh_ahead_max_keys", 500),
+        concurrency=_setting("refresh_ahead_concurrency", 4),
+    )
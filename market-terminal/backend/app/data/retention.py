@@ -0,0 +1,277 @@
+"""Retention and compaction for the append-only cache tables.
+
+Several tables only ever grow: ``analysis_cache`` gains a row per
+composite run, ``options_cache`` a row per contract per snapshot, and the
+legacy ``hist_*`` price rows in ``fundamentals_cache`` (superseded by
+:mod:`app.data.bar_store`) are never read again once stale.  Every
+``retention_interval_minutes`` :class:`RetentionEngine` applies a
+:class:`RetentionPolicy` per table, then compacts the file:
+
+* Age cutoff -- rows older than ``max_age_days`` are deleted
+* Keep latest N -- only the newest ``keep_latest`` rows per
+  ``partition_by`` key survive
+* Options downsampling -- snapshots older than
+  ``retention_options_full_hours`` are thinned to the last one per
+  symbol per day
+* ``PRAGMA incremental_vacuum`` returns freed pages to the filesystem and
+  a bounded ``ANALYZE`` refreshes planner statistics
+
+Deletes run in batches of :data:`DELETE_BATCH` rows so the single writer
+connection is never held for long.  Each run's deleted row counts and
+reclaimed bytes are reported by :meth:`RetentionEngine.get_stats`.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DELETE_BATCH: int = 5_000
+# First run waits this long after startup so it never competes with warm-up.
+_STARTUP_DELAY_S: float = 120.0
+
+
+@dataclass(slots=True, frozen=True)
+class RetentionPolicy:
+    """How long rows of one table (optionally a filtered subset) are kept.
+
+    *time_column* may hold either ISO-8601 (``T``-separated, with offset)
+    or SQLite ``datetime('now')`` timestamps; both are normalised with
+    ``datetime()`` before comparison.
+    """
+
+    table: str
+    time_column: str
+    max_age_days: float | None = None
+    keep_latest: int | None = None
+    partition_by: tuple[str, ...] = ()
+    where: str = "1=1"
+
+
+def default_policies() -> list[RetentionPolicy]:
+    """Build the per-table policies from Settings."""
+    from app.config import get_settings
+    s = get_settings()
+    return [
+        RetentionPolicy(
+            "analysis_cache", "created_at",
+            max_age_days=s.retention_analysis_days,
+            keep_latest=s.retention_analysis_keep, partition_by=("ticker",),
+        ),
+        RetentionPolicy(
+            "fundamentals_cache", "fetched_at",
+            max_age_days=s.retention_history_days,
+            where="data_type = 'price' AND period LIKE 'hist\\_%' ESCAPE '\\'",
+        ),
+        RetentionPolicy(
+            "options_cache", "fetched_at", max_age_days=s.retention_options_days,
+        ),
+    ]
+
+
+def _cutoff(days: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+class RetentionEngine:
+    """Periodically prunes cache tables and compacts the database file."""
+
+    def __init__(
+        self,
+        interval_s: float,
+        policies: list[RetentionPolicy],
+        options_full_hours: float | None = None,
+    ) -> None:
+        self._interval_s = interval_s
+        self._policies = policies
+        self._options_full_hours = options_full_hours
+        self._task: asyncio.Task[None] | None = None
+        self._run_lock = asyncio.Lock()
+
+        self._runs = 0
+        self._failures = 0
+        self._total_rows = 0
+        self._total_bytes = 0
+        self._last_report: dict[str, Any] | None = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def start(self, initial_delay_s: float = _STARTUP_DELAY_S) -> None:
+        """Start the background loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._loop(initial_delay_s),
+            )
+
+    async def stop(self) -> None:
+        """Cancel the background loop, waiting for a run in progress to abort."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, initial_delay_s: float) -> None:
+        await asyncio.sleep(initial_delay_s)
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failures += 1
+                logger.warning("Retention run failed", exc_info=True)
+            await asyncio.sleep(self._interval_s)
+
+    # -- one pass -----------------------------------------------------------
+
+    async def run_once(self) -> dict[str, Any]:
+        """Apply every policy, reclaim free pages and ANALYZE.  Returns the report."""
+        async with self._run_lock:
+            from app.data.database import get_database
+            db = await get_database()
+            started = time.perf_counter()
+            before = await db.page_stats()
+
+            tables = await self._existing_tables(db)
+            deleted: dict[str, int] = {}
+            for policy in self._policies:
+                if policy.table in tables:
+                    n = await self._apply(db, policy)
+                    deleted[policy.table] = deleted.get(policy.table, 0) + n
+            if self._options_full_hours is not None and "options_cache" in tables:
+                n = await self._downsample_options(db, self._options_full_hours)
+                deleted["options_cache"] = deleted.get("options_cache", 0) + n
+
+            await db.reclaim_space()
+            await db.analyze()
+            after = await db.page_stats()
+
+            page_size = after["page_size"] or before["page_size"]
+            reclaimed = max(before["page_count"] - after["page_count"], 0) * page_size
+            rows = sum(deleted.values())
+            report = {
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "rows_deleted": deleted,
+                "bytes_before": before["page_count"] * before["page_size"],
+                "bytes_after": after["page_count"] * page_size,
+                "bytes_reclaimed": reclaimed,
+            }
+            self._runs += 1
+            self._total_rows += rows
+            self._total_bytes += reclaimed
+            self._last_report = report
+            logger.info(
+                "Retention: deleted %d rows, reclaimed %d bytes in %.0f ms",
+                rows, reclaimed, report["elapsed_ms"],
+            )
+            return report
+
+    @staticmethod
+    async def _existing_tables(db: Any) -> set[str]:
+        rows = await db.fetch_all("SELECT name FROM sqlite_master WHERE type = 'table'")
+        return {r["name"] for r in rows}
+
+    async def _apply(self, db: Any, policy: RetentionPolicy) -> int:
+        deleted = 0
+        if policy.max_age_days is not None and policy.max_age_days > 0:
+            deleted += await _delete_batched(
+                db, policy.table,
+                f"SELECT rowid FROM {policy.table} WHERE ({policy.where}) "
+                f"AND datetime({policy.time_column}) < datetime(?)",
+                (_cutoff(policy.max_age_days),),
+            )
+        if policy.keep_latest is not None and policy.keep_latest > 0:
+            partition = ", ".join(policy.partition_by) or "NULL"
+            deleted += await _delete_batched(
+                db, policy.table,
+                "SELECT rid FROM ("
+                f"SELECT rowid AS rid, ROW_NUMBER() OVER (PARTITION BY {partition} "
+                f"ORDER BY datetime({policy.time_column}) DESC) AS rn "
+                f"FROM {policy.table} WHERE ({policy.where})"
+                ") WHERE rn > ?",
+                (policy.keep_latest,),
+            )
+        return deleted
+
+    @staticmethod
+    async def _downsample_options(db: Any, full_hours: float) -> int:
+        """Keep only the last ``options_cache`` snapshot per symbol per day
+        for snapshots older than *full_hours*."""
+        return await _delete_batched(
+            db, "options_cache",
+            "SELECT id FROM ("
+            "SELECT id, datetime(fetched_at) AS ts, MAX(datetime(fetched_at)) OVER "
+            "(PARTITION BY symbol, date(fetched_at)) AS last_ts "
+            "FROM options_cache WHERE datetime(fetched_at) < datetime(?)"
+            ") WHERE ts < last_ts",
+            (_cutoff(full_hours / 24.0),),
+        )
+
+    # -- statistics ---------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return run counters, totals and the last run's report."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_s": self._interval_s,
+            "runs": self._runs,
+            "failures": self._failures,
+            "total_rows_deleted": self._total_rows,
+            "total_bytes_reclaimed": self._total_bytes,
+            "last_run": self._last_report,
+        }
+
+
+async def _delete_batched(
+    db: Any, table: str, select_sql: str, params: tuple[Any, ...],
+) -> int:
+    """Delete the rows whose rowid *select_sql* yields, DELETE_BATCH at a time."""
+    total = 0
+    while True:
+        cursor = await db.execute(
+            f"DELETE FROM {table} WHERE rowid IN "
+            f"(SELECT * FROM ({select_sql}) LIMIT {DELETE_BATCH})",
+            params,
+        )
+        n = cursor.rowcount if cursor.rowcount is not None else 0
+        total += max(n, 0)
+        if n < DELETE_BATCH:
+            return total
+        await asyncio.sleep(0)
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+_engine: RetentionEngine | None = None
+
+
+def get_retention_engine() -> RetentionEngine:
+    """Return the process-wide retention engine (not started)."""
+    global _engine
+    if _engine is None:
+        from app.config import get_settings
+        s = get_settings()
+        _engine = RetentionEngine(
+            interval_s=max(s.retention_interval_minutes, 1) * 60.0,
+            policies=default_policies(),
+            options_full_hours=s.retention_options_full_hours,
+        )
+    return _engine
+
+
+async def close_retention_engine() -> None:
+    """Stop and drop the singleton (FastAPI shutdown)."""
+    global _engine
+    if _engine is not None:
+        await _engine.stop()
+        _engine = None
@@ -112,6 +112,11 @@ CREATE TABLE IF NOT EXISTS macro_events (
 -- --------------------------------------------------------------------------
 -- 7. Macro reactions — historical asset price reactions to macro events
 -- --------------------------------------------------------------------------
+-- Written by app/data/macro_reactions.py.  event_name is the event type slug
+-- (``cpi``, ``nfp``, ...); reaction_1d / reaction_5d are percent returns.
+-- Files created before the detail columns existed get them from migration v2.
+-- A macro_reaction_stats row marks a (event type, symbol) pair as computed
+-- and holds its averages over the default reaction window.
 CREATE TABLE IF NOT EXISTS macro_reactions (
     id                  INTEGER PRIMARY KEY AUTOINCREMENT,
     event_name          TEXT NOT NULL,
@@ -121,9 +126,29 @@ CREATE TABLE IF NOT EXISTS macro_reactions (
     reaction_5d         REAL,
     surprise_direction  TEXT,
     calculated_at       TEXT NOT NULL DEFAULT (datetime('now')),
+    event_value         REAL,
+    expected_value      REAL,
+    price_before        REAL,
+    price_after_1d      REAL,
+    price_after_5d      REAL,
+    volume_ratio        REAL,
     UNIQUE(event_name, event_date, symbol)
 );
 
+CREATE TABLE IF NOT EXISTS macro_reaction_stats (
+    event_name             TEXT NOT NULL,
+    symbol                 TEXT NOT NULL,
+    fred_indicator         TEXT NOT NULL,
+    latest_event_date      TEXT,
+    avg_return_1d_on_beat  REAL,
+    avg_return_1d_on_miss  REAL,
+    avg_return_5d_on_beat  REAL,
+    avg_return_5d_on_miss  REAL,
+    avg_volume_ratio       REAL,
+    calculated_at          TEXT NOT NULL,
+    PRIMARY KEY (event_name, symbol)
+);
+
 -- --------------------------------------------------------------------------
 -- 8. Ownership cache — 13F institutional holdings
 -- --------------------------------------------------------------------------
@@ -210,6 +235,97 @@ CREATE TABLE IF NOT EXISTS options_cache (
     UNIQUE(symbol, option_ticker, fetched_at)
 );
 
+-- --------------------------------------------------------------------------
+-- 12. Price bars — one shared OHLCV series per (symbol, interval)
+-- --------------------------------------------------------------------------
+-- Served by app/data/bar_store.py; every history period slices the same
+-- series.  ts is the source ISO timestamp (YYYY-MM-DD for daily+ bars).
+CREATE TABLE IF NOT EXISTS price_bars (
+    symbol      TEXT NOT NULL,
+    interval    TEXT NOT NULL,
+    ts          TEXT NOT NULL,
+    open        REAL NOT NULL,
+    high        REAL NOT NULL,
+    low         REAL NOT NULL,
+    close       REAL NOT NULL,
+    volume      REAL,
+    PRIMARY KEY (symbol, interval, ts)
+) WITHOUT ROWID;
+
+-- covered_from: series is complete from this date on (NULL = full history)
+CREATE TABLE IF NOT EXISTS price_bar_series (
+    symbol       TEXT NOT NULL,
+    interval     TEXT NOT NULL,
+    covered_from TEXT,
+    source       TEXT NOT NULL DEFAULT 'yfinance',
+    fetched_at   TEXT NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+
+-- --------------------------------------------------------------------------
+-- 13. Analysis state — incremental analyzer intermediates
+-- --------------------------------------------------------------------------
+-- Written by app/analysis/state_store.py; state_json is stamped with the
+-- last bar it covers and rebuilt whenever that bar no longer matches.
+CREATE TABLE IF NOT EXISTS analysis_state (
+    symbol       TEXT NOT NULL,
+    methodology  TEXT NOT NULL,
+    timeframe    TEXT NOT NULL,
+    state_json   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL,
+    PRIMARY KEY (symbol, methodology, timeframe)
+);
+
+-- --------------------------------------------------------------------------
+-- 14. 13F information tables — each filing parsed once
+-- --------------------------------------------------------------------------
+-- Written by app/data/edgar_ownership_helpers.py.  A thirteenf_filings row
+-- marks an accession as parsed; its positions (one per CUSIP) then answer
+-- holder lookups for every symbol in the filing without re-downloading it.
+CREATE TABLE IF NOT EXISTS thirteenf_filings (
+    accession_no   TEXT PRIMARY KEY,
+    cik            INTEGER NOT NULL,
+    holder_name    TEXT NOT NULL,
+    filing_date    TEXT NOT NULL,
+    report_period  TEXT NOT NULL DEFAULT '',
+    num_positions  INTEGER NOT NULL DEFAULT 0,
+    parsed_at      TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS thirteenf_positions (
+    accession_no   TEXT NOT NULL,
+    cusip          TEXT NOT NULL,
+    ticker         TEXT,
+    shares         INTEGER,
+    value_usd      REAL,
+    PRIMARY KEY (accession_no, cusip)
+);
+
+-- --------------------------------------------------------------------------
+-- 15. COT history archive — completed CFTC years, parsed once
+-- --------------------------------------------------------------------------
+-- Written by app/data/cot_archive.py.  A cot_archive_years row marks a
+-- completed calendar year as archived; its rows for every mapped market
+-- are never downloaded or parsed again.
+CREATE TABLE IF NOT EXISTS cot_archive_years (
+    year         INTEGER PRIMARY KEY,
+    num_rows     INTEGER NOT NULL DEFAULT 0,
+    archived_at  TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cot_history (
+    market_name       TEXT NOT NULL,
+    report_date       TEXT NOT NULL,
+    commercial_long   INTEGER,
+    commercial_short  INTEGER,
+    commercial_net    INTEGER,
+    speculative_long  INTEGER,
+    speculative_short INTEGER,
+    speculative_net   INTEGER,
+    open_interest     INTEGER,
+    PRIMARY KEY (market_name, report_date)
+) WITHOUT ROWID;
+
 -- ==========================================================================
 -- Indexes
 -- ==========================================================================
@@ -237,6 +353,9 @@ CREATE INDEX IF NOT EXISTS idx_macro_reactions_event
 CREATE INDEX IF NOT EXISTS idx_ownership_cache_symbol
     ON ownership_cache(symbol, report_period DESC);
 
+CREATE INDEX IF NOT EXISTS idx_thirteenf_positions_ticker
+    ON thirteenf_positions(ticker, accession_no);
+
 CREATE INDEX IF NOT EXISTS idx_insider_transactions_symbol
     ON insider_transactions(symbol, transaction_date DESC);
 
@@ -0,0 +1,263 @@
+"""Write-behind persistence queue for cache tables.
+
+Cache upserts (``fundamentals_cache``, ``ownership_cache``,
+``insider_transactions``, ``cot_data``, ``analysis_cache``) are data the
+caller already holds, so there is no reason for a request to wait on the
+SQLite commit that persists them.  Writers :meth:`~WriteBehindQueue.put`
+rows here instead and return immediately; a background task flushes the
+buffer every ``write_behind_flush_ms`` as one batch under a single commit
+(:meth:`DatabaseManager.execute_batch`).  Features:
+
+* Rows are keyed by the table's unique key, so repeated upserts of the
+  same row before a flush coalesce into the latest value
+* Reads stay consistent: readers call :meth:`~WriteBehindQueue.settle`
+  for a table before querying it, which waits for any queued or
+  in-flight rows of that table to land.  Hot readers instead serve
+  queued rows straight from the buffer (:meth:`~WriteBehindQueue.queued`)
+  and only wait for a batch already writing their key
+  (:meth:`~WriteBehindQueue.wait_inflight`)
+* Deletes call :meth:`~WriteBehindQueue.discard` and then
+  :meth:`~WriteBehindQueue.wait_inflight`, so neither a queued upsert nor
+  one in a running batch can resurrect a row deleted after it was queued
+* A full buffer (``write_behind_max_pending``) triggers an early flush
+* :func:`close_write_behind` flushes everything on shutdown
+
+Rows that fail to persist are logged and dropped -- these are cache rows
+and will be refetched.  Each statement group of a batch succeeds or fails
+on its own, and the stats count rows per group.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Sequence
+
+logger = logging.getLogger(__name__)
+
+_RowKey = tuple[str, tuple[Any, ...]]
+
+
+class WriteBehindQueue:
+    """Coalescing buffer of upserts flushed to SQLite in periodic batches."""
+
+    def __init__(self, flush_interval_s: float, max_pending: int) -> None:
+        self._interval = flush_interval_s
+        self._max_pending = max_pending
+        # (table, key) -> (sql, params); insertion order is flush order
+        self._pending: dict[_RowKey, tuple[str, tuple[Any, ...]]] = {}
+        self._inflight: dict[_RowKey, tuple[str, tuple[Any, ...]]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._kick: asyncio.Task[int] | None = None
+        self._closed = False
+
+        self._queued = 0
+        self._coalesced = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    # -- producers ----------------------------------------------------------
+
+    def put(
+        self, table: str, key: tuple[Any, ...], sql: str, params: tuple[Any, ...],
+    ) -> None:
+        """Queue one upsert of *table*'s row *key*, replacing any queued one."""
+        self.put_many(table, sql, [(key, params)])
+
+    def put_many(
+        self,
+        table: str,
+        sql: str,
+        rows: Sequence[tuple[tuple[Any, ...], tuple[Any, ...]]],
+    ) -> None:
+        """Queue ``(key, params)`` upserts of *table* sharing one statement."""
+        for key, params in rows:
+            row_key = (table, key)
+            if row_key in self._pending:
+                self._coalesced += 1
+            self._pending[row_key] = (sql, params)
+            self._queued += 1
+        self._ensure_running()
+        if len(self._pending) >= self._max_pending and (
+            self._kick is None or self._kick.done()
+        ):
+            self._kick = asyncio.get_running_loop().create_task(self.flush())
+
+    def discard(self, table: str, key_prefix: tuple[Any, ...] = ()) -> int:
+        """Drop queued rows of *table* whose key starts with *key_prefix*."""
+        n = len(key_prefix)
+        doomed = [
+            rk for rk in self._pending
+            if rk[0] == table and rk[1][:n] == key_prefix
+        ]
+        for rk in doomed:
+            del self._pending[rk]
+        return len(doomed)
+
+    # -- consumers ----------------------------------------------------------
+
+    def has_pending(self, table: str) -> bool:
+        """Whether *table* has queued or in-flight rows."""
+        return any(rk[0] == table for rk in (*self._inflight, *self._pending))
+
+    def queued(
+        self, table: str, key_prefix: tuple[Any, ...] = (),
+    ) -> list[tuple[Any, ...]]:
+        """Params of queued rows of *table* whose key starts with *key_prefix*.
+
+        These are newer than anything in SQLite for the same key.
+        """
+        n = len(key_prefix)
+        return [
+            params for (t, key), (_, params) in self._pending.items()
+            if t == table and key[:n] == key_prefix
+        ]
+
+    async def wait_inflight(
+        self, table: str, key_prefix: tuple[Any, ...] = (),
+    ) -> None:
+        """Wait for a running batch that writes a *table* row under *key_prefix*.
+
+        Rows still queued are left alone; this never starts a flush.
+        """
+        n = len(key_prefix)
+        if any(t == table and key[:n] == key_prefix for t, key in self._inflight):
+            # flush() holds the lock for the whole batch, commit included.
+            async with self._flush_lock:
+                pass
+
+    async def settle(self, table: str) -> None:
+        """Wait until every queued write to *table* is visible in SQLite."""
+        if self.has_pending(table):
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Persist everything queued so far in one batch.  Returns row count."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            tables = {rk[0] for rk in batch}
+            self._inflight = batch
+
+            groups: dict[str, list[tuple[Any, ...]]] = {}
+            for sql, params in batch.values():
+                groups.setdefault(sql, []).append(params)
+
+            items = list(groups.items())
+            started = time.perf_counter()
+            try:
+                from app.data.database import get_database
+                db = await get_database()
+                errors = await db.execute_batch(items)
+            except Exception:
+                self._dropped += len(batch)
+                logger.warning(
+                    "Write-behind flush of %d rows (%s) failed; dropped",
+                    len(batch), ", ".join(sorted(tables)), exc_info=True,
+                )
+            else:
+                # Only the groups that failed are lost; the rest committed.
+                dropped = 0
+                for (sql, rows), error in zip(items, errors or ()):
+                    if error is None:
+                        continue
+                    dropped += len(rows)
+                    logger.warning(
+                        "Write-behind group of %d rows failed; dropped: %s",
+                        len(rows), sql.split("(", 1)[0].strip(), exc_info=error,
+                    )
+                self._dropped += dropped
+                self._flushed += len(batch) - dropped
+            finally:
+                self._inflight = {}
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._flushes += 1
+                self._last_flush_ms = elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            return len(batch)
+
+    async def close(self) -> None:
+        """Stop the flush task and persist whatever is still queued."""
+        self._closed = True
+        for task in (self._task, self._kick):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._kick = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, throughput and flush-latency counters."""
+        return {
+            "pending": len(self._pending),
+            "queued": self._queued,
+            "coalesced": self._coalesced,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "last_flush_ms": round(self._last_flush_ms, 1),
+            "max_flush_ms": round(self._max_flush_ms, 1),
+        }
+
+    # -- internals ----------------------------------------------------------
+
+    def _ensure_running(self) -> None:
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self._interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+_queue: WriteBehindQueue | None = None
+
+
+def _setting(name: str, default: int) -> int:
+    """Positive int Settings value *name*, else *default*."""
+    from app.config import get_settings
+    value = getattr(get_settings(), name, 0)
+    return value if isinstance(value, int) and value > 0 else default
+
+
+def get_write_behind() -> WriteBehindQueue:
+    """Return the process-wide write-behind queue."""
+    global _queue
+    if _queue is None:
+        _queue = WriteBehindQueue(
+            flush_interval_s=_setting("write_behind_flush_ms", 250) / 1000.0,
+            max_pending=_setting("write_behind_max_pending", 1000),
+        )
+    return _queue
+
+
+async def close_write_behind() -> None:
+    """Flush and drop the singleton queue (FastAPI shutdown)."""
+    global _queue
+    if _queue is not None:
+        await _queue.close()
+        _queue = None
+
+
+def reset_write_behind() -> None:
+    """Drop the singleton without flushing.  For tests."""
+    global _queue
+    _queue = None
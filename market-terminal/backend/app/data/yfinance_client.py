@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import enum
 import logging
+import math
 import time
 from collections import deque
 from datetime import datetime, timezone
@@ -25,6 +26,110 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 
 _ASYNC_TIMEOUT = 10.0  # seconds for asyncio.wait_for wrapping yfinance calls
+_QUOTE_CHUNK_SIZE = 175  # tickers per yf.download() call in get_quotes_bulk
+
+_INTRADAY_INTERVALS = frozenset({"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"})
+
+# yf.download() column -> historical record key
+_PRICE_COLUMNS = (
+    ("Open", "open"), ("High", "high"), ("Low", "low"),
+    ("Close", "close"), ("Adj Close", "adjusted_close"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Column-wise DataFrame conversion
+# ---------------------------------------------------------------------------
+
+def _float_column(series: Any) -> list[float | None]:
+    """Coerce a column to floats in one pass; NaN and unparseable cells -> None."""
+    import numpy as np
+    import pandas as pd
+
+    arr = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+    out: list[float | None] = arr.tolist()
+    for i in np.flatnonzero(np.isnan(arr)).tolist():
+        out[i] = None
+    return out
+
+
+def _int_column(series: Any) -> list[int | None]:
+    """Coerce a column to ints (truncating floats); NaN/Inf -> None."""
+    import numpy as np
+    import pandas as pd
+
+    series = pd.to_numeric(series, errors="coerce")
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return series.astype(np.int64).tolist()
+    arr = series.to_numpy(dtype=np.float64)
+    missing = ~np.isfinite(arr)
+    out: list[int | None] = np.where(missing, 0, arr).astype(np.int64).tolist()
+    for i in np.flatnonzero(missing).tolist():
+        out[i] = None
+    return out
+
+
+def _date_strings(index: Any, intraday: bool) -> list[str]:
+    """Format a bar index: ISO timestamps intraday, ``YYYY-MM-DD`` otherwise."""
+    if intraday:
+        return [ts.isoformat() if hasattr(ts, "isoformat") else str(ts) for ts in index]
+    if hasattr(index, "strftime"):
+        return list(index.strftime("%Y-%m-%d"))
+    return [str(idx) for idx in index]
+
+
+def _history_columns(df: Any, interval: str = "1d") -> dict[str, list[Any]]:
+    """Convert a flattened ``yf.download()`` frame to per-field columns.
+
+    Returns ``{"date": [...], "open": [...], ..., "volume": [...]}`` with
+    ``None`` for missing cells.  Columns absent from *df* are all ``None``.
+    """
+    n = len(df)
+
+    def _field(col_name: str) -> Any:
+        col = df[col_name]
+        # Duplicate column labels (MultiIndex leakage) select a frame.
+        return col.iloc[:, 0] if getattr(col, "ndim", 1) > 1 else col
+
+    columns: dict[str, list[Any]] = {
+        "date": _date_strings(df.index, interval in _INTRADAY_INTERVALS),
+    }
+    for col_name, out_key in _PRICE_COLUMNS:
+        columns[out_key] = _float_column(_field(col_name)) if col_name in df.columns else [None] * n
+    columns["volume"] = _int_column(_field("Volume")) if "Volume" in df.columns else [None] * n
+    return columns
+
+
+def _columns_to_records(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Zip per-field columns (see :func:`_history_columns`) into row dicts."""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def statement_to_records(df: Any) -> list[dict[str, Any]]:
+    """Convert a yfinance financial statement to one record per period.
+
+    Statements have line items as the *index* and reporting dates as
+    *columns*.  Values are coerced to float column-wise; NaN -> None.
+    """
+    if df is None or (hasattr(df, "empty") and df.empty):
+        return []
+    import numpy as np
+    import pandas as pd
+
+    keys = [str(idx_name).lower().replace(" ", "_") for idx_name in df.index]
+    values = df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
+    records: list[dict[str, Any]] = []
+    for j, col in enumerate(df.columns):
+        period = col.strftime("%Y-%m-%d") if hasattr(col, "strftime") else str(col)
+        cells: list[float | None] = values[:, j].tolist()
+        for i in np.flatnonzero(missing[:, j]).tolist():
+            cells[i] = None
+        row_data: dict[str, Any] = {"period": period}
+        row_data.update(zip(keys, cells))
+        records.append(row_data)
+    return records
 
 
 class CircuitState(enum.Enum):
@@ -183,15 +288,16 @@ class YFinanceClient:
         return True
 
     @staticmethod
-    def _validate_historical(data: list[dict]) -> bool:
-        """Validate historical data is not empty or malformed."""
-        if not data:
+    def _validate_historical(columns: dict[str, list[Any]]) -> bool:
+        """Validate per-field history columns are not empty or malformed."""
+        import numpy as np
+
+        if not columns.get("date"):
             return False
-        for bar in data:
-            for field in ("open", "high", "low", "close"):
-                val = bar.get(field)
-                if val is not None and val < 0:
-                    return False
+        for field in ("open", "high", "low", "close"):
+            arr = np.array(columns[field], dtype=np.float64)  # None -> NaN
+            if (arr < 0).any():
+                return False
         return True
 
     # -- DataFrame helper ---------------------------------------------------
@@ -201,21 +307,9 @@ class YFinanceClient:
         """Convert a pandas DataFrame to a list of dicts, handling None/NaN.
 
         Financial DataFrames from yfinance have dates as *columns* and
-        line-items as *index*, so we iterate over columns to produce one
-        record per reporting period.
+        line-items as *index*; see :func:`statement_to_records`.
         """
-        if df is None or (hasattr(df, "empty") and df.empty):
-            return []
-        import pandas as pd
-        records: list[dict[str, Any]] = []
-        for col in df.columns:
-            period = col.strftime("%Y-%m-%d") if hasattr(col, "strftime") else str(col)
-            row_data: dict[str, Any] = {"period": period}
-            for idx_name, val in df[col].items():
-                key = str(idx_name).lower().replace(" ", "_")
-                row_data[key] = float(val) if pd.notna(val) else None
-            records.append(row_data)
-        return records
+        return statement_to_records(df)
 
     # -- public API: quotes -------------------------------------------------
 
@@ -263,6 +357,100 @@ class YFinanceClient:
         logger.info("yfinance: get_quote(%s) - success (%.0fms)", symbol, elapsed_ms)
         return self._add_metadata(result)
 
+    async def get_quotes_bulk(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Get quotes for many symbols from chunked ``yf.download()`` calls.
+
+        One request per ~175 symbols instead of one ``Ticker.info`` scrape
+        per symbol.  Quotes are built from the last two daily bars, so
+        ``market_cap`` is not included.  Symbols without a valid quote are
+        omitted from the result.
+        """
+        if not self._enabled or not symbols:
+            return {}
+        if not self._check_circuit():
+            return {}
+        start = time.monotonic()
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        logger.info("yfinance: get_quotes_bulk(%d symbols) - starting", len(symbols))
+        yf = self._yf
+        quotes: dict[str, dict[str, Any]] = {}
+
+        for i in range(0, len(symbols), _QUOTE_CHUNK_SIZE):
+            chunk = symbols[i:i + _QUOTE_CHUNK_SIZE]
+
+            def _sync(tickers: list[str] = chunk) -> Any:
+                return yf.download(
+                    tickers, period="5d", interval="1d", auto_adjust=True,
+                    progress=False, threads=False,
+                )
+
+            df = await self._run_sync(_sync)
+            if df is None or (hasattr(df, "empty") and df.empty):
+                logger.warning("yfinance: get_quotes_bulk chunk of %d - empty", len(chunk))
+                continue
+            quotes.update(self._quotes_from_download(df, chunk))
+
+        if quotes:
+            self._record_success()
+        elapsed_ms = (time.monotonic() - start) * 1000
+        logger.info(
+            "yfinance: get_quotes_bulk - %d / %d quotes (%.0fms)",
+            len(quotes), len(symbols), elapsed_ms,
+        )
+        return quotes
+
+    def _quotes_from_download(
+        self, df: Any, symbols: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Build quote dicts from a ``yf.download()`` frame of daily bars.
+
+        Multi-ticker downloads have ``(field, ticker)`` MultiIndex columns;
+        a flat frame is only attributable when *symbols* has one entry.
+        """
+        multi = getattr(df.columns, "nlevels", 1) > 1
+        if not multi and len(symbols) != 1:
+            return {}
+        now = datetime.now(timezone.utc).isoformat()
+        quotes: dict[str, dict[str, Any]] = {}
+        for sym in symbols:
+            try:
+                bars = df.xs(sym, axis=1, level=1) if multi else df
+                bars = bars.dropna(subset=["Close"])
+            except KeyError:
+                continue
+            if bars.empty:
+                continue
+            last = bars.iloc[-1]
+            price = float(last["Close"])
+            prev = float(bars["Close"].iloc[-2]) if len(bars) >= 2 else None
+            change = price - prev if prev else None
+            volume = last.get("Volume")
+            result: dict[str, Any] = {
+                "symbol": sym,
+                "current_price": price,
+                "change": change,
+                "percent_change": change / prev * 100 if change is not None else None,
+                "high": self._finite_or_none(last.get("High")),
+                "low": self._finite_or_none(last.get("Low")),
+                "open": self._finite_or_none(last.get("Open")),
+                "previous_close": prev,
+                "volume": int(volume) if self._finite_or_none(volume) is not None else None,
+                "market_cap": None,
+                "timestamp": now,
+            }
+            if self._validate_quote(result):
+                quotes[sym] = self._add_metadata(result)
+        return quotes
+
+    @staticmethod
+    def _finite_or_none(value: Any) -> float | None:
+        """Return *value* as a float, or None for missing/NaN/Inf."""
+        try:
+            f = float(value)
+        except (TypeError, ValueError):
+            return None
+        return f if math.isfinite(f) else None
+
     # -- public API: historical data ----------------------------------------
 
     async def get_historical(
@@ -296,58 +484,23 @@ class YFinanceClient:
         df = df.sort_index()
         df = df[~df.index.duplicated(keep="first")]
 
-        # Define intervals that are treated as intraday (require time component)
-        intraday_intervals = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
-        is_intraday = interval in intraday_intervals
-
-        records: list[dict[str, Any]] = []
-        for idx, row in df.iterrows():
-            if is_intraday:
-                date_str = idx.isoformat()
-            elif hasattr(idx, "strftime"):
-                date_str = idx.strftime("%Y-%m-%d")
-            else:
-                date_str = str(idx)
-            rec: dict[str, Any] = {"date": date_str}
-            for col_name, out_key in (
-                ("Open", "open"), ("High", "high"), ("Low", "low"),
-                ("Close", "close"), ("Adj Close", "adjusted_close"),
-            ):
-                val = row.get(col_name)
-                if val is not None and not isinstance(val, float):
-                    # Guard against Series (shouldn't happen after flatten, but be safe)
-                    try:
-                        val = float(val)
-                    except (TypeError, ValueError):
-                        val = None
-                rec[out_key] = float(val) if val is not None and pd.notna(val) else None
-            vol = row.get("Volume")
-            if vol is not None and not isinstance(vol, (int, float)):
-                try:
-                    vol = int(vol)
-                except (TypeError, ValueError):
-                    vol = None
-            rec["volume"] = int(vol) if vol is not None and pd.notna(vol) else None
-            records.append(rec)
+        # Convert column-wise (one numpy pass per field) rather than per row.
+        columns = _history_columns(df, interval)
 
         # Deduplicate by date string — sort_index+drop_duplicates above operates on
         # the full pandas Timestamp, so multiple intraday timestamps that share the same
         # strftime date (or isoformat string for intraday) can still produce duplicates
         # in extreme edge-cases (e.g. multi-ticker MultiIndex leakage, DST overlaps).
-        seen_dates: set[str] = set()
-        deduped: list[dict[str, Any]] = []
-        for rec in records:
-            if rec["date"] not in seen_dates:
-                seen_dates.add(rec["date"])
-                deduped.append(rec)
-        if len(deduped) < len(records):
+        duplicated = pd.Index(columns["date"]).duplicated(keep="first")
+        if duplicated.any():
             logger.warning(
                 "yfinance: get_historical(%s) - dropped %d duplicate date rows",
-                symbol, len(records) - len(deduped),
+                symbol, int(duplicated.sum()),
             )
-        records = deduped
+            keep = (~duplicated).nonzero()[0].tolist()
+            columns = {key: [vals[i] for i in keep] for key, vals in columns.items()}
 
-        if not self._validate_historical(records):
+        if not self._validate_historical(columns):
             logger.warning("yfinance: get_historical(%s) - validation failed", symbol)
             self._record_failure()
             return None
@@ -359,6 +512,7 @@ class YFinanceClient:
         # is conservative enough to block bad data without rejecting real ones.
         # Exception: very short requested periods ("1d", "5d") can legitimately
         # return <= 15 bars.
+        records = _columns_to_records(columns)
         short_period = period in ("1d", "5d")
         if not short_period and len(records) < 15:
             logger.warning(
@@ -98,6 +98,26 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     logging.getLogger().setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
 
+    # Background pruning / compaction of the append-only cache tables
+    if settings.retention_enabled:
+        from app.data.retention import get_retention_engine
+        get_retention_engine().start()
+
+    # Refresh watchlist quotes ahead of expiry
+    try:
+        from app.data.database import get_database
+        from app.data.cache import get_cache_manager
+        db = await get_database()
+        rows = await db.fetch_all("SELECT symbol FROM watchlist")
+        get_cache_manager().pin_symbols([r["symbol"] for r in rows])
+    except Exception:
+        logger.warning("Could not pin watchlist symbols for refresh-ahead", exc_info=True)
+
+    # Keep precomputed macro event reactions up to date
+    if settings.macro_reactions_enabled:
+        from app.data.macro_reactions import get_reaction_engine
+        get_reaction_engine().start()
+
     yield
 
     # -- shutdown --------------------------------------------------------
@@ -105,6 +125,9 @@ async def lifespan(app: FastAPI):
 
     # Close data clients and database
     close_fns = [
+        ("retention", "app.data.retention", "close_retention_engine"),
+        ("macro_reactions", "app.data.macro_reactions", "close_reaction_engine"),
+        ("analysis_executors", "app.api.routes.analysis", "close_analysis_executors"),
         ("cache_manager", "app.data.cache", "close_cache_manager"),
         ("finnhub_client", "app.data.finnhub_client", "close_finnhub_client"),
         ("yfinance_client", "app.data.yfinance_client", "close_yfinance_client"),
@@ -112,6 +135,7 @@ async def lifespan(app: FastAPI):
         ("ownership_client", "app.data.edgar_ownership", "close_ownership_client"),
         ("fred_client", "app.data.fred_client", "close_fred_client"),
         ("cot_client", "app.data.cot_client", "close_cot_client"),
+        ("write_behind", "app.data.write_behind", "close_write_behind"),
         ("database", "app.data.database", "close_database"),
     ]
     for label, mod_path, fn_name in close_fns:
@@ -234,14 +258,22 @@ for _router in (
 # ---------------------------------------------------------------------------
 @app.get("/api/health", tags=["health"])
 async def health_check() -> dict:
-    """Liveness probe with database, API key status, and uptime."""
+    """Liveness probe with database, API key status, rate limits, cache and uptime."""
     # Database status
     db_status = "unknown"
+    db_stats: dict = {}
     try:
         from app.data.database import get_database
         db = await get_database()
         row = await db.fetch_one("SELECT 1")
         db_status = "connected" if row is not None else "error"
+        from app.data.write_behind import get_write_behind
+        from app.data.retention import get_retention_engine
+        db_stats = {
+            **db.get_stats(),
+            "write_behind": get_write_behind().get_stats(),
+            "retention": get_retention_engine().get_stats(),
+        }
     except Exception:
         db_status = "error"
 
@@ -254,11 +286,17 @@ async def health_check() -> dict:
 
     uptime = time.time() - _startup_time if _startup_time > 0 else 0.0
 
+    from app.data.cache import get_cache_manager
+    from app.data.rate_limiter import get_rate_limiter_stats
+
     return {
         "status": "ok",
         "version": "1.0.0",
         "database": db_status,
+        "database_stats": db_stats,
         "api_keys": api_keys,
+        "rate_limits": get_rate_limiter_stats(),
+        "cache": get_cache_manager().get_stats(),
         "uptime_seconds": round(uptime, 1),
     }
 
@@ -0,0 +1,20 @@
+"""Session-wide fixtures for the backend test suite."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_database_singleton():
+    """Close the shared DatabaseManager once the session ends.
+
+    Routes exercised through the TestClient open the singleton; its pooled
+    aiosqlite connections run on non-daemon threads that would otherwise
+    keep the interpreter from exiting.
+    """
+    yield
+    from app.data.database import close_database
+
+    asyncio.run(close_database())
@@ -5,6 +5,7 @@ and factory functions for all backend integration test files.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -112,6 +113,10 @@ class MockDatabase:
     async def executemany(self, sql: str, params_seq: Any = ()) -> None:
         pass
 
+    async def execute_batch(self, groups: Any) -> None:
+        for sql, params_seq in groups:
+            self.executed.extend((sql, params) for params in params_seq)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -126,9 +131,13 @@ def _reset_singletons():
 
     from app.api.routes.websocket import ws_manager
     ws_manager._connections.clear()
+    ws_manager._channels.clear()
+
+    from app.data.write_behind import reset_write_behind
+    reset_write_behind()
 
-    import app.data.database as db_mod
-    db_mod._manager = None
+    from app.data.database import close_database
+    asyncio.run(close_database())
 
     import app.data.cache as cache_mod
     cache_mod._manager = None
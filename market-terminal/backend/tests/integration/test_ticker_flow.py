@@ -74,7 +74,7 @@ class TestTickerFlow:
             source="yfinance",
         )
         mock_cm.get_price = AsyncMock(return_value=price_result)
-        mock_cm.get_historical_prices = AsyncMock(return_value=hist_result)
+        mock_cm.get_chart_bars = AsyncMock(return_value=hist_result)
 
         mock_fh = MagicMock()
         mock_fh.is_enabled = False
@@ -91,6 +91,8 @@ class TestTickerFlow:
         assert len(data["ohlcv"]) == len(SAMPLE_OHLCV)
         first_bar = data["ohlcv"][0]
         assert set(first_bar.keys()) == {"date", "open", "high", "low", "close", "volume"}
+        # The period is resampled from the cached base series, not refetched.
+        mock_cm.get_chart_bars.assert_awaited_once_with("AAPL", "1mo", since=None)
 
     def test_ticker_all_sources_fail_returns_error(self, client):
         """When get_cache_manager raises DataSourceError, global handler returns 502."""
@@ -1614,5 +1614,53 @@ class TestValidateInputAdditional(unittest.TestCase):
         self.m.validate_input(_make_price_df(), vol)
 
 
+# ---------------------------------------------------------------------------
+# Incremental state helpers
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalStateHelpers(unittest.TestCase):
+    """locate_dates, stamp_state, resume_index, analyze_incremental."""
+
+    def setUp(self):
+        self.m = _ConcreteMethodology()
+
+    def test_locate_dates_datetime_and_string_columns(self):
+        df = _make_price_df(10)
+        wanted = [str(df["date"].iloc[3]), "1999-01-01 00:00:00", str(df["date"].iloc[9])]
+        self.assertEqual(self.m.locate_dates(df, wanted), [3, -1, 9])
+        sdf = df.assign(date=df["date"].dt.strftime("%Y-%m-%d"))
+        self.assertEqual(self.m.locate_dates(sdf, [sdf["date"].iloc[5], "nope"]), [5, -1])
+        self.assertEqual(self.m.locate_dates(df.iloc[:0], ["x"]), [-1])
+
+    def test_stamp_then_resume_after_append(self):
+        state: dict[str, Any] = {}
+        self.m.stamp_state(state, _make_price_df(20))
+        self.assertEqual(state["last_close"], 120.0)  # bar 18, not the forming bar
+        self.assertEqual(self.m.resume_index(state, _make_price_df(30)), 19)
+
+    def test_resume_rejects_mismatches(self):
+        state: dict[str, Any] = {}
+        self.m.stamp_state(state, _make_price_df(20))
+        df = _make_price_df(30)
+        self.assertIsNone(self.m.resume_index({}, df))
+        self.assertIsNone(self.m.resume_index({**state, "version": "0.9"}, df))
+        self.assertIsNone(self.m.resume_index({**state, "last_close": 1.0}, df))
+        # df now starts before the state's first bar
+        self.assertIsNone(self.m.resume_index({**state, "first_date": str(df["date"].iloc[2])}, df))
+
+    def test_resume_after_window_slides(self):
+        state: dict[str, Any] = {}
+        self.m.stamp_state(state, _make_price_df(20))
+        slid = _make_price_df(30).iloc[5:].reset_index(drop=True)
+        self.assertEqual(self.m.resume_index(state, slid), 14)
+
+    def test_analyze_incremental_without_support_returns_no_state(self):
+        signal, state = _run(self.m.analyze_incremental(
+            "AAPL", _make_price_df(), _make_volume_df(), state={"x": 1}))
+        self.assertEqual(signal.methodology, "wyckoff")
+        self.assertIsNone(state)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,320 @@
+"""Tests for the shared per-bar feature cache (app.analysis.features).
+
+Validates memoization, frame matching, the per-run LRU, and that every
+primitive reproduces the analyzers' former per-module computations
+exactly, so sharing features never changes a signal.
+
+No real network or database calls are made.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_analysis_features.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.analysis.base import BaseMethodology
+from app.analysis.canslim import CANSLIMAnalyzer
+from app.analysis.elliott_wave import ElliottWaveAnalyzer
+from app.analysis.features import (
+    BarFeatures,
+    clear_bar_features,
+    get_bar_features,
+    merge_price_volume,
+)
+from app.analysis.ict_smart_money import ICTSmartMoneyAnalyzer
+from app.analysis.larry_williams import LarryWilliamsAnalyzer, _WR_PERIOD_SHORT
+from app.analysis.wyckoff import WyckoffAnalyzer
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _run(coro):
+    """Run an async coroutine synchronously for testing."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _make_frames(rows: int = 300, seed: int = 7) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Random-walk OHLC and volume frames with some unchanged closes."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, 1.0, rows).round(1)
+    close = 100.0 + np.cumsum(steps)
+    open_ = close - rng.normal(0.0, 0.5, rows)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 2.0, rows)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 2.0, rows)
+    dates = pd.date_range("2023-01-02", periods=rows, freq="B")
+    price = pd.DataFrame({
+        "date": dates, "open": open_, "high": high, "low": low, "close": close,
+    })
+    volume = pd.DataFrame({
+        "date": dates, "volume": rng.integers(1_000, 50_000, rows).astype(float),
+    })
+    return price, volume
+
+
+def _reference_true_range(df: pd.DataFrame) -> np.ndarray:
+    prev_close = df["close"].shift(1)
+    tr1 = df["high"] - df["low"]
+    tr2 = (df["high"] - prev_close).abs()
+    tr3 = (df["low"] - prev_close).abs()
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1).to_numpy()
+
+
+# ---------------------------------------------------------------------------
+# 1. Memoization and matching
+# ---------------------------------------------------------------------------
+
+
+class TestBarFeaturesCache(unittest.TestCase):
+
+    def setUp(self):
+        self.price, self.volume = _make_frames()
+        self.features = BarFeatures(self.price, self.volume)
+
+    def test_frame_matches_merge(self):
+        expected = merge_price_volume(self.price, self.volume)
+        pd.testing.assert_frame_equal(self.features.frame, expected)
+
+    def test_primitives_are_memoized(self):
+        self.assertIs(self.features.true_range, self.features.true_range)
+        self.assertIs(self.features.swing_masks(3), self.features.swing_masks(3))
+        self.assertIs(self.features.column("close"), self.features.column("close"))
+
+    def test_arrays_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.features.true_range[0] = 1.0
+        with self.assertRaises(ValueError):
+            self.features.column("high")[0] = 1.0
+
+    def test_matches_copies(self):
+        self.assertTrue(self.features.matches(self.price.copy(), self.volume.copy()))
+
+    def test_does_not_match_changed_last_close(self):
+        changed = self.price.copy()
+        changed.loc[changed.index[-1], "close"] += 1.0
+        self.assertFalse(self.features.matches(changed, self.volume))
+
+    def test_does_not_match_missing_volume(self):
+        self.assertFalse(self.features.matches(self.price, None))
+
+    def test_wraps_merged_frame(self):
+        merged = merge_price_volume(self.price, self.volume)
+        features = BarFeatures(merged)
+        self.assertIs(features.frame, merged)
+
+
+class TestBarFeaturesRegistry(unittest.TestCase):
+
+    def setUp(self):
+        clear_bar_features()
+        self.price, self.volume = _make_frames()
+
+    def tearDown(self):
+        clear_bar_features()
+
+    def test_same_frames_reuse_entry(self):
+        first = get_bar_features("aapl", "1d", self.price, self.volume)
+        second = get_bar_features("AAPL", "1d", self.price.copy(), self.volume.copy())
+        self.assertIs(first, second)
+
+    def test_interval_is_part_of_key(self):
+        first = get_bar_features("AAPL", "1d", self.price, self.volume)
+        second = get_bar_features("AAPL", "1w", self.price, self.volume)
+        self.assertIsNot(first, second)
+
+    def test_forming_bar_change_rebuilds(self):
+        first = get_bar_features("AAPL", "1d", self.price, self.volume)
+        changed = self.price.copy()
+        changed.loc[changed.index[-1], "close"] += 1.0
+        second = get_bar_features("AAPL", "1d", changed, self.volume)
+        self.assertIsNot(first, second)
+        self.assertTrue(second.matches(changed, self.volume))
+
+    def test_least_recently_used_entry_evicted(self):
+        first = get_bar_features("S0", "1d", self.price, self.volume)
+        for i in range(1, 17):
+            get_bar_features(f"S{i}", "1d", self.price, self.volume)
+        self.assertIsNot(get_bar_features("S0", "1d", self.price, self.volume), first)
+
+
+class TestBarFeaturesFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.price, self.volume = _make_frames()
+
+    def test_uses_matching_features(self):
+        features = BarFeatures(self.price, self.volume)
+        got = BaseMethodology.bar_features(
+            self.price.copy(), self.volume.copy(), {"features": features},
+        )
+        self.assertIs(got, features)
+
+    def test_ignores_stale_features(self):
+        other_price, other_volume = _make_frames(rows=200)
+        stale = BarFeatures(other_price, other_volume)
+        got = BaseMethodology.bar_features(self.price, self.volume, {"features": stale})
+        self.assertIsNot(got, stale)
+        self.assertTrue(got.matches(self.price, self.volume))
+
+    def test_builds_when_absent(self):
+        got = BaseMethodology.bar_features(self.price, self.volume, {})
+        self.assertIsInstance(got, BarFeatures)
+
+
+# ---------------------------------------------------------------------------
+# 2. Equivalence with the former per-analyzer computations
+# ---------------------------------------------------------------------------
+
+
+class TestPrimitiveEquivalence(unittest.TestCase):
+
+    def setUp(self):
+        self.price, self.volume = _make_frames()
+        self.features = BarFeatures(self.price, self.volume)
+        self.df = self.features.frame
+
+    def test_true_range(self):
+        np.testing.assert_array_equal(self.features.true_range, _reference_true_range(self.df))
+
+    def test_window_true_range(self):
+        for lookback in (1, 20, 50, 400):
+            window = self.df.tail(lookback)
+            np.testing.assert_array_equal(
+                self.features.window_true_range(lookback), _reference_true_range(window),
+            )
+
+    def test_median_true_range(self):
+        closes = self.df["close"].to_numpy()
+        highs = self.df["high"].to_numpy()
+        lows = self.df["low"].to_numpy()
+        n = len(closes)
+        for lookback in (10, 50, 1000):
+            trs = sorted(
+                max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+                for i in range(max(1, n - lookback), n)
+            )
+            self.assertEqual(self.features.median_true_range(lookback), trs[len(trs) // 2])
+
+    def test_median_true_range_needs_two_bars(self):
+        self.assertIsNone(BarFeatures(self.df.head(1)).median_true_range(50))
+
+    def test_rolling_extremes(self):
+        np.testing.assert_array_equal(
+            self.features.rolling_max("high", 14),
+            self.df["high"].rolling(14).max().to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            self.features.rolling_min("low", 14),
+            self.df["low"].rolling(14).min().to_numpy(),
+        )
+
+    def test_tail_max(self):
+        self.assertEqual(
+            self.features.tail_max("high", 252), float(self.df["high"].tail(252).max()),
+        )
+
+    def test_period_return(self):
+        closes = self.df["close"]
+        for bars in (2, 252, len(closes)):
+            start = float(closes.iloc[-bars])
+            self.assertAlmostEqual(
+                self.features.period_return(bars), (float(closes.iloc[-1]) - start) / start,
+            )
+
+    def test_close_direction(self):
+        for lookback in (1, 20, 400):
+            window = self.df.tail(lookback)
+            shifted = window["close"].shift(1)
+            direction = self.features.close_direction(lookback)
+            np.testing.assert_array_equal(direction > 0, (window["close"] > shifted).to_numpy())
+            np.testing.assert_array_equal(direction < 0, (window["close"] < shifted).to_numpy())
+
+    def test_swing_masks_match_ict(self):
+        analyzer = ICTSmartMoneyAnalyzer()
+        for window in (2, 3, 5):
+            is_high, is_low = self.features.swing_masks(window)
+            highs = self.df["high"].to_numpy()
+            lows = self.df["low"].to_numpy()
+            for offset, i in enumerate(range(window, len(highs) - window)):
+                neighbours = np.r_[highs[i - window:i], highs[i + 1:i + window + 1]]
+                self.assertEqual(bool(is_high[offset]), bool((highs[i] >= neighbours).all()))
+                neighbours = np.r_[lows[i - window:i], lows[i + 1:i + window + 1]]
+                self.assertEqual(bool(is_low[offset]), bool((lows[i] <= neighbours).all()))
+        self.assertEqual(
+            analyzer._detect_swings(self.df),
+            analyzer._detect_swings(self.df, self.features),
+        )
+
+    def test_williams_ad_matches_loop(self):
+        closes = self.df["close"].to_numpy(dtype=float)
+        highs = self.df["high"].to_numpy(dtype=float)
+        lows = self.df["low"].to_numpy(dtype=float)
+        expected = LarryWilliamsAnalyzer._ad_values(closes, highs, lows, 1)
+        np.testing.assert_array_equal(self.features.williams_ad, expected)
+        np.testing.assert_array_equal(self.features.williams_ad_line, np.cumsum(expected))
+
+    def test_wr_series_matches_compute_wr(self):
+        analyzer = LarryWilliamsAnalyzer()
+        closes = self.df["close"].to_numpy()
+        highs = self.df["high"].to_numpy()
+        lows = self.df["low"].to_numpy()
+        series = analyzer._wr_series(self.features, _WR_PERIOD_SHORT)
+        for i in range(_WR_PERIOD_SHORT - 1, len(closes)):
+            self.assertEqual(
+                series[i],
+                analyzer._compute_wr(highs[:i + 1], lows[:i + 1], closes[:i + 1], _WR_PERIOD_SHORT),
+            )
+        self.assertTrue(np.isnan(series[:_WR_PERIOD_SHORT - 1]).all())
+
+    def test_wr_series_flat_range(self):
+        flat = self.df.assign(high=100.0, low=100.0, close=100.0)
+        series = LarryWilliamsAnalyzer._wr_series(BarFeatures(flat), _WR_PERIOD_SHORT)
+        self.assertTrue((series[_WR_PERIOD_SHORT - 1:] == -50.0).all())
+
+
+# ---------------------------------------------------------------------------
+# 3. Shared features leave signals unchanged
+# ---------------------------------------------------------------------------
+
+
+class TestSharedFeaturesSignals(unittest.TestCase):
+
+    ANALYZERS = (
+        WyckoffAnalyzer, ElliottWaveAnalyzer, ICTSmartMoneyAnalyzer,
+        LarryWilliamsAnalyzer, CANSLIMAnalyzer,
+    )
+
+    def setUp(self):
+        self.price, self.volume = _make_frames(rows=400)
+        self.fundamentals = {
+            "ttm": {"shares_outstanding": 1e8},
+            "quarterly": [],
+        }
+
+    def _signal(self, cls, **kwargs):
+        signal = _run(cls().analyze(
+            "TEST", self.price.copy(), self.volume.copy(), self.fundamentals, **kwargs,
+        ))
+        data = signal.to_dict()
+        data.pop("timestamp", None)
+        return data
+
+    def test_signals_identical_with_shared_features(self):
+        features = BarFeatures(self.price, self.volume)
+        for cls in self.ANALYZERS:
+            with self.subTest(analyzer=cls.__name__):
+                self.assertEqual(self._signal(cls), self._signal(cls, features=features))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1930,3 +1930,194 @@ class TestGetLock:
             assert lock_a is not lock_b
         finally:
             loop.close()
+
+
+# ===================================================================
+# 20. TestExecutionModes (~6 tests)
+# ===================================================================
+def _slow_analyzer(methodology, delay, exc=None):
+    """Analyzer whose ``analyze`` blocks its thread for *delay* seconds."""
+    import time as _time
+
+    async def _analyze(*args, **kwargs):
+        _time.sleep(delay)
+        if exc is not None:
+            raise exc
+        return _make_signal(methodology)
+
+    analyzer = MagicMock()
+    analyzer.analyze = _analyze
+    return analyzer
+
+
+def _run(requested, loader, mode, timeout=25.0):
+    """Invoke _run_methodologies directly with mocked aggregator/broadcasts."""
+    from app.api.routes.analysis import _build_dataframes, _run_methodologies
+
+    price_df, volume_df = _build_dataframes(list(_SAMPLE_HISTORY))
+    _, agg_p, _, bp, *_ = _patch_analysis()
+    settings = MagicMock(analysis_execution_mode="sequential",
+                         analysis_max_workers=6,
+                         analysis_methodology_timeout_seconds=timeout)
+    with agg_p, bp as bc, \
+         patch("app.api.routes.analysis._load_analyzer", side_effect=loader), \
+         patch("app.api.routes.analysis.get_settings", return_value=settings):
+        result = asyncio.run(_run_methodologies(
+            "AAPL", price_df, volume_df, None, [], requested, None, True,
+            execution_mode=mode,
+        ))
+    return result, bc
+
+
+class TestExecutionModes:
+    """Sequential vs thread-pool methodology execution."""
+
+    def test_thread_mode_runs_concurrently(self):
+        names = ["wyckoff", "elliott_wave", "ict_smart_money"]
+        import time as _time
+        start = _time.monotonic()
+        result, _ = _run(names, lambda n: _slow_analyzer(n, 0.3), "thread")
+        elapsed = _time.monotonic() - start
+        assert len(result["signals"]) == 3
+        assert elapsed < 0.8  # well under the 0.9s sequential sum
+
+    def test_signals_keep_requested_order(self):
+        delays = {"wyckoff": 0.3, "elliott_wave": 0.0, "canslim": 0.1}
+        result, _ = _run(list(delays), lambda n: _slow_analyzer(n, delays[n]), "thread")
+        assert [s.methodology for s in result["signals"]] == list(delays)
+
+    def test_per_methodology_timeout_marks_failed(self):
+        delays = {"wyckoff": 0.0, "elliott_wave": 1.0}
+        result, bc = _run(list(delays), lambda n: _slow_analyzer(n, delays[n]),
+                          "thread", timeout=0.2)
+        assert result["metadata"]["failed_methodologies"] == ["elliott_wave"]
+        assert [s.methodology for s in result["signals"]] == ["wyckoff"]
+        assert "failed" in [c.args[4] for c in bc.call_args_list]
+
+    def test_thread_mode_exception_marks_failed(self):
+        def _loader(n):
+            exc = RuntimeError("boom") if n == "canslim" else None
+            return _slow_analyzer(n, 0.0, exc)
+
+        result, _ = _run(["wyckoff", "canslim"], _loader, "thread")
+        assert result["metadata"]["failed_methodologies"] == ["canslim"]
+
+    def test_sequential_mode_reports_mode(self):
+        result, _ = _run(["wyckoff"], lambda n: _make_analyzer_mock(n), "sequential")
+        assert result["metadata"]["execution_mode"] == "sequential"
+        assert len(result["signals"]) == 1
+
+    def test_unknown_mode_falls_back_to_sequential(self):
+        result, _ = _run(["wyckoff"], lambda n: _make_analyzer_mock(n), "bogus")
+        assert result["metadata"]["execution_mode"] == "sequential"
+
+    def test_metadata_has_per_methodology_durations(self):
+        result, _ = _run(["wyckoff", "sentiment"], lambda n: _make_analyzer_mock(n), "thread")
+        durations = result["metadata"]["methodology_durations_ms"]
+        assert set(durations) == {"wyckoff", "sentiment"}
+        assert result["metadata"]["methodologies_wall_ms"] >= 0
+
+    def test_incremental_state_loaded_and_saved(self):
+        async def _analyze(*args, incremental_state=None, **kwargs):
+            incremental_state["seen"] = dict(incremental_state)
+            return _make_signal("ict_smart_money")
+
+        inc = MagicMock(supports_incremental=True)
+        inc.analyze = _analyze
+        loader = lambda n: inc if n == "ict_smart_money" else _make_analyzer_mock(n)
+        with patch("app.api.routes.analysis.load_analysis_state",
+                   new_callable=AsyncMock, return_value={"k": 1}) as load, \
+             patch("app.api.routes.analysis.save_analysis_state",
+                   new_callable=AsyncMock) as save:
+            result, _ = _run(["wyckoff", "ict_smart_money"], loader, "thread")
+        load.assert_awaited_once_with("AAPL", "ict_smart_money", "1d")
+        save.assert_awaited_once_with(
+            "AAPL", "ict_smart_money", "1d", {"k": 1, "seen": {"k": 1}})
+        assert result["metadata"]["incremental_methodologies"] == ["ict_smart_money"]
+
+    def test_state_store_failure_does_not_fail_methodology(self):
+        inc = _make_analyzer_mock("ict_smart_money")
+        inc.supports_incremental = True
+        with patch("app.api.routes.analysis.load_analysis_state",
+                   new_callable=AsyncMock, side_effect=RuntimeError("db down")), \
+             patch("app.api.routes.analysis.save_analysis_state",
+                   new_callable=AsyncMock) as save:
+            result, _ = _run(["ict_smart_money"], lambda n: inc, "sequential")
+        assert result["metadata"]["failed_methodologies"] == []
+        save.assert_not_awaited()  # analyzer left the empty state untouched
+
+
+def test_analysis_state_round_trip(tmp_path):
+    from app.analysis.state_store import load_analysis_state, save_analysis_state
+    from app.data.database import DatabaseManager
+
+    async def _go():
+        mgr = DatabaseManager(tmp_path / "state.db")
+        await mgr.initialize()
+        try:
+            with patch("app.data.database.get_database",
+                       new_callable=AsyncMock, return_value=mgr):
+                assert await load_analysis_state("aapl", "ict_smart_money", "1d") == {}
+                await save_analysis_state("aapl", "ict_smart_money", "1d", {"a": [1, 2]})
+                await save_analysis_state("AAPL", "ict_smart_money", "1d", {"a": [3]})
+                return await load_analysis_state("AAPL", "ict_smart_money", "1d")
+        finally:
+            await mgr.close()
+
+    assert asyncio.run(_go()) == {"a": [3]}
+
+
+def test_thread_mode_keeps_db_analyzer_on_event_loop(tmp_path):
+    """Sentiment's score cache I/O runs on the server loop in thread mode."""
+    import threading
+
+    from app.analysis.sentiment import _FINBERT_SCORE_VERSION, SentimentAnalyzer
+    from app.api.routes.analysis import _build_dataframes, _run_methodologies
+    from app.data.database import DatabaseManager
+
+    scoring_threads: list[threading.Thread] = []
+
+    async def _score(self_, text):
+        scoring_threads.append(threading.current_thread())
+        return {"score": 0.5, "label": "bullish", "model": "finbert",
+                "model_version": _FINBERT_SCORE_VERSION}
+
+    articles = [{"headline": "Beat", "url": "https://x/beat",
+                 "published_at": _NOW.isoformat(), "source": "Reuters"}]
+    price_df, volume_df = _build_dataframes(list(_SAMPLE_HISTORY))
+    _, agg_p, _, bp, *_ = _patch_analysis()
+    settings = MagicMock(analysis_execution_mode="thread",
+                         analysis_max_workers=2,
+                         analysis_methodology_timeout_seconds=25.0)
+
+    async def _go():
+        mgr = DatabaseManager(tmp_path / "thread_mode.db")
+        await mgr.initialize()
+        try:
+            # A main-loop write leaves a group commit open on this loop.
+            mgr._commit_window_s = 0.2
+            write = asyncio.ensure_future(
+                mgr.execute("INSERT INTO watchlist (symbol) VALUES (?)", ("AAPL",)))
+            await asyncio.sleep(0.01)
+            with agg_p, bp, \
+                 patch("app.api.routes.analysis._load_analyzer",
+                       side_effect=lambda n: SentimentAnalyzer()), \
+                 patch("app.api.routes.analysis.get_settings", return_value=settings), \
+                 patch("app.data.database.get_database",
+                       new_callable=AsyncMock, return_value=mgr), \
+                 patch.object(SentimentAnalyzer, "score_article", _score):
+                result = await _run_methodologies(
+                    "AAPL", price_df, volume_df, None, articles, ["sentiment"],
+                    None, False, execution_mode="thread",
+                )
+            await write
+            rows = await mgr.fetch_all(
+                "SELECT url, sentiment_model FROM news_cache WHERE symbol = 'AAPL'")
+            return result, rows
+        finally:
+            await mgr.close()
+
+    result, rows = asyncio.run(_go())
+    assert result["metadata"]["failed_methodologies"] == []
+    assert scoring_threads == [threading.main_thread()]
+    assert rows == [{"url": "https://x/beat", "sentiment_model": _FINBERT_SCORE_VERSION}]
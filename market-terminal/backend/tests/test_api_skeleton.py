@@ -532,10 +532,13 @@ class TestHealthCheckEndpoint:
         data = resp.json()
         assert isinstance(data["uptime_seconds"], (int, float))
 
-    def test_response_has_exactly_five_keys(self):
+    def test_response_has_expected_keys(self):
         resp = client.get("/api/health")
         data = resp.json()
-        expected_keys = {"status", "version", "database", "api_keys", "uptime_seconds"}
+        expected_keys = {
+            "status", "version", "database", "database_stats", "api_keys",
+            "rate_limits", "cache", "uptime_seconds",
+        }
         assert set(data.keys()) == expected_keys
 
     def test_content_type_is_json(self):
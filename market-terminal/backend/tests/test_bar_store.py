@@ -0,0 +1,402 @@
+"""Tests for the columnar OHLCV bar store (``app.data.bar_store``).
+
+Validates period helpers, BarSeries windowing / record and frame
+conversion (zero-copy), merge semantics, persistence and reload through a
+real temporary SQLite database, incremental append sizing, and the
+CacheManager.get_historical_prices integration (one shared series per
+symbol/interval, stale-while-append), and chart resampling from the shared
+base series (calendar/session buckets, memoization, get_chart_bars).
+
+No network calls are made; the yfinance fetch is an AsyncMock.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_bar_store.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from app.data.bar_store import (
+    BarSeries,
+    BarStore,
+    _columns_from_bars,
+    resample,
+    period_days,
+    source_period,
+    window_start,
+)
+from app.data.cache import CacheManager
+
+
+def _bars(n: int, *, end: date | None = None, base: float = 100.0) -> list[dict]:
+    """*n* consecutive daily bars ending at *end* (default: today)."""
+    end = end or datetime.now(timezone.utc).date()
+    out = []
+    for i in range(n):
+        d = end - timedelta(days=n - 1 - i)
+        px = base + i
+        out.append({
+            "date": d.isoformat(), "open": px, "high": px + 1, "low": px - 1,
+            "close": px + 0.5, "adjusted_close": px + 0.5, "volume": 1000 + i,
+        })
+    return out
+
+
+def _hourly(days: list[str]) -> list[dict]:
+    """Regular-session 1h bars (09:30 .. 15:30 ET) on each ``YYYY-MM-DD`` day."""
+    out = []
+    for day in days:
+        for i in range(7):
+            px = 100.0 + len(out)
+            out.append({
+                "date": f"{day}T{9 + i:02d}:30:00-04:00", "open": px, "high": px + 1,
+                "low": px - 1, "close": px + 0.5, "volume": 100,
+            })
+    return out
+
+
+def _series(
+    bars: list[dict], covered_from: str | None = None, interval: str = "1d",
+) -> BarSeries:
+    return BarSeries.from_columns(
+        "AAPL", interval, _columns_from_bars(bars),
+        covered_from=covered_from, source="yfinance",
+        fetched_at=datetime.now(timezone.utc).isoformat(), fetched_ts=datetime.now().timestamp(),
+    )
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    """Real DatabaseManager on a temp file, patched in as the singleton."""
+    from app.data.database import DatabaseManager
+
+    mgr = DatabaseManager(tmp_path / "bars.db")
+    await mgr.initialize()
+    with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mgr):
+        yield mgr
+    await mgr.close()
+
+
+# ===================================================================
+# 1. Period helpers
+# ===================================================================
+class TestPeriods:
+    """period_days / source_period / window_start."""
+
+    def test_period_days(self):
+        assert period_days("5d") == 5
+        assert period_days("9mo") == 279
+        assert period_days("15y") == 5475
+        assert period_days("max") is None
+
+    def test_source_period_rounds_up_to_valid_period(self):
+        assert source_period(period_days("9mo"), "1d") == "1y"
+        assert source_period(period_days("10y"), "1d") == "10y"
+        assert source_period(period_days("15y"), "1d") == "max"
+        assert source_period(None, "1d") == "max"
+
+    def test_source_period_caps_intraday(self):
+        assert source_period(period_days("15y"), "1h") == "2y"
+        assert source_period(None, "1h") == "2y"
+        assert source_period(3.75, "1h") == "5d"
+
+    def test_window_start(self):
+        now = datetime(2024, 6, 30, tzinfo=timezone.utc)
+        assert window_start("5d", "1d", now) == "2024-06-25"
+        assert window_start("max", "1d", now) is None
+        # intraday windows clamp to the source's lookback limit
+        assert window_start("max", "1h", now) == window_start("2y", "1h", now)
+
+
+# ===================================================================
+# 2. BarSeries
+# ===================================================================
+class TestBarSeries:
+    """Windowing, coverage, conversion."""
+
+    def test_window_is_a_view(self):
+        s = _series(_bars(30))
+        start = s.dates[10]
+        w = s.window(start)
+        assert len(w) == 20
+        assert w.dates[0] == start
+        assert np.shares_memory(w.close, s.close)
+
+    def test_covers(self):
+        assert _series(_bars(5), covered_from=None).covers("2000-01-01")
+        s = _series(_bars(5), covered_from="2024-01-01")
+        assert s.covers("2024-02-01")
+        assert not s.covers("2023-12-31")
+        assert not s.covers(None)
+
+    def test_to_records_shape(self):
+        rec = _series(_bars(2)).to_records()[0]
+        assert set(rec) == {"date", "open", "high", "low", "close", "volume"}
+        assert isinstance(rec["volume"], int)
+
+    def test_to_frames_zero_copy(self):
+        s = _series(_bars(10))
+        price_df, volume_df = s.to_frames()
+        assert list(price_df.columns) == ["date", "open", "high", "low", "close"]
+        assert np.shares_memory(price_df["close"].to_numpy(), s.close)
+        assert np.shares_memory(volume_df["volume"].to_numpy(), s.volume)
+
+    def test_arrays_read_only(self):
+        s = _series(_bars(3))
+        with pytest.raises(ValueError):
+            s.close[0] = 1.0
+
+    def test_missing_ohlc_dropped_and_missing_volume_filtered(self):
+        bars = _bars(4)
+        bars[1]["close"] = None
+        bars[2]["volume"] = None
+        s = _series(bars)
+        assert len(s) == 3
+        price_df, volume_df = s.to_frames()
+        assert len(price_df) == 3
+        assert len(volume_df) == 2
+        assert s.to_records()[1]["volume"] is None
+
+
+# ===================================================================
+# 3. BarStore persistence
+# ===================================================================
+class TestBarStore:
+    """Ingest, reload, merge and invalidation against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_ingest_and_reload(self, db):
+        store = BarStore()
+        await store.ingest("aapl", "1d", _bars(20), covered_from="2020-01-01", source="yfinance")
+        fresh = BarStore()
+        s = await fresh.load("AAPL", "1d")
+        assert s is not None and len(s) == 20
+        assert s.covered_from == "2020-01-01"
+        assert s.age < 60
+
+    @pytest.mark.asyncio
+    async def test_merge_writes_only_new_bars(self, db):
+        store = BarStore()
+        history = _bars(22)
+        await store.ingest("AAPL", "1d", history[:20], covered_from="2020-01-01", source="yfinance")
+        written = store.get_stats()["bar_rows_written"]
+        # Overlapping top-up window: 18 unchanged stored bars + 2 new ones.
+        s = await store.ingest("AAPL", "1d", history[2:], covered_from="2020-01-01", source="yfinance")
+        assert len(s) == 22
+        assert list(s.dates) == sorted(s.dates)
+        assert store.get_stats()["bar_rows_written"] - written == 2
+        row = await db.fetch_one("SELECT COUNT(*) AS n FROM price_bars")
+        assert row["n"] == 22
+
+    @pytest.mark.asyncio
+    async def test_revised_history_persisted(self, db):
+        """A back-adjusted older bar reaches SQLite, not just the memory copy."""
+        store = BarStore()
+        history = _bars(20)
+        await store.ingest("AAPL", "1d", history, covered_from=None, source="yfinance")
+        revised = [dict(b) for b in history]
+        revised[5].update(open=1.0, high=2.0, low=0.5, close=1.5)
+        revised[-1].update(close=999.0)
+        written = store.get_stats()["bar_rows_written"]
+        await store.ingest("AAPL", "1d", revised, covered_from=None, source="yfinance")
+        assert store.get_stats()["bar_rows_written"] - written == 2
+        reloaded = await BarStore().load("AAPL", "1d")
+        assert reloaded.close[5] == 1.5
+        assert reloaded.open[5] == 1.0
+        assert reloaded.close[-1] == 999.0
+        assert reloaded.close[4] == history[4]["close"]
+
+    @pytest.mark.asyncio
+    async def test_coverage_widens(self, db):
+        store = BarStore()
+        await store.ingest("AAPL", "1d", _bars(5), covered_from="2024-01-01", source="yfinance")
+        s = await store.ingest("AAPL", "1d", _bars(5), covered_from=None, source="yfinance")
+        assert s.covered_from is None
+
+    @pytest.mark.asyncio
+    async def test_backfill_maps_period(self, db):
+        store = BarStore()
+        fetch = AsyncMock(return_value=_bars(30))
+        s = await store.backfill("AAPL", "15y", "1d", fetch)
+        fetch.assert_awaited_once_with(symbol="AAPL", period="max", interval="1d")
+        assert s.covered_from is None
+
+    @pytest.mark.asyncio
+    async def test_append_latest_requests_short_window(self, db):
+        store = BarStore()
+        old = _bars(200, end=datetime.now(timezone.utc).date() - timedelta(days=3))
+        s = await store.ingest("AAPL", "1d", old, covered_from=None, source="yfinance")
+        fetch = AsyncMock(return_value=_bars(25))
+        s2 = await store.append_latest(s, fetch)
+        assert fetch.await_args.kwargs["period"] == "1mo"
+        assert len(s2) == 203
+
+    @pytest.mark.asyncio
+    async def test_delete(self, db):
+        store = BarStore()
+        await store.ingest("AAPL", "1d", _bars(5), covered_from=None, source="yfinance")
+        await store.delete("aapl")
+        assert await store.load("AAPL", "1d") is None
+
+
+# ===================================================================
+# 4. CacheManager integration
+# ===================================================================
+class TestCacheManagerHistory:
+    """get_historical_prices served from the shared series."""
+
+    @staticmethod
+    def _yf(bars):
+        mock_yf = MagicMock()
+        mock_yf.get_historical = AsyncMock(return_value=bars)
+        return patch("app.data.yfinance_client.get_yfinance_client", return_value=mock_yf), mock_yf
+
+    @pytest.mark.asyncio
+    async def test_periods_share_one_series(self, db):
+        cm = CacheManager()
+        p, mock_yf = self._yf(_bars(400))
+        with p:
+            r1 = await cm.get_historical_prices("AAPL", "1y", "1d")
+            r2 = await cm.get_historical_prices("AAPL", "3mo", "1d")
+        assert mock_yf.get_historical.await_count == 1
+        assert r1.is_cached is False and r2.is_cached is True
+        assert len(r2.data) < len(r1.data)
+        assert r2.data[-1] == r1.data[-1]
+        assert r1.cache_key == "price:AAPL:hist_1y_1d"
+
+    @pytest.mark.asyncio
+    async def test_as_series_returns_window(self, db):
+        cm = CacheManager()
+        p, _ = self._yf(_bars(100))
+        with p:
+            r = await cm.get_historical_prices("AAPL", "1mo", "1d", as_series=True)
+        assert isinstance(r.data, BarSeries)
+        assert r.data.dates[0] >= window_start("1mo", "1d")
+
+    @pytest.mark.asyncio
+    async def test_stale_series_served_and_appended(self, db):
+        cm = CacheManager()
+        old = _bars(100, end=datetime.now(timezone.utc).date() - timedelta(days=1))
+        p, mock_yf = self._yf(old)
+        with p:
+            await cm.get_historical_prices("AAPL", "1mo", "1d")
+            series = await cm._bars.load("AAPL", "1d")
+            series.fetched_ts -= 10_000  # older than the price TTL
+            mock_yf.get_historical.return_value = _bars(25)
+            r = await cm.get_historical_prices("AAPL", "1mo", "1d")
+            assert r.is_stale is True
+            await asyncio.gather(*cm._bg_tasks)
+        assert mock_yf.get_historical.await_args.kwargs["period"] == "1mo"
+        refreshed = await cm._bars.load("AAPL", "1d")
+        assert len(refreshed) == 101
+        assert cm.get_stats()["bg_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_source_failure_returns_none(self, db):
+        cm = CacheManager()
+        p, _ = self._yf(None)
+        with p:
+            assert await cm.get_historical_prices("AAPL", "1y", "1d") is None
+
+
+# ===================================================================
+# 5. Chart resampling
+# ===================================================================
+class TestResample:
+    """Session/calendar buckets derived from the shared base series."""
+
+    def test_weekly_buckets_start_monday(self):
+        # Mon 2026-10-05 .. Sun 2026-10-18
+        s = _series(_bars(14, end=date(2026, 10, 18)))
+        w = resample(s, "1wk")
+        assert w.interval == "1wk"
+        assert list(w.dates) == ["2026-10-05", "2026-10-12"]
+        assert w.open[0] == s.open[0] and w.close[0] == s.close[6]
+        assert w.high[1] == s.high[7:].max()
+        assert w.low[0] == s.low[:7].min()
+        assert w.volume[0] == s.volume[:7].sum()
+
+    def test_monthly_and_quarterly_buckets(self):
+        s = _series(_bars(90, end=date(2026, 3, 31)))
+        m = resample(s, "1mo")
+        assert list(m.dates) == ["2026-01-01", "2026-02-01", "2026-03-01"]
+        assert m.close[1] == s.close[58]  # 2026-02-28
+        q = resample(s, "3mo")
+        assert len(q) == 1
+        assert (q.open[0], q.close[0]) == (s.open[0], s.close[-1])
+
+    def test_session_buckets_anchored_at_open(self):
+        s = _series(_hourly(["2026-10-15", "2026-10-16"]), interval="1h")
+        h4 = resample(s, "4h")
+        assert [d[11:16] for d in h4.dates] == ["09:30", "13:30", "09:30", "13:30"]
+        assert h4.close[0] == s.close[3]
+        assert list(h4.volume) == [400, 300, 400, 300]
+        h12 = resample(s, "12h")
+        assert len(h12) == 2
+        assert h12.dates[1].startswith("2026-10-16")
+
+    def test_unknown_volume_stays_unknown(self):
+        bars = _bars(14, end=date(2026, 10, 18))
+        for bar in bars[:7]:
+            bar["volume"] = None
+        bars[8]["volume"] = None
+        w = resample(_series(bars), "1wk")
+        recs = w.to_records()
+        assert recs[0]["volume"] is None
+        assert recs[1]["volume"] == sum(b["volume"] for b in bars[7:] if b["volume"])
+
+    def test_base_rule_returns_series_unchanged(self):
+        s = _series(_bars(5))
+        assert resample(s, "1d") is s
+
+    def test_memoized_until_base_changes(self):
+        store = BarStore()
+        s = _series(_bars(30))
+        first = store.resampled(s, "1wk")
+        assert store.resampled(s, "1wk") is first
+        grown = _series(_bars(31))
+        assert store.resampled(grown, "1wk") is not first
+        stats = store.get_stats()
+        assert stats["bar_resamples"] == 2
+        assert stats["bar_resample_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chart_rules_share_one_download(self, db):
+        cm = CacheManager()
+        mock_yf = MagicMock()
+        mock_yf.get_historical = AsyncMock(return_value=_bars(400))
+        with patch("app.data.yfinance_client.get_yfinance_client", return_value=mock_yf):
+            daily = await cm.get_chart_bars("AAPL", "1d")
+            weekly = await cm.get_chart_bars("AAPL", "1wk")
+            monthly = await cm.get_chart_bars("AAPL", "1mo")
+        assert mock_yf.get_historical.await_count == 1
+        assert len(monthly.data) < len(weekly.data) < len(daily.data)
+        assert weekly.cache_key == "price:AAPL:chart_1wk"
+        assert weekly.data[-1]["close"] == daily.data[-1]["close"]
+
+    @pytest.mark.asyncio
+    async def test_since_returns_only_newer_bars(self, db):
+        cm = CacheManager()
+        mock_yf = MagicMock()
+        mock_yf.get_historical = AsyncMock(return_value=_bars(400))
+        with patch("app.data.yfinance_client.get_yfinance_client", return_value=mock_yf):
+            full = await cm.get_chart_bars("AAPL", "1d")
+            cursor = full.data[-3]["date"]
+            tail = await cm.get_chart_bars("AAPL", "1d", since=cursor)
+            weekly = await cm.get_chart_bars("AAPL", "1wk")
+            last_week = await cm.get_chart_bars(
+                "AAPL", "1wk", since=weekly.data[-1]["date"],
+            )
+        assert tail.data == full.data[-3:]
+        assert last_week.data == weekly.data[-1:]
+        assert tail.fetched_at == full.fetched_at
+
+    @pytest.mark.asyncio
+    async def test_unknown_chart_rule_rejected(self):
+        with pytest.raises(ValueError):
+            await CacheManager().get_chart_bars("AAPL", "2wk")
@@ -30,6 +30,7 @@ from app.data.cache import (
     close_cache_manager,
 )
 from app.data.cache_types import CachedResult, FALLBACK_CHAINS
+from app.data.write_behind import get_write_behind, reset_write_behind
 
 
 # ---------------------------------------------------------------------------
@@ -57,9 +58,17 @@ def _mock_settings():
     s.cache_ttl_ownership = 86400
     s.cache_ttl_insider = 14400
     s.cache_ttl_analysis = 3600
+    s.cache_ttl_profile = 604800
+    s.cache_ttl_financials = 21600
     return s
 
 
+async def _flushed_rows(db) -> list[tuple]:
+    """Flush the write-behind queue into *db*; return the params written."""
+    await get_write_behind().flush()
+    return [p for _sql, seq in db.execute_batch.call_args[0][0] for p in seq]
+
+
 def _mock_db():
     """Return an AsyncMock database with fetch_one/fetch_all/execute."""
     db = AsyncMock()
@@ -80,9 +89,11 @@ def _reset_singletons():
     """Reset module-level singletons before and after each test."""
     cache_mod._ttl_map = None
     cache_mod._manager = None
+    reset_write_behind()
     yield
     cache_mod._ttl_map = None
     cache_mod._manager = None
+    reset_write_behind()
 
 
 @pytest.fixture
@@ -262,9 +273,8 @@ class TestWriteCache:
         """Upserts into fundamentals_cache with correct values."""
         data = {"current_price": 150.0}
         await manager._write_cache("aapl", "price", "latest", "finnhub", data)
-        patched_db.execute.assert_called_once()
-        call_args = patched_db.execute.call_args
-        params = call_args[0][1]
+        patched_db.execute.assert_not_called()
+        [params] = await _flushed_rows(patched_db)
         assert params[0] == "AAPL"
         assert params[1] == "price"
         assert params[2] == "latest"
@@ -275,8 +285,7 @@ class TestWriteCache:
     async def test_stores_iso_timestamp(self, manager, patched_db):
         """Stores an ISO-format timestamp in fetched_at."""
         await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
-        call_args = patched_db.execute.call_args
-        params = call_args[0][1]
+        [params] = await _flushed_rows(patched_db)
         ts = params[5]
         # Validate ISO format
         dt = datetime.fromisoformat(ts)
@@ -315,6 +324,43 @@ class TestDeleteCache:
         params = patched_db.execute.call_args[0][1]
         assert params == ("AAPL",)
 
+    @pytest.mark.asyncio
+    async def test_discards_queued_writes(self, manager, patched_db):
+        """A queued upsert is dropped so the delete is not undone by a flush."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        await manager._write_cache("AAPL", "news", "latest", "finnhub", [])
+        await manager._write_cache("MSFT", "price", "latest", "finnhub", {"v": 2})
+        await manager._delete_cache("aapl", "price")
+        rows = await _flushed_rows(patched_db)
+        assert [(r[0], r[1]) for r in rows] == [("AAPL", "news"), ("MSFT", "price")]
+
+    @pytest.mark.asyncio
+    async def test_waits_for_inflight_flush(self, manager, patched_db):
+        """The DELETE runs after a batch already writing the symbol commits."""
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def slow_batch(groups):
+            await release.wait()
+            order.append("batch")
+
+        async def delete(sql, params=()):
+            if "fundamentals_cache" in sql:
+                order.append("delete")
+            return MagicMock(rowcount=1)
+
+        patched_db.execute_batch = AsyncMock(side_effect=slow_batch)
+        patched_db.execute.side_effect = delete
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        flushing = asyncio.create_task(get_write_behind().flush())
+        await asyncio.sleep(0)
+        deleting = asyncio.create_task(manager._delete_cache("AAPL", "price"))
+        await asyncio.sleep(0.01)
+        assert order == []
+        release.set()
+        await asyncio.gather(flushing, deleting)
+        assert order == ["batch", "delete"]
+
 
 # ===================================================================
 # 6. _build_result
@@ -582,85 +628,109 @@ class TestGetOrFetch:
 # 8. Background Refresh
 # ===================================================================
 class TestBgRefresh:
-    """CacheManager._schedule_bg_refresh background task management."""
+    """Stale-hit refreshes and refresh-ahead tracking via the scheduler."""
 
     @pytest.mark.asyncio
     async def test_schedules_refresh_successfully(self, manager):
-        """Schedules a background refresh and returns True."""
-        with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}):
-            with patch.object(manager, "_write_cache", new_callable=AsyncMock):
-                result = manager._schedule_bg_refresh("price", "AAPL", "latest")
+        """Queues a refresh of the stale key and returns True."""
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=None):
+            with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}) as mock_fetch:
+                with patch.object(manager, "_write_cache", new_callable=AsyncMock) as mock_write:
+                    result = manager._schedule_bg_refresh("price", "AAPL", "latest")
+                    await asyncio.sleep(0.05)
         assert result is True
-        assert len(manager._bg_tasks) == 1
-        # Clean up
-        for t in manager._bg_tasks:
-            t.cancel()
-        await asyncio.gather(*manager._bg_tasks, return_exceptions=True)
-
-    @pytest.mark.asyncio
-    async def test_caps_at_max_bg_tasks(self, manager):
-        """Returns False when _MAX_BG_TASKS is reached."""
-        # Fill with dummy never-resolving tasks
-        for _ in range(_MAX_BG_TASKS):
-            task = asyncio.create_task(asyncio.sleep(100))
-            manager._bg_tasks.add(task)
-        result = manager._schedule_bg_refresh("price", "AAPL", "latest")
-        assert result is False
-        # Clean up tasks
-        for t in manager._bg_tasks:
-            t.cancel()
-        await asyncio.gather(*manager._bg_tasks, return_exceptions=True)
+        mock_fetch.assert_awaited_once()
+        mock_write.assert_awaited_once()
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_not_capped_by_bg_task_limit(self, manager):
+        """Stale refreshes are queued, not dropped, beyond _MAX_BG_TASKS."""
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=None):
+            with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}) as mock_fetch:
+                with patch.object(manager, "_write_cache", new_callable=AsyncMock):
+                    results = [
+                        manager._schedule_bg_refresh("price", f"SYM{i}", "latest")
+                        for i in range(_MAX_BG_TASKS + 5)
+                    ]
+                    await asyncio.sleep(0.1)
+        assert all(results)
+        assert mock_fetch.await_count == _MAX_BG_TASKS + 5
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_repeated_stale_hits_deduplicated(self, manager):
+        """Stale hits of one key before its refresh runs fetch it once."""
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=None):
+            with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}) as mock_fetch:
+                with patch.object(manager, "_write_cache", new_callable=AsyncMock):
+                    for _ in range(3):
+                        manager._schedule_bg_refresh("price", "AAPL", "latest")
+                    await asyncio.sleep(0.05)
+        mock_fetch.assert_awaited_once()
+        assert manager.get_stats()["refresh_ahead"]["deduplicated"] == 2
+        await manager.close()
 
     @pytest.mark.asyncio
     async def test_failed_bg_refresh_does_not_crash(self, manager):
-        """A failed background refresh logs but does not crash."""
-        with patch.object(
-            manager, "_fetch_from_source", new_callable=AsyncMock,
-            side_effect=RuntimeError("network error"),
-        ):
-            manager._schedule_bg_refresh("price", "AAPL", "latest")
-            # Wait for the task to complete
-            await asyncio.sleep(0.1)
-        # Should not raise, bg_tasks should be cleaned up
-        remaining = {t for t in manager._bg_tasks if not t.done()}
-        assert len(remaining) == 0
-
-    @pytest.mark.asyncio
-    async def test_done_callback_cleans_up_task_set(self, manager):
-        """Done callback removes completed task from _bg_tasks."""
-        with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}):
-            with patch.object(manager, "_write_cache", new_callable=AsyncMock):
+        """A failed background refresh is counted but does not crash."""
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=None):
+            with patch.object(
+                manager, "_fetch_from_source", new_callable=AsyncMock,
+                side_effect=RuntimeError("network error"),
+            ):
                 manager._schedule_bg_refresh("price", "AAPL", "latest")
-                assert len(manager._bg_tasks) == 1
-                # Wait for task to complete
-                await asyncio.sleep(0.1)
-        # After completion, done callback should have discarded the task
-        remaining = {t for t in manager._bg_tasks if not t.done()}
-        assert len(remaining) == 0
+                await asyncio.sleep(0.05)
+        assert manager.get_stats()["refresh_ahead"]["failed"] == 1
+        await manager.close()
 
     @pytest.mark.asyncio
     async def test_bg_refresh_increments_stats(self, manager):
         """Successful bg refresh increments bg_refreshes stat."""
-        with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}):
-            with patch.object(manager, "_write_cache", new_callable=AsyncMock):
-                manager._schedule_bg_refresh("price", "AAPL", "latest")
-                await asyncio.sleep(0.1)
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=None):
+            with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"v": 1}):
+                with patch.object(manager, "_write_cache", new_callable=AsyncMock):
+                    manager._schedule_bg_refresh("price", "AAPL", "latest")
+                    await asyncio.sleep(0.05)
         assert manager._stats["bg_refreshes"] == 1
+        await manager.close()
 
     @pytest.mark.asyncio
-    async def test_bg_refresh_cleans_done_tasks_before_count(self, manager):
-        """Completed tasks are pruned before checking the cap."""
-        # Create a done task
-        done_task = asyncio.create_task(asyncio.sleep(0))
-        await asyncio.sleep(0.01)  # let it complete
-        manager._bg_tasks.add(done_task)
+    async def test_refresh_skipped_when_already_fresh(self, manager):
+        """A key refreshed meanwhile (e.g. by an interactive miss) is not refetched."""
+        cached = ({"v": 1}, _now_iso(), 5.0)
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=cached):
+            with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock) as mock_fetch:
+                fetched_ts = await manager._refresh_key("price", "AAPL", "latest", None, 800.0)
+        mock_fetch.assert_not_called()
+        assert fetched_ts is not None
 
-        # Should be able to add more since done ones are pruned
-        with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value=None):
-            result = manager._schedule_bg_refresh("price", "AAPL", "latest")
-        assert result is True
-        # Clean up
-        await asyncio.sleep(0.05)
+    @pytest.mark.asyncio
+    async def test_fresh_hit_tracks_key(self, manager, patched_settings):
+        """Fresh hits register the key for refresh-ahead."""
+        cached = ({"price": 150}, _past_iso(10), 10.0)
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=cached):
+            await manager.get_or_fetch("price", "AAPL")
+        assert manager.get_stats()["refresh_ahead"]["tracked"] == 1
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_custom_fetch_fn_not_tracked(self, manager, patched_settings):
+        """Keys fetched with a custom fetch_fn cannot be refreshed by the scheduler."""
+        cached = ({"price": 150}, _past_iso(10), 10.0)
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=cached):
+            await manager.get_or_fetch("price", "AAPL", fetch_fn=AsyncMock())
+        assert manager.get_stats()["refresh_ahead"]["tracked"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pin_symbols(self, manager):
+        """Watchlist symbols are pinned and unpinned."""
+        with patch.object(manager, "_refresh_key", new_callable=AsyncMock, return_value=None):
+            manager.pin_symbols(["aapl", "MSFT"])
+            assert manager.get_stats()["refresh_ahead"]["pinned"] == 2
+            manager.unpin_symbols(["AAPL"])
+            assert manager.get_stats()["refresh_ahead"]["pinned"] == 1
+        await manager.close()
 
 
 # ===================================================================
@@ -762,6 +832,20 @@ class TestDispatch:
             await manager._dispatch("insider", "AAPL", "latest", "edgar")
         mock_client.get_insider_transactions.assert_called_once_with("AAPL", days=365)
 
+    @pytest.mark.asyncio
+    async def test_profile_and_financials_finnhub(self, manager):
+        """Routes profile / financials to the Finnhub supplement endpoints."""
+        mock_client = MagicMock()
+        mock_client.get_company_profile = AsyncMock(return_value={"name": "Apple Inc"})
+        mock_client.get_basic_financials = AsyncMock(return_value={"beta": 1.2})
+        with patch("app.data.finnhub_client.get_finnhub_client", return_value=mock_client):
+            profile = await manager._dispatch("profile", "AAPL", "latest", "finnhub")
+            financials = await manager._dispatch("financials", "AAPL", "latest", "finnhub")
+        assert profile == {"name": "Apple Inc"}
+        assert financials == {"beta": 1.2}
+        mock_client.get_company_profile.assert_called_once_with("AAPL")
+        mock_client.get_basic_financials.assert_called_once_with("AAPL")
+
     @pytest.mark.asyncio
     async def test_unknown_combination_returns_none(self, manager):
         """Unknown data_type/source combination returns None."""
@@ -804,6 +888,31 @@ class TestConvenienceMethods:
             await manager.get_fundamentals("MSFT")
         mock_gof.assert_called_once_with("fundamentals", "MSFT", force_refresh=False)
 
+    @pytest.mark.asyncio
+    async def test_get_company_profile_and_basic_financials(self, manager):
+        """Supplements delegate to get_or_fetch with their own data types."""
+        with patch.object(manager, "get_or_fetch", new_callable=AsyncMock, return_value="r") as mock_gof:
+            await manager.get_company_profile("MSFT")
+            await manager.get_basic_financials("MSFT", force_refresh=True)
+        assert mock_gof.call_args_list[0].args == ("profile", "MSFT")
+        assert mock_gof.call_args_list[1].args == ("financials", "MSFT")
+        assert mock_gof.call_args_list[1].kwargs == {"force_refresh": True}
+
+    @pytest.mark.asyncio
+    async def test_warm_profile_needs_no_upstream_call(
+        self, manager, patched_db, patched_settings,
+    ):
+        """A cached profile is served from L1 without another Finnhub call."""
+        mock_client = MagicMock()
+        mock_client.get_company_profile = AsyncMock(return_value={"name": "Apple Inc"})
+        with patch("app.data.finnhub_client.get_finnhub_client", return_value=mock_client):
+            first = await manager.get_company_profile("AAPL")
+            second = await manager.get_company_profile("AAPL")
+        mock_client.get_company_profile.assert_awaited_once()
+        assert first.source == "finnhub" and first.ttl_seconds == 604800
+        assert second.is_cached is True
+        assert second.data == {"name": "Apple Inc"}
+
     @pytest.mark.asyncio
     async def test_get_news(self, manager):
         """get_news delegates to get_or_fetch('news', ...)."""
@@ -851,20 +960,17 @@ class TestConvenienceMethods:
         mock_gof.assert_called_once_with("cot", "GLD", force_refresh=False)
 
     @pytest.mark.asyncio
-    async def test_get_historical_prices(self, manager):
-        """get_historical_prices uses fetch_fn with yfinance."""
+    async def test_get_historical_prices(self, manager, patched_settings):
+        """get_historical_prices backfills the bar store from yfinance on a miss."""
         mock_yf = MagicMock()
-        mock_yf.get_historical = AsyncMock(return_value={"bars": []})
-        with patch("app.data.yfinance_client.get_yfinance_client", return_value=mock_yf):
-            with patch.object(manager, "get_or_fetch", new_callable=AsyncMock, return_value="r") as mock_gof:
-                await manager.get_historical_prices("AAPL", "1y", "1d")
-        mock_gof.assert_called_once()
-        call_kwargs = mock_gof.call_args
-        assert call_kwargs[0][0] == "price"
-        assert call_kwargs[0][1] == "AAPL"
-        assert call_kwargs[0][2] == "hist_1y_1d"
-        assert call_kwargs[1]["source_override"] == "yfinance"
-        assert call_kwargs[1]["fetch_fn"] is not None
+        mock_yf.get_historical = AsyncMock(return_value=None)
+        with patch("app.data.yfinance_client.get_yfinance_client", return_value=mock_yf), \
+                patch.object(manager._bars, "load", new_callable=AsyncMock, return_value=None), \
+                patch.object(manager._bars, "backfill", new_callable=AsyncMock, return_value=None) as mock_bf:
+            result = await manager.get_historical_prices("aapl", "1y", "1d")
+        assert result is None
+        mock_bf.assert_awaited_once_with("AAPL", "1y", "1d", mock_yf.get_historical)
+        assert manager._stats["total_failures"] == 1
 
     @pytest.mark.asyncio
     async def test_get_income_statement(self, manager):
@@ -942,10 +1048,9 @@ class TestInvalidation:
     async def test_invalidate_all(self, manager, patched_db):
         """invalidate_all executes DELETE with 1=1."""
         await manager.invalidate_all()
-        patched_db.execute.assert_called_once()
-        sql = patched_db.execute.call_args[0][0]
-        assert "1=1" in sql
-        assert "DELETE" in sql
+        sqls = [c[0][0] for c in patched_db.execute.call_args_list]
+        assert "DELETE FROM fundamentals_cache WHERE 1=1" in sqls
+        assert "DELETE FROM price_bars WHERE 1=1" in sqls
 
 
 # ===================================================================
@@ -965,6 +1070,7 @@ class TestStats:
         assert stats["total_failures"] == 0
         assert stats["bg_refreshes"] == 0
         assert stats["active_bg_tasks"] == 0
+        assert stats["refresh_ahead"]["queue_depth"] == 0
 
     def test_stats_accumulate(self, manager):
         """Stats accumulate correctly after operations."""
@@ -1069,14 +1175,12 @@ class TestWatchlistRefresh:
 
     @pytest.mark.asyncio
     async def test_schedule_watchlist_refresh(self, manager):
-        """Calls get_price for each symbol."""
-        with patch.object(manager, "get_price", new_callable=AsyncMock, return_value="r") as mock_gp:
-            with patch("app.data.cache.asyncio.sleep", new_callable=AsyncMock):
+        """Force-refreshes all symbols in one bulk call, without sleeps."""
+        with patch.object(manager, "get_prices_bulk", new_callable=AsyncMock, return_value={}) as mock_bulk:
+            with patch("app.data.cache.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
                 await manager.schedule_watchlist_refresh(["AAPL", "MSFT", "GOOG"])
-        assert mock_gp.call_count == 3
-        mock_gp.assert_any_call("AAPL", force_refresh=True)
-        mock_gp.assert_any_call("MSFT", force_refresh=True)
-        mock_gp.assert_any_call("GOOG", force_refresh=True)
+        mock_bulk.assert_awaited_once_with(["AAPL", "MSFT", "GOOG"], force_refresh=True)
+        mock_sleep.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_refresh_symbol_refreshes_all_data_types(self, manager):
@@ -1309,7 +1413,7 @@ class TestEdgeCases:
     async def test_write_cache_uppercases_symbol(self, manager, patched_db):
         """_write_cache uppercases the symbol."""
         await manager._write_cache("aapl", "price", "latest", "finnhub", {"v": 1})
-        params = patched_db.execute.call_args[0][1]
+        [params] = await _flushed_rows(patched_db)
         assert params[0] == "AAPL"
 
     def test_init_creates_default_stats(self):
@@ -1324,3 +1428,181 @@ class TestEdgeCases:
         mgr = CacheManager()
         assert len(mgr._locks) == 0
         assert len(mgr._bg_tasks) == 0
+
+
+# ===================================================================
+# 19. L1 in-process tier
+# ===================================================================
+class TestL1Tier:
+    """CacheManager integration with the MemoryCache L1 tier."""
+
+    @pytest.mark.asyncio
+    async def test_write_through_serves_next_read_from_l1(self, manager, patched_db, patched_settings):
+        """_write_cache populates L1 so the next read skips SQLite."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        result = await manager._read_cache("AAPL", "price", "latest")
+        assert result is not None
+        assert result[0] == {"v": 1}
+        patched_db.fetch_one.assert_not_called()
+        assert manager.get_stats()["l1_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_l1_miss_served_from_write_behind_buffer(
+        self, manager, patched_db, patched_settings,
+    ):
+        """A queued row answers an L1 miss without flushing or querying SQLite."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        await manager._write_cache("MSFT", "price", "latest", "finnhub", {"v": 2})
+        manager._l1.clear()
+        result = await manager._read_cache("AAPL", "price", "latest")
+        assert result is not None
+        assert result[0] == {"v": 1}
+        patched_db.fetch_one.assert_not_called()
+        patched_db.execute_batch.assert_not_called()
+        assert get_write_behind().get_stats()["pending"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sqlite_read_populates_l1(self, manager, patched_db, patched_settings):
+        """A fresh SQLite row is promoted into L1."""
+        patched_db.fetch_one.return_value = {
+            "value_json": json.dumps({"v": 2}),
+            "source": "finnhub",
+            "fetched_at": _past_iso(10),
+        }
+        await manager._read_cache("AAPL", "price", "latest")
+        await manager._read_cache("AAPL", "price", "latest")
+        assert patched_db.fetch_one.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_sqlite_read_not_promoted(self, manager, patched_db, patched_settings):
+        """A row older than its TTL stays out of L1."""
+        patched_db.fetch_one.return_value = {
+            "value_json": json.dumps({"v": 3}),
+            "source": "finnhub",
+            "fetched_at": _past_iso(5000),
+        }
+        await manager._read_cache("AAPL", "price", "latest")
+        await manager._read_cache("AAPL", "price", "latest")
+        assert patched_db.fetch_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_l1(self, manager, patched_db, patched_settings):
+        """invalidate() removes the symbol from L1 as well as SQLite."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        await manager.invalidate("AAPL")
+        await manager._read_cache("AAPL", "price", "latest")
+        patched_db.fetch_one.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_corporate_action_drops_l1(self, manager, patched_db, patched_settings):
+        """invalidate_on_corporate_action() removes every data type from L1."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        await manager._write_cache("AAPL", "news", "latest", "finnhub", [])
+        await manager.invalidate_on_corporate_action("AAPL", "split")
+        assert manager.get_stats()["l1_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_clears_l1(self, manager, patched_db, patched_settings):
+        """invalidate_all() empties L1."""
+        await manager._write_cache("AAPL", "price", "latest", "finnhub", {"v": 1})
+        await manager.invalidate_all()
+        assert manager.get_stats()["l1_entries"] == 0
+
+    def test_stats_include_l1_counters(self, manager):
+        """get_stats() exposes L1 hit/miss/eviction counters."""
+        stats = manager.get_stats()
+        for key in ("l1_hits", "l1_misses", "l1_evictions", "l1_entries", "l1_bytes"):
+            assert stats[key] == 0
+
+
+# ===================================================================
+# 20. Bulk price quotes
+# ===================================================================
+def _finnhub_stub(calls_remaining: int = 60, enabled: bool = True) -> MagicMock:
+    client = MagicMock()
+    client.is_enabled = enabled
+    client.calls_remaining = calls_remaining
+    return client
+
+
+class TestPricesBulk:
+    """get_prices_bulk and the per-source batch fetch behind it."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entries_not_fetched(self, manager, patched_settings):
+        """Fresh cache hits are returned without touching any source."""
+        cached = ({"current_price": 150}, _now_iso(), 10.0)
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock, return_value=cached):
+            with patch.object(manager, "_fetch_prices_bulk", new_callable=AsyncMock) as mock_fetch:
+                results = await manager.get_prices_bulk(["aapl", "MSFT", "AAPL"])
+        assert list(results) == ["AAPL", "MSFT"]
+        assert all(r.is_cached and not r.is_stale for r in results.values())
+        mock_fetch.assert_not_awaited()
+        assert manager._stats["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_misses_and_stale_fetched_together(self, manager, patched_settings):
+        """Missing and stale symbols go to one bulk fetch; failures fall back to stale."""
+        reads = {
+            "AAPL": ({"current_price": 150}, _now_iso(), 10.0),
+            "MSFT": ({"current_price": 300}, _past_iso(1000), 1000.0),
+            "GOOG": None,
+            "TSLA": ({"current_price": 200}, _past_iso(1000), 1000.0),
+            "NOPE": None,
+        }
+
+        async def _read(symbol, data_type, period):
+            return reads[symbol]
+
+        fetched = {"MSFT": ("finnhub", {"current_price": 310}), "GOOG": ("yfinance", {"current_price": 140})}
+        with patch.object(manager, "_read_cache", side_effect=_read):
+            with patch.object(manager, "_fetch_prices_bulk", new_callable=AsyncMock, return_value=fetched) as mock_fetch:
+                with patch.object(manager, "_write_cache", new_callable=AsyncMock) as mock_write:
+                    results = await manager.get_prices_bulk(["AAPL", "MSFT", "GOOG", "TSLA", "NOPE"])
+        mock_fetch.assert_awaited_once_with(["MSFT", "GOOG", "TSLA", "NOPE"])
+        assert mock_write.await_count == 2
+        assert results["MSFT"].data == {"current_price": 310} and results["MSFT"].source == "finnhub"
+        assert results["GOOG"].source == "yfinance"
+        assert results["TSLA"].is_stale is True
+        assert results["NOPE"] is None
+        assert manager._stats["fetches"] == 2
+        assert manager._stats["stale_hits"] == 1
+        assert manager._stats["total_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_skips_cache(self, manager, patched_settings):
+        with patch.object(manager, "_read_cache", new_callable=AsyncMock) as mock_read:
+            with patch.object(manager, "_fetch_prices_bulk", new_callable=AsyncMock, return_value={}) as mock_fetch:
+                await manager.get_prices_bulk(["AAPL"], force_refresh=True)
+        mock_read.assert_not_awaited()
+        mock_fetch.assert_awaited_once_with(["AAPL"])
+
+    @pytest.mark.asyncio
+    async def test_finnhub_limited_to_rate_budget(self, manager):
+        """Finnhub only gets as many symbols as its window allows; yfinance takes the rest."""
+        yf_client = MagicMock()
+        yf_client.get_quotes_bulk = AsyncMock(return_value={"MSFT": {"p": 2}, "GOOG": {"p": 3}})
+        with patch("app.data.finnhub_client.get_finnhub_client", return_value=_finnhub_stub(1)):
+            with patch("app.data.yfinance_client.get_yfinance_client", return_value=yf_client):
+                with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock, return_value={"p": 1}) as mock_src:
+                    found = await manager._fetch_prices_bulk(["AAPL", "MSFT", "GOOG"])
+        mock_src.assert_awaited_once_with("price", "AAPL", "latest", "finnhub")
+        yf_client.get_quotes_bulk.assert_awaited_once_with(["MSFT", "GOOG"])
+        assert found == {
+            "AAPL": ("finnhub", {"p": 1}),
+            "MSFT": ("yfinance", {"p": 2}),
+            "GOOG": ("yfinance", {"p": 3}),
+        }
+
+    @pytest.mark.asyncio
+    async def test_finnhub_failures_fall_through(self, manager):
+        """Finnhub misses and a disabled Finnhub both land on yfinance."""
+        yf_client = MagicMock()
+        yf_client.get_quotes_bulk = AsyncMock(return_value={})
+        with patch("app.data.finnhub_client.get_finnhub_client", return_value=_finnhub_stub(enabled=False)):
+            with patch("app.data.yfinance_client.get_yfinance_client", return_value=yf_client):
+                with patch.object(manager, "_fetch_from_source", new_callable=AsyncMock) as mock_src:
+                    found = await manager._fetch_prices_bulk(["AAPL", "MSFT"])
+        mock_src.assert_not_awaited()
+        yf_client.get_quotes_bulk.assert_awaited_once_with(["AAPL", "MSFT"])
+        assert found == {}
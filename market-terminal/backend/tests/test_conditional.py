@@ -0,0 +1,63 @@
+"""Tests for the conditional GET helpers (app.api.conditional).
+
+Validates weak ETag construction, If-None-Match matching (lists, ``*``,
+weak/strong forms) and the 304 short-circuit.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_conditional.py -v``
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from fastapi import Response
+
+from app.api.conditional import conditional, etag_matches, make_etag
+
+
+def _request(if_none_match: str | None = None) -> MagicMock:
+    request = MagicMock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+# ===================================================================
+# 1. ETags
+# ===================================================================
+class TestEtags:
+
+    def test_weak_and_deterministic(self):
+        etag = make_etag("price:AAPL:chart_1d", "2026-02-07T16:00:00+00:00")
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert etag == make_etag("price:AAPL:chart_1d", "2026-02-07T16:00:00+00:00")
+
+    def test_parts_are_delimited(self):
+        assert make_etag("ab", "c") != make_etag("a", "bc")
+        assert make_etag("x", None) != make_etag("x", "")
+
+    def test_matching(self):
+        etag = make_etag("x")
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+        assert etag_matches(f'W/"other", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches(make_etag("y"), etag)
+
+
+# ===================================================================
+# 2. conditional()
+# ===================================================================
+class TestConditional:
+
+    def test_sets_headers_when_not_matching(self):
+        response = Response()
+        assert conditional(_request(), response, "x") is None
+        assert response.headers["etag"] == make_etag("x")
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_returns_304_when_matching(self):
+        response = Response()
+        not_modified = conditional(_request(make_etag("x")), response, "x")
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == make_etag("x")
+        assert not_modified.body == b""
@@ -62,6 +62,9 @@ _CACHED_ROW = {
 }
 
 
+_THIS_YEAR = datetime.now(timezone.utc).year
+
+
 def _make_historical(count=10, base_net=50000):
     """Generate historical cache rows (descending by date)."""
     rows = []
@@ -695,7 +698,7 @@ class TestFetchYear:
         with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=b"zipdata"):
             with patch("app.data.cot_client.extract_csv_from_zip_sync", return_value="csv text"):
                 with patch("app.data.cot_client.parse_cot_csv_sync", return_value=[_GOLD_ROW, {"market_name": "OTHER"}]):
-                    result = await client._fetch_year(2026, "GOLD - COMEX")
+                    result = await client._fetch_year(_THIS_YEAR, "GOLD - COMEX")
         assert result is not None
         assert len(result) == 1
         assert result[0]["market_name"] == "GOLD - COMEX"
@@ -704,7 +707,7 @@ class TestFetchYear:
     async def test_download_failure_returns_none(self, client):
         """Returns None when download fails."""
         with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=None):
-            result = await client._fetch_year(2026, "GOLD - COMEX")
+            result = await client._fetch_year(_THIS_YEAR, "GOLD - COMEX")
         assert result is None
 
     @pytest.mark.asyncio
@@ -712,7 +715,7 @@ class TestFetchYear:
         """Returns None when ZIP extraction fails."""
         with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=b"zipdata"):
             with patch("app.data.cot_client.extract_csv_from_zip_sync", return_value=None):
-                result = await client._fetch_year(2026, "GOLD - COMEX")
+                result = await client._fetch_year(_THIS_YEAR, "GOLD - COMEX")
         assert result is None
 
     @pytest.mark.asyncio
@@ -721,10 +724,98 @@ class TestFetchYear:
         with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=b"zipdata"):
             with patch("app.data.cot_client.extract_csv_from_zip_sync", return_value="csv"):
                 with patch("app.data.cot_client.parse_cot_csv_sync", return_value=[{"market_name": "OTHER"}]):
-                    result = await client._fetch_year(2026, "GOLD - COMEX")
+                    result = await client._fetch_year(_THIS_YEAR, "GOLD - COMEX")
         assert result is None
 
 
+# ===================================================================
+# 14b. Year archive and shared downloads
+# ===================================================================
+class TestYearArchive:
+    """Completed years are archived; live downloads are shared."""
+
+    @pytest.mark.asyncio
+    async def test_archived_year_is_local_read(self, client):
+        """An archived completed year never hits the network."""
+        with patch("app.data.cot_client.load_archived_year", new_callable=AsyncMock, return_value=[_CACHED_ROW]):
+            with patch.object(client, "_download_bytes", new_callable=AsyncMock) as mock_dl:
+                result = await client._fetch_year(2020, "GOLD - COMEX")
+        assert result == [_CACHED_ROW]
+        mock_dl.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_archived_year_without_market_returns_none(self, client):
+        with patch("app.data.cot_client.load_archived_year", new_callable=AsyncMock, return_value=[]):
+            with patch.object(client, "_download_bytes", new_callable=AsyncMock) as mock_dl:
+                assert await client._fetch_year(2020, "GOLD - COMEX") is None
+        mock_dl.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_completed_year_downloaded_once_and_archived(self, client):
+        """A missing completed year is parsed once for all markets and stored."""
+        silver = {**_GOLD_ROW, "market_name": "SILVER - COMEX"}
+        with patch("app.data.cot_client.load_archived_year", new_callable=AsyncMock, return_value=None):
+            with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=b"zip") as mock_dl:
+                with patch("app.data.cot_client.extract_csv_from_zip_sync", return_value="csv"):
+                    with patch("app.data.cot_client.parse_cot_csv_sync", return_value=[_GOLD_ROW, silver]):
+                        with patch("app.data.cot_client.archive_year", new_callable=AsyncMock) as mock_archive:
+                            gold, silv = await asyncio.gather(
+                                client._fetch_year(2020, "GOLD - COMEX"),
+                                client._fetch_year(2020, "SILVER - COMEX"),
+                            )
+        assert gold == [_GOLD_ROW] and silv == [silver]
+        mock_dl.assert_called_once()
+        mock_archive.assert_awaited_once_with(2020, [_GOLD_ROW, silver])
+
+    @pytest.mark.asyncio
+    async def test_current_year_not_archived(self, client):
+        with patch("app.data.cot_client.load_archived_year", new_callable=AsyncMock) as mock_load:
+            with patch.object(client, "_download_bytes", new_callable=AsyncMock, return_value=b"zip"):
+                with patch("app.data.cot_client.extract_csv_from_zip_sync", return_value="csv"):
+                    with patch("app.data.cot_client.parse_cot_csv_sync", return_value=[_GOLD_ROW]):
+                        with patch("app.data.cot_client.archive_year", new_callable=AsyncMock) as mock_archive:
+                            await client._fetch_year(_THIS_YEAR, "GOLD - COMEX")
+        mock_load.assert_not_called()
+        mock_archive.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_current_report_parsed_once_across_lookups(self, client):
+        with patch.object(client, "_download_text", new_callable=AsyncMock, return_value="csv") as mock_dl:
+            with patch("app.data.cot_client.parse_cot_csv_sync", return_value=[_GOLD_ROW]) as mock_parse:
+                first = await client._parsed_current_report()
+                second = await client._parsed_current_report()
+        assert first == second == [_GOLD_ROW]
+        mock_dl.assert_called_once()
+        mock_parse.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_years_fetched_concurrently(self, client):
+        """fetch_historical loads every year and the current report at once."""
+        active = 0
+        peak = 0
+
+        async def _slow_year(year, market_name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [_GOLD_ROW]
+
+        with patch("app.data.cot_client.get_cached_cot_data", new_callable=AsyncMock, side_effect=[None, _make_historical(10)]):
+            with patch.object(client, "_fetch_year", side_effect=_slow_year):
+                with patch.object(client, "_parsed_current_report", new_callable=AsyncMock, return_value=[]):
+                    with patch("app.data.cot_client.store_cot_rows", new_callable=AsyncMock):
+                        await client.fetch_historical("GOLD - COMEX", weeks=520)
+        assert peak == len(CotClient._years_for_weeks(_THIS_YEAR, 520))
+
+    def test_is_completed_year(self):
+        from app.data.cot_archive import is_completed_year
+        assert is_completed_year(2024, datetime(2025, 1, 20, tzinfo=timezone.utc))
+        assert not is_completed_year(2024, datetime(2025, 1, 5, tzinfo=timezone.utc))
+        assert not is_completed_year(2025, datetime(2025, 6, 1, tzinfo=timezone.utc))
+
+
 # ===================================================================
 # 15. Edge Cases
 # ===================================================================
@@ -36,6 +36,7 @@ from app.data.cot_helpers import (
     tag,
     _delta,
 )
+from app.data.write_behind import get_write_behind, reset_write_behind
 
 # ---------------------------------------------------------------------------
 # Sample CSV for parse_cot_csv_sync tests
@@ -459,6 +460,32 @@ class TestParseCotCsvSync:
         assert gold["speculative_change"] == 2000
 
 
+    def test_legacy_column_names(self):
+        """Spaced legacy column names are used when underscore names are absent."""
+        csv = (
+            "Market and Exchange Names,As of Date in Form YYMMDD,"
+            "Open Interest (All),Commercial Positions-Long (All),"
+            "Commercial Positions-Short (All)\n"
+            "GOLD - COMEX ,260204,500000,200000,250000\n"
+        )
+        gold = parse_cot_csv_sync(csv)[0]
+        assert gold["market_name"] == "GOLD - COMEX"
+        assert gold["commercial_net"] == -50000
+        assert gold["speculative_long"] == 0
+        assert gold["open_interest_change"] == 0
+
+    def test_missing_cells_default_to_zero(self):
+        csv = SAMPLE_COT_CSV.replace("GOLD - COMEX,260204,500000,", "GOLD - COMEX,260204,,")
+        gold = [r for r in parse_cot_csv_sync(csv) if r["market_name"] == "GOLD - COMEX"][0]
+        assert gold["open_interest"] == 0
+        assert isinstance(gold["commercial_long"], int)
+
+    def test_bad_date_rows_dropped(self):
+        csv = SAMPLE_COT_CSV.replace("SILVER - COMEX,260204", "SILVER - COMEX,notadate")
+        names = [r["market_name"] for r in parse_cot_csv_sync(csv)]
+        assert names == ["GOLD - COMEX"]
+
+
 # ===================================================================
 # 8. extract_csv_from_zip_sync
 # ===================================================================
@@ -957,9 +984,15 @@ class TestGetCachedCurrentReport:
 class TestStoreCotRows:
     """The store_cot_rows() async cache writer."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_write_behind(self):
+        reset_write_behind()
+        yield
+        reset_write_behind()
+
     @pytest.mark.asyncio
     async def test_stores_rows(self):
-        """Calls executemany with correct parameters."""
+        """Queues rows on the write-behind queue, flushed in one batch."""
         rows = [
             {"market_name": "GOLD - COMEX", "report_date": "2026-02-04",
              "commercial_long": 200000, "commercial_short": 250000,
@@ -968,21 +1001,21 @@ class TestStoreCotRows:
              "open_interest": 500000},
         ]
         mock_db = AsyncMock()
-        mock_db.executemany = AsyncMock()
-        with patch("app.data.cot_helpers.get_database", return_value=mock_db):
-            from app.data.cot_helpers import store_cot_rows
-            await store_cot_rows(rows)
-        mock_db.executemany.assert_called_once()
-        sql = mock_db.executemany.call_args[0][0]
+        from app.data.cot_helpers import store_cot_rows
+        await store_cot_rows(rows + rows)
+        with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mock_db):
+            await get_write_behind().flush()
+        mock_db.executemany.assert_not_called()
+        [(sql, params_seq)] = mock_db.execute_batch.call_args[0][0]
         assert "INSERT OR REPLACE" in sql
         assert "cot_data" in sql
+        # The duplicate (market_name, report_date) row coalesced.
+        assert len(params_seq) == 1
+        assert params_seq[0][:2] == ("GOLD - COMEX", "2026-02-04")
 
     @pytest.mark.asyncio
     async def test_empty_rows_no_op(self):
-        """Empty rows list does not call the database."""
-        mock_db = AsyncMock()
-        mock_db.executemany = AsyncMock()
-        with patch("app.data.cot_helpers.get_database", return_value=mock_db):
-            from app.data.cot_helpers import store_cot_rows
-            await store_cot_rows([])
-        mock_db.executemany.assert_not_called()
+        """Empty rows list queues nothing."""
+        from app.data.cot_helpers import store_cot_rows
+        await store_cot_rows([])
+        assert not get_write_behind().has_pending("cot_data")
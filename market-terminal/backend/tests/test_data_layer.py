@@ -9,14 +9,21 @@ Run with: ``cd market-terminal/backend && python -m pytest tests/test_data_layer
 """
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 
-from app.data.database import DatabaseManager, close_database, get_database
+from app.data.database import (
+    DatabaseManager,
+    _connection_pragmas,
+    close_database,
+    get_database,
+)
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -31,9 +38,17 @@ EXPECTED_TABLES = [
     "analysis_results",
     "macro_events",
     "macro_reactions",
+    "macro_reaction_stats",
     "ownership_cache",
     "insider_transactions",
     "cot_data",
+    "price_bars",
+    "price_bar_series",
+    "analysis_state",
+    "thirteenf_filings",
+    "thirteenf_positions",
+    "cot_archive_years",
+    "cot_history",
     "schema_version",
 ]
 
@@ -48,6 +63,7 @@ EXPECTED_INDEXES = [
     "idx_ownership_cache_symbol",
     "idx_insider_transactions_symbol",
     "idx_cot_data_market",
+    "idx_thirteenf_positions_ticker",
 ]
 
 # Expected columns per table (order matches schema.sql)
@@ -82,7 +98,8 @@ TABLE_COLUMNS = {
     "macro_reactions": [
         "id", "event_name", "event_date", "symbol",
         "reaction_1d", "reaction_5d", "surprise_direction",
-        "calculated_at",
+        "calculated_at", "event_value", "expected_value", "price_before",
+        "price_after_1d", "price_after_5d", "volume_ratio",
     ],
     "ownership_cache": [
         "id", "symbol", "holder_name", "shares", "value_usd",
@@ -342,16 +359,20 @@ class TestSchemaIdempotency:
         manager = DatabaseManager(db_path=db_path)
         await manager.initialize()
 
+        before = await manager.fetch_one(
+            "SELECT COUNT(*) as cnt FROM schema_version"
+        )
+
         # Manually run schema a second time
         schema_sql = SCHEMA_SQL.read_text(encoding="utf-8")
         assert manager._db is not None
         await manager._db.executescript(schema_sql)
 
-        # Verify schema_version still has exactly version 1
+        # Verify the version-1 row was not inserted again
         row = await manager.fetch_one(
             "SELECT COUNT(*) as cnt FROM schema_version"
         )
-        assert row["cnt"] == 1
+        assert row["cnt"] == before["cnt"]
         await manager.close()
 
     @pytest.mark.asyncio
@@ -561,10 +582,36 @@ class TestMigrations:
     """Tests for _migrate() and _get_schema_version()."""
 
     @pytest.mark.asyncio
-    async def test_schema_version_is_1_after_init(self, db: DatabaseManager):
-        """After initialization, schema version must be 1 (from schema.sql INSERT)."""
+    async def test_schema_version_after_init(self, db: DatabaseManager):
+        """After initialization, schema version is 1 (schema.sql INSERT) plus
+        every registered migration."""
+        from app.data import database as db_module
+
         version = await db._get_schema_version()
-        assert version == 1
+        assert version == max(db_module._MIGRATIONS, default=1)
+
+    @pytest.mark.asyncio
+    async def test_macro_reaction_columns_added_to_old_file(self, tmp_path: Path):
+        """Migration v2 adds the reaction detail columns to a pre-existing table."""
+        import sqlite3
+
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE macro_reactions ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, event_name TEXT NOT NULL, "
+            "event_date TEXT NOT NULL, symbol TEXT NOT NULL, reaction_1d REAL, "
+            "reaction_5d REAL, surprise_direction TEXT, "
+            "calculated_at TEXT NOT NULL DEFAULT (datetime('now')), "
+            "UNIQUE(event_name, event_date, symbol));"
+        )
+        conn.close()
+
+        manager = DatabaseManager(db_path=path)
+        await manager.initialize()
+        rows = await manager.fetch_all("PRAGMA table_info(macro_reactions)")
+        assert sorted(r["name"] for r in rows) == sorted(TABLE_COLUMNS["macro_reactions"])
+        await manager.close()
 
     @pytest.mark.asyncio
     async def test_schema_version_row_content(self, db: DatabaseManager):
@@ -736,3 +783,193 @@ class TestPathResolution:
             result = _resolve_db_path()
             assert result == abs_path
             assert result.is_absolute()
+
+
+# ===================================================================
+# 10. Read Pool, Group Commit & Pragmas
+# ===================================================================
+class TestReadPoolAndGroupCommit:
+    """Tests for the read-only pool, grouped commits and tuned pragmas."""
+
+    @pytest.mark.asyncio
+    async def test_read_pool_opened(self, db: DatabaseManager):
+        """initialize() must open the configured read-only connections."""
+        stats = db.get_stats()
+        assert stats["read_pool_size"] > 0
+        assert stats["read_pool_idle"] == stats["read_pool_size"]
+
+    @pytest.mark.asyncio
+    async def test_readers_are_read_only(self, db: DatabaseManager):
+        """Pool connections must reject writes."""
+        with pytest.raises(sqlite3.OperationalError):
+            await db._readers[0].execute(
+                "INSERT INTO watchlist (symbol) VALUES (?)", ("RO",)
+            )
+
+    @pytest.mark.asyncio
+    async def test_reads_see_committed_writes(self, db: DatabaseManager):
+        """A row written via execute() is visible to the next pooled read."""
+        await db.execute("INSERT INTO watchlist (symbol) VALUES (?)", ("SEEN",))
+        row = await db.fetch_one(
+            "SELECT symbol FROM watchlist WHERE symbol = ?", ("SEEN",)
+        )
+        assert row == {"symbol": "SEEN"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_commits(self, db: DatabaseManager):
+        """Writes landing together must be covered by fewer COMMITs."""
+        before = db.get_stats()["commits"]
+        await asyncio.gather(*(
+            db.execute("INSERT INTO watchlist (symbol) VALUES (?)", (f"G{i}",))
+            for i in range(20)
+        ))
+        assert db.get_stats()["commits"] - before < 20
+        row = await db.fetch_one(
+            "SELECT COUNT(*) AS cnt FROM watchlist WHERE symbol LIKE 'G%'"
+        )
+        assert row["cnt"] == 20
+
+    @pytest.mark.asyncio
+    async def test_reads_beyond_pool_size_wait(self, db: DatabaseManager):
+        """More concurrent reads than readers must queue, not fail."""
+        n = db.get_stats()["read_pool_size"] * 3
+        rows = await asyncio.gather(*(db.fetch_one("SELECT 1 AS one") for _ in range(n)))
+        assert rows == [{"one": 1}] * n
+        stats = db.get_stats()
+        assert stats["pool_wait"]["count"] >= n
+        assert stats["reads"]["count"] >= n
+        assert stats["read_pool_idle"] == stats["read_pool_size"]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_commits_once(self, db: DatabaseManager):
+        """execute_batch() runs every group under a single COMMIT."""
+        before = db.get_stats()["commits"]
+        await db.execute_batch([
+            ("INSERT INTO watchlist (symbol) VALUES (?)", [("B1",), ("B2",)]),
+            ("INSERT INTO watchlist (symbol, group_name) VALUES (?, ?)", [("B3", "x")]),
+        ])
+        assert db.get_stats()["commits"] - before == 1
+        row = await db.fetch_one(
+            "SELECT COUNT(*) AS cnt FROM watchlist WHERE symbol LIKE 'B%'"
+        )
+        assert row["cnt"] == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_keeps_good_groups(self, db: DatabaseManager):
+        """A failing group is reported while the other groups are committed."""
+        errors = await db.execute_batch([
+            ("INSERT INTO no_such_table (x) VALUES (?)", [(1,)]),
+            ("INSERT INTO watchlist (symbol) VALUES (?)", [("KEPT",)]),
+        ])
+        assert isinstance(errors[0], sqlite3.OperationalError)
+        assert errors[1] is None
+        row = await db.fetch_one(
+            "SELECT symbol FROM watchlist WHERE symbol = ?", ("KEPT",)
+        )
+        assert row == {"symbol": "KEPT"}
+
+    @pytest.mark.asyncio
+    async def test_pragmas_applied(self, db: DatabaseManager):
+        """synchronous=NORMAL and temp_store=MEMORY must be set on readers."""
+        sync = await db.fetch_one("PRAGMA synchronous")
+        temp = await db.fetch_one("PRAGMA temp_store")
+        assert sync["synchronous"] == 1  # NORMAL
+        assert temp["temp_store"] == 2  # MEMORY
+
+    @pytest.mark.asyncio
+    async def test_close_closes_pool(self, tmp_path: Path):
+        """close() must release every pooled reader."""
+        manager = DatabaseManager(db_path=tmp_path / "pool_close.db")
+        await manager.initialize()
+        await manager.close()
+        assert manager.get_stats()["read_pool_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_stops_reader_threads(self, tmp_path: Path):
+        """close() must close idle readers so no connection thread outlives it."""
+        manager = DatabaseManager(db_path=tmp_path / "pool_threads.db")
+        await manager.initialize()
+        conns = [manager._db, *manager._readers]
+        await manager.fetch_one("SELECT 1")
+        await manager.close()
+        for conn in conns:
+            conn._thread.join(timeout=5)
+            assert not conn._thread.is_alive()
+
+    @pytest.mark.asyncio
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    async def test_close_survives_dead_writer_thread(self, tmp_path: Path):
+        """A writer whose worker died on a closed loop must not hang close()."""
+        manager = DatabaseManager(db_path=tmp_path / "dead_writer.db")
+        await manager.initialize()
+        writer = manager._db
+        gone = asyncio.new_event_loop()
+        orphan = gone.create_future()
+        gone.close()
+        writer._tx.put_nowait((orphan, lambda: None))
+        writer._thread.join(timeout=5)
+        assert not writer._thread.is_alive()
+
+        await asyncio.wait_for(manager.close(), timeout=5)
+        assert manager.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_close_commits_write_inside_window(self, tmp_path: Path):
+        """close() cancels the window timer but still commits pending writes."""
+        path = tmp_path / "close_window.db"
+        manager = DatabaseManager(db_path=path)
+        await manager.initialize()
+        manager._commit_window_s = 60.0
+        write = asyncio.ensure_future(
+            manager.execute("INSERT INTO watchlist (symbol) VALUES (?)", ("LATE",))
+        )
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(manager.close(), timeout=5)
+        await asyncio.wait_for(write, timeout=5)
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM watchlist WHERE symbol = 'LATE'"
+            ).fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    @pytest.mark.asyncio
+    async def test_foreign_loop_calls_after_owner_write(self, db: DatabaseManager):
+        """A worker thread's own loop can write and read while an owner commit is open."""
+        db._commit_window_s = 0.2
+        main = asyncio.ensure_future(
+            db.execute("INSERT INTO watchlist (symbol) VALUES (?)", ("MAIN",))
+        )
+        await asyncio.sleep(0.01)
+        assert db._pending_commit is not None
+
+        async def _worker() -> dict | None:
+            await db.executemany(
+                "INSERT INTO watchlist (symbol) VALUES (?)", [("W1",), ("W2",)]
+            )
+            return await db.fetch_one(
+                "SELECT COUNT(*) AS cnt FROM watchlist "
+                "WHERE symbol IN ('MAIN', 'W1', 'W2')"
+            )
+
+        row = await asyncio.to_thread(asyncio.run, _worker())
+        await main
+        assert row == {"cnt": 3}
+        stats = db.get_stats()
+        assert stats["read_pool_idle"] == stats["read_pool_size"]
+
+    def test_invalid_pragma_values_fall_back(self):
+        """Unknown modes must never be interpolated into PRAGMA SQL."""
+        pragmas = _connection_pragmas(SimpleNamespace(
+            database_synchronous="NORMAL; DROP TABLE watchlist",
+            database_temp_store="bogus",
+            database_mmap_size=-1,
+            database_cache_size_kib=2048,
+        ))
+        assert pragmas == [
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA mmap_size=0",
+            "PRAGMA cache_size=-2048",
+            "PRAGMA temp_store=MEMORY",
+        ]
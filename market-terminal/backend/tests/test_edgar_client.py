@@ -24,15 +24,14 @@ import app.data.edgar_client as mod
 from app.data.edgar_client import (
     EdgarClient,
     _extract_value,
-    _get_edgar_rate_lock,
     _safe_div,
     _safe_growth,
     _tag,
     _wait_for_edgar_rate_limit,
-    _EDGAR_MAX_CALLS_PER_SECOND,
     close_edgar_client,
     get_edgar_client,
 )
+from app.data.rate_limiter import get_rate_limiter, reset_rate_limiters
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -42,12 +41,10 @@ from app.data.edgar_client import (
 def _reset_singleton():
     """Reset module-level singleton and rate limiter between tests."""
     mod._client = None
-    mod._edgar_call_timestamps.clear()
-    mod._edgar_rate_lock = None
+    reset_rate_limiters()
     yield
     mod._client = None
-    mod._edgar_call_timestamps.clear()
-    mod._edgar_rate_lock = None
+    reset_rate_limiters()
 
 
 @pytest.fixture
@@ -462,45 +459,38 @@ class TestPureHelpers:
 # 2. Rate Limiter
 # ===================================================================
 class TestRateLimiter:
-    """Tests for module-level rate limiter functions."""
+    """Tests for the shared EDGAR rate limit."""
 
-    def test_rate_limit_constant_is_10(self):
-        """_EDGAR_MAX_CALLS_PER_SECOND is 10."""
-        assert _EDGAR_MAX_CALLS_PER_SECOND == 10
+    def test_rate_limit_budget_is_10_per_second(self):
+        """The EDGAR budget is 10 calls per second (SEC fair-access)."""
+        limiter = get_rate_limiter("edgar")
+        assert (limiter.calls, limiter.period) == (10, 1.0)
 
-    def test_lock_created_lazily(self):
-        """_get_edgar_rate_lock creates a new Lock on first call."""
-        assert mod._edgar_rate_lock is None
-        lock = _get_edgar_rate_lock()
-        assert isinstance(lock, asyncio.Lock)
-        assert mod._edgar_rate_lock is lock
-
-    def test_lock_returns_same_instance(self):
-        """_get_edgar_rate_lock returns the same Lock on repeated calls."""
-        lock1 = _get_edgar_rate_lock()
-        lock2 = _get_edgar_rate_lock()
-        assert lock1 is lock2
+    def test_limiter_is_shared(self):
+        """Every caller draws from the same EDGAR limiter."""
+        assert get_rate_limiter("edgar") is get_rate_limiter("edgar")
 
     @pytest.mark.asyncio
     async def test_single_call_goes_through(self):
         """A single call proceeds without waiting."""
-        # Should not raise or block
         await _wait_for_edgar_rate_limit()
-        assert len(mod._edgar_call_timestamps) == 1
+        assert get_rate_limiter("edgar").available == 9
 
     @pytest.mark.asyncio
     async def test_multiple_calls_within_limit(self):
         """Multiple calls within the limit all proceed."""
         for _ in range(5):
             await _wait_for_edgar_rate_limit()
-        assert len(mod._edgar_call_timestamps) == 5
+        assert get_rate_limiter("edgar").available == 5
 
     @pytest.mark.asyncio
-    async def test_timestamps_deque_records_calls(self):
-        """Each call appends a timestamp to the deque."""
-        await _wait_for_edgar_rate_limit()
+    async def test_11th_call_waits_for_window(self):
+        """The 11th call within a second queues until a token returns."""
+        for _ in range(10):
+            await _wait_for_edgar_rate_limit()
+        start = time.monotonic()
         await _wait_for_edgar_rate_limit()
-        assert len(mod._edgar_call_timestamps) == 2
+        assert time.monotonic() - start > 0.5
 
 
 # ===================================================================
@@ -30,6 +30,7 @@ from app.data.edgar_ownership_helpers import (
     EFTS_URL,
     HOLDER_CACHE_TTL,
     INSIDER_CACHE_TTL,
+    MAX_13F_CONCURRENCY,
     MAX_EFTS_RESULTS,
     MAX_FILINGS_PER_SEARCH,
     TX_CODE_MAP,
@@ -37,9 +38,13 @@ from app.data.edgar_ownership_helpers import (
     build_insider_response,
     get_cached_holders,
     get_cached_insiders,
+    get_parsed_13f_holdings,
+    match_13f_position,
     now_iso,
+    parse_13f_table,
     parse_form4_sync,
     quarter_start,
+    store_13f_table,
     store_holders,
     store_insiders,
     tag,
@@ -47,6 +52,7 @@ from app.data.edgar_ownership_helpers import (
     _extract_shares,
     _extract_value,
 )
+from app.data.write_behind import get_write_behind, reset_write_behind
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -56,8 +62,10 @@ from app.data.edgar_ownership_helpers import (
 def _reset_singleton():
     """Reset module-level singleton between tests."""
     mod._client = None
+    reset_write_behind()
     yield
     mod._client = None
+    reset_write_behind()
 
 
 @pytest.fixture
@@ -161,7 +169,7 @@ def _make_holdings_df(
     return pd.DataFrame({
         "Issuer": [f"Company {t}" for t in tickers],
         "Class": ["COM"] * len(tickers),
-        "Cusip": ["000000000"] * len(tickers),
+        "Cusip": [f"{i:09d}" for i in range(len(tickers))],
         "Ticker": tickers,
         "SharesPrnAmount": shares,
         "Value": values,
@@ -396,25 +404,38 @@ class TestCacheHelpers:
         assert call_args[1][0] == "AAPL"
 
     @pytest.mark.asyncio
-    async def test_store_holders_calls_executemany(self, mock_db):
-        """store_holders calls executemany with correct SQL."""
+    async def test_store_holders_queues_write_behind(self, mock_db):
+        """store_holders queues the upsert; the flush writes it in one batch."""
         holders = [
             {"holder_name": "Big Fund", "shares": 1000, "value_usd": 150000,
              "filing_date": "2025-01-10", "report_period": "2024-12-31"},
         ]
-        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
-            await store_holders("AAPL", holders)
-        mock_db.executemany.assert_called_once()
-        sql = mock_db.executemany.call_args[0][0]
+        await store_holders("AAPL", holders)
+        assert get_write_behind().has_pending("ownership_cache")
+        with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mock_db):
+            await get_write_behind().flush()
+        mock_db.executemany.assert_not_called()
+        mock_db.execute_batch.assert_called_once()
+        [(sql, params_seq)] = mock_db.execute_batch.call_args[0][0]
         assert "INSERT OR REPLACE" in sql
         assert "ownership_cache" in sql
+        assert params_seq[0][:2] == ("AAPL", "Big Fund")
 
     @pytest.mark.asyncio
     async def test_store_holders_handles_empty_list(self, mock_db):
         """store_holders does nothing when holders list is empty."""
-        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
-            await store_holders("AAPL", [])
-        mock_db.executemany.assert_not_called()
+        await store_holders("AAPL", [])
+        assert not get_write_behind().has_pending("ownership_cache")
+
+    @pytest.mark.asyncio
+    async def test_get_cached_holders_settles_queued_rows(self, mock_db):
+        """Queued holders are flushed before the cache is read."""
+        await store_holders("AAPL", [{"holder_name": "Big Fund", "report_period": "2024-12-31"}])
+        with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mock_db), \
+                patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
+            await get_cached_holders("AAPL")
+        mock_db.execute_batch.assert_called_once()
+        assert not get_write_behind().has_pending("ownership_cache")
 
     @pytest.mark.asyncio
     async def test_get_cached_insiders_returns_list_on_hit(self, mock_db):
@@ -451,8 +472,8 @@ class TestCacheHelpers:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_store_insiders_calls_executemany(self, mock_db):
-        """store_insiders calls executemany with correct SQL."""
+    async def test_store_insiders_queues_write_behind(self, mock_db):
+        """store_insiders queues the upsert; the flush writes it in one batch."""
         transactions = [
             {"insider_name": "Jane CEO", "insider_title": "CEO",
              "transaction_type": "buy", "shares": 500,
@@ -460,19 +481,20 @@ class TestCacheHelpers:
              "shares_owned_after": 10000,
              "transaction_date": "2025-01-10", "filing_date": "2025-01-12"},
         ]
-        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
-            await store_insiders("AAPL", transactions)
-        mock_db.executemany.assert_called_once()
-        sql = mock_db.executemany.call_args[0][0]
+        await store_insiders("AAPL", transactions)
+        with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mock_db):
+            await get_write_behind().flush()
+        mock_db.executemany.assert_not_called()
+        [(sql, params_seq)] = mock_db.execute_batch.call_args[0][0]
         assert "INSERT OR REPLACE" in sql
         assert "insider_transactions" in sql
+        assert len(params_seq) == 1
 
     @pytest.mark.asyncio
     async def test_store_insiders_handles_empty_list(self, mock_db):
         """store_insiders does nothing when transactions list is empty."""
-        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
-            await store_insiders("AAPL", [])
-        mock_db.executemany.assert_not_called()
+        await store_insiders("AAPL", [])
+        assert not get_write_behind().has_pending("insider_transactions")
 
     @pytest.mark.asyncio
     async def test_get_cached_holders_handles_naive_datetime(self, mock_db):
@@ -1026,6 +1048,11 @@ class TestSearchEfts:
 class TestParse13fHolding:
     """Tests for EdgarOwnershipClient._parse_13f_holding."""
 
+    @pytest.fixture(autouse=True)
+    def _no_table_cache(self):
+        with patch("app.data.edgar_ownership.store_13f_table", new_callable=AsyncMock) as store:
+            yield store
+
     @pytest.mark.asyncio
     async def test_returns_holding_dict_on_success(self, client):
         """_parse_13f_holding returns dict with holder_name, shares, value_usd."""
@@ -1177,6 +1204,11 @@ class TestParse13fHolding:
 class TestGetInstitutionalHolders:
     """Tests for EdgarOwnershipClient.get_institutional_holders."""
 
+    @pytest.fixture(autouse=True)
+    def _no_table_cache(self):
+        with patch("app.data.edgar_ownership.get_parsed_13f_holdings", new_callable=AsyncMock, return_value={}):
+            yield
+
     @pytest.mark.asyncio
     async def test_returns_cached_data_with_cached_flag(self, client, mock_db):
         """get_institutional_holders returns cached data with _cached=True on cache hit."""
@@ -1333,6 +1365,181 @@ class TestGetInstitutionalHolders:
         assert parse_count == 2
 
 
+# ===================================================================
+# 9b. 13F information table cache and concurrent parsing
+# ===================================================================
+class Test13fTableCache:
+    """Per-accession 13F table parsing, persistence and fan-out."""
+
+    def _hit(self, n: int) -> dict:
+        return {"institution_name": f"Fund {n}", "cik": 1000 + n,
+                "filing_date": "2025-01-10", "accession_no": f"acc-{n}",
+                "report_period": "2024-12-31"}
+
+    def test_parse_13f_table_one_position_per_cusip(self):
+        df = pd.DataFrame({
+            "Cusip": ["037833100", "037833100", "594918104", None],
+            "Ticker": ["aapl", "AAPL", "MSFT", "XYZ"],
+            "SharesPrnAmount": [100, 999, 50, 7],
+            "Value": [1000.0, 9990.0, float("nan"), 70.0],
+        })
+        positions = parse_13f_table(df)
+        assert [p["cusip"] for p in positions] == ["037833100", "594918104", "TICKER:XYZ"]
+        assert positions[0] == {"cusip": "037833100", "ticker": "AAPL",
+                                "shares": 100, "value_usd": 1000.0}
+        assert positions[1]["value_usd"] is None
+
+    def test_parse_13f_table_handles_empty(self):
+        assert parse_13f_table(pd.DataFrame()) == []
+        assert parse_13f_table(None) == []
+
+    def test_match_13f_position_uses_aliases(self):
+        positions = [{"cusip": "30303M102", "ticker": "FB", "shares": 5, "value_usd": 1.0}]
+        assert match_13f_position(positions, "meta")["shares"] == 5
+        assert match_13f_position(positions, "AAPL") is None
+
+    @pytest.mark.asyncio
+    async def test_get_parsed_13f_holdings_marks_parsed_accessions(self, mock_db):
+        mock_db.fetch_all = AsyncMock(side_effect=[
+            [{"accession_no": "acc-1", "holder_name": "Fund 1",
+              "filing_date": "2025-01-10", "report_period": "2024-12-31"},
+             {"accession_no": "acc-2", "holder_name": "Fund 2",
+              "filing_date": "2025-01-11", "report_period": "2024-12-31"}],
+            [{"accession_no": "acc-1", "ticker": "AAPL", "shares": 10, "value_usd": 99.0}],
+        ])
+        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
+            result = await get_parsed_13f_holdings(["acc-1", "acc-2", "acc-3"], "aapl")
+
+        assert set(result) == {"acc-1", "acc-2"}
+        assert result["acc-1"] == {"holder_name": "Fund 1", "shares": 10, "value_usd": 99.0,
+                                   "report_period": "2024-12-31", "filing_date": "2025-01-10"}
+        assert result["acc-2"] is None
+        assert mock_db.fetch_all.call_args_list[1][0][1] == ("acc-1", "acc-2", "acc-3", "AAPL")
+
+    @pytest.mark.asyncio
+    async def test_get_parsed_13f_holdings_empty_input_skips_db(self, mock_db):
+        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
+            assert await get_parsed_13f_holdings([], "AAPL") == {}
+        mock_db.fetch_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_13f_table_writes_positions_before_marker(self, mock_db):
+        positions = [{"cusip": "037833100", "ticker": "AAPL", "shares": 1, "value_usd": 2.0}]
+        with patch("app.data.edgar_ownership_helpers.get_database", return_value=mock_db):
+            await store_13f_table("acc-1", 1001, "Fund 1", "2025-01-10", "2024-12-31", positions)
+
+        mock_db.executemany.assert_called_once()
+        assert mock_db.executemany.call_args[0][1] == [("acc-1", "037833100", "AAPL", 1, 2.0)]
+        assert "thirteenf_filings" in mock_db.execute.call_args_list[-1][0][0]
+
+    @pytest.mark.asyncio
+    async def test_parsed_filing_is_persisted_whole(self, client):
+        """One download stores every position, not just the requested ticker."""
+        mock_obj = MagicMock()
+        mock_obj.holdings = _make_holdings_df(
+            tickers=["AAPL", "MSFT", "NVDA"],
+            shares=[1000000, 500000, 250000],
+            values=[250000000, 200000000, 150000000],
+        )
+        mock_obj.report_period = "2024-12-31"
+        mock_edgar_mod = MagicMock()
+        mock_edgar_mod.Filing.return_value.obj.return_value = mock_obj
+
+        with patch("app.data.edgar_ownership._wait_for_edgar_rate_limit", new_callable=AsyncMock):
+            with patch("app.data.edgar_ownership.store_13f_table", new_callable=AsyncMock) as mock_store:
+                with patch.dict("sys.modules", {"edgar": mock_edgar_mod}):
+                    result = await client._parse_13f_holding(
+                        cik=1001, company_name="Fund 1", form="13F-HR",
+                        filing_date="2025-01-10", accession_no="acc-1",
+                        target_ticker="MSFT",
+                    )
+
+        assert result["shares"] == 500000
+        stored = mock_store.call_args[0]
+        assert stored[:5] == ("acc-1", 1001, "Fund 1", "2025-01-10", "2024-12-31")
+        assert [p["ticker"] for p in stored[5]] == ["AAPL", "MSFT", "NVDA"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_download(self, client):
+        """Lookups for two tickers in the same filing download it once."""
+        calls = 0
+
+        async def _load(*args):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "2024-12-31", parse_13f_table(_make_holdings_df())
+
+        with patch.object(client, "_load_13f_table", side_effect=_load):
+            aapl, msft = await asyncio.gather(
+                client._parse_13f_holding(1001, "Fund 1", "13F-HR", "2025-01-10", "acc-1", "AAPL"),
+                client._parse_13f_holding(1001, "Fund 1", "13F-HR", "2025-01-10", "acc-1", "MSFT"),
+            )
+
+        assert calls == 1
+        assert (aapl["shares"], msft["shares"]) == (1000000, 500000)
+        assert client._inflight_13f == {}
+
+    @pytest.mark.asyncio
+    async def test_parsed_accessions_are_not_downloaded(self, client):
+        hits = [self._hit(1), self._hit(2), self._hit(3)]
+        local = {
+            "acc-1": {"holder_name": "Fund 1", "shares": 10, "value_usd": 1.0,
+                      "report_period": "2024-12-31", "filing_date": "2025-01-10"},
+            "acc-2": None,
+        }
+        fresh = {"holder_name": "Fund 3", "shares": 30, "value_usd": 3.0,
+                 "report_period": "2024-12-31", "filing_date": "2025-01-10"}
+
+        with patch("app.data.edgar_ownership.get_cached_holders", new_callable=AsyncMock, return_value=None):
+            with patch.object(client, "_search_efts", new_callable=AsyncMock, return_value=hits):
+                with patch("app.data.edgar_ownership.get_parsed_13f_holdings", new_callable=AsyncMock, return_value=local):
+                    with patch.object(client, "_parse_13f_holding", new_callable=AsyncMock, return_value=fresh) as mock_parse:
+                        with patch("app.data.edgar_ownership.store_holders", new_callable=AsyncMock):
+                            result = await client.get_institutional_holders("AAPL")
+
+        assert mock_parse.call_count == 1
+        assert mock_parse.call_args.kwargs["accession_no"] == "acc-3"
+        assert {h["holder_name"] for h in result["holders"]} == {"Fund 1", "Fund 3"}
+
+    @pytest.mark.asyncio
+    async def test_filings_parsed_concurrently_with_bound(self, client):
+        hits = [self._hit(n) for n in range(12)]
+        active = peak = 0
+
+        async def _parse(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"holder_name": kwargs["company_name"], "shares": 1, "value_usd": 1.0,
+                    "report_period": "2024-12-31", "filing_date": "2025-01-10"}
+
+        with patch("app.data.edgar_ownership.get_cached_holders", new_callable=AsyncMock, return_value=None):
+            with patch.object(client, "_search_efts", new_callable=AsyncMock, return_value=hits):
+                with patch("app.data.edgar_ownership.get_parsed_13f_holdings", new_callable=AsyncMock, return_value={}):
+                    with patch.object(client, "_parse_13f_holding", side_effect=_parse):
+                        with patch("app.data.edgar_ownership.store_holders", new_callable=AsyncMock):
+                            result = await client.get_institutional_holders("AAPL")
+
+        assert result["num_holders"] == 12
+        assert 1 < peak <= MAX_13F_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_table_cache_read_failure_falls_back_to_parsing(self, client):
+        holding = {"holder_name": "Fund 1", "shares": 1, "value_usd": 1.0,
+                   "report_period": "2024-12-31", "filing_date": "2025-01-10"}
+        with patch("app.data.edgar_ownership.get_cached_holders", new_callable=AsyncMock, return_value=None):
+            with patch.object(client, "_search_efts", new_callable=AsyncMock, return_value=[self._hit(1)]):
+                with patch("app.data.edgar_ownership.get_parsed_13f_holdings", new_callable=AsyncMock, side_effect=Exception("db")):
+                    with patch.object(client, "_parse_13f_holding", new_callable=AsyncMock, return_value=holding):
+                        with patch("app.data.edgar_ownership.store_holders", new_callable=AsyncMock):
+                            result = await client.get_institutional_holders("AAPL")
+
+        assert result["num_holders"] == 1
+
+
 # ===================================================================
 # 10. get_top_holders
 # ===================================================================
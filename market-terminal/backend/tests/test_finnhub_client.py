@@ -23,11 +23,26 @@ from app.data.finnhub_client import (
     close_finnhub_client,
     get_finnhub_client,
 )
+from app.data.rate_limiter import (
+    Priority,
+    RateLimiter,
+    get_rate_limiter,
+    request_priority,
+    reset_rate_limiters,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _reset_rate_limiters():
+    """Give every test a fresh shared Finnhub budget."""
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
 @pytest.fixture
 def mock_settings():
     """Settings with a valid test API key and default circuit breaker config."""
@@ -200,7 +215,7 @@ class TestDisabledMode:
 # 3. Rate Limiter
 # ===================================================================
 class TestRateLimiter:
-    """Sliding-window rate limiter enforcing 60 requests per minute."""
+    """Shared rate-limit scheduler enforcing 60 requests per minute."""
 
     @pytest.mark.asyncio
     async def test_first_request_goes_through(self, client):
@@ -233,37 +248,33 @@ class TestRateLimiter:
             assert client.calls_remaining == 58
 
     @pytest.mark.asyncio
-    async def test_rate_limiter_uses_asyncio_lock(self, client):
-        """The rate limiter uses an asyncio.Lock for concurrency safety."""
-        assert isinstance(client._rate_lock, asyncio.Lock)
+    async def test_uses_shared_finnhub_limiter(self, client):
+        """Requests draw from the shared "finnhub" scheduler budget."""
+        limiter = get_rate_limiter("finnhub")
+        assert isinstance(limiter, RateLimiter)
+        assert limiter.calls == 60 and limiter.period == 60.0
+        await client._wait_for_rate_limit()
+        assert limiter.available == 59
 
     @pytest.mark.asyncio
     async def test_old_calls_expire_after_60_seconds(self, client):
-        """After 60 seconds, old call timestamps expire and slots reopen."""
-        # Fill up the call timestamps 61 seconds in the past
-        now = time.monotonic()
-        client._call_timestamps = deque([now - 61] * 60)
-
-        # All old calls should be expired, so calls_remaining should be 60
+        """After 60 seconds, spent tokens return and slots reopen."""
+        limiter = get_rate_limiter("finnhub")
+        limiter._spent = deque([time.monotonic() - 61] * 60)
         assert client.calls_remaining == 60
 
     @pytest.mark.asyncio
-    async def test_61st_request_blocks_until_window_slides(self, client):
-        """The 61st request causes a sleep until the window slides."""
-        mock_resp = _make_response({"c": 150.0, "d": 1.0, "dp": 0.67, "h": 151.0,
-                                    "l": 149.0, "o": 149.5, "pc": 148.5, "t": 1700000000})
-
-        # Pre-fill 60 timestamps at the "current" time
-        now = time.monotonic()
-        client._call_timestamps = deque([now] * 60)
+    async def test_61st_request_waits_for_window(self, client):
+        """The 61st request queues until a token returns."""
+        limiter = get_rate_limiter("finnhub")
+        limiter._spent = deque([time.monotonic()] * 60)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._wait_for_rate_limit(), timeout=0.05)
 
-        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=mock_resp):
-            with patch("app.data.finnhub_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                await client.get_quote("AAPL")
-                # asyncio.sleep should have been called with a positive wait time
-                mock_sleep.assert_called_once()
-                wait_time = mock_sleep.call_args[0][0]
-                assert wait_time > 0
+    def test_background_calls_remaining_excludes_reserve(self, client):
+        """Background work cannot spend the interactive reserve."""
+        with request_priority(Priority.BACKGROUND):
+            assert client.calls_remaining == 60 - get_rate_limiter("finnhub").reserve
 
 
 # ===================================================================
@@ -10,12 +10,13 @@ import asyncio
 import httpx
 from httpx import Response
 from app.data.forex_calendar_client import get_forex_calendar_client, CircuitBreakerState
+from app.data.rate_limiter import get_rate_limiter, reset_rate_limiters
 
 @pytest.fixture(autouse=True)
 def reset_client_singletons():
     # Make sure we start with a fresh client each test
     client = get_forex_calendar_client()
-    client._ff_rate_limiter.clear()
+    reset_rate_limiters()
     client._ff_cb_failures.clear()
     client._ff_cb_state = CircuitBreakerState.CLOSED
     client._jb_cb_failures.clear()
@@ -41,7 +42,7 @@ async def test_ff_rate_limiter():
     assert await client._check_ff_rate_limit() is False
     
     # Fake time passing
-    client._ff_rate_limiter[0] -= 400
+    get_rate_limiter("forex_factory")._spent[0] -= 400
     assert await client._check_ff_rate_limit() is True
 
 @pytest.mark.asyncio
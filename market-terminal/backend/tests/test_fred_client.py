@@ -31,6 +31,7 @@ from app.data.fred_client import (
     close_fred_client,
     get_fred_client,
 )
+from app.data.rate_limiter import get_rate_limiter, reset_rate_limiters
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -48,10 +49,12 @@ def _make_series(dates: list[str], values: list[float]) -> pd.Series:
 
 @pytest.fixture(autouse=True)
 def _reset_singleton():
-    """Reset module-level singleton before and after each test."""
+    """Reset module-level singleton and shared rate limiters around each test."""
     mod._client = None
+    reset_rate_limiters()
     yield
     mod._client = None
+    reset_rate_limiters()
 
 
 @pytest.fixture
@@ -229,56 +232,38 @@ class TestInit:
         assert client._cache_ttl_fundamentals == mock_settings.cache_ttl_fundamentals
         assert client._cache_ttl_macro == mock_settings.cache_ttl_macro
 
-    def test_rate_deque_starts_empty(self, client):
-        """Rate limiter timestamp deque starts empty."""
-        assert len(client._rate_timestamps) == 0
-
-    def test_rate_lock_is_asyncio_lock(self, client):
-        """Rate limiter uses an asyncio.Lock."""
-        assert isinstance(client._rate_lock, asyncio.Lock)
+    def test_rate_budget_starts_full(self, client):
+        """The shared FRED rate budget starts with every token available."""
+        assert get_rate_limiter("fred").available == 120
 
 
 # ===================================================================
 # 4. Rate Limiter
 # ===================================================================
 class TestRateLimiter:
-    """Sliding-window rate limiter (120 req/min)."""
+    """Shared rate-limit scheduler (120 req/min)."""
 
     @pytest.mark.asyncio
     async def test_allows_requests_under_limit(self, client):
         """Multiple requests under the limit proceed without blocking."""
         for _ in range(5):
             await client._wait_for_rate_limit()
-        assert len(client._rate_timestamps) == 5
-
-    @pytest.mark.asyncio
-    async def test_blocks_when_at_capacity(self, client):
-        """When at 120/min capacity, the next request triggers asyncio.sleep."""
-        now = time.monotonic()
-        client._rate_timestamps = deque([now] * 120)
-
-        with patch("app.data.fred_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await client._wait_for_rate_limit()
-            mock_sleep.assert_called_once()
-            wait_time = mock_sleep.call_args[0][0]
-            assert wait_time > 0
+        assert get_rate_limiter("fred").available == 115
 
     @pytest.mark.asyncio
-    async def test_prunes_old_timestamps(self, client):
-        """Timestamps older than 60 seconds are pruned from the deque."""
-        now = time.monotonic()
-        # Fill with old timestamps (61 seconds ago)
-        client._rate_timestamps = deque([now - 61] * 50)
-        await client._wait_for_rate_limit()
-        # Old ones pruned, only the new one remains
-        assert len(client._rate_timestamps) == 1
+    async def test_waits_when_at_capacity(self, client):
+        """When at 120/min capacity, the next request queues."""
+        get_rate_limiter("fred")._spent = deque([time.monotonic()] * 120)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._wait_for_rate_limit(), timeout=0.05)
 
     @pytest.mark.asyncio
-    async def test_first_request_goes_through(self, client):
-        """The very first request proceeds immediately."""
-        assert len(client._rate_timestamps) == 0
+    async def test_expired_tokens_return(self, client):
+        """Tokens spent more than 60 seconds ago are available again."""
+        limiter = get_rate_limiter("fred")
+        limiter._spent = deque([time.monotonic() - 61] * 50)
         await client._wait_for_rate_limit()
-        assert len(client._rate_timestamps) == 1
+        assert limiter.available == 119
 
 
 # ===================================================================
@@ -1049,14 +1034,13 @@ class TestEdgeCases:
 
     @pytest.mark.asyncio
     async def test_rate_limiter_uses_sliding_window(self, client):
-        """Verifies the rate limiter uses a 60-second sliding window."""
+        """Verifies the rate limiter uses a 60-second window."""
         now = time.monotonic()
-        # 119 recent + 1 old
-        client._rate_timestamps = deque([now - 61] + [now] * 119)
-        # The old one should be pruned, leaving 119 + 1 new = 120
+        limiter = get_rate_limiter("fred")
+        # 119 recent + 1 old: the old token has returned
+        limiter._spent = deque([now - 61] + [now] * 119)
         await client._wait_for_rate_limit()
-        # All old ones pruned, 119 recent + 1 new = 120
-        assert len(client._rate_timestamps) == 120
+        assert limiter.available == 0
 
     def test_now_iso_returns_valid_iso_string(self):
         """_now_iso returns a valid ISO-8601 string."""
@@ -1070,5 +1054,6 @@ class TestEdgeCases:
 
     @pytest.mark.asyncio
     async def test_max_calls_per_minute_constant(self, client):
-        """_max_per_min defaults to 120."""
-        assert client._max_per_min == 120
+        """The FRED budget defaults to 120 calls per minute."""
+        limiter = get_rate_limiter("fred")
+        assert (limiter.calls, limiter.period) == (120, 60.0)
@@ -0,0 +1,211 @@
+"""Tests for the fundamentals service fetch plan.
+
+Validates that independent EDGAR/Finnhub sources are fetched concurrently,
+that the yfinance supplements only run when the primary sources leave
+gaps (or ownership is requested), and that per-source timings are
+reported in the response metadata.
+
+ALL upstream clients are mocked -- no network requests are made.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_fundamentals_service.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.data.fundamentals_service import _needs_yf_info, get_fundamentals_data
+
+_DELAY = 0.05
+
+
+def _income(quarters: int = 12) -> list[dict]:
+    return [
+        {"period": f"2024-Q{q}", "revenue": 1000.0 + q, "net_income": 100.0,
+         "eps_diluted": 1.0, "gross_margin": 0.4, "operating_margin": 0.2,
+         "net_margin": 0.1}
+        for q in range(quarters)
+    ]
+
+
+def _balance() -> list[dict]:
+    return [{"total_equity": 5000.0, "debt_to_equity": 0.5, "shares_outstanding": 100}]
+
+
+def _cash_flow() -> list[dict]:
+    return [{"free_cash_flow": 50.0} for _ in range(12)]
+
+
+def _slow(value):
+    async def _call(*args, **kwargs):
+        await asyncio.sleep(_DELAY)
+        return value
+    return AsyncMock(side_effect=_call)
+
+
+def _clients(*, complete_market: bool = True):
+    edgar = MagicMock()
+    edgar.get_eps_history = _slow(_income())
+    edgar.get_balance_sheet = _slow(_balance())
+    edgar.get_cash_flow = _slow(_cash_flow())
+    edgar.get_company = _slow({"cik": 320193, "name": "Apple Inc."})
+
+    finnhub = MagicMock()
+    finnhub.get_basic_financials = _slow(
+        {"market_cap": 3_000_000.0, "pe_ratio": 30.0, "dividend_yield": 0.5}
+        if complete_market else {}
+    )
+    finnhub.get_company_profile = _slow({"name": "Apple Inc", "shareOutstanding": 15_000.0})
+    finnhub.get_quote = _slow({"current_price": 190.0})
+
+    yfinance = MagicMock()
+    yfinance.get_info = _slow({"name": "Apple", "heldPercentInstitutions": 0.6})
+    yfinance.get_financials = _slow(None)
+    return edgar, finnhub, yfinance
+
+
+def _patched(edgar, finnhub, yfinance):
+    return (
+        patch("app.data.fundamentals_service.get_edgar_client", return_value=edgar),
+        patch("app.data.fundamentals_service.get_finnhub_client", return_value=finnhub),
+        patch("app.data.fundamentals_service.get_yfinance_client", return_value=yfinance),
+    )
+
+
+async def _run(clients, **kwargs) -> dict:
+    ep, fp, yp = _patched(*clients)
+    with ep, fp, yp:
+        return await get_fundamentals_data("AAPL", **kwargs)
+
+
+# ===================================================================
+# 1. Supplement decision
+# ===================================================================
+class TestNeedsYfInfo:
+
+    def test_complete_primary_data_needs_nothing(self):
+        assert _needs_yf_info(
+            {"current_price": 1.0},
+            {"market_cap": 1.0, "pe_ratio": 1.0, "dividend_yield": 0.0},
+            {"shareOutstanding": 1.0},
+        ) is False
+
+    @pytest.mark.parametrize("quote,market,profile", [
+        (None, {"market_cap": 1.0, "pe_ratio": 1.0, "dividend_yield": 1.0}, {"shareOutstanding": 1.0}),
+        ({"current_price": 1.0}, {"pe_ratio": 1.0, "dividend_yield": 1.0}, {"shareOutstanding": 1.0}),
+        ({"current_price": 1.0}, {"market_cap": 1.0, "dividend_yield": 1.0}, {"shareOutstanding": 1.0}),
+        ({"current_price": 1.0}, {"market_cap": 1.0, "pe_ratio": 1.0, "dividend_yield": 1.0}, {}),
+        ({"current_price": 1.0}, {"market_cap": 1.0, "pe_ratio": 1.0}, {"shareOutstanding": 1.0}),
+    ])
+    def test_any_gap_needs_supplement(self, quote, market, profile):
+        assert _needs_yf_info(quote, market, profile) is True
+
+    def test_missing_quarterly_data_needs_supplement(self):
+        assert _needs_yf_info(
+            {"current_price": 1.0},
+            {"market_cap": 1.0, "pe_ratio": 1.0, "dividend_yield": 1.0},
+            {"shareOutstanding": 1.0},
+            has_quarterly=False,
+        ) is True
+
+    def test_profile_market_cap_covers_missing_metric(self):
+        assert _needs_yf_info(
+            {"current_price": 1.0},
+            {"pe_ratio": 1.0, "dividend_yield": 1.0},
+            {"market_cap": 1.0, "shareOutstanding": 1.0},
+        ) is False
+
+
+# ===================================================================
+# 2. Fetch plan
+# ===================================================================
+class TestFetchPlan:
+
+    @pytest.mark.asyncio
+    async def test_primary_sources_fetched_concurrently(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await _run(_clients(), include_ownership=False)
+        # Seven primary calls of _DELAY each; sequential would take 7x.
+        assert loop.time() - start < _DELAY * 4
+
+    @pytest.mark.asyncio
+    async def test_yf_info_skipped_when_primary_covers_fields(self):
+        clients = _clients()
+        result = await _run(clients, include_ownership=False)
+        clients[2].get_info.assert_not_called()
+        assert "yfinance_info" not in result["_timings_ms"]
+        assert result["institutional_ownership"] is None
+
+    @pytest.mark.asyncio
+    async def test_yf_info_fetched_when_primary_has_gaps(self):
+        clients = _clients(complete_market=False)
+        await _run(clients, include_ownership=False)
+        clients[2].get_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_yf_info_fills_ttm_without_edgar(self):
+        clients = _clients()
+        clients[0].get_eps_history = _slow(None)
+        clients[0].get_cash_flow = _slow(None)
+        clients[2].get_info = _slow({"total_revenue": 5e9, "gross_margins": 0.4})
+        with patch("app.data.fundamentals_service._fetch_yf_financials_direct", return_value=None):
+            result = await _run(clients, include_ownership=False)
+        clients[2].get_info.assert_awaited_once()
+        assert result["ttm"]["revenue"] == 5e9
+        assert result["ttm"]["gross_margin"] == 0.4
+
+    @pytest.mark.asyncio
+    async def test_ownership_runs_yf_info_alongside_primary(self):
+        clients = _clients()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await _run(clients)
+        clients[2].get_info.assert_awaited_once()
+        assert result["institutional_ownership"] == 0.6
+        assert loop.time() - start < _DELAY * 4
+
+    @pytest.mark.asyncio
+    async def test_yf_financials_skipped_when_edgar_complete(self):
+        clients = _clients()
+        await _run(clients, include_ownership=False)
+        clients[2].get_financials.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_yf_financials_fetched_when_edgar_missing(self):
+        clients = _clients()
+        clients[0].get_eps_history = _slow(None)
+        with patch("app.data.fundamentals_service._fetch_yf_financials_direct", return_value=None):
+            await _run(clients, include_ownership=False)
+        clients[2].get_financials.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_source_does_not_block_others(self):
+        clients = _clients()
+        clients[1].get_quote = AsyncMock(side_effect=Exception("finnhub down"))
+        with patch("app.data.fundamentals_service._fetch_fast_info", return_value=None):
+            result = await _run(clients, include_ownership=False)
+        assert result["company_name"] == "Apple Inc."
+        assert "finnhub_quote" in result["_timings_ms"]
+
+
+# ===================================================================
+# 3. Timing metadata
+# ===================================================================
+class TestTimings:
+
+    @pytest.mark.asyncio
+    async def test_every_fetched_source_is_timed(self):
+        result = await _run(_clients())
+        timings = result["_timings_ms"]
+        assert set(timings) == {
+            "edgar_income", "edgar_balance_sheet", "edgar_cash_flow",
+            "edgar_company", "finnhub_financials", "finnhub_profile",
+            "finnhub_quote", "yfinance_info", "total",
+        }
+        assert all(ms >= 0 for ms in timings.values())
+        assert timings["total"] >= max(
+            ms for name, ms in timings.items() if name != "total"
+        )
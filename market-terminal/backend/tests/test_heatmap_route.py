@@ -270,3 +270,36 @@ async def test_get_heatmap_valid_index_all():
 
     assert response.status_code == 200
     mock.assert_awaited_once_with(index_filter="all", sector_filter="all")
+
+
+@pytest.mark.asyncio
+async def test_get_heatmap_unchanged_snapshot_returns_304():
+    """A matching If-None-Match returns 304 until prices are refreshed."""
+    with _patch_service():
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get("/api/heatmap")
+            etag = first.headers["etag"]
+            response = await client.get("/api/heatmap", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_heatmap_refreshed_snapshot_returns_200():
+    """A new refreshed_at (or other filters) yields a different ETag."""
+    refreshed = {**_SAMPLE_RESPONSE, "refreshed_at": "2026-03-02T14:31:00Z"}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        with _patch_service():
+            etag = (await client.get("/api/heatmap")).headers["etag"]
+            other = (await client.get("/api/heatmap?index=sp500")).headers["etag"]
+        with _patch_service(refreshed):
+            response = await client.get("/api/heatmap", headers={"If-None-Match": etag})
+
+    assert other != etag
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -5,7 +5,7 @@ swing detection, structure classification, market structure shift detection,
 order block detection, fair value gap detection, liquidity sweep detection,
 breaker block detection, premium/discount analysis, direction determination,
 entry zone calculation, confidence scoring, key levels, reasoning string,
-and edge cases.
+edge cases, and parity of the vectorized detectors with the original loops.
 
 No real network or database calls are made.
 
@@ -2332,5 +2332,500 @@ class TestEdgeCases(unittest.TestCase):
         self.assertFalse(math.isinf(sig.confidence))
 
 
+# ===================================================================
+# Vectorized detector parity
+# ===================================================================
+#
+# Reference copies of the original per-bar loop detectors.  The numpy
+# implementations in ict_smart_money must reproduce their output exactly.
+
+def _ref_detect_swings(df: pd.DataFrame) -> list[_SwingPoint]:
+    """Loop implementation the vectorized detector replaced."""
+    highs = df["high"].values
+    lows = df["low"].values
+    n = len(df)
+    swings: list[_SwingPoint] = []
+    w = _SWING_WINDOW
+
+    for i in range(w, n - w):
+        left_start = i - w
+        right_end = i + w + 1
+
+        # Swing high: current high >= all highs in window on both sides
+        is_swing_high = True
+        for j in range(left_start, right_end):
+            if j == i:
+                continue
+            if highs[j] > highs[i]:
+                is_swing_high = False
+                break
+
+        if is_swing_high:
+            swings.append(_SwingPoint(
+                index=i,
+                price=float(highs[i]),
+                date=str(df.iloc[i]["date"]),
+                swing_type="high",
+            ))
+
+        # Swing low: current low <= all lows in window on both sides
+        is_swing_low = True
+        for j in range(left_start, right_end):
+            if j == i:
+                continue
+            if lows[j] < lows[i]:
+                is_swing_low = False
+                break
+
+        if is_swing_low:
+            swings.append(_SwingPoint(
+                index=i,
+                price=float(lows[i]),
+                date=str(df.iloc[i]["date"]),
+                swing_type="low",
+            ))
+
+    swings.sort(key=lambda s: s.index)
+    return swings
+
+
+def _ref_detect_order_blocks(
+    df: pd.DataFrame,
+    swings: list[_SwingPoint],
+) -> list[_OrderBlock]:
+    """Loop implementation the vectorized detector replaced."""
+    n = len(df)
+    opens = df["open"].values
+    highs = df["high"].values
+    lows = df["low"].values
+    closes = df["close"].values
+
+    order_blocks: list[_OrderBlock] = []
+    seen_indices: set[int] = set()
+
+    swing_highs = [s for s in swings if s.swing_type == "high"]
+    swing_lows = [s for s in swings if s.swing_type == "low"]
+
+    # Bullish OBs: find bearish candle before move that breaks swing high
+    for sh in swing_highs:
+        target_level = sh.price
+        # Look for bars after the swing high that break above it
+        for i in range(sh.index + 1, n):
+            if highs[i] > target_level:
+                # Found the break bar. Walk backward to find last bearish candle
+                ob_idx: int | None = None
+                for j in range(i - 1, max(sh.index - 1, -1), -1):
+                    if closes[j] < opens[j]:
+                        ob_idx = j
+                        break
+
+                if ob_idx is not None and ob_idx not in seen_indices:
+                    seen_indices.add(ob_idx)
+                    ob_high = float(max(opens[ob_idx], closes[ob_idx]))
+                    ob_low = float(lows[ob_idx])
+
+                    # Check mitigation: any bar after OB trades through zone
+                    mitigated = False
+                    for k in range(ob_idx + 1, n):
+                        if lows[k] <= ob_low:
+                            mitigated = True
+                            break
+
+                    order_blocks.append(_OrderBlock(
+                        ob_type="bullish",
+                        high=ob_high,
+                        low=ob_low,
+                        date=str(df.iloc[ob_idx]["date"]),
+                        index=ob_idx,
+                        mitigated=mitigated,
+                    ))
+                break  # Only use the first break of this swing
+
+    # Bearish OBs: find bullish candle before move that breaks swing low
+    for sl in swing_lows:
+        target_level = sl.price
+        for i in range(sl.index + 1, n):
+            if lows[i] < target_level:
+                ob_idx = None
+                for j in range(i - 1, max(sl.index - 1, -1), -1):
+                    if closes[j] > opens[j]:
+                        ob_idx = j
+                        break
+
+                if ob_idx is not None and ob_idx not in seen_indices:
+                    seen_indices.add(ob_idx)
+                    ob_high = float(highs[ob_idx])
+                    ob_low = float(min(opens[ob_idx], closes[ob_idx]))
+
+                    mitigated = False
+                    for k in range(ob_idx + 1, n):
+                        if highs[k] >= ob_high:
+                            mitigated = True
+                            break
+
+                    order_blocks.append(_OrderBlock(
+                        ob_type="bearish",
+                        high=ob_high,
+                        low=ob_low,
+                        date=str(df.iloc[ob_idx]["date"]),
+                        index=ob_idx,
+                        mitigated=mitigated,
+                    ))
+                break
+
+    order_blocks.sort(key=lambda ob: ob.index, reverse=True)
+    return order_blocks
+
+
+def _ref_detect_fair_value_gaps(df: pd.DataFrame) -> list[_FairValueGap]:
+    """Loop implementation the vectorized detector replaced."""
+    n = len(df)
+    highs = df["high"].values
+    lows = df["low"].values
+
+    fvgs: list[_FairValueGap] = []
+
+    for i in range(2, n):
+        c1_high = float(highs[i - 2])
+        c1_low = float(lows[i - 2])
+        c3_high = float(highs[i])
+        c3_low = float(lows[i])
+
+        # Bullish FVG: candle 1 high < candle 3 low
+        if c1_high < c3_low:
+            fvg_low = c1_high
+            fvg_high = c3_low
+            gap_size = fvg_high - fvg_low
+
+            if gap_size < _EPSILON:
+                continue
+
+            # Calculate fill from subsequent bars
+            max_penetration = 0.0
+            for k in range(i + 1, n):
+                pen = fvg_high - float(lows[k])
+                if pen > max_penetration:
+                    max_penetration = pen
+
+            fill_pct = max_penetration / gap_size
+            fill_pct = max(0.0, min(1.0, fill_pct))
+
+            if fill_pct >= 1.0:
+                continue
+
+            fvgs.append(_FairValueGap(
+                fvg_type="bullish",
+                high=fvg_high,
+                low=fvg_low,
+                date=str(df.iloc[i - 1]["date"]),  # middle candle date
+                index=i - 1,
+                fill_percent=fill_pct,
+            ))
+
+        # Bearish FVG: candle 1 low > candle 3 high
+        if c1_low > c3_high:
+            fvg_high = c1_low
+            fvg_low = c3_high
+            gap_size = fvg_high - fvg_low
+
+            if gap_size < _EPSILON:
+                continue
+
+            max_penetration = 0.0
+            for k in range(i + 1, n):
+                pen = float(highs[k]) - fvg_low
+                if pen > max_penetration:
+                    max_penetration = pen
+
+            fill_pct = max_penetration / gap_size
+            fill_pct = max(0.0, min(1.0, fill_pct))
+
+            if fill_pct >= 1.0:
+                continue
+
+            fvgs.append(_FairValueGap(
+                fvg_type="bearish",
+                high=fvg_high,
+                low=fvg_low,
+                date=str(df.iloc[i - 1]["date"]),
+                index=i - 1,
+                fill_percent=fill_pct,
+            ))
+
+    fvgs.sort(key=lambda f: f.index, reverse=True)
+    return fvgs[:_MAX_FVGS]
+
+
+def _ref_detect_liquidity_sweeps(
+    df: pd.DataFrame,
+    swings: list[_SwingPoint],
+) -> list[_LiquiditySweep]:
+    """Loop implementation the vectorized detector replaced."""
+    n = len(df)
+    highs = df["high"].values
+    lows = df["low"].values
+    closes = df["close"].values
+
+    sweep_start = max(0, n - _SWEEP_LOOKBACK)
+    sweeps: list[_LiquiditySweep] = []
+    used_swings: set[int] = set()
+
+    swing_highs = [s for s in swings if s.swing_type == "high" and s.index < sweep_start]
+    swing_lows = [s for s in swings if s.swing_type == "low" and s.index < sweep_start]
+
+    # Also include swings within the sweep window that occurred before
+    # the bar being tested
+    all_swing_highs = [s for s in swings if s.swing_type == "high"]
+    all_swing_lows = [s for s in swings if s.swing_type == "low"]
+
+    for i in range(sweep_start, n):
+        # Buy-side sweep: bar high exceeds a prior swing high
+        for sh in all_swing_highs:
+            if sh.index >= i or sh.index in used_swings:
+                continue
+            if highs[i] > sh.price:
+                # Check reversal: close of this bar or within next bars
+                # falls back below the swing high
+                reversed_below = False
+                check_end = min(i + _SWEEP_MAX_BARS + 1, n)
+                for j in range(i, check_end):
+                    if closes[j] < sh.price:
+                        reversed_below = True
+                        break
+
+                if reversed_below:
+                    used_swings.add(sh.index)
+                    sweeps.append(_LiquiditySweep(
+                        sweep_type="buy_side",
+                        level=sh.price,
+                        date=str(df.iloc[i]["date"]),
+                        index=i,
+                    ))
+
+        # Sell-side sweep: bar low goes below a prior swing low
+        for sl in all_swing_lows:
+            if sl.index >= i or sl.index in used_swings:
+                continue
+            if lows[i] < sl.price:
+                reversed_above = False
+                check_end = min(i + _SWEEP_MAX_BARS + 1, n)
+                for j in range(i, check_end):
+                    if closes[j] > sl.price:
+                        reversed_above = True
+                        break
+
+                if reversed_above:
+                    used_swings.add(sl.index)
+                    sweeps.append(_LiquiditySweep(
+                        sweep_type="sell_side",
+                        level=sl.price,
+                        date=str(df.iloc[i]["date"]),
+                        index=i,
+                    ))
+
+    sweeps.sort(key=lambda s: s.index, reverse=True)
+    return sweeps
+
+
+def _make_random_ohlc(rows: int, seed: int, *, nan_frac: float = 0.0,
+                      string_dates: bool = False) -> pd.DataFrame:
+    """Random-walk OHLC with optional NaN holes and tied prices."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 1.5, rows))
+    # Round to create exact ties between bars (exercises >= / <= edges)
+    close = np.round(close, 0)
+    opens = np.round(close + rng.normal(0, 1.0, rows), 0)
+    highs = np.maximum(opens, close) + np.round(rng.uniform(0, 2, rows), 0)
+    lows = np.minimum(opens, close) - np.round(rng.uniform(0, 2, rows), 0)
+    if nan_frac:
+        for col in (opens, highs, lows, close):
+            col[rng.random(rows) < nan_frac] = np.nan
+    dates = pd.date_range("2010-01-01", periods=rows, freq="B")
+    return pd.DataFrame({
+        "date": dates.strftime("%Y-%m-%d") if string_dates else dates,
+        "open": opens, "high": highs, "low": lows, "close": close,
+        "volume": np.full(rows, 1000.0),
+    })
+
+
+class TestVectorizedParity(unittest.TestCase):
+    """Numpy detectors match the original loop implementations."""
+
+    CASES = [
+        (rows, seed, nan_frac, string_dates)
+        for rows in (0, 1, 3, 7, 8, 25, 120, 600)
+        for seed in range(4)
+        for nan_frac in (0.0, 0.03)
+        for string_dates in (False, True)
+    ]
+
+    def setUp(self):
+        self.analyzer = ICTSmartMoneyAnalyzer()
+
+    def _frames(self):
+        for rows, seed, nan_frac, string_dates in self.CASES:
+            yield (rows, seed, nan_frac), _make_random_ohlc(
+                rows, seed, nan_frac=nan_frac, string_dates=string_dates,
+            )
+
+    @staticmethod
+    def _same(a: list, b: list) -> bool:
+        """Element-wise equality treating NaN fields as equal."""
+        if len(a) != len(b):
+            return False
+        for x, y in zip(a, b):
+            for fx, fy in zip(x, y):
+                if isinstance(fx, float) and isinstance(fy, float) \
+                        and math.isnan(fx) and math.isnan(fy):
+                    continue
+                if fx != fy:
+                    return False
+        return True
+
+    def test_swings(self):
+        for case, df in self._frames():
+            with self.subTest(case=case):
+                self.assertTrue(self._same(
+                    self.analyzer._detect_swings(df), _ref_detect_swings(df)))
+
+    def test_order_blocks(self):
+        for case, df in self._frames():
+            swings = _ref_detect_swings(df)
+            with self.subTest(case=case):
+                self.assertTrue(self._same(
+                    self.analyzer._detect_order_blocks(df, swings),
+                    _ref_detect_order_blocks(df, swings)))
+
+    def test_order_blocks_arbitrary_swing_levels(self):
+        """Swing prices that are not the bar's own high/low."""
+        df = _make_random_ohlc(200, 11)
+        rng = np.random.default_rng(3)
+        swings = [
+            _SwingPoint(index=int(i), price=float(p), date="", swing_type=t)
+            for i, p, t in zip(
+                rng.integers(0, 200, 60), rng.uniform(80, 130, 60),
+                rng.choice(["high", "low"], 60),
+            )
+        ]
+        self.assertTrue(self._same(
+            self.analyzer._detect_order_blocks(df, swings),
+            _ref_detect_order_blocks(df, swings)))
+
+    def test_fair_value_gaps(self):
+        for case, df in self._frames():
+            with self.subTest(case=case):
+                self.assertTrue(self._same(
+                    self.analyzer._detect_fair_value_gaps(df),
+                    _ref_detect_fair_value_gaps(df)))
+
+    def test_fair_value_gaps_inverted_bars(self):
+        """Bars with high < low can satisfy both gap tests on one bar."""
+        df = _make_random_ohlc(80, 5)
+        df["high"], df["low"] = df["low"].copy(), df["high"].copy()
+        self.assertTrue(self._same(
+            self.analyzer._detect_fair_value_gaps(df),
+            _ref_detect_fair_value_gaps(df)))
+
+    def test_liquidity_sweeps(self):
+        for case, df in self._frames():
+            swings = _ref_detect_swings(df)
+            with self.subTest(case=case):
+                self.assertTrue(self._same(
+                    self.analyzer._detect_liquidity_sweeps(df, swings),
+                    _ref_detect_liquidity_sweeps(df, swings)))
+
+    def test_liquidity_sweeps_shared_swing_index(self):
+        """A high and a low on the same bar compete for one sweep."""
+        df = _make_random_ohlc(60, 2)
+        swings = []
+        for i in range(30, 45):
+            swings.append(_SwingPoint(i, float(df["high"].iloc[i]) - 3, "", "high"))
+            swings.append(_SwingPoint(i, float(df["low"].iloc[i]) + 3, "", "low"))
+        self.assertTrue(self._same(
+            self.analyzer._detect_liquidity_sweeps(df, swings),
+            _ref_detect_liquidity_sweeps(df, swings)))
+
+    def test_full_analysis_unchanged(self):
+        """End-to-end signal is identical with reference detectors."""
+        df = _make_random_ohlc(400, 9)
+        pdf = df[["date", "open", "high", "low", "close"]]
+        vdf = df[["date", "volume"]]
+        fast = _run(self.analyzer.analyze("TEST", pdf, vdf))
+        ref = ICTSmartMoneyAnalyzer()
+        # The reference scan ignores the shared feature frame.
+        ref._detect_swings = lambda df, features=None: _ref_detect_swings(df)
+        ref._detect_order_blocks = _ref_detect_order_blocks
+        ref._detect_fair_value_gaps = _ref_detect_fair_value_gaps
+        ref._detect_liquidity_sweeps = _ref_detect_liquidity_sweeps
+        slow = _run(ref.analyze("TEST", pdf, vdf))
+        self.assertEqual(fast.direction, slow.direction)
+        self.assertEqual(fast.confidence, slow.confidence)
+        self.assertEqual(fast.key_levels, slow.key_levels)
+        self.assertEqual(fast.reasoning, slow.reasoning)
+
+
+class TestIncrementalSwings(unittest.TestCase):
+    """Swing detection resumed from persisted state matches a full scan."""
+
+    def setUp(self):
+        self.analyzer = ICTSmartMoneyAnalyzer()
+
+    @staticmethod
+    def _persisted(state: dict) -> dict:
+        """Round-trip through JSON like the analysis_state table does."""
+        import json
+        return json.loads(json.dumps(state, default=str))
+
+    def _build_state(self, df: pd.DataFrame) -> dict:
+        state: dict = {}
+        self.analyzer._detect_swings_incremental(df, state)
+        return self._persisted(state)
+
+    def test_appended_bars_match_full_scan(self):
+        for string_dates in (False, True):
+            df = _make_random_ohlc(500, 3, string_dates=string_dates)
+            for k in (60, 300, 480, 499):
+                state = self._build_state(df.iloc[:k])
+                got = self.analyzer._detect_swings_incremental(df, state)
+                self.assertEqual(got, self.analyzer._detect_swings(df), (string_dates, k))
+
+    def test_slid_window_matches_full_scan(self):
+        df = _make_random_ohlc(500, 5)
+        state = self._build_state(df.iloc[:400])
+        slid = df.iloc[50:].reset_index(drop=True)
+        got = self.analyzer._detect_swings_incremental(slid, state)
+        self.assertEqual(got, self.analyzer._detect_swings(slid))
+
+    def test_revised_close_rebuilds(self):
+        df = _make_random_ohlc(300, 6)
+        state = self._build_state(df.iloc[:250])
+        revised = df.copy()
+        revised.loc[:, ["open", "high", "low", "close"]] *= 0.5  # split adjustment
+        self.assertIsNone(self.analyzer.resume_index(state, revised))
+        got = self.analyzer._detect_swings_incremental(revised, state)
+        self.assertEqual(got, self.analyzer._detect_swings(revised))
+
+    def test_state_excludes_forming_bar(self):
+        df = _make_random_ohlc(200, 7)
+        state = self._build_state(df)
+        self.assertEqual(state["last_date"], str(df["date"].iloc[-2]))
+        self.assertEqual(state["methodology"], "ict_smart_money")
+
+    def test_analyze_incremental_returns_state_and_same_signal(self):
+        df = _make_random_ohlc(400, 8)
+        pdf = df[["date", "open", "high", "low", "close"]]
+        vdf = df[["date", "volume"]]
+        _, state = _run(self.analyzer.analyze_incremental(
+            "TEST", pdf.iloc[:350], vdf.iloc[:350]))
+        signal, state = _run(self.analyzer.analyze_incremental(
+            "TEST", pdf, vdf, state=self._persisted(state)))
+        full = _run(self.analyzer.analyze("TEST", pdf, vdf))
+        self.assertEqual(signal.direction, full.direction)
+        self.assertEqual(signal.confidence, full.confidence)
+        self.assertEqual(signal.key_levels, full.key_levels)
+        self.assertEqual(signal.reasoning, full.reasoning)
+        self.assertEqual(state["last_date"], str(df["date"].iloc[-2]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -995,6 +995,38 @@ class TestAnalyzeAD(unittest.TestCase):
         result = self.analyzer._analyze_accumulation_distribution(df)
         self.assertIsInstance(result, _ADResult)
 
+    @staticmethod
+    def _random_df(rows: int, seed: int) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        close = 100.0 + np.cumsum(rng.normal(0, 1.0, rows))
+        return pd.DataFrame({
+            "date": pd.date_range("2020-01-01", periods=rows, freq="B"),
+            "open": close, "high": close + rng.uniform(0, 2, rows),
+            "low": close - rng.uniform(0, 2, rows), "close": close,
+            "volume": np.full(rows, 1000.0),
+        })
+
+    def test_incremental_state_matches_full_recompute(self):
+        import json
+        df = self._random_df(300, 4)
+        for k in (5, 40, 250, 299):
+            state: dict = {}
+            self.analyzer._analyze_accumulation_distribution(df.iloc[:k], state)
+            state = json.loads(json.dumps(state))
+            self.assertIsNotNone(self.analyzer.resume_index(state, df))
+            got = self.analyzer._analyze_accumulation_distribution(df, state)
+            self.assertEqual(got, self.analyzer._analyze_accumulation_distribution(df), k)
+            self.assertEqual(state["last_date"], str(df["date"].iloc[-2]))
+            self.assertLessEqual(len(state["ad_tail"]), 20)
+
+    def test_incremental_state_for_other_methodology_ignored(self):
+        df = self._random_df(60, 5)
+        state = {"methodology": "ict_smart_money", "version": "1.0.0",
+                 "first_date": "x", "last_date": "y", "last_close": 1.0}
+        got = self.analyzer._analyze_accumulation_distribution(df, state)
+        self.assertEqual(got, self.analyzer._analyze_accumulation_distribution(df))
+        self.assertEqual(state["methodology"], "larry_williams")
+
 
 # ---------------------------------------------------------------------------
 # 9. TestCalculateComposite
@@ -213,6 +213,13 @@ def _patch_both(fred_return=None, fred_raises=False,
             yield fred_mock, finnhub_mock
 
 
+@pytest.fixture(autouse=True)
+def _no_reaction_store():
+    """Compute reactions per request (no shared SQLite store between tests)."""
+    with patch("app.data.macro_reactions._database", new=AsyncMock(return_value=None)):
+        yield
+
+
 # ===================================================================
 # CALENDAR ENDPOINT: GET /api/macro/calendar
 # ===================================================================
@@ -0,0 +1,329 @@
+"""Tests for the precomputed macro reaction store (app.data.macro_reactions).
+
+Validates the reaction math, cold computation and persistence, indexed
+reads with precomputed averages, incremental updates (new releases,
+revisions, unsettled 5-day prices), the background pass over tracked pairs
+and watchlist symbols, error mapping and the store-less fallback.
+
+Runs against a real temporary SQLite database; FRED and Finnhub are mocks.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_macro_reactions.py -v``
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+
+from app.data.database import DatabaseManager
+from app.data.macro_reactions import (
+    AVERAGE_WINDOW,
+    ReactionEngine,
+    build_price_lookup,
+    compute_averages,
+    compute_reactions,
+)
+from app.exceptions import DataSourceError
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+def _records(count: int, *, start: date = date(2024, 1, 15), step: float = 0.5) -> list[dict]:
+    """Monthly FRED-style releases with rising values."""
+    return [
+        {"date": (start + timedelta(days=30 * i)).isoformat(), "value": round(100.0 + step * i, 4)}
+        for i in range(count)
+    ]
+
+
+def _candles(first: date, days: int) -> list[dict]:
+    """Daily candles (every calendar day) with closes rising by 1."""
+    return [
+        {
+            "close": 100.0 + i, "volume": 1_000_000,
+            "timestamp": f"{(first + timedelta(days=i)).isoformat()}T16:00:00+00:00",
+        }
+        for i in range(days)
+    ]
+
+
+def _clients(records: list[dict] | None, candles: list[dict] | None) -> tuple[MagicMock, MagicMock]:
+    fred = MagicMock()
+    fred.get_series = AsyncMock(return_value=records)
+    finnhub = MagicMock()
+    finnhub.get_candles = AsyncMock(return_value=candles)
+    return fred, finnhub
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path: Path) -> DatabaseManager:
+    manager = DatabaseManager(db_path=tmp_path / "reactions.db")
+    await manager.initialize()
+    with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=manager):
+        yield manager
+    await manager.close()
+
+
+def _engine() -> ReactionEngine:
+    return ReactionEngine(interval_s=3600.0)
+
+
+# ===================================================================
+# 1. Reaction math
+# ===================================================================
+class TestReactionMath:
+
+    def test_reaction_fields(self):
+        records = [{"date": "2025-01-15", "value": 100.0}, {"date": "2025-02-14", "value": 101.0}]
+        lookup = build_price_lookup(_candles(date(2025, 2, 1), 30))
+        (reaction,) = compute_reactions(records, [1], lookup)
+        assert reaction["surprise"] == "above"
+        assert reaction["expected"] == 100.0
+        assert reaction["price_before"] == 112.0     # 2025-02-13
+        assert reaction["price_after_1d"] == 114.0   # 2025-02-15
+        assert reaction["price_after_5d"] == 118.0
+        assert reaction["return_1d_percent"] == round(2 / 112 * 100, 2)
+        assert reaction["volume_ratio"] == 1.0
+
+    def test_skips_records_without_value(self):
+        records = [
+            {"date": "2025-01-15", "value": 100.0},
+            {"date": "2025-02-14", "value": None},
+            {"date": "2025-03-14", "value": 99.0},
+        ]
+        reactions = compute_reactions(records, [1, 2], build_price_lookup(_candles(date(2025, 1, 1), 90)))
+        assert [r["event_date"] for r in reactions] == ["2025-03-14"]
+        assert reactions[0]["expected"] is None and reactions[0]["surprise"] == "inline"
+
+    def test_averages_split_by_surprise(self):
+        averages = compute_averages([
+            {"surprise": "above", "return_1d_percent": 1.0, "return_5d_percent": 2.0, "volume_ratio": 1.0},
+            {"surprise": "above", "return_1d_percent": 3.0, "return_5d_percent": None, "volume_ratio": None},
+            {"surprise": "below", "return_1d_percent": -1.0, "return_5d_percent": -2.0, "volume_ratio": 2.0},
+        ])
+        assert averages == {
+            "avg_return_1d_on_beat": 2.0, "avg_return_1d_on_miss": -1.0,
+            "avg_return_5d_on_beat": 2.0, "avg_return_5d_on_miss": -2.0,
+            "avg_volume_ratio": 1.5,
+        }
+
+
+# ===================================================================
+# 2. Cold computation and indexed reads
+# ===================================================================
+class TestStore:
+
+    @pytest.mark.asyncio
+    async def test_first_request_computes_and_stores(self, db: DatabaseManager):
+        records = _records(20)
+        fred, finnhub = _clients(records, _candles(date(2023, 12, 1), 700))
+        engine = _engine()
+
+        result = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 5, fred=fred, finnhub=finnhub)
+        assert [r["event_date"] for r in result["reactions"]] == [r["date"] for r in records[-5:]]
+
+        row = await db.fetch_one("SELECT COUNT(*) AS n FROM macro_reactions WHERE symbol = 'AAPL'")
+        assert row["n"] == 19
+        stats = await db.fetch_one("SELECT * FROM macro_reaction_stats")
+        assert stats["event_name"] == "cpi" and stats["fred_indicator"] == "cpi_headline"
+        assert stats["latest_event_date"] == records[-1]["date"]
+
+    @pytest.mark.asyncio
+    async def test_second_request_is_a_store_read(self, db: DatabaseManager):
+        fred, finnhub = _clients(_records(20), _candles(date(2023, 12, 1), 700))
+        engine = _engine()
+        cold = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 8, fred=fred, finnhub=finnhub)
+        warm = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 8, fred=fred, finnhub=finnhub)
+
+        assert warm == cold
+        assert fred.get_series.await_count == 1
+        assert finnhub.get_candles.await_count == 1
+        assert engine.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_default_window_averages_are_precomputed(self, db: DatabaseManager):
+        fred, finnhub = _clients(_records(20), _candles(date(2023, 12, 1), 700))
+        engine = _engine()
+        cold = await engine.get_reactions(
+            "cpi", "AAPL", "cpi_headline", AVERAGE_WINDOW, fred=fred, finnhub=finnhub,
+        )
+        await db.execute("UPDATE macro_reaction_stats SET avg_volume_ratio = 9.99")
+
+        warm = await engine.get_reactions("cpi", "AAPL", "cpi_headline", AVERAGE_WINDOW)
+        assert warm["averages"]["avg_volume_ratio"] == 9.99
+        other = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 3)
+        assert other["averages"] == compute_averages(cold["reactions"][-3:])
+
+    @pytest.mark.asyncio
+    async def test_no_candles_leaves_pair_uncomputed(self, db: DatabaseManager):
+        fred, finnhub = _clients(_records(5), None)
+        engine = _engine()
+        result = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 5, fred=fred, finnhub=finnhub)
+        assert result["reactions"] == []
+        assert await db.fetch_one("SELECT * FROM macro_reaction_stats") is None
+
+    @pytest.mark.asyncio
+    async def test_source_errors(self, db: DatabaseManager):
+        engine = _engine()
+        fred, finnhub = _clients(None, None)
+        fred.get_series.side_effect = RuntimeError("down")
+        with pytest.raises(DataSourceError) as exc:
+            await engine.get_reactions("cpi", "AAPL", "cpi_headline", 5, fred=fred, finnhub=finnhub)
+        assert exc.value.source == "fred"
+
+        fred, finnhub = _clients(_records(5), None)
+        finnhub.get_candles.side_effect = RuntimeError("down")
+        with pytest.raises(DataSourceError) as exc:
+            await engine.get_reactions("cpi", "AAPL", "cpi_headline", 5, fred=fred, finnhub=finnhub)
+        assert exc.value.source == "finnhub"
+
+    @pytest.mark.asyncio
+    async def test_without_store_computes_every_request(self):
+        fred, finnhub = _clients(_records(6), _candles(date(2023, 12, 1), 300))
+        engine = _engine()
+        with patch("app.data.macro_reactions._database", new=AsyncMock(return_value=None)):
+            for _ in range(2):
+                result = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 3, fred=fred, finnhub=finnhub)
+                assert len(result["reactions"]) == 3
+        assert finnhub.get_candles.await_count == 2
+
+
+# ===================================================================
+# 3. Incremental updates
+# ===================================================================
+class TestIncremental:
+
+    @pytest.mark.asyncio
+    async def test_new_release_fetches_only_its_range(self, db: DatabaseManager):
+        records = _records(21)
+        fred, finnhub = _clients(records[:20], _candles(date(2023, 12, 1), 700))
+        engine = _engine()
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        fred.get_series.return_value = records
+        history = await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        assert history[-1]["event_date"] == records[-1]["date"]
+        _, _, from_ts, to_ts = finnhub.get_candles.await_args.args
+        newest = datetime.fromisoformat(records[-1]["date"]).replace(tzinfo=timezone.utc)
+        assert from_ts == int((newest - timedelta(days=20)).timestamp())
+        assert to_ts == int((newest + timedelta(days=15)).timestamp())
+        assert engine.get_stats()["rows_written"] == 20
+
+    @pytest.mark.asyncio
+    async def test_settled_history_is_not_refetched(self, db: DatabaseManager):
+        fred, finnhub = _clients(_records(20), _candles(date(2023, 12, 1), 700))
+        engine = _engine()
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+        assert finnhub.get_candles.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revised_release_is_recomputed(self, db: DatabaseManager):
+        records = _records(10)
+        fred, finnhub = _clients(records, _candles(date(2023, 12, 1), 400))
+        engine = _engine()
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        revised = [dict(r) for r in records]
+        revised[5]["value"] = 50.0
+        fred.get_series.return_value = revised
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        rows = await db.fetch_all(
+            "SELECT event_date, event_value, expected_value, surprise_direction "
+            "FROM macro_reactions ORDER BY event_date"
+        )
+        by_date = {r["event_date"]: r for r in rows}
+        assert by_date[records[5]["date"]]["event_value"] == 50.0
+        assert by_date[records[5]["date"]]["surprise_direction"] == "below"
+        assert by_date[records[6]["date"]]["expected_value"] == 50.0
+        assert engine.get_stats()["rows_written"] == 9 + 2
+
+    @pytest.mark.asyncio
+    async def test_rows_outside_fred_window_are_not_served(self, db: DatabaseManager):
+        records = _records(45)
+        fred, finnhub = _clients(records[:40], _candles(date(2023, 12, 1), 1500))
+        engine = _engine()
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        # Five new releases shift the window; FRED also drops one release.
+        shifted = records[:30] + records[31:]
+        fred.get_series.return_value = shifted
+        await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        result = await engine.get_reactions("cpi", "AAPL", "cpi_headline", 36, fred=fred, finnhub=finnhub)
+        dates = [r["event_date"] for r in result["reactions"]]
+        assert dates == [r["date"] for r in shifted[-36:]]
+        row = await db.fetch_one("SELECT COUNT(*) AS n FROM macro_reactions")
+        assert row["n"] == 36
+
+    @pytest.mark.asyncio
+    async def test_recent_release_waits_for_5d_price(self, db: DatabaseManager):
+        today = datetime.now(timezone.utc).date()
+        records = _records(3, start=today - timedelta(days=62))
+        partial = _candles(today - timedelta(days=90), 90)  # ends yesterday
+        fred, finnhub = _clients(records, partial)
+        engine = _engine()
+        history = await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+        assert history[-1]["event_date"] == records[-1]["date"]
+        assert history[-1]["price_after_5d"] is None
+
+        finnhub.get_candles.return_value = _candles(today - timedelta(days=90), 100)
+        history = await engine.update("cpi", "AAPL", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+        assert history[-1]["price_after_5d"] is not None
+        from_ts = finnhub.get_candles.await_args.args[2]
+        assert from_ts > int(datetime.fromisoformat(records[1]["date"]).replace(tzinfo=timezone.utc).timestamp())
+
+
+# ===================================================================
+# 4. Background pass
+# ===================================================================
+class TestRunOnce:
+
+    @pytest.mark.asyncio
+    async def test_covers_tracked_pairs_and_watchlist(self, db: DatabaseManager):
+        await db.execute("INSERT INTO watchlist (symbol) VALUES ('MSFT')")
+        fred, finnhub = _clients(_records(8), _candles(date(2023, 12, 1), 400))
+        engine = _engine()
+        engine.track("nfp", "AAPL", "nonfarm_payrolls")
+
+        with patch("app.data.fred_client.get_fred_client", return_value=fred), \
+                patch("app.data.finnhub_client.get_finnhub_client", return_value=finnhub):
+            report = await engine.run_once()
+
+        assert report["pairs"] == 2 and report["pairs_failed"] == 0
+        rows = await db.fetch_all("SELECT event_name, symbol FROM macro_reaction_stats ORDER BY symbol")
+        assert [(r["event_name"], r["symbol"]) for r in rows] == [("nfp", "AAPL"), ("nfp", "MSFT")]
+        assert report["rows_written"] == 14
+
+    @pytest.mark.asyncio
+    async def test_restores_tracked_pairs_from_store(self, db: DatabaseManager):
+        fred, finnhub = _clients(_records(8), _candles(date(2023, 12, 1), 400))
+        await _engine().update("cpi", "SPY", "cpi_headline", fred=fred, finnhub=finnhub, db=db)
+
+        fred.get_series.return_value = _records(9)
+        restarted = _engine()
+        with patch("app.data.fred_client.get_fred_client", return_value=fred), \
+                patch("app.data.finnhub_client.get_finnhub_client", return_value=finnhub):
+            report = await restarted.run_once()
+
+        assert report["pairs"] == 1 and report["rows_written"] == 1
+        assert restarted.get_stats()["tracked_pairs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_pair_does_not_stop_the_run(self, db: DatabaseManager):
+        fred, finnhub = _clients(None, None)
+        fred.get_series.side_effect = RuntimeError("down")
+        engine = _engine()
+        engine.track("cpi", "AAPL", "cpi_headline")
+        with patch("app.data.fred_client.get_fred_client", return_value=fred), \
+                patch("app.data.finnhub_client.get_finnhub_client", return_value=finnhub):
+            report = await engine.run_once()
+        assert report["pairs_failed"] == 1
+        assert engine.get_stats()["runs"] == 1
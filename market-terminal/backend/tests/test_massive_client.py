@@ -14,6 +14,14 @@ from app.data.massive_client import (
     _sanitize_dict,
     _to_snake_case
 )
+from app.data.rate_limiter import reset_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
 
 
 @pytest.fixture
@@ -32,6 +40,7 @@ async def test_massive_client_singleton(mock_settings):
     assert c1._api_key == "test_key"
     assert c1._tier == "free"
     assert c1._rate_limit == 5
+    assert c1._limiter.calls == 5
 
 
 @pytest.mark.asyncio
@@ -17,7 +17,8 @@ from app.data.massive_ws_client import (
     get_massive_ws_client,
     _WS_URL,
     _CB_COOLDOWN_S,
-    _CB_MAX_ATTEMPTS
+    _CB_MAX_ATTEMPTS,
+    _MAX_PENDING_TRADES
 )
 from app.config import Settings
 from app.api.routes.websocket import WebSocketManager
@@ -31,6 +32,7 @@ def _patch_settings(monkeypatch, api_key="test-api-key", tier="developer"):
     mock_settings = Settings()
     mock_settings.massive_api_key = api_key
     mock_settings.massive_options_tier = tier
+    mock_settings.massive_ws_flush_ms = 10
     monkeypatch.setattr("app.data.massive_ws_client.get_settings", lambda: mock_settings)
 
 def _patch_ws_manager(monkeypatch):
@@ -193,7 +195,7 @@ async def test_options_quote_is_broadcast(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_options_trade_is_broadcast(monkeypatch):
-    """O messages map into unified broadcast Manager for Trades."""
+    """O messages map into unified broadcast Manager as trade batches."""
     _patch_settings(monkeypatch)
     mock_connect, mock_ws = _patch_websockets_connect(monkeypatch)
     mock_manager = _patch_ws_manager(monkeypatch)
@@ -219,9 +221,11 @@ async def test_options_trade_is_broadcast(monkeypatch):
     mock_manager.broadcast_to_subscribers.assert_called_once()
     args, _ = mock_manager.broadcast_to_subscribers.call_args
     assert args[0] == "options_trade:O:AAPL240315C00170000"
-    assert args[1]["price"] == 1.55
-    assert args[1]["size"] == 2
-    assert args[1]["exchange"] == "CBOE"
+    assert args[1]["type"] == "options_trades"
+    trade = args[1]["trades"][0]
+    assert trade["price"] == 1.55
+    assert trade["size"] == 2
+    assert trade["exchange"] == "CBOE"
     
     await client.stop()
 
@@ -282,3 +286,83 @@ async def test_get_metrics(monkeypatch):
     assert metrics["subscriptions_count"] == 1
     
     await client.stop()
+
+
+_TICKER = "O:AAPL240315C00170000"
+
+
+def _quote(bid, ticker=_TICKER):
+    return {"ev": "OQ", "sym": ticker, "bp": bid, "ap": bid + 0.1, "t": 1708340400000}
+
+
+def _trade(price, ticker=_TICKER):
+    return {"ev": "O", "sym": ticker, "p": price, "s": 1, "x": "CBOE", "t": 1708340400000}
+
+
+@pytest.mark.asyncio
+async def test_quotes_conflated_to_latest_per_ticker(monkeypatch):
+    """Only the newest quote per ticker is published on a flush."""
+    _patch_settings(monkeypatch)
+    mock_manager = _patch_ws_manager(monkeypatch)
+    client = get_massive_ws_client()
+
+    other = "O:MSFT240315P00400000"
+    client._process_payload(json.dumps([_quote(1.0), _quote(1.1), _quote(2.0, other)]))
+    client._process_payload(json.dumps([_quote(1.2)]))
+    await client._flush()
+
+    published = {c.args[0]: c.args[1] for c in mock_manager.broadcast_to_subscribers.call_args_list}
+    assert published[f"options_quote:{_TICKER}"]["bid"] == 1.2
+    assert published[f"options_quote:{other}"]["bid"] == 2.0
+    assert len(published) == 2
+
+    metrics = await client.get_metrics()
+    assert metrics["conflated_quotes"] == 2
+    assert metrics["backlog"] == 0
+
+
+@pytest.mark.asyncio
+async def test_trades_batched_per_flush(monkeypatch):
+    """All trades for a ticker since the last flush go out as one array."""
+    _patch_settings(monkeypatch)
+    mock_manager = _patch_ws_manager(monkeypatch)
+    client = get_massive_ws_client()
+
+    client._process_payload(json.dumps([_trade(1.0), _trade(1.1)]))
+    client._process_payload(json.dumps([_trade(1.2)]))
+    assert (await client.get_metrics())["backlog"] == 3
+    await client._flush()
+
+    mock_manager.broadcast_to_subscribers.assert_called_once()
+    channel, message = mock_manager.broadcast_to_subscribers.call_args.args
+    assert channel == f"options_trade:{_TICKER}"
+    assert [t["price"] for t in message["trades"]] == [1.0, 1.1, 1.2]
+
+
+@pytest.mark.asyncio
+async def test_trade_backlog_bounded(monkeypatch):
+    """Trades beyond the per-window cap are dropped and counted."""
+    _patch_settings(monkeypatch)
+    _patch_ws_manager(monkeypatch)
+    client = get_massive_ws_client()
+
+    client._process_payload(json.dumps([_trade(1.0)] * (_MAX_PENDING_TRADES + 5)))
+
+    metrics = await client.get_metrics()
+    assert metrics["backlog"] == _MAX_PENDING_TRADES
+    assert metrics["dropped_events"] == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_counts_dropped(monkeypatch):
+    """A broadcast error drops that flush's events without stopping the rest."""
+    _patch_settings(monkeypatch)
+    mock_manager = _patch_ws_manager(monkeypatch)
+    mock_manager.broadcast_to_subscribers.side_effect = [RuntimeError("boom"), None]
+    client = get_massive_ws_client()
+
+    client._process_payload(json.dumps([_quote(1.0), _trade(1.0), _trade(1.1)]))
+    await client._flush()
+
+    assert mock_manager.broadcast_to_subscribers.call_count == 2
+    assert (await client.get_metrics())["dropped_events"] == 1
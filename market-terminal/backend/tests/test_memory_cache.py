@@ -0,0 +1,163 @@
+"""Tests for the in-process L1 cache tier (``app.data.memory_cache``).
+
+Validates MemoryCache get/put round-trips, TTL expiry, LRU and byte-budget
+eviction, expired-first eviction, invalidation scoping and statistics.
+
+No real network or database calls are made.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_memory_cache.py -v``
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.data.memory_cache import MemoryCache
+
+
+def _put(cache: MemoryCache, key: str, *, ttl: int = 900, size: int = 10,
+         age: float = 0.0, data_type: str = "price", symbol: str = "AAPL",
+         data: object = None) -> bool:
+    """Insert *key* fetched *age* seconds ago."""
+    ts = time.time() - age
+    return cache.put(
+        key, data if data is not None else {"k": key},
+        data_type=data_type, symbol=symbol, fetched_at="2024-01-01T00:00:00+00:00",
+        fetched_ts=ts, ttl=ttl, size=size,
+    )
+
+
+# ===================================================================
+# 1. get / put
+# ===================================================================
+class TestGetPut:
+    """Basic round-trips."""
+
+    def test_miss_on_empty(self):
+        cache = MemoryCache(10, 1000)
+        assert cache.get("price:AAPL:latest") is None
+        assert cache.get_stats()["l1_misses"] == 1
+
+    def test_hit_returns_data_fetched_at_and_age(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "price:AAPL:latest", age=5.0, data={"price": 1})
+        data, fetched_at, age = cache.get("price:AAPL:latest")
+        assert data == {"price": 1}
+        assert fetched_at == "2024-01-01T00:00:00+00:00"
+        assert 4.5 < age < 10.0
+        assert cache.get_stats()["l1_hits"] == 1
+
+    def test_replace_updates_bytes(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "a", size=100)
+        _put(cache, "a", size=40)
+        assert len(cache) == 1
+        assert cache.get_stats()["l1_bytes"] == 40
+
+    def test_already_expired_not_admitted(self):
+        cache = MemoryCache(10, 1000)
+        assert _put(cache, "a", ttl=60, age=120) is False
+        assert len(cache) == 0
+
+    def test_oversized_not_admitted(self):
+        cache = MemoryCache(10, 100)
+        assert _put(cache, "a", size=101) is False
+        assert len(cache) == 0
+
+
+# ===================================================================
+# 2. TTL and eviction
+# ===================================================================
+class TestEviction:
+    """TTL expiry and LRU / byte-budget eviction."""
+
+    def test_expired_entry_is_a_miss(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "a", ttl=1, age=0.0)
+        cache._entries["a"].expires_ts = time.time() - 1
+        assert cache.get("a") is None
+        stats = cache.get_stats()
+        assert stats["l1_expirations"] == 1
+        assert stats["l1_entries"] == 0
+
+    def test_lru_eviction_by_count(self):
+        cache = MemoryCache(2, 1000)
+        _put(cache, "a")
+        _put(cache, "b")
+        cache.get("a")  # "b" becomes least recently used
+        _put(cache, "c")
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["l1_evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = MemoryCache(10, 100)
+        _put(cache, "a", size=60)
+        _put(cache, "b", size=60)
+        assert cache.get("a") is None
+        assert cache.get_stats()["l1_bytes"] == 60
+
+    def test_expired_entries_evicted_before_live(self):
+        cache = MemoryCache(2, 1000)
+        _put(cache, "old")
+        _put(cache, "live")
+        cache._entries["live"].expires_ts = time.time() - 1
+        cache.get("old")
+        _put(cache, "new")
+        # "live" (expired) went first even though "old" is older by LRU
+        assert cache.get("old") is not None
+        stats = cache.get_stats()
+        assert stats["l1_evictions"] == 0
+        assert stats["l1_expirations"] == 1
+
+
+# ===================================================================
+# 3. Invalidation
+# ===================================================================
+class TestInvalidation:
+    """Scoped and global invalidation."""
+
+    def test_invalidate_symbol_all_types(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "price:AAPL:latest")
+        _put(cache, "news:AAPL:latest", data_type="news")
+        _put(cache, "price:MSFT:latest", symbol="MSFT")
+        assert cache.invalidate("aapl") == 2
+        assert len(cache) == 1
+
+    def test_invalidate_scoped_to_data_type(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "price:AAPL:latest")
+        _put(cache, "news:AAPL:latest", data_type="news")
+        assert cache.invalidate("AAPL", "news") == 1
+        assert cache.get("price:AAPL:latest") is not None
+
+    def test_clear_resets_bytes(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "a", size=50)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_stats()["l1_bytes"] == 0
+
+
+# ===================================================================
+# 4. Statistics
+# ===================================================================
+class TestStats:
+    """get_stats reporting."""
+
+    def test_hit_rate(self):
+        cache = MemoryCache(10, 1000)
+        _put(cache, "a")
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.get("c")
+        assert cache.get_stats()["l1_hit_rate"] == pytest.approx(0.5)
+
+    def test_reports_limits(self):
+        stats = MemoryCache(7, 99).get_stats()
+        assert stats["l1_max_entries"] == 7
+        assert stats["l1_max_bytes"] == 99
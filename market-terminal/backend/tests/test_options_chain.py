@@ -0,0 +1,278 @@
+"""Tests for the columnar options chain (``app.data.options_chain``).
+
+Validates the vectorized Black-Scholes helpers against textbook values,
+implied-volatility round trips, OptionChain construction (ordering,
+per-expiration offsets, read-only columns), filter selection and its memo,
+local greeks filling only what the provider left out, per-expiration
+aggregates, and the per-snapshot memo in ``chain_for``.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_options_chain.py -v``
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.data.cache_types import CachedResult
+from app.data.options_chain import (
+    OptionChain,
+    bs_greeks,
+    bs_price,
+    chain_for,
+    implied_vol,
+    norm_cdf,
+    reset_option_chains,
+    years_to_expiry,
+)
+
+_NOW = datetime(2026, 3, 2, 15, 0, tzinfo=timezone.utc)
+
+
+def _contract(strike: float, expiration: str, ctype: str, **extra) -> dict:
+    return {
+        "strike": strike, "expiration": expiration, "contract_type": ctype,
+        "option_ticker": f"O:AAPL{expiration}{ctype[0].upper()}{strike:g}", **extra,
+    }
+
+
+def _payload(contracts: list[dict], underlying: float | None = 100.0) -> dict:
+    return {"underlying_symbol": "AAPL", "underlying_price": underlying, "chain": contracts}
+
+
+def _result(data: dict, fetched_at: str = "2026-03-02T15:00:00+00:00") -> CachedResult:
+    return CachedResult(
+        data=data, data_type="options", cache_key="options:AAPL:chain", source="massive",
+        is_cached=True, is_stale=False, fetched_at=fetched_at,
+        cache_age_seconds=0.0, cache_age_human="just now", ttl_seconds=60,
+        expires_at="2026-03-02T15:01:00+00:00",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    reset_option_chains()
+    yield
+    reset_option_chains()
+
+
+# ===================================================================
+# 1. Black-Scholes helpers
+# ===================================================================
+class TestBlackScholes:
+
+    def test_norm_cdf_matches_erf(self):
+        xs = np.linspace(-6.0, 6.0, 241)
+        exact = np.array([0.5 * (1.0 + math.erf(x / math.sqrt(2.0))) for x in xs])
+        assert np.max(np.abs(norm_cdf(xs) - exact)) < 1e-7
+
+    def test_textbook_prices(self):
+        one = np.array([1.0])
+        s, k, t, sigma = 100.0 * one, 100.0 * one, one, 0.2 * one
+        call = bs_price(s, k, t, sigma, 0.05, np.array([True]))
+        put = bs_price(s, k, t, sigma, 0.05, np.array([False]))
+        assert call[0] == pytest.approx(10.4506, abs=1e-3)
+        assert put[0] == pytest.approx(5.5735, abs=1e-3)
+
+    def test_put_call_parity(self):
+        k = np.array([80.0, 100.0, 120.0])
+        s, t, sigma = np.full(3, 100.0), np.full(3, 0.5), np.full(3, 0.3)
+        call = bs_price(s, k, t, sigma, 0.04, np.ones(3, dtype=bool))
+        put = bs_price(s, k, t, sigma, 0.04, np.zeros(3, dtype=bool))
+        np.testing.assert_allclose(call - put, s - k * np.exp(-0.04 * t), atol=1e-6)
+
+    def test_textbook_greeks(self):
+        one = np.array([1.0])
+        g = bs_greeks(100.0 * one, 100.0 * one, one, 0.2 * one, 0.05, np.array([True]))
+        assert g["delta"][0] == pytest.approx(0.6368, abs=1e-4)
+        assert g["gamma"][0] == pytest.approx(0.01876, abs=1e-5)
+        assert g["vega"][0] == pytest.approx(0.3752, abs=1e-4)
+        assert g["theta"][0] == pytest.approx(-6.414 / 365.0, abs=1e-4)
+        put = bs_greeks(100.0 * one, 100.0 * one, one, 0.2 * one, 0.05, np.array([False]))
+        assert put["delta"][0] == pytest.approx(0.6368 - 1.0, abs=1e-4)
+
+    def test_implied_vol_round_trip(self):
+        k = np.array([90.0, 100.0, 110.0, 100.0])
+        calls = np.array([True, True, False, False])
+        s, t = np.full(4, 100.0), np.full(4, 0.25)
+        sigma = np.array([0.15, 0.35, 0.6, 1.2])
+        price = bs_price(s, k, t, sigma, 0.04, calls)
+        np.testing.assert_allclose(implied_vol(price, s, k, t, 0.04, calls), sigma, atol=1e-6)
+
+    def test_implied_vol_nan_below_intrinsic(self):
+        iv = implied_vol(
+            np.array([5.0]), np.array([120.0]), np.array([100.0]),
+            np.array([0.5]), 0.04, np.array([True]),
+        )
+        assert np.isnan(iv[0])
+
+    def test_years_to_expiry(self):
+        years = years_to_expiry(["2026-03-02", "2027-03-02", "bad"], _NOW)
+        assert years[0] == pytest.approx(6 * 3600 / (365 * 86400))  # 16:00 ET = 21:00Z
+        assert years[1] == pytest.approx(1.0 + 6 * 3600 / (365 * 86400))
+        assert np.isnan(years[2])
+
+
+# ===================================================================
+# 2. Construction and selection
+# ===================================================================
+class TestOptionChain:
+
+    def _chain(self) -> OptionChain:
+        contracts = [
+            _contract(110.0, "2026-06-19", "put", implied_volatility=0.3, open_interest=50),
+            _contract(90.0, "2026-04-17", "call", implied_volatility=0.2, open_interest=10),
+            _contract(100.0, "2026-04-17", "put", implied_volatility=0.4, open_interest=30),
+            _contract(100.0, "2026-04-17", "call", implied_volatility=0.3),
+            _contract(100.0, "2026-06-19", "call", implied_volatility=0.5, open_interest=20),
+        ]
+        for c in contracts:
+            c.update(delta=0.5, gamma=0.01, theta=-0.02, vega=0.1)
+        return OptionChain.from_payload(_payload(contracts), now=_NOW)
+
+    def test_sorted_with_offsets(self):
+        chain = self._chain()
+        assert chain.expirations == ["2026-04-17", "2026-06-19"]
+        assert chain.offsets.tolist() == [0, 3, 5]
+        assert chain.strike.tolist() == [90.0, 100.0, 100.0, 100.0, 110.0]
+        assert chain.is_call.tolist() == [True, True, False, True, False]
+        assert chain.expiration_counts() == [("2026-04-17", 3), ("2026-06-19", 2)]
+
+    def test_columns_read_only(self):
+        chain = self._chain()
+        with pytest.raises(ValueError):
+            chain.strike[0] = 1.0
+        with pytest.raises(ValueError):
+            chain.values["delta"][0] = 1.0
+
+    def test_select_filters(self):
+        chain = self._chain()
+        assert chain.select().tolist() == [0, 1, 2, 3, 4]
+        assert chain.select(expiration_gte="2026-05-01").tolist() == [3, 4]
+        assert chain.select(expiration_lte="2026-04-17").tolist() == [0, 1, 2]
+        assert chain.select(strike_gte=95.0, strike_lte=105.0).tolist() == [1, 2, 3]
+        assert chain.select(contract_type="put").tolist() == [2, 4]
+        assert chain.select(expiration_gte="2026-07-01").tolist() == []
+        assert chain.select(
+            expiration_gte="2026-06-19", expiration_lte="2026-04-17",
+        ).tolist() == []
+
+    def test_select_memoized(self):
+        chain = self._chain()
+        rows = chain.select(contract_type="call")
+        assert chain.select(contract_type="call") is rows
+        assert not rows.flags.writeable
+
+    def test_records(self):
+        chain = self._chain()
+        records = chain.records(chain.select(contract_type="put"))
+        assert [(r["strike"], r["expiration"]) for r in records] == [
+            (100.0, "2026-04-17"), (110.0, "2026-06-19"),
+        ]
+        first = records[0]
+        assert first["contract_type"] == "put"
+        assert first["open_interest"] == 30 and isinstance(first["open_interest"], int)
+        assert first["bid"] is None
+        assert first["greeks_computed"] is False
+
+    def test_summary(self):
+        summary = self._chain().summary
+        assert summary[0] == {
+            "expiration": "2026-04-17", "avg_iv": pytest.approx(0.3),
+            "put_call_ratio": 0.5, "total_open_interest": 40, "contract_count": 3,
+        }
+        assert summary[1]["avg_iv"] == pytest.approx(0.4)
+        assert summary[1]["put_call_ratio"] == 1.0
+
+    def test_summary_without_open_interest_or_calls(self):
+        chain = OptionChain.from_payload(
+            _payload([_contract(100.0, "2026-04-17", "put")], underlying=None), now=_NOW,
+        )
+        assert chain.summary == [{
+            "expiration": "2026-04-17", "avg_iv": None, "put_call_ratio": None,
+            "total_open_interest": None, "contract_count": 1,
+        }]
+
+    def test_empty_chain(self):
+        chain = OptionChain.from_payload(_payload([]), now=_NOW)
+        assert len(chain) == 0
+        assert chain.summary == [] and chain.expiration_counts() == []
+        assert chain.records(chain.select()) == []
+
+
+# ===================================================================
+# 3. Local greeks
+# ===================================================================
+class TestLocalGreeks:
+
+    def test_fills_missing_iv_and_greeks_from_mid(self):
+        t = years_to_expiry(["2026-06-19"], _NOW)
+        mid = float(bs_price(
+            np.array([100.0]), np.array([100.0]), t, np.array([0.3]), 0.04, np.array([True]),
+        )[0])
+        chain = OptionChain.from_payload(
+            _payload([_contract(100.0, "2026-06-19", "call", bid=mid - 0.05, ask=mid + 0.05)]),
+            rate=0.04, now=_NOW,
+        )
+        record = chain.records(chain.select())[0]
+        assert record["greeks_computed"] is True
+        assert record["implied_volatility"] == pytest.approx(0.3, abs=1e-4)
+        assert 0.5 < record["delta"] < 0.7
+        assert record["gamma"] > 0 and record["vega"] > 0 and record["theta"] < 0
+        assert chain.summary[0]["avg_iv"] == pytest.approx(0.3, abs=1e-4)
+
+    def test_uses_last_price_without_quote(self):
+        chain = OptionChain.from_payload(
+            _payload([_contract(100.0, "2026-06-19", "put", last_price=4.0)]), now=_NOW,
+        )
+        assert chain.greeks_computed.tolist() == [True]
+        assert chain.values["delta"][0] < 0
+
+    def test_vendor_values_kept(self):
+        chain = OptionChain.from_payload(
+            _payload([
+                _contract(100.0, "2026-06-19", "call", implied_volatility=0.25, delta=0.42),
+                _contract(100.0, "2026-06-19", "put", implied_volatility=0.25, delta=-0.58,
+                          gamma=0.02, theta=-0.03, vega=0.2),
+            ]),
+            now=_NOW,
+        )
+        call, put = chain.records(chain.select())
+        assert call["delta"] == 0.42 and call["implied_volatility"] == 0.25
+        assert call["gamma"] is not None and call["greeks_computed"] is True
+        assert put["delta"] == -0.58 and put["greeks_computed"] is False
+
+    def test_skipped_without_inputs(self):
+        contracts = [
+            _contract(100.0, "2026-06-19", "call"),                      # no price
+            _contract(100.0, "2026-02-20", "call", bid=1.0, ask=1.2),    # expired
+        ]
+        assert not OptionChain.from_payload(_payload(contracts), now=_NOW).greeks_computed.any()
+        no_spot = OptionChain.from_payload(
+            _payload([_contract(100.0, "2026-06-19", "call", bid=1.0, ask=1.2)], underlying=None),
+            now=_NOW,
+        )
+        assert not no_spot.greeks_computed.any()
+        assert np.isnan(no_spot.values["delta"][0])
+
+
+# ===================================================================
+# 4. Snapshot memo
+# ===================================================================
+class TestChainFor:
+
+    def test_memoized_per_fetched_at(self):
+        data = _payload([_contract(100.0, "2026-06-19", "call", implied_volatility=0.3)])
+        first = chain_for(_result(data))
+        assert chain_for(_result(data)) is first
+        refreshed = chain_for(_result(data, fetched_at="2026-03-02T15:01:00+00:00"))
+        assert refreshed is not first
+        assert refreshed.fetched_at == "2026-03-02T15:01:00+00:00"
+
+    def test_reset(self):
+        data = _payload([])
+        first = chain_for(_result(data))
+        reset_option_chains()
+        assert chain_for(_result(data)) is not first
@@ -106,3 +106,60 @@ def test_disabled_client(monkeypatch):
     # Will hit a 503 instead of 404 because CacheManager returns None if custom fetch fails entirely or dispatch returns None securely.
     assert resp.status_code == 503
     assert "Options data source not configured" in resp.json()["error"]
+
+def _fixed_chain(monkeypatch, fetched_at="2026-03-02T14:30:00+00:00"):
+    """Serve a fixed cached chain so its ETag is stable across requests."""
+    from app.api.routes import options as options_route
+    from app.data.cache_types import CachedResult
+
+    result = CachedResult(
+        data={
+            "underlying_symbol": "AAPL",
+            "underlying_price": 189.45,
+            "chain": [{
+                "strike": 185.0, "expiration": "2026-03-20", "contract_type": "call",
+                "bid": 6.20, "ask": 6.35, "option_ticker": "O:AAPL260320C00185000",
+            }],
+        },
+        data_type="options", cache_key="options:AAPL:chain", source="massive",
+        is_cached=True, is_stale=False, fetched_at=fetched_at,
+        cache_age_seconds=5.0, cache_age_human="5s ago", ttl_seconds=60,
+        expires_at="2026-03-02T14:31:00+00:00",
+    )
+    monkeypatch.setattr(
+        options_route._cache_mgr, "get_or_fetch", AsyncMock(return_value=result),
+    )
+
+def test_options_chain_etag_304(monkeypatch):
+    _fixed_chain(monkeypatch)
+    first = client.get("/api/options/chain/AAPL")
+    etag = first.headers["etag"]
+    resp = client.get("/api/options/chain/AAPL", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+def test_options_chain_new_snapshot_not_304(monkeypatch):
+    _fixed_chain(monkeypatch)
+    etag = client.get("/api/options/chain/AAPL").headers["etag"]
+    _fixed_chain(monkeypatch, fetched_at="2026-03-02T14:31:00+00:00")
+    resp = client.get("/api/options/chain/AAPL", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["contract_count"] == 1
+
+def test_expirations_and_greeks_etag_304(monkeypatch):
+    _fixed_chain(monkeypatch)
+    for path in ("/api/options/expirations/AAPL", "/api/options/greeks/AAPL"):
+        etag = client.get(path).headers["etag"]
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+def test_filters_and_pages_share_one_snapshot(monkeypatch):
+    from app.api.routes import options as options_route
+
+    _fixed_chain(monkeypatch)
+    all_rows = client.get("/api/options/chain/AAPL")
+    puts = client.get("/api/options/chain/AAPL?contract_type=put")
+    assert all_rows.json()["data"]["contract_count"] == 1
+    assert puts.json()["data"]["contract_count"] == 0
+    assert puts.headers["etag"] != all_rows.headers["etag"]
+    periods = {c.args[2] for c in options_route._cache_mgr.get_or_fetch.await_args_list}
+    assert periods == {"chain"}
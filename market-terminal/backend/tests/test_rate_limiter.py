@@ -0,0 +1,262 @@
+"""Tests for the shared upstream rate-limit scheduler.
+
+Validates the token-bucket window, priority ordering of queued callers,
+the interactive-only reserve, non-blocking ``try_acquire``, metrics, and
+the per-provider registry.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_rate_limiter.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.data.rate_limiter import (
+    Priority,
+    RateLimiter,
+    current_priority,
+    get_rate_limiter,
+    get_rate_limiter_stats,
+    provider_wait,
+    request_priority,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+# ===================================================================
+# 1. Priority context
+# ===================================================================
+class TestPriorityContext:
+
+    def test_default_is_interactive(self):
+        assert current_priority() == Priority.INTERACTIVE
+
+    def test_request_priority_sets_and_restores(self):
+        with request_priority(Priority.BACKGROUND):
+            assert current_priority() == Priority.BACKGROUND
+            with request_priority(Priority.PREWARM):
+                assert current_priority() == Priority.PREWARM
+            assert current_priority() == Priority.BACKGROUND
+        assert current_priority() == Priority.INTERACTIVE
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_priority(self):
+        async def _inner():
+            return current_priority()
+
+        with request_priority(Priority.BACKGROUND):
+            task = asyncio.create_task(_inner())
+        assert await task == Priority.BACKGROUND
+
+
+# ===================================================================
+# 2. Token bucket
+# ===================================================================
+class TestTokenBucket:
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_budget_without_waiting(self):
+        limiter = RateLimiter("t", 5, 60.0)
+        for _ in range(5):
+            await limiter.acquire()
+        assert limiter.available == 0
+        assert limiter.get_stats()["queued"]["interactive"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_when_empty(self):
+        limiter = RateLimiter("t", 2, 60.0)
+        await limiter.acquire()
+        await limiter.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_token_returns_after_period(self):
+        limiter = RateLimiter("t", 2, 0.1)
+        await limiter.acquire()
+        await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.05
+
+    def test_spent_tokens_expire(self):
+        limiter = RateLimiter("t", 3, 60.0)
+        limiter._spent = deque([time.monotonic() - 61] * 3)
+        assert limiter.available == 3
+        assert limiter.next_token_in() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_budget_per_window(self):
+        limiter = RateLimiter("t", 4, 0.2)
+        grants: list[float] = []
+
+        async def _call():
+            await limiter.acquire()
+            grants.append(time.monotonic())
+
+        await asyncio.gather(*(_call() for _ in range(10)))
+        for i, ts in enumerate(grants):
+            in_window = [g for g in grants[i:] if g - ts < 0.2 - 1e-3]
+            assert len(in_window) <= 4
+
+    def test_calls_at_least_one(self):
+        assert RateLimiter("t", 0, 1.0).calls == 1
+
+
+# ===================================================================
+# 3. Priority scheduling
+# ===================================================================
+class TestPriorityScheduling:
+
+    def test_reserve_is_a_tenth_of_budget(self):
+        assert RateLimiter("t", 60, 60.0).reserve == 6
+        assert RateLimiter("t", 5, 60.0).reserve == 0
+
+    def test_background_cannot_spend_reserve(self):
+        limiter = RateLimiter("t", 10, 60.0)
+        limiter._spent = deque([time.monotonic()] * 9)
+        assert limiter.available_for(Priority.INTERACTIVE) == 1
+        assert limiter.available_for(Priority.BACKGROUND) == 0
+        with request_priority(Priority.BACKGROUND):
+            assert limiter.try_acquire() is False
+        assert limiter.try_acquire() is True
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_queued_background(self):
+        limiter = RateLimiter("t", 2, 0.1)
+        order: list[str] = []
+
+        async def _call(tag: str, priority: Priority):
+            await limiter.acquire(priority)
+            order.append(tag)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        background = [asyncio.create_task(_call(f"bg{i}", Priority.BACKGROUND)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(_call("ui", Priority.INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+        assert order[0] == "ui"
+
+    @pytest.mark.asyncio
+    async def test_background_served_before_prewarm(self):
+        limiter = RateLimiter("t", 1, 0.05)
+        order: list[str] = []
+
+        async def _call(tag: str, priority: Priority):
+            await limiter.acquire(priority)
+            order.append(tag)
+
+        await limiter.acquire()
+        prewarm = asyncio.create_task(_call("pre", Priority.PREWARM))
+        await asyncio.sleep(0)
+        background = asyncio.create_task(_call("bg", Priority.BACKGROUND))
+        await asyncio.gather(prewarm, background)
+        assert order == ["bg", "pre"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        limiter = RateLimiter("t", 1, 0.05)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_does_not_jump_queue(self):
+        limiter = RateLimiter("t", 1, 0.05)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.try_acquire() is False
+        await waiter
+
+
+# ===================================================================
+# 4. Metrics
+# ===================================================================
+class TestMetrics:
+
+    @pytest.mark.asyncio
+    async def test_queue_and_wait_metrics(self):
+        limiter = RateLimiter("t", 1, 0.05)
+        await limiter.acquire()
+        await asyncio.gather(limiter.acquire(Priority.BACKGROUND), limiter.acquire(Priority.BACKGROUND))
+        stats = limiter.get_stats()
+        assert stats["granted"] == {"interactive": 1, "background": 2, "prewarm": 0}
+        assert stats["queued"]["background"] == 2
+        assert stats["max_queue_depth"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["max_wait_ms"] > 0
+        assert stats["avg_wait_ms_by_priority"]["background"] > 0
+
+    def test_rejections_counted(self):
+        limiter = RateLimiter("t", 1, 60.0)
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+        assert limiter.get_stats()["rejected"] == 1
+
+
+# ===================================================================
+# 5. Registry
+# ===================================================================
+class TestRegistry:
+
+    def _settings(self, **overrides):
+        s = MagicMock()
+        s.rate_limit_finnhub_per_minute = 60
+        s.rate_limit_fred_per_minute = 120
+        s.rate_limit_edgar_per_second = 10
+        s.rate_limit_forex_factory_per_5min = 2
+        s.rate_limit_massive_per_minute = 0
+        for k, v in overrides.items():
+            setattr(s, k, v)
+        return s
+
+    def test_budgets_from_settings(self):
+        with patch("app.config.get_settings", return_value=self._settings(rate_limit_finnhub_per_minute=30)):
+            limiter = get_rate_limiter("finnhub")
+        assert (limiter.calls, limiter.period) == (30, 60.0)
+
+    def test_same_instance_per_provider(self):
+        with patch("app.config.get_settings", return_value=self._settings()):
+            assert get_rate_limiter("edgar") is get_rate_limiter("edgar")
+            assert get_rate_limiter("edgar") is not get_rate_limiter("fred")
+
+    def test_unset_budget_uses_default_calls(self):
+        with patch("app.config.get_settings", return_value=self._settings()):
+            limiter = get_rate_limiter("massive", default_calls=6000)
+        assert limiter.calls == 6000
+
+    def test_configured_budget_overrides_default_calls(self):
+        with patch("app.config.get_settings", return_value=self._settings(rate_limit_massive_per_minute=100)):
+            limiter = get_rate_limiter("massive", default_calls=6000)
+        assert limiter.calls == 100
+
+    def test_stats_cover_every_limiter_in_use(self):
+        with patch("app.config.get_settings", return_value=self._settings()):
+            get_rate_limiter("finnhub")
+            get_rate_limiter("edgar")
+        assert set(get_rate_limiter_stats()) == {"finnhub", "edgar"}
+
+    def test_provider_wait(self):
+        assert provider_wait("massive") == 0.0  # no limiter created yet
+        with patch("app.config.get_settings", return_value=self._settings(rate_limit_finnhub_per_minute=10)):
+            limiter = get_rate_limiter("finnhub")
+        now = time.monotonic()
+        limiter._spent = deque([now] * 9)  # the last token is the interactive reserve
+        assert provider_wait("finnhub", Priority.INTERACTIVE) == 0.0
+        assert 59.0 < provider_wait("finnhub") <= 60.0
@@ -0,0 +1,260 @@
+"""Tests for the refresh-ahead scheduler (app.data.refresh_ahead).
+
+Validates refreshing ahead of expiry, stale-hit deduplication, hot-window
+drops, the key cap, rate-budget deferral, pinned quotes around market
+hours, bounded concurrency, failure retries and the metrics.
+
+The refresh callback is mocked -- no network or DB is touched.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_refresh_ahead.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import app.data.refresh_ahead as ra_mod
+from app.data.refresh_ahead import RefreshScheduler, create_refresh_scheduler
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _refresh_fn() -> AsyncMock:
+    """A refresh callback that succeeds with 'fetched now'."""
+    return AsyncMock(side_effect=lambda *args: time.time())
+
+
+def _scheduler(refresh_fn=None, **kwargs) -> RefreshScheduler:
+    return RefreshScheduler(refresh_fn or _refresh_fn(), **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _no_budget_wait():
+    with patch.object(ra_mod, "provider_wait", return_value=0.0) as wait:
+        yield wait
+
+
+# ===================================================================
+# 1. Scheduling
+# ===================================================================
+class TestScheduling:
+
+    @pytest.mark.asyncio
+    async def test_refreshes_before_expiry(self):
+        fn = _refresh_fn()
+        sched = _scheduler(fn)
+        # TTL 0.2s -> lead capped at half the TTL -> due 0.1s from now
+        sched.touch("price", "AAPL", "latest", fetched_ts=time.time(), ttl=0.2)
+        await asyncio.sleep(0.05)
+        fn.assert_not_awaited()
+        await asyncio.sleep(0.1)
+        assert fn.await_count >= 1
+        assert fn.await_args.args[:3] == ("price", "AAPL", "latest")
+        stats = sched.get_stats()
+        assert stats["refreshed"] >= 1
+        assert stats["missed_expiry"] == 0
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_lead_is_fraction_of_ttl_with_floor(self):
+        sched = _scheduler(lead_fraction=0.1)
+        assert sched._lead(900) == 90
+        assert sched._lead(120) == ra_mod._MIN_LEAD_S
+        assert sched._lead(20) == 10  # never more than half the TTL
+
+    @pytest.mark.asyncio
+    async def test_repeated_touch_of_same_value_not_requeued(self):
+        sched = _scheduler()
+        fetched = time.time()
+        for _ in range(5):
+            sched.touch("price", "AAPL", "latest", fetched_ts=fetched, ttl=900)
+        assert len(sched._heap) == 1
+        assert sched.get_stats()["tracked"] == 1
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_requests_deduplicated(self):
+        fn = _refresh_fn()
+        sched = _scheduler(fn)
+        for _ in range(3):
+            assert sched.request_now("price", "AAPL", "latest", ttl=900)
+        await asyncio.sleep(0.02)
+        fn.assert_awaited_once()
+        assert sched.get_stats()["deduplicated"] == 2
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        active = 0
+        peak = 0
+
+        async def slow(*args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return time.time()
+
+        sched = _scheduler(AsyncMock(side_effect=slow), concurrency=2)
+        for i in range(6):
+            sched.request_now("price", f"S{i}", "latest", ttl=900)
+        await asyncio.sleep(0.15)
+        assert peak == 2
+        assert sched.get_stats()["refreshed"] == 6
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_failure_counted_and_retried(self):
+        fn = AsyncMock(side_effect=[None, time.time()])
+        sched = _scheduler(fn)
+        with patch.object(ra_mod, "_RETRY_S", 0.01):
+            sched.request_now("price", "AAPL", "latest", ttl=900)
+            await asyncio.sleep(0.1)
+        stats = sched.get_stats()
+        assert stats["failed"] == 1
+        assert stats["refreshed"] == 1
+        await sched.stop()
+
+
+# ===================================================================
+# 2. Drops and budgets
+# ===================================================================
+class TestDropsAndBudgets:
+
+    @pytest.mark.asyncio
+    async def test_cold_key_dropped_when_due(self):
+        fn = _refresh_fn()
+        sched = _scheduler(fn, hot_window_s=0.0)
+        sched.touch("price", "AAPL", "latest", fetched_ts=time.time(), ttl=0.1)
+        await asyncio.sleep(0.1)
+        fn.assert_not_awaited()
+        stats = sched.get_stats()
+        assert stats["dropped_cold"] == 1
+        assert stats["tracked"] == 0
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_read_key_evicted(self):
+        sched = _scheduler(max_keys=2)
+        now = time.time()
+        for sym in ("A", "B", "C"):
+            sched.touch("price", sym, "latest", fetched_ts=now, ttl=900)
+        stats = sched.get_stats()
+        assert stats["tracked"] == 2
+        assert stats["dropped_evicted"] == 1
+        assert "price:A:latest" not in sched._entries
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_of_pinned_keys_rejects(self):
+        sched = _scheduler(AsyncMock(return_value=None), max_keys=1)
+        sched.pin(["AAPL"], ttl=900)
+        assert sched.request_now("news", "MSFT", "latest", ttl=900) is False
+        assert sched.get_stats()["dropped_full"] == 1
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_deferred_while_provider_budget_exhausted(self, _no_budget_wait):
+        fn = _refresh_fn()
+        _no_budget_wait.side_effect = [0.03, 0.0]
+        sched = _scheduler(fn)
+        sched.request_now("price", "AAPL", "latest", ttl=900)
+        await asyncio.sleep(0.01)
+        fn.assert_not_awaited()
+        await asyncio.sleep(0.05)
+        fn.assert_awaited_once()
+        _no_budget_wait.assert_called_with("finnhub", ra_mod.Priority.BACKGROUND)
+        stats = sched.get_stats()
+        assert stats["deferred"] == 1
+        # Lateness is measured from the original due time
+        assert stats["max_lateness_ms"] >= 25
+        await sched.stop()
+
+
+# ===================================================================
+# 3. Pinned watchlist quotes
+# ===================================================================
+class TestPinned:
+
+    @pytest.mark.asyncio
+    async def test_pinned_quote_refreshed_during_market_hours(self):
+        fn = _refresh_fn()
+        sched = _scheduler(fn, hot_window_s=0.0)
+        with patch.object(ra_mod, "_is_market_open", return_value=True):
+            sched.pin(["aapl"], ttl=900)
+            await asyncio.sleep(0.02)
+        fn.assert_awaited_once()
+        assert fn.await_args.args[:3] == ("price", "AAPL", "latest")
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_pinned_quote_parked_outside_market_hours(self):
+        fn = _refresh_fn()
+        sched = _scheduler(fn, hot_window_s=0.0)
+        with patch.object(ra_mod, "_is_market_open", return_value=False):
+            sched.pin(["AAPL"], ttl=900)
+            await asyncio.sleep(0.02)
+        fn.assert_not_awaited()
+        stats = sched.get_stats()
+        assert stats["parked"] == 1
+        assert stats["pinned"] == 1
+        assert sched._entries["price:AAPL:latest"].due > time.time()
+        await sched.stop()
+
+    @pytest.mark.asyncio
+    async def test_pinned_keys_never_evicted(self):
+        sched = _scheduler(AsyncMock(return_value=None), max_keys=2)
+        sched.pin(["AAPL"], ttl=900)
+        for sym in ("B", "C"):
+            sched.touch("price", sym, "latest", fetched_ts=time.time(), ttl=900)
+        assert "price:AAPL:latest" in sched._entries
+        await sched.stop()
+
+    def test_next_market_open_skips_weekend(self):
+        friday_evening = datetime(2026, 10, 16, 17, 0, tzinfo=ra_mod._ET).timestamp()
+        nxt = datetime.fromtimestamp(ra_mod._next_market_open(friday_evening), ra_mod._ET)
+        assert (nxt.weekday(), nxt.hour, nxt.minute) == (0, 9, 30)
+
+    def test_market_hours(self):
+        def ts(h, m):
+            return datetime(2026, 10, 15, h, m, tzinfo=ra_mod._ET).timestamp()
+        assert ra_mod._is_market_open(ts(9, 30))
+        assert not ra_mod._is_market_open(ts(9, 29))
+        assert not ra_mod._is_market_open(ts(16, 0))
+
+
+# ===================================================================
+# 4. Settings and lifecycle
+# ===================================================================
+class TestLifecycle:
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_in_flight(self):
+        started = asyncio.Event()
+
+        async def hang(*args):
+            started.set()
+            await asyncio.sleep(100)
+
+        sched = _scheduler(AsyncMock(side_effect=hang))
+        sched.request_now("price", "AAPL", "latest", ttl=900)
+        await asyncio.wait_for(started.wait(), 1)
+        await sched.stop()
+        stats = sched.get_stats()
+        assert stats["in_flight"] == 0
+        assert stats["tracked"] == 0
+
+    def test_invalid_settings_fall_back_to_defaults(self):
+        with patch("app.config.get_settings", return_value=MagicMock()):
+            sched = create_refresh_scheduler(AsyncMock())
+        assert sched._lead_fraction == 0.1
+        assert sched._hot_window == 1800.0
+        assert sched._max_keys == 500
+        assert sched._concurrency == 4
@@ -0,0 +1,294 @@
+"""Tests for the retention / compaction engine (app.data.retention).
+
+Validates age cutoffs, keep-latest-N per key, filtered policies (legacy
+``hist_*`` rows), options snapshot downsampling, mixed timestamp formats,
+batched deletes, incremental vacuum / auto_vacuum conversion and the
+run report.
+
+Runs against a real temporary SQLite database -- no network calls.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_retention.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+import app.data.retention as ret_mod
+from app.analysis.composite import _CREATE_CACHE_TABLE
+from app.data.database import DatabaseManager
+from app.data.retention import RetentionEngine, RetentionPolicy
+
+_ANALYSIS = RetentionPolicy(
+    "analysis_cache", "created_at",
+    max_age_days=30, keep_latest=3, partition_by=("ticker",),
+)
+_HISTORY = RetentionPolicy(
+    "fundamentals_cache", "fetched_at", max_age_days=7,
+    where="data_type = 'price' AND period LIKE 'hist\\_%' ESCAPE '\\'",
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+def _ago(days: float = 0.0, hours: float = 0.0, sqlite_format: bool = False) -> str:
+    dt = datetime.now(timezone.utc) - timedelta(days=days, hours=hours)
+    return dt.strftime("%Y-%m-%d %H:%M:%S") if sqlite_format else dt.isoformat()
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path: Path) -> DatabaseManager:
+    manager = DatabaseManager(db_path=tmp_path / "retention.db")
+    await manager.initialize()
+    await manager.execute(_CREATE_CACHE_TABLE)
+    with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=manager):
+        yield manager
+    await manager.close()
+
+
+def _engine(*policies: RetentionPolicy, options_full_hours: float | None = None) -> RetentionEngine:
+    return RetentionEngine(
+        interval_s=3600.0, policies=list(policies), options_full_hours=options_full_hours,
+    )
+
+
+async def _add_analysis(db: DatabaseManager, ticker: str, created_at: str) -> None:
+    await db.execute(
+        "INSERT INTO analysis_cache "
+        "(ticker, composite_json, signals_json, weights_json, created_at) "
+        "VALUES (?, '{}', '[]', '{}', ?)",
+        (ticker, created_at),
+    )
+
+
+async def _add_fundamental(db: DatabaseManager, period: str, fetched_at: str) -> None:
+    await db.execute(
+        "INSERT INTO fundamentals_cache "
+        "(symbol, data_type, period, value_json, source, fetched_at) "
+        "VALUES ('AAPL', 'price', ?, '[]', 'yfinance', ?)",
+        (period, fetched_at),
+    )
+
+
+async def _add_option(db: DatabaseManager, symbol: str, ticker: str, fetched_at: str) -> None:
+    await db.execute(
+        "INSERT INTO options_cache "
+        "(symbol, expiration_date, contract_type, strike_price, option_ticker, fetched_at) "
+        "VALUES (?, '2026-12-18', 'call', 100.0, ?, ?)",
+        (symbol, ticker, fetched_at),
+    )
+
+
+async def _count(db: DatabaseManager, table: str) -> int:
+    row = await db.fetch_one(f"SELECT COUNT(*) AS n FROM {table}")
+    return row["n"]
+
+
+# ===================================================================
+# 1. Policies
+# ===================================================================
+class TestPolicies:
+
+    @pytest.mark.asyncio
+    async def test_age_cutoff(self, db):
+        await _add_analysis(db, "AAPL", _ago(days=60))
+        await _add_analysis(db, "AAPL", _ago(days=1))
+        report = await _engine(_ANALYSIS).run_once()
+        assert report["rows_deleted"] == {"analysis_cache": 1}
+        assert await _count(db, "analysis_cache") == 1
+
+    @pytest.mark.asyncio
+    async def test_keep_latest_per_key(self, db):
+        for i in range(6):
+            await _add_analysis(db, "AAPL", _ago(hours=i))
+        await _add_analysis(db, "MSFT", _ago(hours=1))
+        await _engine(_ANALYSIS).run_once()
+        rows = await db.fetch_all(
+            "SELECT ticker, created_at FROM analysis_cache ORDER BY ticker, created_at DESC"
+        )
+        assert [r["ticker"] for r in rows] == ["AAPL"] * 3 + ["MSFT"]
+        # The newest three AAPL composites survive.
+        assert rows[0]["created_at"] > rows[2]["created_at"]
+
+    @pytest.mark.asyncio
+    async def test_filtered_policy_only_touches_matching_rows(self, db):
+        await _add_fundamental(db, "hist_1y_1d", _ago(days=30))
+        await _add_fundamental(db, "hist_5d_1h", _ago(days=1))
+        await _add_fundamental(db, "latest", _ago(days=30))
+        await _add_fundamental(db, "history", _ago(days=30))
+        await _engine(_HISTORY).run_once()
+        rows = await db.fetch_all("SELECT period FROM fundamentals_cache ORDER BY period")
+        assert [r["period"] for r in rows] == ["hist_5d_1h", "history", "latest"]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_timestamp_format(self, db):
+        await _add_analysis(db, "AAPL", _ago(days=60, sqlite_format=True))
+        await _add_analysis(db, "AAPL", _ago(hours=1, sqlite_format=True))
+        await _engine(_ANALYSIS).run_once()
+        assert await _count(db, "analysis_cache") == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_table_skipped(self, db):
+        await db.execute("DROP TABLE analysis_cache")
+        report = await _engine(_ANALYSIS).run_once()
+        assert report["rows_deleted"] == {}
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches(self, db, monkeypatch):
+        monkeypatch.setattr(ret_mod, "DELETE_BATCH", 2)
+        for i in range(5):
+            await _add_analysis(db, f"T{i}", _ago(days=60 + i))
+        report = await _engine(_ANALYSIS).run_once()
+        assert report["rows_deleted"] == {"analysis_cache": 5}
+        assert await _count(db, "analysis_cache") == 0
+
+
+# ===================================================================
+# 2. Options downsampling
+# ===================================================================
+class TestOptionsDownsampling:
+
+    @pytest.mark.asyncio
+    async def test_keeps_last_snapshot_per_symbol_per_day(self, db):
+        base = (datetime.now(timezone.utc) - timedelta(days=3)).replace(hour=10, minute=0)
+        for hour in (0, 2, 4):
+            ts = (base + timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M:%S")
+            await _add_option(db, "AAPL", "O:AAPL1", ts)
+            await _add_option(db, "AAPL", "O:AAPL2", ts)
+            await _add_option(db, "MSFT", "O:MSFT1", ts)
+        for hours in (1, 2):
+            await _add_option(db, "AAPL", "O:AAPL1", _ago(hours=hours, sqlite_format=True))
+
+        report = await _engine(options_full_hours=24).run_once()
+
+        assert report["rows_deleted"] == {"options_cache": 6}
+        rows = await db.fetch_all(
+            "SELECT symbol, COUNT(DISTINCT fetched_at) AS snaps FROM options_cache "
+            "WHERE datetime(fetched_at) < datetime('now', '-1 day') GROUP BY symbol"
+        )
+        assert {r["symbol"]: r["snaps"] for r in rows} == {"AAPL": 1, "MSFT": 1}
+        recent = await db.fetch_one(
+            "SELECT COUNT(*) AS n FROM options_cache "
+            "WHERE datetime(fetched_at) >= datetime('now', '-1 day')"
+        )
+        assert recent["n"] == 2
+
+
+# ===================================================================
+# 3. Compaction and reporting
+# ===================================================================
+class TestCompaction:
+
+    @pytest.mark.asyncio
+    async def test_new_database_uses_incremental_auto_vacuum(self, db):
+        assert (await db.page_stats())["auto_vacuum"] == 2
+
+    @pytest.mark.asyncio
+    async def test_reclaims_freed_pages(self, db):
+        blob = "x" * 4000
+        for i in range(200):
+            await db.execute(
+                "INSERT INTO analysis_cache "
+                "(ticker, composite_json, signals_json, weights_json, created_at) "
+                "VALUES (?, ?, '[]', '{}', ?)",
+                (f"T{i}", blob, _ago(days=90)),
+            )
+        report = await _engine(_ANALYSIS).run_once()
+        assert report["rows_deleted"] == {"analysis_cache": 200}
+        assert report["bytes_reclaimed"] > 200 * 4000 // 2
+        assert report["bytes_after"] < report["bytes_before"]
+        assert (await db.page_stats())["freelist_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_converts_legacy_database(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE legacy (x)")
+        conn.commit()
+        conn.close()
+        manager = DatabaseManager(db_path=path)
+        await manager.initialize()
+        try:
+            assert (await manager.page_stats())["auto_vacuum"] == 0
+            # Scheduled reclaim never rewrites the file with a full VACUUM ...
+            assert await manager.reclaim_space() == 0
+            assert (await manager.page_stats())["auto_vacuum"] == 0
+            # ... conversion is an explicit, separate step.
+            await manager.enable_incremental_vacuum()
+            assert (await manager.page_stats())["auto_vacuum"] == 2
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_reclaim_waits_for_open_group_commit(self, db):
+        await db.executemany(
+            "INSERT INTO analysis_cache "
+            "(ticker, composite_json, signals_json, weights_json, created_at) "
+            "VALUES (?, ?, '[]', '{}', ?)",
+            [(f"T{i}", "x" * 4000, _ago()) for i in range(20)],
+        )
+        await db.execute("DELETE FROM analysis_cache")
+        db._commit_window_s = 0.2
+        write = asyncio.ensure_future(db.execute(
+            "INSERT INTO watchlist (symbol) VALUES (?)", ("PEND",)))
+        await asyncio.sleep(0.01)
+        commits = db.get_stats()["commits"]
+        assert await db.reclaim_space() > 0
+        # The pending write landed through its own group commit first.
+        assert write.done()
+        assert db.get_stats()["commits"] == commits + 1
+        assert (await db.page_stats())["freelist_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_accumulate(self, db):
+        engine = _engine(_ANALYSIS)
+        await _add_analysis(db, "AAPL", _ago(days=60))
+        await engine.run_once()
+        await _add_analysis(db, "AAPL", _ago(days=61))
+        await engine.run_once()
+        stats = engine.get_stats()
+        assert stats["runs"] == 2
+        assert stats["total_rows_deleted"] == 2
+        assert stats["last_run"]["rows_deleted"] == {"analysis_cache": 1}
+        assert stats["running"] is False
+
+
+# ===================================================================
+# 4. Background loop
+# ===================================================================
+class TestLifecycle:
+
+    @pytest.mark.asyncio
+    async def test_loop_runs_and_stops(self):
+        engine = _engine()
+        with patch.object(engine, "run_once", new_callable=AsyncMock) as run:
+            engine.start(initial_delay_s=0)
+            await asyncio.sleep(0.01)
+            assert engine.get_stats()["running"] is True
+            await engine.stop()
+        run.assert_awaited_once()
+        assert engine.get_stats()["running"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_counted(self):
+        engine = _engine()
+        with patch.object(engine, "run_once", new_callable=AsyncMock, side_effect=RuntimeError):
+            engine.start(initial_delay_s=0)
+            await asyncio.sleep(0.01)
+            await engine.stop()
+        assert engine.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drops_singleton(self):
+        ret_mod._engine = _engine()
+        ret_mod._engine.start(initial_delay_s=3600)
+        await ret_mod.close_retention_engine()
+        assert ret_mod._engine is None
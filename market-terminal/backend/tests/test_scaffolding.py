@@ -41,7 +41,10 @@ class TestHealthCheck:
     def test_health_response_has_expected_keys(self):
         response = client.get("/api/health")
         data = response.json()
-        assert set(data.keys()) == {"status", "version", "database", "api_keys", "uptime_seconds"}
+        assert set(data.keys()) == {
+            "status", "version", "database", "database_stats", "api_keys",
+            "rate_limits", "cache", "uptime_seconds",
+        }
 
 
 # ===================================================================
@@ -30,13 +30,38 @@ _SENTINEL = object()  # used to distinguish "explicit None" from "use default"
 
 
 class MockDatabase:
-    """Sequentially pops results from internal queues."""
+    """In-memory stand-in for the scan engine's database access.
+
+    ``fetch_one`` / ``fetch_all`` pop from internal queues (table-exists
+    check, then the watchlist).  The batch scan queries are answered from
+    per-symbol dicts: ``composites`` (analysis_cache rows),
+    ``method_signals`` (analysis_results rows) and ``prices`` (price_cache
+    rows).  SQL-side filters are not emulated -- the engine re-checks every
+    filter in Python.
+    """
 
     def __init__(self):
         self._fetch_all_results: list[list[dict]] = []
         self._fetch_one_results: list[dict | None] = []
+        self.composites: dict[str, dict | None] = {}
+        self.method_signals: dict[str, dict | None] = {}
+        self.prices: dict[str, dict | None] = {}
+        self.batch_queries: list[str] = []
+
+    @staticmethod
+    def _keyed(rows: dict[str, dict | None], key: str) -> list[dict]:
+        return [dict(row, **{key: sym}) for sym, row in rows.items() if row is not None]
 
     async def fetch_all(self, sql, params=()):
+        if "FROM analysis_cache" in sql:
+            self.batch_queries.append("composites")
+            return self._keyed(self.composites, "ticker")
+        if "FROM analysis_results" in sql:
+            self.batch_queries.append("method_signals")
+            return self._keyed(self.method_signals, "symbol")
+        if "FROM price_cache" in sql:
+            self.batch_queries.append("last_bars")
+            return self._keyed(self.prices, "symbol")
         if self._fetch_all_results:
             return self._fetch_all_results.pop(0)
         return []
@@ -163,42 +188,31 @@ def _setup_single_ticker_db(
 ):
     """Set up a MockDatabase with one ticker fully populated.
 
-    DB call order in run_scan:
+    DB calls in run_scan:
       1. fetch_one  -- _table_exists  (sqlite_master check)
       2. fetch_all  -- _fetch_watchlist (tickers)
-      3. fetch_one  -- _get_composite  (analysis_cache)
-      4. fetch_one  -- _get_method_signal (only when method query param is set)
-      5. fetch_one  -- price_cache (only when ticker passes _matches)
+      3. fetch_all  -- _fetch_composites  (analysis_cache, batch)
+      4. fetch_all  -- _fetch_method_signals (only when method query param is set)
+      5. fetch_all  -- _fetch_last_bars (only when at least one ticker matched)
 
-    Set *will_match=False* if this ticker will be filtered out (skips price row).
+    *will_match* is accepted for readability at call sites; the batch mock
+    answers every query regardless.
     """
-    db = MockDatabase()
-    # 1. _table_exists -> analysis_cache exists
-    db._fetch_one_results.append({"cnt": 1})
-    # 2. _fetch_watchlist
-    db._fetch_all_results.append([_watchlist_row(symbol, group_name=group_name)])
-    # 3. _get_composite
-    comp_json = _make_composite_json(
-        direction=direction,
-        confidence=confidence,
-        confluence=confluence,
-        timeframe_breakdown=timeframe_breakdown,
+    return _setup_multi_ticker_db(
+        [{
+            "symbol": symbol, "group_name": group_name,
+            "direction": direction, "confidence": confidence,
+            "confluence_count": confluence,
+            "created_at": _NOW_STR if created_at is _SENTINEL else created_at,
+            "method_direction": method_direction,
+            "method_confidence": method_confidence,
+            "method_timeframe": method_timeframe,
+            "close": close, "open_": open_,
+            "timeframe_breakdown": timeframe_breakdown,
+            "will_match": will_match,
+        }],
+        method=method,
     )
-    ca = _NOW_STR if created_at is _SENTINEL else created_at
-    db._fetch_one_results.append(_cache_row(composite_json=comp_json, created_at=ca))
-    # 4. _get_method_signal (only if method specified)
-    if method is not None:
-        db._fetch_one_results.append(
-            _method_signal_row(
-                direction=method_direction,
-                confidence=method_confidence,
-                timeframe=method_timeframe,
-            )
-        )
-    # 5. price_cache (only if ticker will pass _matches)
-    if will_match:
-        db._fetch_one_results.append(_price_row(close=close, open_=open_))
-    return db
 
 
 def _setup_multi_ticker_db(tickers, method=None):
@@ -209,10 +223,6 @@ def _setup_multi_ticker_db(tickers, method=None):
         method_direction, method_confidence, method_timeframe, close, open_,
         timeframe_breakdown, will_match.
     All keys are optional and have sensible defaults.
-
-    IMPORTANT: set ``will_match=False`` on tickers that will be filtered out
-    by _matches(), because those never reach the price_cache fetch_one call.
-    If not specified, defaults to True.
     """
     db = MockDatabase()
     # 1. _table_exists
@@ -224,36 +234,29 @@ def _setup_multi_ticker_db(tickers, method=None):
     ]
     db._fetch_all_results.append(wl)
 
-    for t in tickers:
-        direction = t.get("direction", "bullish")
-        confidence = t.get("confidence", 0.72)
-        confluence = t.get("confluence_count", 4)
-        created_at = t.get("created_at", _NOW_STR)
-        tb = t.get("timeframe_breakdown")
-        will_match = t.get("will_match", True)
+    for i, t in enumerate(tickers):
+        sym = t.get("symbol", f"T{i}")
         comp_json = _make_composite_json(
-            direction=direction,
-            confidence=confidence,
-            confluence=confluence,
-            timeframe_breakdown=tb,
+            direction=t.get("direction", "bullish"),
+            confidence=t.get("confidence", 0.72),
+            confluence=t.get("confluence_count", 4),
+            timeframe_breakdown=t.get("timeframe_breakdown"),
         )
-        # 3. _get_composite
-        db._fetch_one_results.append(
-            _cache_row(composite_json=comp_json, created_at=created_at)
+        # 3. analysis_cache
+        db.composites[sym] = _cache_row(
+            composite_json=comp_json, created_at=t.get("created_at", _NOW_STR),
         )
-        # 4. _get_method_signal (only if method set)
+        # 4. analysis_results (only if method set)
         if method is not None:
-            md = t.get("method_direction", "bullish")
-            mc = t.get("method_confidence", 0.75)
-            mt = t.get("method_timeframe", "medium")
-            db._fetch_one_results.append(
-                _method_signal_row(direction=md, confidence=mc, timeframe=mt)
-            )
-        # 5. price_cache (only if ticker will pass _matches)
-        if will_match:
-            db._fetch_one_results.append(
-                _price_row(close=t.get("close", 150.0), open_=t.get("open_", 145.0))
+            db.method_signals[sym] = _method_signal_row(
+                direction=t.get("method_direction", "bullish"),
+                confidence=t.get("method_confidence", 0.75),
+                timeframe=t.get("method_timeframe", "medium"),
             )
+        # 5. price_cache
+        db.prices[sym] = _price_row(
+            close=t.get("close", 150.0), open_=t.get("open_", 145.0),
+        )
     return db
 
 
@@ -530,10 +533,8 @@ class TestMethodSignalFilter:
         db = MockDatabase()
         db._fetch_one_results.append({"cnt": 1})  # table exists
         db._fetch_all_results.append([_watchlist_row("AAPL")])
-        db._fetch_one_results.append(
-            _cache_row(composite_json=_make_composite_json())
-        )
-        db._fetch_one_results.append(None)  # no method signal
+        db.composites["AAPL"] = _cache_row(composite_json=_make_composite_json())
+        db.method_signals["AAPL"] = None  # no method signal
         with _patch_db(db):
             resp = _get_scan(method="wyckoff")
         assert resp.json()["total_matches"] == 0
@@ -1230,12 +1231,12 @@ class TestStaleAnalysis:
         db._fetch_one_results.append({"cnt": 1})  # table exists
         db._fetch_all_results.append([_watchlist_row("AAPL")])
         # Build cache_row with explicit None for created_at
-        db._fetch_one_results.append({
+        db.composites["AAPL"] = {
             "composite_json": _make_composite_json(),
             "signals_json": "[]",
             "created_at": None,
-        })
-        db._fetch_one_results.append(_price_row())
+        }
+        db.prices["AAPL"] = _price_row()
         with _patch_db(db):
             resp = _get_scan()
         item = resp.json()["results"][0]
@@ -1302,7 +1303,7 @@ class TestEmptyResults:
         db = MockDatabase()
         db._fetch_one_results.append({"cnt": 1})  # table exists
         db._fetch_all_results.append([_watchlist_row("AAPL")])
-        db._fetch_one_results.append(None)  # no composite
+        db.composites["AAPL"] = None  # no composite
         with _patch_db(db):
             resp = _get_scan()
         assert resp.json()["total_matches"] == 0
@@ -1325,11 +1326,11 @@ class TestEmptyResults:
         db = MockDatabase()
         db._fetch_one_results.append({"cnt": 1})  # table exists
         db._fetch_all_results.append([_watchlist_row("AAPL")])
-        db._fetch_one_results.append({
+        db.composites["AAPL"] = {
             "composite_json": "not valid json{{{",
             "signals_json": "[]",
             "created_at": _NOW_STR,
-        })
+        }
         with _patch_db(db):
             resp = _get_scan()
         assert resp.json()["total_matches"] == 0
@@ -1703,8 +1704,8 @@ class TestResultItemFields:
         db = MockDatabase()
         db._fetch_one_results.append({"cnt": 1})  # table exists
         db._fetch_all_results.append([_watchlist_row("AAPL")])
-        db._fetch_one_results.append(_cache_row())  # composite
-        db._fetch_one_results.append(None)  # no price
+        db.composites["AAPL"] = _cache_row()  # composite
+        db.prices["AAPL"] = None  # no price
         with _patch_db(db):
             resp = _get_scan()
         item = resp.json()["results"][0]
@@ -1984,3 +1985,113 @@ class TestTableExists:
         db._fetch_one_results.append({"other": 1})
         result = asyncio.get_event_loop().run_until_complete(_table_exists(db, "test"))
         assert result is False
+
+
+# ===================================================================
+# 23. TestBatchEngine (~8 tests)
+# ===================================================================
+class TestBatchEngine:
+    """Set-based scan engine against a real SQLite database."""
+
+    @staticmethod
+    async def _make_db(tmp_path):
+        from app.analysis.composite import _CREATE_CACHE_TABLE
+        from app.data.database import DatabaseManager
+
+        db = DatabaseManager(tmp_path / "scan.db")
+        await db.initialize()
+        await db.execute(_CREATE_CACHE_TABLE)
+        old = (datetime.now(tz=timezone.utc) - timedelta(days=1)).isoformat()
+        rows = [
+            # symbol, group, confidence, confluence, wyckoff dir, wyckoff conf
+            ("AAPL", "tech", 0.80, 5, "bullish", 0.90),
+            ("MSFT", "tech", 0.55, 3, "bearish", 0.60),
+            ("XOM", "energy", 0.40, 2, "bullish", 0.30),
+        ]
+        for i, (sym, grp, conf, confl, mdir, mconf) in enumerate(rows):
+            await db.execute(
+                "INSERT INTO watchlist (symbol, group_name, sort_order) VALUES (?, ?, ?)",
+                (sym, grp, i),
+            )
+            # An older composite that must be ignored in favour of the latest.
+            await db.execute(
+                "INSERT INTO analysis_cache (ticker, composite_json, signals_json, "
+                "weights_json, created_at) VALUES (?, ?, '[]', '{}', ?)",
+                (sym, _make_composite_json(confidence=0.99, confluence=6), old),
+            )
+            await db.execute(
+                "INSERT INTO analysis_cache (ticker, composite_json, signals_json, "
+                "weights_json, created_at) VALUES (?, ?, '[]', '{}', ?)",
+                (sym, _make_composite_json(confidence=conf, confluence=confl), _NOW_STR),
+            )
+            await db.execute(
+                "INSERT INTO analysis_results (symbol, methodology, direction, "
+                "confidence, timeframe, signal_json, analyzed_at) "
+                "VALUES (?, 'wyckoff', ?, ?, 'medium', '{}', ?)",
+                (sym, mdir, mconf, _NOW_STR),
+            )
+            for day, (opn, close) in enumerate([(90.0, 95.0), (100.0, 110.0)]):
+                await db.execute(
+                    "INSERT INTO price_cache (symbol, date, open, close, source) "
+                    "VALUES (?, ?, ?, ?, 'test')",
+                    (sym, f"2024-01-0{day + 1}", opn, close),
+                )
+        return db
+
+    @staticmethod
+    def _scan(tmp_path, **kwargs):
+        import asyncio
+        from app.api.routes.scan import _scan_impl
+
+        async def _run():
+            db = await TestBatchEngine._make_db(tmp_path)
+            try:
+                with _patch_db(db):
+                    return await _scan_impl(**kwargs)
+            finally:
+                await db.close()
+
+        return asyncio.run(_run())
+
+    def test_latest_composite_only(self, tmp_path):
+        out = self._scan(tmp_path)
+        confs = {r["symbol"]: r["composite"]["overall_confidence"] for r in out["results"]}
+        assert confs == {"AAPL": 0.80, "MSFT": 0.55, "XOM": 0.40}
+
+    def test_last_bar_price(self, tmp_path):
+        out = self._scan(tmp_path)
+        item = next(r for r in out["results"] if r["symbol"] == "AAPL")
+        assert item["last_price"] == 110.0
+        assert item["price_change_percent"] == 10.0
+
+    def test_confluence_and_confidence_pushed_down(self, tmp_path):
+        out = self._scan(tmp_path, confluence=3, min_confidence=0.5)
+        assert {r["symbol"] for r in out["results"]} == {"AAPL", "MSFT"}
+        assert out["scan_plan"]["pushed_filters"] == ["confluence", "composite_confidence"]
+
+    def test_method_signal_filter(self, tmp_path):
+        out = self._scan(tmp_path, method="wyckoff", signal="bullish", min_confidence=0.5)
+        assert [r["symbol"] for r in out["results"]] == ["AAPL"]
+        assert "method_signals" in out["scan_plan"]["queries"]
+
+    def test_group_filter(self, tmp_path):
+        out = self._scan(tmp_path, group="energy")
+        assert [r["symbol"] for r in out["results"]] == ["XOM"]
+        assert out["total_scanned"] == 1
+
+    def test_constant_query_count(self, tmp_path):
+        out = self._scan(tmp_path, method="wyckoff")
+        assert out["scan_plan"]["engine"] == "batch"
+        assert out["scan_plan"]["queries"] == [
+            "watchlist", "composites", "method_signals", "last_bars",
+        ]
+
+    def test_plan_has_timings(self, tmp_path):
+        timings = self._scan(tmp_path)["scan_plan"]["timings_ms"]
+        for key in ("watchlist", "composites", "filter", "last_bars"):
+            assert timings[key] >= 0
+
+    def test_no_price_query_when_nothing_matches(self, tmp_path):
+        out = self._scan(tmp_path, confluence=6)
+        assert out["results"] == []
+        assert "last_bars" not in out["scan_plan"]["queries"]
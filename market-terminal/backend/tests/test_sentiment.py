@@ -41,7 +41,10 @@ from app.analysis.sentiment import (
     _NO_ARTICLES_CONFIDENCE,
     _RECENCY_HALF_LIFE_DAYS,
     _STOPWORDS,
+    _FINBERT_SCORE_VERSION,
     _TREND_THRESHOLD,
+    _finbert_batcher,
+    _score_cache_key,
     get_finbert,
     _load_lm_dict,
 )
@@ -2364,5 +2367,117 @@ class TestArticleScoredFields(unittest.TestCase):
             self.assertEqual(scored[0]["source"], "Reuters")
 
 
+
+# ---------------------------------------------------------------------------
+# 28. TestFinBERTScoreCache
+# ---------------------------------------------------------------------------
+
+
+class TestFinBERTScoreCache(unittest.TestCase):
+    """Persistent FinBERT score cache and batched inference."""
+
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+        self.now = datetime.now(tz=timezone.utc)
+        articles = [
+            {"headline": "Cached headline", "url": "https://x/1", "published_at": self.now.isoformat()},
+            {"headline": "Fresh headline", "url": "https://x/2", "published_at": self.now.isoformat()},
+            {"headline": "No url headline", "published_at": self.now.isoformat()},
+        ]
+        self.parsed = self.analyzer._parse_articles(articles, self.now)
+
+    def _run_scoring(self, cached: dict[str, Any]):
+        calls: list[str] = []
+        saved: list[Any] = []
+
+        async def _score(self_, text):
+            calls.append(text)
+            return {"score": 0.5, "label": "bullish", "model": "finbert",
+                    "model_version": _FINBERT_SCORE_VERSION}
+
+        async def _load(symbol, keys):
+            return {k: v for k, v in cached.items() if k in keys}
+
+        async def _save(symbol, rows):
+            saved.extend(rows)
+
+        with patch.object(SentimentAnalyzer, "score_article", _score), \
+                patch("app.analysis.sentiment._load_cached_scores", _load), \
+                patch("app.analysis.sentiment._save_cached_scores", _save):
+            scored = _run(self.analyzer._score_all_articles(self.parsed, self.now, symbol="AAPL"))
+        return scored, calls, saved
+
+    def test_cache_key_prefers_url(self):
+        self.assertEqual(_score_cache_key({"url": " https://x/1 "}, "t"), "https://x/1")
+
+    def test_cache_key_hashes_text_without_url(self):
+        key = _score_cache_key({"url": ""}, "some text")
+        self.assertTrue(key.startswith("sha256:"))
+        self.assertEqual(key, _score_cache_key({}, "some text"))
+
+    def test_cached_articles_not_rescored(self):
+        cached = {"https://x/1": {"url": "https://x/1", "headline": "Cached headline",
+                                  "summary": "", "sentiment_score": -0.6}}
+        scored, calls, saved = self._run_scoring(cached)
+        self.assertEqual(calls, ["Fresh headline", "No url headline"])
+        self.assertAlmostEqual(scored[0]["score"], -0.6)
+        self.assertEqual(scored[0]["label"], "bearish")
+        self.assertEqual(len(saved), 2)
+
+    def test_changed_headline_is_rescored(self):
+        cached = {"https://x/1": {"url": "https://x/1", "headline": "Old headline",
+                                  "summary": "", "sentiment_score": -0.6}}
+        scored, calls, _ = self._run_scoring(cached)
+        self.assertIn("Cached headline", calls)
+        self.assertAlmostEqual(scored[0]["score"], 0.5)
+
+    def test_changed_summary_is_rescored(self):
+        cached = {"https://x/1": {"url": "https://x/1", "headline": "Cached headline",
+                                  "summary": "Earlier summary", "sentiment_score": -0.6}}
+        scored, calls, _ = self._run_scoring(cached)
+        self.assertIn("Cached headline", calls)
+        self.assertAlmostEqual(scored[0]["score"], 0.5)
+
+    def test_non_finbert_results_not_saved(self):
+        saved: list[Any] = []
+
+        async def _load(symbol, keys):
+            return {}
+
+        async def _save(symbol, rows):
+            saved.extend(rows)
+
+        with _patch_score_article(model="loughran_mcdonald"), \
+                patch("app.analysis.sentiment._load_cached_scores", _load), \
+                patch("app.analysis.sentiment._save_cached_scores", _save):
+            _run(self.analyzer._score_all_articles(self.parsed, self.now, symbol="AAPL"))
+        self.assertEqual(saved, [])
+
+    def test_cache_read_failure_falls_back_to_scoring(self):
+        async def _load(symbol, keys):
+            raise RuntimeError("db down")
+
+        with _patch_score_article(), \
+                patch("app.analysis.sentiment._load_cached_scores", _load), \
+                patch("app.analysis.sentiment._save_cached_scores", MagicMock()):
+            scored = _run(self.analyzer._score_all_articles(self.parsed, self.now, symbol="AAPL"))
+        self.assertEqual(len(scored), 3)
+
+    def test_batcher_coalesces_concurrent_submits(self):
+        batches: list[list[str]] = []
+
+        def _probs(texts):
+            batches.append(list(texts))
+            return [(0.1 * i, 0.0) for i in range(len(texts))]
+
+        async def _go():
+            return await asyncio.gather(*(_finbert_batcher.submit(t) for t in ["a", "b", "c"]))
+
+        with patch("app.analysis.sentiment._finbert_probs", _probs):
+            results = _run(_go())
+        self.assertEqual(batches, [["a", "b", "c"]])
+        self.assertEqual([r[0] for r in results], [0.0, 0.1, 0.2])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,12 +2,15 @@
 
 Validates symbol validation, price response structure, fallback/error handling,
 query parameters (period, include_history), OHLCV history, market open detection,
-asset type inference, price block construction, and edge cases.
+asset type inference, price block construction, edge cases, incremental
+history (``since``) with ETag / If-None-Match revalidation, and cached
+supplements fetched concurrently with the quote (per-section freshness).
 
 Run with: ``pytest tests/test_ticker_endpoint.py -v``
 """
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 from zoneinfo import ZoneInfo
@@ -81,6 +84,13 @@ def _make_cached_result(data, **overrides):
     return CachedResult(**defaults)
 
 
+def _supplement_result(data, data_type):
+    """Cached profile / financials section (None stays None)."""
+    if data is None:
+        return None
+    return _make_cached_result(data, data_type=data_type, cache_key=f"{data_type}:AAPL:latest")
+
+
 def _patch_ticker(
     price_data=None,
     price_result="default",
@@ -115,20 +125,20 @@ def _patch_ticker(
         hist_cr = None
     else:
         hist_cr = hist_result
-    cache_mock.get_historical_prices = AsyncMock(return_value=hist_cr)
+    cache_mock.get_chart_bars = AsyncMock(return_value=hist_cr)
 
     finnhub_mock = MagicMock()
     type(finnhub_mock).is_enabled = PropertyMock(return_value=finnhub_enabled)
 
     if profile_raises:
-        finnhub_mock.get_company_profile = AsyncMock(side_effect=Exception("profile error"))
+        cache_mock.get_company_profile = AsyncMock(side_effect=Exception("profile error"))
     else:
-        finnhub_mock.get_company_profile = AsyncMock(return_value=profile)
+        cache_mock.get_company_profile = AsyncMock(return_value=_supplement_result(profile, "profile"))
 
     if financials_raises:
-        finnhub_mock.get_basic_financials = AsyncMock(side_effect=Exception("financials error"))
+        cache_mock.get_basic_financials = AsyncMock(side_effect=Exception("financials error"))
     else:
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=financials)
+        cache_mock.get_basic_financials = AsyncMock(return_value=_supplement_result(financials, "financials"))
 
     cache_patcher = patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock)
     finnhub_patcher = patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock)
@@ -493,10 +503,10 @@ class TestFallbackAndErrorHandling:
         assert resp.status_code == 404
 
     def test_cache_get_historical_raises_returns_empty_ohlcv(self):
-        """If cache.get_historical_prices() raises, endpoint returns empty ohlcv."""
+        """If cache.get_chart_bars() raises, endpoint returns empty ohlcv."""
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(side_effect=Exception("db error"))
+        cache_mock.get_chart_bars = AsyncMock(side_effect=Exception("db error"))
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=False)
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
@@ -513,20 +523,20 @@ class TestQueryParameters:
     """Verify period and include_history query parameters."""
 
     def test_default_period_is_1d(self):
-        """Without specifying period, default is 1d mapped to yfinance '1d'."""
+        """Without specifying period, default is the daily chart rule."""
         hist_cr = _make_cached_result(_SAMPLE_HISTORY, data_type="historical")
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(return_value=hist_cr)
+        cache_mock.get_chart_bars = AsyncMock(return_value=hist_cr)
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=True)
-        finnhub_mock.get_company_profile = AsyncMock(return_value=_SAMPLE_PROFILE)
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=None)
+        cache_mock.get_company_profile = AsyncMock(return_value=_supplement_result(_SAMPLE_PROFILE, "profile"))
+        cache_mock.get_basic_financials = AsyncMock(return_value=None)
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
              patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock):
             resp = _get("AAPL", include_history="true")
         assert resp.status_code == 200
-        cache_mock.get_historical_prices.assert_called_once_with("AAPL", period="1d", interval="1d")
+        cache_mock.get_chart_bars.assert_called_once_with("AAPL", "1d", since=None)
 
     def test_include_history_false_no_ohlcv(self):
         cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE)
@@ -577,69 +587,70 @@ class TestQueryParameters:
         assert resp.status_code == 422
 
     @pytest.mark.parametrize(
-        "user_period, yf_period",
+        "user_period, rule",
         [
             ("1d", "1d"),
-            ("1w", "5d"),
+            ("1w", "1wk"),
             ("1m", "1mo"),
             ("3m", "3mo"),
-            ("6m", "6mo"),
+            ("6mo", "6mo"),
             ("1y", "1y"),
             ("5y", "5y"),
+            ("1h", "1h"),
+            ("4h", "4h"),
+            ("8h", "8h"),
+            ("12h", "12h"),
         ],
-        ids=["1d->1d", "1w->5d", "1m->1mo", "3m->3mo", "6m->6mo", "1y->1y", "5y->5y"],
     )
-    def test_period_maps_correctly(self, user_period, yf_period):
-        """Verify that user-facing period is mapped to the correct yfinance period."""
+    def test_period_maps_correctly(self, user_period, rule):
+        """Verify that each user-facing period is served by its chart rule."""
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(return_value=None)
+        cache_mock.get_chart_bars = AsyncMock(return_value=None)
 
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=True)
-        finnhub_mock.get_company_profile = AsyncMock(return_value=_SAMPLE_PROFILE)
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=None)
+        cache_mock.get_company_profile = AsyncMock(return_value=_supplement_result(_SAMPLE_PROFILE, "profile"))
+        cache_mock.get_basic_financials = AsyncMock(return_value=None)
 
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
              patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock):
             _get("AAPL", period=user_period, include_history="true")
 
-        cache_mock.get_historical_prices.assert_called_once_with(
-            "AAPL", period=yf_period, interval="1d",
-        )
+        cache_mock.get_chart_bars.assert_called_once_with("AAPL", rule, since=None)
 
     def test_include_history_true_calls_get_historical(self):
-        """With include_history=true, cache.get_historical_prices is invoked."""
+        """With include_history=true, cache.get_chart_bars is invoked."""
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(return_value=None)
+        cache_mock.get_chart_bars = AsyncMock(return_value=None)
 
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=True)
-        finnhub_mock.get_company_profile = AsyncMock(return_value=None)
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=None)
+        cache_mock.get_company_profile = AsyncMock(return_value=None)
+        cache_mock.get_basic_financials = AsyncMock(return_value=None)
 
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
              patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock):
             _get("AAPL", include_history="true")
 
-        cache_mock.get_historical_prices.assert_called_once()
+        cache_mock.get_chart_bars.assert_called_once()
 
     def test_include_history_false_does_not_call_historical(self):
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(return_value=None)
+        cache_mock.get_chart_bars = AsyncMock(return_value=None)
 
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=True)
-        finnhub_mock.get_company_profile = AsyncMock(return_value=None)
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=None)
+        cache_mock.get_company_profile = AsyncMock(return_value=None)
+        cache_mock.get_basic_financials = AsyncMock(return_value=None)
 
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
              patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock):
             _get("AAPL", include_history="false")
 
-        cache_mock.get_historical_prices.assert_not_called()
+        cache_mock.get_chart_bars.assert_not_called()
 
 
 # ===================================================================
@@ -658,12 +669,12 @@ class TestOHLCVHistory:
 
         cache_mock = MagicMock()
         cache_mock.get_price = AsyncMock(return_value=_make_cached_result(_SAMPLE_QUOTE))
-        cache_mock.get_historical_prices = AsyncMock(return_value=hr)
+        cache_mock.get_chart_bars = AsyncMock(return_value=hr)
 
         finnhub_mock = MagicMock()
         type(finnhub_mock).is_enabled = PropertyMock(return_value=True)
-        finnhub_mock.get_company_profile = AsyncMock(return_value=_SAMPLE_PROFILE)
-        finnhub_mock.get_basic_financials = AsyncMock(return_value=None)
+        cache_mock.get_company_profile = AsyncMock(return_value=_supplement_result(_SAMPLE_PROFILE, "profile"))
+        cache_mock.get_basic_financials = AsyncMock(return_value=None)
 
         with patch("app.api.routes.ticker.get_cache_manager", return_value=cache_mock), \
              patch("app.api.routes.ticker.get_finnhub_client", return_value=finnhub_mock):
@@ -699,7 +710,7 @@ class TestOHLCVHistory:
         assert first["volume"] == 35_000_000
 
     def test_ohlcv_empty_when_hist_result_none(self):
-        """When cache.get_historical_prices returns None, ohlcv is []."""
+        """When cache.get_chart_bars returns None, ohlcv is []."""
         body = self._get_with_history(hist_data=None, hist_result=None)
         assert body["ohlcv"] == []
 
@@ -1212,3 +1223,180 @@ class TestCombinedScenarios:
         assert resp1.json()["name"] == "CompA"
         assert resp2.json()["price"]["current"] == 200
         assert resp2.json()["name"] == "CompB"
+
+
+# ===================================================================
+# 11. Incremental history and conditional GET
+# ===================================================================
+class TestIncrementalHistory:
+    """``since`` cursors and ETag / If-None-Match on the ticker payload."""
+
+    def test_since_passed_to_chart_bars(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY[-1:])
+        with cp as cache_patch, fp:
+            resp = _get("AAPL", include_history="true", since="2026-02-05")
+        assert resp.status_code == 200
+        assert len(resp.json()["ohlcv"]) == 1
+        cache_patch.return_value.get_chart_bars.assert_called_once_with(
+            "AAPL", "1d", since="2026-02-05",
+        )
+
+    def test_intraday_since_accepted(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=[])
+        with cp, fp:
+            resp = _get("AAPL", include_history="true", period="4h",
+                        since="2026-02-05T13:30:00-05:00")
+        assert resp.status_code == 200
+
+    def test_malformed_since_returns_422(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE)
+        with cp, fp:
+            resp = _get("AAPL", include_history="true", since="yesterday")
+        assert resp.status_code == 422
+
+    def test_response_carries_etag(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY)
+        with cp, fp:
+            resp = _get("AAPL", include_history="true")
+        assert resp.headers["etag"].startswith('W/"')
+        assert resp.headers["cache-control"] == "no-cache"
+
+    def test_unchanged_data_returns_304(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY)
+        with cp, fp:
+            etag = _get("AAPL", include_history="true").headers["etag"]
+            resp = client.get(
+                "/api/ticker/AAPL", params={"include_history": "true"},
+                headers={"If-None-Match": etag},
+            )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_cache_age_does_not_change_etag(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE)
+        with cp, fp:
+            first = _get("AAPL").headers["etag"]
+        aged = _make_cached_result(dict(_SAMPLE_QUOTE), cache_age_seconds=300.0)
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, price_result=aged)
+        with cp, fp:
+            assert _get("AAPL").headers["etag"] == first
+
+    def test_304_answered_before_ohlcv_built(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY)
+        with cp, fp:
+            etag = _get("AAPL", include_history="true").headers["etag"]
+        bar = MagicMock()
+        bar.get.side_effect = AssertionError("bar rows built for a 304")
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=[bar])
+        with cp, fp:
+            resp = client.get(
+                "/api/ticker/AAPL", params={"include_history": "true"},
+                headers={"If-None-Match": etag},
+            )
+        assert resp.status_code == 304
+
+    def test_refetched_quote_changes_etag(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE)
+        with cp, fp:
+            first = _get("AAPL").headers["etag"]
+        newer = _make_cached_result(
+            dict(_SAMPLE_QUOTE), fetched_at="2026-02-07T16:05:00+00:00",
+        )
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, price_result=newer)
+        with cp, fp:
+            assert _get("AAPL").headers["etag"] != first
+
+    def test_refetched_history_changes_etag(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY)
+        with cp, fp:
+            etag = _get("AAPL", include_history="true").headers["etag"]
+        newer = _make_cached_result(
+            _SAMPLE_HISTORY, data_type="historical", cache_key="hist:AAPL:1d",
+            fetched_at="2026-02-07T16:15:00+00:00",
+        )
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_result=newer)
+        with cp, fp:
+            resp = client.get(
+                "/api/ticker/AAPL", params={"include_history": "true"},
+                headers={"If-None-Match": etag},
+            )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+
+# ===================================================================
+# 12. Cached supplements and per-section freshness
+# ===================================================================
+class TestSupplements:
+    """Profile / financials via the cache, concurrently with the quote."""
+
+    def test_freshness_block_per_section(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, financials=_SAMPLE_FINANCIALS)
+        with cp, fp:
+            body = _get("AAPL").json()
+        fresh = body["freshness"]
+        assert set(fresh) == {"quote", "profile", "financials"}
+        assert fresh["quote"] == {
+            "source": "finnhub",
+            "fetched_at": "2026-02-07T16:00:00+00:00",
+            "age_seconds": 42.0,
+            "is_stale": False,
+            "expires_at": "2026-02-07T16:15:00+00:00",
+        }
+        assert fresh["profile"]["source"] == "finnhub"
+
+    def test_missing_supplement_has_no_freshness(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, financials_raises=True)
+        with cp, fp:
+            body = _get("AAPL").json()
+        assert body["freshness"]["financials"] is None
+        assert body["name"] == "Apple Inc"
+
+    def test_history_freshness_when_requested(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, hist_data=_SAMPLE_HISTORY)
+        with cp, fp:
+            body = _get("AAPL", include_history="true").json()
+        assert body["freshness"]["history"]["fetched_at"] == "2026-02-07T16:00:00+00:00"
+
+    def test_supplements_read_through_cache(self):
+        cp, fp = _patch_ticker(profile=_SAMPLE_PROFILE, financials=_SAMPLE_FINANCIALS)
+        with cp as cache_patch, fp as finnhub_patch:
+            _get("AAPL")
+        cache_mock = cache_patch.return_value
+        cache_mock.get_company_profile.assert_awaited_once_with("AAPL")
+        cache_mock.get_basic_financials.assert_awaited_once_with("AAPL")
+        finnhub_patch.return_value.get_company_profile.assert_not_called()
+
+    def test_supplements_skipped_when_finnhub_disabled(self):
+        cp, fp = _patch_ticker(finnhub_enabled=False)
+        with cp as cache_patch, fp:
+            body = _get("AAPL").json()
+        cache_patch.return_value.get_company_profile.assert_not_called()
+        assert body["freshness"]["profile"] is None
+
+    def test_fetched_concurrently_with_quote(self):
+        active = 0
+        peak = 0
+
+        def _tracked(result):
+            async def _call(*args, **kwargs):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return result
+            return _call
+
+        cp, fp = _patch_ticker()
+        with cp as cache_patch, fp:
+            cache_mock = cache_patch.return_value
+            cache_mock.get_price = AsyncMock(side_effect=_tracked(_make_cached_result(_SAMPLE_QUOTE)))
+            cache_mock.get_company_profile = AsyncMock(
+                side_effect=_tracked(_supplement_result(_SAMPLE_PROFILE, "profile")),
+            )
+            cache_mock.get_basic_financials = AsyncMock(side_effect=_tracked(None))
+            resp = _get("AAPL")
+        assert resp.status_code == 200
+        assert peak == 3
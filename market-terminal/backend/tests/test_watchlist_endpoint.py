@@ -72,13 +72,18 @@ class MockDatabase:
 
 @contextmanager
 def _patch_db(mock_db):
-    """Replace ``get_database`` in the watchlist route module."""
+    """Replace ``get_database`` (and the cache manager, exposed as
+    ``mock_db.cache_manager``) in the watchlist route module."""
     async def _get_mock_db():
         return mock_db
 
+    mock_db.cache_manager = unittest.mock.MagicMock()
     with unittest.mock.patch(
         "app.api.routes.watchlist.get_database",
         new=_get_mock_db,
+    ), unittest.mock.patch(
+        "app.api.routes.watchlist.get_cache_manager",
+        return_value=mock_db.cache_manager,
     ):
         yield mock_db
 
@@ -370,6 +375,12 @@ class TestAddTicker:
             body = client.post("/api/watchlist/", json={"symbol": "AAPL"}).json()
         assert body["symbol"] == "AAPL"
 
+    def test_successful_add_pins_quote_refresh(self):
+        db = self._add_success_db()
+        with _patch_db(db):
+            client.post("/api/watchlist/", json={"symbol": "aapl"})
+        db.cache_manager.pin_symbols.assert_called_once_with(["AAPL"])
+
     def test_default_group_is_default(self):
         db = self._add_success_db(group="default")
         with _patch_db(db):
@@ -677,6 +688,12 @@ class TestDeleteTicker:
             body = client.delete("/api/watchlist/AAPL").json()
         assert body == {"removed": "AAPL"}
 
+    def test_delete_unpins_quote_refresh(self):
+        db = MockDatabase(fetch_one_results=[{"id": 1}])
+        with _patch_db(db):
+            client.delete("/api/watchlist/aapl")
+        db.cache_manager.unpin_symbols.assert_called_once_with(["AAPL"])
+
     def test_not_found_returns_404(self):
         db = MockDatabase(fetch_one_results=[None])
         with _patch_db(db):
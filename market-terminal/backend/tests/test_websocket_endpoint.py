@@ -25,6 +25,8 @@ from app.api.routes.websocket import (
     _HEARTBEAT_INTERVAL_S,
     _MAX_CONNECTIONS,
     _MAX_MESSAGE_BYTES,
+    _SEND_QUEUE_SIZE,
+    _SLOW_CONSUMER_CLOSE_CODE,
     _STALE_TIMEOUT_S,
     ws_manager,
 )
@@ -53,10 +55,25 @@ def _make_mock_ws(state=WebSocketState.CONNECTED):
     """Create a mock WebSocket object."""
     ws = MagicMock()
     ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
     type(ws).client_state = PropertyMock(return_value=state)
     return ws
 
 
+def _frame(message):
+    """The text frame the manager sends for *message*."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def _deliver(mgr, coro):
+    """Run a manager send coroutine, then wait for its writers to drain."""
+    async def _go():
+        await coro
+        await mgr.drain()
+    _run(_go())
+
+
 def _fresh_manager():
     """Return a new WebSocketManager with no connections."""
     return WebSocketManager()
@@ -66,10 +83,12 @@ def _fresh_manager():
 def _clean_ws_manager():
     """Context manager that clears ws_manager connections before and after."""
     ws_manager._connections.clear()
+    ws_manager._channels.clear()
     try:
         yield ws_manager
     finally:
         ws_manager._connections.clear()
+        ws_manager._channels.clear()
 
 
 def _add_connection_sync(mgr, ws, client_id):
@@ -199,24 +218,24 @@ class TestManagerBroadcast:
         _run(mgr.connect(ws2, "c2"))
         _run(mgr.connect(ws3, "c3"))
         msg = {"type": "price_update", "symbol": "AAPL"}
-        _run(mgr.broadcast(msg))
-        ws1.send_json.assert_called_once_with(msg)
-        ws2.send_json.assert_called_once_with(msg)
-        ws3.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws1.send_text.assert_called_once_with(_frame(msg))
+        ws2.send_text.assert_called_once_with(_frame(msg))
+        ws3.send_text.assert_called_once_with(_frame(msg))
 
     def test_broadcast_to_empty_pool(self):
         mgr = _fresh_manager()
         # Should not raise
-        _run(mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
 
     def test_broadcast_one_failing_client_removed(self):
         mgr = _fresh_manager()
         ws_ok = _make_mock_ws()
         ws_bad = _make_mock_ws()
-        ws_bad.send_json = AsyncMock(side_effect=Exception("broken pipe"))
+        ws_bad.send_text = AsyncMock(side_effect=Exception("broken pipe"))
         _run(mgr.connect(ws_ok, "ok"))
         _run(mgr.connect(ws_bad, "bad"))
-        _run(mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
         # Failing client should be removed
         assert "bad" not in mgr._connections
         assert "ok" in mgr._connections
@@ -225,11 +244,11 @@ class TestManagerBroadcast:
         mgr = _fresh_manager()
         ws1 = _make_mock_ws()
         ws2 = _make_mock_ws()
-        ws1.send_json = AsyncMock(side_effect=Exception("fail"))
-        ws2.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws1.send_text = AsyncMock(side_effect=Exception("fail"))
+        ws2.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws1, "c1"))
         _run(mgr.connect(ws2, "c2"))
-        _run(mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
         assert mgr.get_connection_count() == 0
 
     def test_broadcast_does_not_block_on_failure(self):
@@ -237,26 +256,26 @@ class TestManagerBroadcast:
         mgr = _fresh_manager()
         ws_ok = _make_mock_ws()
         ws_bad = _make_mock_ws()
-        ws_bad.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws_bad.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws_ok, "ok"))
         _run(mgr.connect(ws_bad, "bad"))
         msg = {"type": "test"}
-        _run(mgr.broadcast(msg))
-        ws_ok.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws_ok.send_text.assert_called_once_with(_frame(msg))
 
     def test_broadcast_message_preserved(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
         _run(mgr.connect(ws, "c1"))
         msg = {"type": "news_alert", "symbol": "MSFT", "headline": "Big news"}
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_broadcast_disconnected_client_removed(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws(state=WebSocketState.DISCONNECTED)
         _run(mgr.connect(ws, "c1"))
-        _run(mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
         assert "c1" not in mgr._connections
 
 
@@ -272,26 +291,26 @@ class TestManagerSendToClient:
         ws = _make_mock_ws()
         _run(mgr.connect(ws, "c1"))
         msg = {"type": "test", "data": 42}
-        _run(mgr.send_to_client("c1", msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.send_to_client("c1", msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_send_to_unknown_client_logs_warning(self):
         mgr = _fresh_manager()
         with patch("app.api.routes.websocket.logger") as mock_logger:
-            _run(mgr.send_to_client("nonexistent", {"type": "test"}))
+            _deliver(mgr, mgr.send_to_client("nonexistent", {"type": "test"}))
             mock_logger.warning.assert_called()
 
     def test_send_to_unknown_client_no_error(self):
         mgr = _fresh_manager()
         # Should not raise
-        _run(mgr.send_to_client("nonexistent", {"type": "test"}))
+        _deliver(mgr, mgr.send_to_client("nonexistent", {"type": "test"}))
 
     def test_send_failure_disconnects_client(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
-        ws.send_json = AsyncMock(side_effect=Exception("broken"))
+        ws.send_text = AsyncMock(side_effect=Exception("broken"))
         _run(mgr.connect(ws, "c1"))
-        _run(mgr.send_to_client("c1", {"type": "test"}))
+        _deliver(mgr, mgr.send_to_client("c1", {"type": "test"}))
         assert "c1" not in mgr._connections
 
     def test_send_only_to_target_not_others(self):
@@ -300,14 +319,14 @@ class TestManagerSendToClient:
         ws2 = _make_mock_ws()
         _run(mgr.connect(ws1, "c1"))
         _run(mgr.connect(ws2, "c2"))
-        _run(mgr.send_to_client("c1", {"type": "test"}))
-        ws2.send_json.assert_not_called()
+        _deliver(mgr, mgr.send_to_client("c1", {"type": "test"}))
+        ws2.send_text.assert_not_called()
 
     def test_send_to_disconnected_client_removes_it(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws(state=WebSocketState.DISCONNECTED)
         _run(mgr.connect(ws, "c1"))
-        _run(mgr.send_to_client("c1", {"type": "test"}))
+        _deliver(mgr, mgr.send_to_client("c1", {"type": "test"}))
         assert "c1" not in mgr._connections
 
 
@@ -326,20 +345,20 @@ class TestManagerBroadcastToSubscribers:
         _run(mgr.connect(ws2, "c2"))
         _run(mgr.subscribe("c1", "price:AAPL"))
         msg = {"type": "price_update", "symbol": "AAPL"}
-        _run(mgr.broadcast_to_subscribers("price:AAPL", msg))
-        ws1.send_json.assert_called_once_with(msg)
-        ws2.send_json.assert_not_called()
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", msg))
+        ws1.send_text.assert_called_once_with(_frame(msg))
+        ws2.send_text.assert_not_called()
 
     def test_no_subscribers_no_sends(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
         _run(mgr.connect(ws, "c1"))
-        _run(mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
-        ws.send_json.assert_not_called()
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
+        ws.send_text.assert_not_called()
 
     def test_empty_pool_no_error(self):
         mgr = _fresh_manager()
-        _run(mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
 
     def test_mixed_subscriptions(self):
         mgr = _fresh_manager()
@@ -353,18 +372,18 @@ class TestManagerBroadcastToSubscribers:
         _run(mgr.subscribe("c2", "price:AAPL"))
         # c3 is NOT subscribed
         msg = {"type": "price_update"}
-        _run(mgr.broadcast_to_subscribers("price:AAPL", msg))
-        ws1.send_json.assert_called_once_with(msg)
-        ws2.send_json.assert_called_once_with(msg)
-        ws3.send_json.assert_not_called()
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", msg))
+        ws1.send_text.assert_called_once_with(_frame(msg))
+        ws2.send_text.assert_called_once_with(_frame(msg))
+        ws3.send_text.assert_not_called()
 
     def test_failing_subscriber_removed(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
-        ws.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws, "c1"))
         _run(mgr.subscribe("c1", "ch"))
-        _run(mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
         assert "c1" not in mgr._connections
 
     def test_different_channel_not_sent(self):
@@ -372,8 +391,8 @@ class TestManagerBroadcastToSubscribers:
         ws = _make_mock_ws()
         _run(mgr.connect(ws, "c1"))
         _run(mgr.subscribe("c1", "news:AAPL"))
-        _run(mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
-        ws.send_json.assert_not_called()
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
+        ws.send_text.assert_not_called()
 
     def test_multiple_channels_one_matches(self):
         mgr = _fresh_manager()
@@ -381,8 +400,8 @@ class TestManagerBroadcastToSubscribers:
         _run(mgr.connect(ws, "c1"))
         _run(mgr.subscribe("c1", "price:AAPL"))
         _run(mgr.subscribe("c1", "news:AAPL"))
-        _run(mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
-        ws.send_json.assert_called_once()
+        _deliver(mgr, mgr.broadcast_to_subscribers("price:AAPL", {"type": "test"}))
+        ws.send_text.assert_called_once()
 
 
 # ===================================================================
@@ -655,38 +674,38 @@ class TestManagerSafeSend:
         mgr = _fresh_manager()
         ws = _make_mock_ws()
         conn = _Connection(ws, "c1")
-        result = _run(mgr._safe_send(conn, {"type": "test"}))
+        result = _run(mgr._safe_send(conn, _frame({"type": "test"})))
         assert result is False
 
     def test_failure_returns_true(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
-        ws.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws.send_text = AsyncMock(side_effect=Exception("fail"))
         conn = _Connection(ws, "c1")
-        result = _run(mgr._safe_send(conn, {"type": "test"}))
+        result = _run(mgr._safe_send(conn, _frame({"type": "test"})))
         assert result is True
 
     def test_disconnected_state_returns_true(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws(state=WebSocketState.DISCONNECTED)
         conn = _Connection(ws, "c1")
-        result = _run(mgr._safe_send(conn, {"type": "test"}))
+        result = _run(mgr._safe_send(conn, _frame({"type": "test"})))
         assert result is True
 
     def test_disconnected_does_not_call_send(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws(state=WebSocketState.DISCONNECTED)
         conn = _Connection(ws, "c1")
-        _run(mgr._safe_send(conn, {"type": "test"}))
-        ws.send_json.assert_not_called()
+        _run(mgr._safe_send(conn, _frame({"type": "test"})))
+        ws.send_text.assert_not_called()
 
-    def test_connected_calls_send_json(self):
+    def test_connected_calls_send_text(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
         conn = _Connection(ws, "c1")
         msg = {"type": "test", "value": 123}
-        _run(mgr._safe_send(conn, msg))
-        ws.send_json.assert_called_once_with(msg)
+        _run(mgr._safe_send(conn, _frame(msg)))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
 
 # ===================================================================
@@ -1150,8 +1169,8 @@ class TestMessageTypes:
             "change_percent": 0.635,
             "timestamp": "2026-02-07T16:00:00Z",
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_analysis_progress(self):
         mgr = _fresh_manager()
@@ -1166,8 +1185,8 @@ class TestMessageTypes:
             "status": "running",
             "message": "Running Wyckoff phase detection...",
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_analysis_complete(self):
         mgr = _fresh_manager()
@@ -1179,8 +1198,8 @@ class TestMessageTypes:
             "composite_signal": {"direction": "bullish", "score": 0.75},
             "timestamp": "2026-02-07T16:05:00Z",
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_news_alert(self):
         mgr = _fresh_manager()
@@ -1193,8 +1212,8 @@ class TestMessageTypes:
             "sentiment": {"score": 0.82, "label": "bullish"},
             "timestamp": "2026-02-07T14:30:00Z",
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_god_agent_stream(self):
         mgr = _fresh_manager()
@@ -1206,8 +1225,8 @@ class TestMessageTypes:
             "chunk": "Based on the Wyckoff analysis...",
             "is_final": False,
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_error_notification(self):
         mgr = _fresh_manager()
@@ -1219,8 +1238,8 @@ class TestMessageTypes:
             "message": "Rate limit exceeded, using cached data",
             "severity": "warning",
         }
-        _run(mgr.broadcast(msg))
-        ws.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast(msg))
+        ws.send_text.assert_called_once_with(_frame(msg))
 
 
 # ===================================================================
@@ -1282,7 +1301,7 @@ class TestConstants:
         assert _STALE_TIMEOUT_S == 90
 
     def test_max_connections(self):
-        assert _MAX_CONNECTIONS == 10
+        assert _MAX_CONNECTIONS == 500
 
     def test_max_message_bytes(self):
         assert _MAX_MESSAGE_BYTES == 65_536
@@ -1302,27 +1321,27 @@ class TestBroadcastSubscriberFailures:
         mgr = _fresh_manager()
         ws_ok = _make_mock_ws()
         ws_bad = _make_mock_ws()
-        ws_bad.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws_bad.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws_ok, "ok"))
         _run(mgr.connect(ws_bad, "bad"))
         _run(mgr.subscribe("ok", "ch"))
         _run(mgr.subscribe("bad", "ch"))
         msg = {"type": "test"}
-        _run(mgr.broadcast_to_subscribers("ch", msg))
-        ws_ok.send_json.assert_called_once_with(msg)
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", msg))
+        ws_ok.send_text.assert_called_once_with(_frame(msg))
         assert "bad" not in mgr._connections
 
     def test_all_subscribers_fail(self):
         mgr = _fresh_manager()
         ws1 = _make_mock_ws()
         ws2 = _make_mock_ws()
-        ws1.send_json = AsyncMock(side_effect=Exception("fail"))
-        ws2.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws1.send_text = AsyncMock(side_effect=Exception("fail"))
+        ws2.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws1, "c1"))
         _run(mgr.connect(ws2, "c2"))
         _run(mgr.subscribe("c1", "ch"))
         _run(mgr.subscribe("c2", "ch"))
-        _run(mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
         assert mgr.get_connection_count() == 0
 
     def test_disconnected_subscriber_removed(self):
@@ -1330,7 +1349,7 @@ class TestBroadcastSubscriberFailures:
         ws = _make_mock_ws(state=WebSocketState.DISCONNECTED)
         _run(mgr.connect(ws, "c1"))
         _run(mgr.subscribe("c1", "ch"))
-        _run(mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
         assert "c1" not in mgr._connections
 
 
@@ -1353,8 +1372,8 @@ class TestManagerConcurrency:
     def test_broadcast_during_empty_pool(self):
         mgr = _fresh_manager()
         # Should not raise or block
-        _run(mgr.broadcast({"type": "test"}))
-        _run(mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
 
     def test_subscribe_after_disconnect_returns_false(self):
         mgr = _fresh_manager()
@@ -1472,7 +1491,7 @@ class TestSafeSendEdgeCases:
         mgr = _fresh_manager()
         ws = _make_mock_ws(state=WebSocketState.CONNECTING)
         conn = _Connection(ws, "c1")
-        result = _run(mgr._safe_send(conn, {"type": "test"}))
+        result = _run(mgr._safe_send(conn, _frame({"type": "test"})))
         assert result is True
 
     def test_send_complex_nested_message(self):
@@ -1486,17 +1505,17 @@ class TestSafeSendEdgeCases:
                 "list": [{"a": 1}, {"b": 2}],
             },
         }
-        result = _run(mgr._safe_send(conn, msg))
+        result = _run(mgr._safe_send(conn, _frame(msg)))
         assert result is False
-        ws.send_json.assert_called_once_with(msg)
+        ws.send_text.assert_called_once_with(_frame(msg))
 
     def test_send_empty_dict(self):
         mgr = _fresh_manager()
         ws = _make_mock_ws()
         conn = _Connection(ws, "c1")
-        result = _run(mgr._safe_send(conn, {}))
+        result = _run(mgr._safe_send(conn, _frame({})))
         assert result is False
-        ws.send_json.assert_called_once_with({})
+        ws.send_text.assert_called_once_with(_frame({}))
 
 
 # ===================================================================
@@ -1511,11 +1530,11 @@ class TestBroadcastCleanup:
         ws_ok1 = _make_mock_ws()
         ws_ok2 = _make_mock_ws()
         ws_bad = _make_mock_ws()
-        ws_bad.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws_bad.send_text = AsyncMock(side_effect=Exception("fail"))
         _run(mgr.connect(ws_ok1, "ok1"))
         _run(mgr.connect(ws_ok2, "ok2"))
         _run(mgr.connect(ws_bad, "bad"))
-        _run(mgr.broadcast({"type": "test"}))
+        _deliver(mgr, mgr.broadcast({"type": "test"}))
         assert mgr.get_connection_count() == 2
         assert "ok1" in mgr._connections
         assert "ok2" in mgr._connections
@@ -1525,7 +1544,7 @@ class TestBroadcastCleanup:
         mgr = _fresh_manager()
         ws_ok = _make_mock_ws()
         ws_bad = _make_mock_ws()
-        ws_bad.send_json = AsyncMock(side_effect=Exception("fail"))
+        ws_bad.send_text = AsyncMock(side_effect=Exception("fail"))
         ws_unsubscribed = _make_mock_ws()
         _run(mgr.connect(ws_ok, "ok"))
         _run(mgr.connect(ws_bad, "bad"))
@@ -1533,13 +1552,160 @@ class TestBroadcastCleanup:
         _run(mgr.subscribe("ok", "ch"))
         _run(mgr.subscribe("bad", "ch"))
         # "unsub" is NOT subscribed
-        _run(mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
         assert "ok" in mgr._connections
         assert "bad" not in mgr._connections
         # "unsub" should still be present (wasn't targeted)
         assert "unsub" in mgr._connections
 
 
+# ===================================================================
+# Channel index
+# ===================================================================
+
+class TestChannelIndex:
+    """The channel -> connection index tracks subscriptions exactly."""
+
+    def test_subscribe_indexes_connection(self):
+        mgr = _fresh_manager()
+        _run(mgr.connect(_make_mock_ws(), "c1"))
+        _run(mgr.subscribe("c1", "ch"))
+        assert mgr._channels["ch"] == {mgr._connections["c1"]}
+
+    def test_unsubscribe_drops_empty_channel(self):
+        mgr = _fresh_manager()
+        _run(mgr.connect(_make_mock_ws(), "c1"))
+        _run(mgr.subscribe("c1", "ch"))
+        _run(mgr.unsubscribe("c1", "ch"))
+        assert "ch" not in mgr._channels
+
+    def test_disconnect_removes_from_every_channel(self):
+        mgr = _fresh_manager()
+        _run(mgr.connect(_make_mock_ws(), "c1"))
+        _run(mgr.connect(_make_mock_ws(), "c2"))
+        _run(mgr.subscribe("c1", "a"))
+        _run(mgr.subscribe("c1", "b"))
+        _run(mgr.subscribe("c2", "b"))
+        _run(mgr.disconnect("c1"))
+        assert "a" not in mgr._channels
+        assert mgr._channels["b"] == {mgr._connections["c2"]}
+
+    def test_stale_cleanup_removes_from_index(self):
+        mgr = _fresh_manager()
+        _run(mgr.connect(_make_mock_ws(), "c1"))
+        _run(mgr.subscribe("c1", "ch"))
+        mgr._connections["c1"].last_heartbeat -= timedelta(seconds=_STALE_TIMEOUT_S + 1)
+        _run(mgr.cleanup_stale())
+        assert mgr._channels == {}
+
+    def test_replaced_connection_leaves_index(self):
+        mgr = _fresh_manager()
+        ws1, ws2 = _make_mock_ws(), _make_mock_ws()
+        _run(mgr.connect(ws1, "c1"))
+        _run(mgr.subscribe("c1", "ch"))
+        _run(mgr.connect(ws2, "c1"))
+        _deliver(mgr, mgr.broadcast_to_subscribers("ch", {"type": "test"}))
+        ws1.send_text.assert_not_called()
+        ws2.send_text.assert_not_called()
+
+
+# ===================================================================
+# Serialize-once fan-out
+# ===================================================================
+
+class TestSerializeOnce:
+    """Each message is encoded once and sent as the same text frame."""
+
+    def test_broadcast_encodes_once(self):
+        mgr = _fresh_manager()
+        sockets = [_make_mock_ws() for _ in range(3)]
+        for i, ws in enumerate(sockets):
+            _run(mgr.connect(ws, f"c{i}"))
+            _run(mgr.subscribe(f"c{i}", "ch"))
+        msg = {"type": "price_update", "symbol": "AAPL"}
+        with patch("app.api.routes.websocket._encode", wraps=_frame) as enc:
+            _deliver(mgr, mgr.broadcast_to_subscribers("ch", msg))
+        enc.assert_called_once_with(msg)
+        frames = {ws.send_text.call_args.args[0] for ws in sockets}
+        assert frames == {_frame(msg)}
+
+    def test_frames_delivered_in_order(self):
+        mgr = _fresh_manager()
+        ws = _make_mock_ws()
+        _run(mgr.connect(ws, "c1"))
+        _run(mgr.subscribe("c1", "ch"))
+
+        async def _burst():
+            for i in range(5):
+                await mgr.broadcast_to_subscribers("ch", {"seq": i})
+            await mgr.drain()
+
+        _run(_burst())
+        sent = [call.args[0] for call in ws.send_text.call_args_list]
+        assert sent == [_frame({"seq": i}) for i in range(5)]
+
+    def test_unserializable_message_dropped(self):
+        mgr = _fresh_manager()
+        ws = _make_mock_ws()
+        _run(mgr.connect(ws, "c1"))
+        _deliver(mgr, mgr.broadcast({"type": "bad", "value": object()}))
+        ws.send_text.assert_not_called()
+        assert "c1" in mgr._connections
+
+
+# ===================================================================
+# Slow-consumer eviction
+# ===================================================================
+
+class TestSlowConsumerEviction:
+    """A client whose send queue fills up is evicted; others are unaffected."""
+
+    def _burst(self, mgr, count):
+        async def _go():
+            for i in range(count):
+                await mgr.broadcast_to_subscribers("ch", {"seq": i})
+            await mgr.drain()
+        _run(_go())
+
+    def _setup(self):
+        mgr = _fresh_manager()
+        fast = _make_mock_ws()
+        _run(mgr.connect(fast, "fast"))
+        _run(mgr.connect(_make_mock_ws(), "slow"))
+        _run(mgr.subscribe("fast", "ch"))
+        _run(mgr.subscribe("slow", "ch"))
+        return mgr, fast
+
+    def test_queue_within_bound_is_kept(self):
+        mgr, _ = self._setup()
+        self._burst(mgr, _SEND_QUEUE_SIZE)
+        assert "slow" in mgr._connections
+
+    def test_full_queue_evicts_and_closes(self):
+        mgr, fast = self._setup()
+        slow_ws = mgr._connections["slow"].ws
+
+        async def _stall(frame):
+            await asyncio.sleep(3600)
+
+        slow_ws.send_text = AsyncMock(side_effect=_stall)
+
+        async def _go():
+            # Yield after each frame: the fast writer keeps up, the slow
+            # one stalls on its first frame while its queue fills.
+            for i in range(_SEND_QUEUE_SIZE + 2):
+                await mgr.broadcast_to_subscribers("ch", {"seq": i})
+                await asyncio.sleep(0)
+            await mgr.drain()
+
+        _run(_go())
+        assert "slow" not in mgr._connections
+        assert mgr._channels["ch"] == {mgr._connections["fast"]}
+        slow_ws.close.assert_awaited_once()
+        assert slow_ws.close.call_args.kwargs["code"] == _SLOW_CONSUMER_CLOSE_CODE
+        assert fast.send_text.call_count == _SEND_QUEUE_SIZE + 2
+
+
 # ===================================================================
 # Error message content validation
 # ===================================================================
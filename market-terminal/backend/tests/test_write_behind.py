@@ -0,0 +1,263 @@
+"""Tests for the write-behind queue (app.data.write_behind).
+
+Validates coalescing by row key, batching into one
+``DatabaseManager.execute_batch`` call, read settling, discards, the
+size-triggered flush, failure accounting, and the shutdown flush.
+
+The database is mocked -- no real DB is touched.
+
+Run with: ``cd market-terminal/backend && python -m pytest tests/test_write_behind.py -v``
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import app.data.write_behind as wb_mod
+from app.data.write_behind import (
+    WriteBehindQueue,
+    close_write_behind,
+    get_write_behind,
+    reset_write_behind,
+)
+
+_SQL_A = "INSERT OR REPLACE INTO table_a (k, v) VALUES (?, ?)"
+_SQL_B = "INSERT OR REPLACE INTO table_b (k, v) VALUES (?, ?)"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def _reset_singleton():
+    reset_write_behind()
+    yield
+    reset_write_behind()
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute_batch = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def patched_db(mock_db):
+    with patch("app.data.database.get_database", new_callable=AsyncMock, return_value=mock_db):
+        yield mock_db
+
+
+@pytest.fixture
+def queue():
+    """A queue whose timer never fires during a test."""
+    return WriteBehindQueue(flush_interval_s=3600.0, max_pending=100)
+
+
+def _batch(db) -> dict[str, list[tuple]]:
+    return dict(db.execute_batch.call_args[0][0])
+
+
+# ===================================================================
+# 1. Coalescing and batching
+# ===================================================================
+class TestCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_last_write_per_key_wins(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        queue.put("table_a", ("x",), _SQL_A, ("x", 2))
+        queue.put("table_a", ("y",), _SQL_A, ("y", 3))
+        assert await queue.flush() == 2
+        assert _batch(patched_db) == {_SQL_A: [("x", 2), ("y", 3)]}
+        stats = queue.get_stats()
+        assert stats["queued"] == 3
+        assert stats["coalesced"] == 1
+        assert stats["flushed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_same_key_in_other_table_kept(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        queue.put("table_b", ("x",), _SQL_B, ("x", 1))
+        await queue.flush()
+        assert set(_batch(patched_db)) == {_SQL_A, _SQL_B}
+
+    @pytest.mark.asyncio
+    async def test_one_batch_per_flush(self, queue, patched_db):
+        queue.put_many("table_a", _SQL_A, [((i,), (i, i)) for i in range(50)])
+        queue.put("table_b", ("z",), _SQL_B, ("z", 0))
+        await queue.flush()
+        patched_db.execute_batch.assert_called_once()
+        assert len(_batch(patched_db)[_SQL_A]) == 50
+        assert queue.get_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_is_noop(self, queue, patched_db):
+        assert await queue.flush() == 0
+        patched_db.execute_batch.assert_not_called()
+
+
+# ===================================================================
+# 2. Read consistency
+# ===================================================================
+class TestSettleAndDiscard:
+
+    @pytest.mark.asyncio
+    async def test_settle_flushes_pending_table(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        assert queue.has_pending("table_a")
+        await queue.settle("table_a")
+        assert not queue.has_pending("table_a")
+        patched_db.execute_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_settle_other_table_does_not_flush(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        await queue.settle("table_b")
+        patched_db.execute_batch.assert_not_called()
+        assert queue.has_pending("table_a")
+
+    @pytest.mark.asyncio
+    async def test_settle_waits_for_inflight_flush(self, queue, patched_db):
+        release = asyncio.Event()
+        landed: list[str] = []
+
+        async def slow_batch(groups):
+            await release.wait()
+            landed.append("batch")
+
+        patched_db.execute_batch.side_effect = slow_batch
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        flushing = asyncio.create_task(queue.flush())
+        await asyncio.sleep(0)
+        assert queue.has_pending("table_a")
+        settling = asyncio.create_task(queue.settle("table_a"))
+        await asyncio.sleep(0)
+        assert not settling.done()
+        release.set()
+        await asyncio.gather(flushing, settling)
+        assert landed == ["batch"]
+
+    @pytest.mark.asyncio
+    async def test_queued_returns_matching_params(self, queue, patched_db):
+        queue.put("table_a", ("AAPL", "price"), _SQL_A, ("AAPL", 1))
+        queue.put("table_a", ("MSFT", "price"), _SQL_A, ("MSFT", 2))
+        queue.put("table_b", ("AAPL", "price"), _SQL_B, ("AAPL", 3))
+        assert queue.queued("table_a", ("AAPL",)) == [("AAPL", 1)]
+        assert queue.queued("table_a", ("TSLA",)) == []
+        patched_db.execute_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_inflight_ignores_queued_rows(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        await queue.wait_inflight("table_a", ("x",))
+        patched_db.execute_batch.assert_not_called()
+        assert queue.has_pending("table_a")
+
+    @pytest.mark.asyncio
+    async def test_wait_inflight_waits_only_for_its_key(self, queue, patched_db):
+        release = asyncio.Event()
+
+        async def slow_batch(groups):
+            await release.wait()
+
+        patched_db.execute_batch.side_effect = slow_batch
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        flushing = asyncio.create_task(queue.flush())
+        await asyncio.sleep(0)
+        await asyncio.wait_for(queue.wait_inflight("table_a", ("y",)), timeout=1)
+        waiting = asyncio.create_task(queue.wait_inflight("table_a", ("x",)))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        release.set()
+        await asyncio.gather(flushing, waiting)
+
+    @pytest.mark.asyncio
+    async def test_discard_by_key_prefix(self, queue, patched_db):
+        queue.put("table_a", ("AAPL", "price"), _SQL_A, ("AAPL", 1))
+        queue.put("table_a", ("AAPL", "news"), _SQL_A, ("AAPL", 2))
+        queue.put("table_a", ("MSFT", "price"), _SQL_A, ("MSFT", 3))
+        assert queue.discard("table_a", ("AAPL",)) == 2
+        await queue.flush()
+        assert _batch(patched_db) == {_SQL_A: [("MSFT", 3)]}
+
+    @pytest.mark.asyncio
+    async def test_discard_whole_table(self, queue, patched_db):
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        queue.put("table_b", ("x",), _SQL_B, ("x", 1))
+        assert queue.discard("table_a") == 1
+        assert not queue.has_pending("table_a")
+        assert queue.has_pending("table_b")
+
+
+# ===================================================================
+# 3. Flush triggers and failures
+# ===================================================================
+class TestFlushTriggers:
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushes_early(self, patched_db):
+        queue = WriteBehindQueue(flush_interval_s=3600.0, max_pending=3)
+        queue.put_many("table_a", _SQL_A, [((i,), (i, i)) for i in range(3)])
+        await asyncio.sleep(0.01)
+        patched_db.execute_batch.assert_called_once()
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes(self, patched_db):
+        queue = WriteBehindQueue(flush_interval_s=0.01, max_pending=100)
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        await asyncio.sleep(0.05)
+        patched_db.execute_batch.assert_called_once()
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_dropped_and_counted(self, queue, patched_db):
+        patched_db.execute_batch.side_effect = RuntimeError("disk full")
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        assert await queue.flush() == 1
+        stats = queue.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["flushed"] == 0
+        assert not queue.has_pending("table_a")
+
+    @pytest.mark.asyncio
+    async def test_failed_group_counts_only_its_rows(self, queue, patched_db):
+        patched_db.execute_batch.return_value = [None, RuntimeError("no table")]
+        queue.put("table_a", ("x",), _SQL_A, ("x", 1))
+        queue.put("table_a", ("y",), _SQL_A, ("y", 2))
+        queue.put("table_b", ("z",), _SQL_B, ("z", 3))
+        assert await queue.flush() == 3
+        stats = queue.get_stats()
+        assert stats["flushed"] == 2
+        assert stats["dropped"] == 1
+
+
+# ===================================================================
+# 4. Singleton lifecycle
+# ===================================================================
+class TestLifecycle:
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_rows(self, patched_db):
+        get_write_behind().put("table_a", ("x",), _SQL_A, ("x", 1))
+        await close_write_behind()
+        patched_db.execute_batch.assert_called_once()
+        assert wb_mod._queue is None
+
+    @pytest.mark.asyncio
+    async def test_close_noop_when_unused(self):
+        await close_write_behind()
+        assert wb_mod._queue is None
+
+    def test_singleton(self):
+        assert get_write_behind() is get_write_behind()
+
+    def test_invalid_settings_fall_back_to_defaults(self):
+        with patch("app.config.get_settings", return_value=MagicMock()):
+            queue = get_write_behind()
+        assert queue._interval == 0.25
+        assert queue._max_pending == 1000
@@ -351,39 +351,49 @@ class TestValidateQuote:
 # ===================================================================
 # 8. _validate_historical
 # ===================================================================
+def _columns(bars: list[dict]) -> dict[str, list]:
+    """Per-field history columns for *bars*, as produced by get_historical."""
+    fields = ("date", "open", "high", "low", "close")
+    return {
+        field: [bar.get(field, f"2024-01-{i + 2:02d}" if field == "date" else None)
+                for i, bar in enumerate(bars)]
+        for field in fields
+    }
+
+
 class TestValidateHistorical:
     def test_valid(self):
-        assert YFinanceClient._validate_historical([{"open": 100, "high": 105, "low": 98, "close": 103}])
+        assert YFinanceClient._validate_historical(_columns([{"open": 100, "high": 105, "low": 98, "close": 103}]))
 
     def test_empty(self):
-        assert YFinanceClient._validate_historical([]) is False
+        assert YFinanceClient._validate_historical(_columns([])) is False
 
     def test_negative_open(self):
-        assert YFinanceClient._validate_historical([{"open": -1, "high": 105, "low": 98, "close": 103}]) is False
+        assert YFinanceClient._validate_historical(_columns([{"open": -1, "high": 105, "low": 98, "close": 103}])) is False
 
     def test_negative_close(self):
-        assert YFinanceClient._validate_historical([{"open": 100, "high": 105, "low": 98, "close": -1}]) is False
+        assert YFinanceClient._validate_historical(_columns([{"open": 100, "high": 105, "low": 98, "close": -1}])) is False
 
     def test_negative_high(self):
-        assert YFinanceClient._validate_historical([{"open": 100, "high": -1, "low": 98, "close": 103}]) is False
+        assert YFinanceClient._validate_historical(_columns([{"open": 100, "high": -1, "low": 98, "close": 103}])) is False
 
     def test_negative_low(self):
-        assert YFinanceClient._validate_historical([{"open": 100, "high": 105, "low": -1, "close": 103}]) is False
+        assert YFinanceClient._validate_historical(_columns([{"open": 100, "high": 105, "low": -1, "close": 103}])) is False
 
     def test_none_values_ok(self):
-        assert YFinanceClient._validate_historical([{"open": None, "high": None, "low": None, "close": None}])
+        assert YFinanceClient._validate_historical(_columns([{"open": None, "high": None, "low": None, "close": None}]))
 
     def test_multi_bar_valid(self):
-        assert YFinanceClient._validate_historical([
+        assert YFinanceClient._validate_historical(_columns([
             {"open": 100, "high": 105, "low": 98, "close": 103},
             {"open": 103, "high": 108, "low": 101, "close": 106},
-        ])
+        ]))
 
     def test_one_bad_bar(self):
-        assert YFinanceClient._validate_historical([
+        assert YFinanceClient._validate_historical(_columns([
             {"open": 100, "high": 105, "low": 98, "close": 103},
             {"open": -1, "high": 108, "low": 101, "close": 106},
-        ]) is False
+        ])) is False
 
 # ===================================================================
 # 9. _df_to_records
@@ -489,6 +499,57 @@ class TestGetQuote:
         with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=_VALID_INFO):
             assert (await client.get_quote("aapl"))["symbol"] == "AAPL"
 
+class TestGetQuotesBulk:
+    @staticmethod
+    def _download_df(closes):
+        idx = pd.DatetimeIndex(["2024-01-02", "2024-01-03"])
+        cols = {}
+        for sym, (prev, last) in closes.items():
+            cols[("Close", sym)] = [prev, last]
+            cols[("High", sym)] = [last + 1, last + 1]
+            cols[("Volume", sym)] = [1000.0, 2000.0]
+        return pd.DataFrame(cols, index=idx)
+
+    @pytest.mark.asyncio
+    async def test_success_multi_ticker(self, client):
+        df = self._download_df({"AAPL": (100.0, 110.0), "MSFT": (200.0, 190.0)})
+        with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=df):
+            r = await client.get_quotes_bulk(["aapl", "MSFT"])
+        assert set(r) == {"AAPL", "MSFT"}
+        assert r["AAPL"]["current_price"] == 110.0 and r["AAPL"]["previous_close"] == 100.0
+        assert r["AAPL"]["change"] == 10.0 and r["AAPL"]["percent_change"] == pytest.approx(10.0)
+        assert r["MSFT"]["change"] == -10.0 and r["MSFT"]["volume"] == 2000
+        assert r["AAPL"]["_source"] == "yfinance" and r["AAPL"]["_is_fallback"] is True
+
+    @pytest.mark.asyncio
+    async def test_missing_symbol_omitted(self, client):
+        df = self._download_df({"AAPL": (100.0, 110.0), "BAD": (float("nan"), float("nan"))})
+        with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=df):
+            r = await client.get_quotes_bulk(["AAPL", "BAD", "GONE"])
+        assert set(r) == {"AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_chunks_requests(self, client):
+        df = self._download_df({"AAPL": (100.0, 110.0)})
+        symbols = [f"S{i}" for i in range(mod._QUOTE_CHUNK_SIZE + 1)]
+        with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=df) as mock_run:
+            await client.get_quotes_bulk(symbols)
+        assert mock_run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, disabled_client):
+        assert await disabled_client.get_quotes_bulk(["AAPL"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_circuit_open(self, client):
+        _open_circuit(client)
+        assert await client.get_quotes_bulk(["AAPL"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_empty_download(self, client):
+        with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=None):
+            assert await client.get_quotes_bulk(["AAPL"]) == {}
+
 # ===================================================================
 # 11. get_historical
 # ===================================================================
@@ -797,9 +858,68 @@ class TestEdgeCases:
         mt.assert_called_once_with(fn, "a1", "a2")
 
     def test_zero_prices_ok(self):
-        assert YFinanceClient._validate_historical([{"open": 0.0, "high": 0.0, "low": 0.0, "close": 0.0}])
+        assert YFinanceClient._validate_historical(_columns([{"open": 0.0, "high": 0.0, "low": 0.0, "close": 0.0}]))
 
     def test_df_non_datetime_cols(self):
         df = pd.DataFrame({"c1": [1.0, 2.0], "c2": [3.0, 4.0]}, index=["Rev", "Cost"])
         r = YFinanceClient._df_to_records(df)
         assert len(r) == 2 and r[0]["period"] == "c1"
+
+# ===================================================================
+# 17. Column-wise conversion
+# ===================================================================
+class TestHistoryColumns:
+    def _df(self, n=20):
+        return _make_mock_df([
+            {**_HIST_ROW, "Date": str(d.date()), "Close": 100.0 + i}
+            for i, d in enumerate(pd.bdate_range("2024-01-02", periods=n))
+        ])
+
+    def test_columns_per_field(self):
+        cols = mod._history_columns(self._df(3))
+        assert cols["date"] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+        assert cols["close"] == [100.0, 101.0, 102.0]
+        assert cols["volume"] == [1000000] * 3
+        assert all(isinstance(v, int) for v in cols["volume"])
+
+    def test_nan_and_missing_columns(self):
+        df = self._df(2).drop(columns=["Adj Close"])
+        df.iloc[0, df.columns.get_loc("Open")] = np.nan
+        df["Volume"] = [np.nan, 5.0]
+        cols = mod._history_columns(df)
+        assert cols["open"][0] is None and cols["open"][1] == 100.0
+        assert cols["adjusted_close"] == [None, None]
+        assert cols["volume"] == [None, 5]
+
+    def test_intraday_iso_dates(self):
+        df = self._df(2)
+        df.index = pd.DatetimeIndex(["2024-01-02 09:30", "2024-01-02 09:35"], tz="America/New_York")
+        assert mod._history_columns(df, "5m")["date"] == [ts.isoformat() for ts in df.index]
+
+    def test_records_match_columns(self):
+        cols = mod._history_columns(self._df(2))
+        records = mod._columns_to_records(cols)
+        assert records[1] == {key: vals[1] for key, vals in cols.items()}
+
+    def test_validate_columns(self):
+        cols = mod._history_columns(self._df(2))
+        assert YFinanceClient._validate_historical(cols)
+        cols["low"][1] = -1.0
+        assert YFinanceClient._validate_historical(cols) is False
+        assert YFinanceClient._validate_historical({"date": []}) is False
+
+    @pytest.mark.asyncio
+    async def test_get_historical_dedupes_dates(self, client):
+        df = self._df(20)
+        df.index = pd.DatetimeIndex(
+            list(df.index[:1]) + [df.index[0] + pd.Timedelta(hours=1)] + list(df.index[2:])
+        )
+        with patch.object(client, "_run_sync", new_callable=AsyncMock, return_value=df):
+            r = await client.get_historical("AAPL")
+        assert len(r) == 19
+        assert r[0]["close"] == 100.0 and r[1]["close"] == 102.0
+
+    def test_statement_records_coerce_objects(self):
+        df = pd.DataFrame({"c1": ["1.5", None]}, index=["Total Revenue", "Net Income"], dtype=object)
+        r = mod.statement_to_records(df)
+        assert r == [{"period": "c1", "total_revenue": 1.5, "net_income": None}]